@@ -6,12 +6,25 @@ A python3 class designed to fetch data from Purple Air's new API.
 https://api.purpleair.com/#api-welcome
 """
 
-from purpleair_api.PurpleAirAPIHelpers import debug_log, send_url_get_request
+from logging import getLogger
+from threading import Lock, Thread
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    KEY_VALIDATION_MODES_LIST,
+)
+from purpleair_api.PurpleAirAPIHelpers import (
+    create_session,
+    debug_log,
+    send_url_get_request,
+)
 from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
 from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
 from purpleair_api.PurpleAirWriteAPI import PurpleAirWriteAPI
 from purpleair_api.PurpleAirLocalAPI import PurpleAirLocalAPI
 
+_logger = getLogger(__name__)
+
 
 class PurpleAirAPI(PurpleAirReadAPI, PurpleAirWriteAPI, PurpleAirLocalAPI):
     """
@@ -20,14 +33,56 @@ class PurpleAirAPI(PurpleAirReadAPI, PurpleAirWriteAPI, PurpleAirLocalAPI):
     """
 
     def __init__(
-        self, your_api_read_key=None, your_api_write_key=None, your_ipv4_address=None
+        self,
+        your_api_read_key=None,
+        your_api_write_key=None,
+        your_ipv4_address=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        single_flight=None,
+        response_cache=None,
+        history_cache=None,
+        key_validation="eager",
+        key_cache=None,
     ):
         """
         :param str your_api_read_key: A valid PurpleAirAPI Read key
         :param str your_api_write_key: A valid PurpleAirAPI Write key
         :param list your_ipv4_address: A list of IPv4 address strings for your PurpleAir sensor(s).
+        :param requests.Session session: (optional) A session shared by the read, write and local
+                                         requests. When not provided one is created with
+                                         `create_session`.
+        :param PurpleAirRateLimiter rate_limiter: (optional) A limiter the read requests take their
+                                                  estimated API points from.
+        :param PurpleAirRetryPolicy retry_policy: (optional) A policy the read, write and local
+                                                  requests send failed requests again with.
+        :param float | tuple timeout: (optional) The timeout the read, write and local requests,
+                                      including the key checks, use when a request does not pass
+                                      its own. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS; None
+                                      waits without a limit.
+        :param PurpleAirSingleFlight single_flight: (optional) Lets identical read requests that
+                                                    are in flight at the same time share one request.
+        :param PurpleAirResponseCache response_cache: (optional) A cache the read responses are kept
+                                                      in. Group changes made with the write key
+                                                      drop the matching entries.
+        :param PurpleAirHistoryCache history_cache: (optional) A local store of downloaded history
+                                                    the ranged history requests read from.
+        :param str key_validation: (optional) When the API keys are checked. One of
+                                   KEY_VALIDATION_MODES_LIST. ``"eager"`` checks them here,
+                                   ``"lazy"`` on the first request that uses each key,
+                                   ``"background"`` in a thread started here, and ``"offline"``
+                                   trusts that each key is of the type it was passed in as.
+        :param PurpleAirKeyCache key_cache: (optional) A file of recent key checks. A key checked
+                                            within its TTL is not checked again.
         """
 
+        if key_validation not in KEY_VALIDATION_MODES_LIST:
+            raise PurpleAirAPIError(
+                f"`key_validation: {key_validation}` must be one of {KEY_VALIDATION_MODES_LIST}!"
+            )
+
         # We can not have all three parameters be empty
         if (
             your_api_read_key is None
@@ -43,6 +98,17 @@ class PurpleAirAPI(PurpleAirReadAPI, PurpleAirWriteAPI, PurpleAirLocalAPI):
         # Save off the API key for internal usage
         self._your_api_read_key = your_api_read_key
 
+        # Check the local addresses before creating a session that would need closing
+        if your_ipv4_address is not None:
+            PurpleAirLocalAPI._validate_ipv4_address_list(your_ipv4_address)
+
+        # One pooled session is shared by the read, write and local requests
+        owns_session = session is None
+        self._session = create_session() if owns_session else session
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._timeout = timeout
+
         self._base_api_v1_request_string = None
 
         # Create the base API request string. Must be HTTPS.
@@ -54,41 +120,113 @@ class PurpleAirAPI(PurpleAirReadAPI, PurpleAirWriteAPI, PurpleAirLocalAPI):
         self._api_keys_last_checked = {}
         self._api_key_types = {}
 
-        retval_api_read_key = None
-        retval_api_write_key = None
+        # Keys that are used before they are checked, mapped to the type they should be
+        self._key_cache = key_cache
+        self._key_validation_lock = Lock()
+        self._unchecked_api_keys = {}
 
-        if your_api_read_key is not None:
-            retval_api_read_key = self._check_an_api_key(your_api_read_key)
+        try:
+            self._start_api_key_checks(
+                your_api_read_key, your_api_write_key, key_validation
+            )
 
-        if your_api_write_key is not None:
-            retval_api_write_key = self._check_an_api_key(your_api_write_key)
+        except Exception:
+            # Do not leak the session this constructor created
+            if owns_session:
+                self._session.close()
+
+            raise
 
         if your_ipv4_address is not None:
-            PurpleAirLocalAPI.__init__(self, ipv4_address_list=your_ipv4_address)
+            PurpleAirLocalAPI.__init__(
+                self,
+                ipv4_address_list=your_ipv4_address,
+                session=self._session,
+                retry_policy=retry_policy,
+                timeout=timeout,
+            )
 
-        if retval_api_read_key is not None:
-            if self._api_key_types[your_api_read_key] == "READ":
-                PurpleAirReadAPI.__init__(self, api_read_key=your_api_read_key)
-                print("PurpleAirAPI: Successfully authenticated read key")
+        if your_api_read_key is not None:
+            PurpleAirReadAPI.__init__(
+                self,
+                api_read_key=your_api_read_key,
+                session=self._session,
+                rate_limiter=rate_limiter,
+                retry_policy=retry_policy,
+                timeout=timeout,
+                single_flight=single_flight,
+                response_cache=response_cache,
+                history_cache=history_cache,
+            )
 
-            else:
-                raise PurpleAirAPIError("Ensure 'your_api_read_key' is a read key.")
+        if your_api_write_key is not None:
+            PurpleAirWriteAPI.__init__(
+                self,
+                api_write_key=your_api_write_key,
+                session=self._session,
+                retry_policy=retry_policy,
+                timeout=timeout,
+                response_cache=response_cache,
+            )
 
-        if retval_api_write_key is not None:
-            if self._api_key_types[your_api_write_key] == "WRITE":
-                PurpleAirWriteAPI.__init__(self, api_write_key=your_api_write_key)
-                print("PurpleAirAPI: Successfully authenticated write key")
+        if key_validation == "background" and self._unchecked_api_keys:
+            Thread(target=self._check_api_keys_in_background, daemon=True).start()
 
-            else:
-                raise PurpleAirAPIError("Ensure 'your_api_write_key' is a write key")
+        self._owns_session = owns_session
 
         # Avoid logging sensitive API keys in debug output
-        debug_log(f"_api_versions contains {len(self._api_versions)} key(s)")
         debug_log(
-            f"_api_keys_last_checked contains {len(self._api_keys_last_checked)} key(s)"
+            "_api_versions contains %s key(s)", len(self._api_versions), logger=_logger
         )
-        debug_log(f"_api_key_types contains {len(self._api_key_types)} key(s)")
-        debug_log(your_ipv4_address)
+        debug_log(
+            "_api_keys_last_checked contains %s key(s)",
+            len(self._api_keys_last_checked),
+            logger=_logger,
+        )
+        debug_log(
+            "_api_key_types contains %s key(s)",
+            len(self._api_key_types),
+            logger=_logger,
+        )
+        debug_log("%s", your_ipv4_address, logger=_logger)
+
+    def _start_api_key_checks(self, api_read_key, api_write_key, key_validation):
+        """
+        An internal helper to check the keys passed to the constructor, or queue them to be
+        checked later, as `key_validation` asks.
+
+        :param str api_read_key: The read key, or None.
+        :param str api_write_key: The write key, or None.
+        :param str key_validation: ``"eager"``, ``"lazy"``, ``"background"`` or ``"offline"``.
+
+        :raises PurpleAirAPIError: If an eager key check fails or a key is of the wrong type.
+        """
+
+        for api_key, expected_key_type in (
+            (api_read_key, "READ"),
+            (api_write_key, "WRITE"),
+        ):
+            if api_key is None:
+                continue
+
+            key_check = (
+                None if self._key_cache is None else self._key_cache.get(api_key)
+            )
+            if key_check is not None:
+                self._save_key_check(api_key, key_check)
+                self._verify_api_key_type(api_key, expected_key_type)
+
+            elif key_validation == "eager":
+                self._check_an_api_key(api_key)
+                self._verify_api_key_type(
+                    api_key, expected_key_type, print_success=True
+                )
+
+            elif key_validation == "offline":
+                self._api_key_types[api_key] = expected_key_type
+
+            else:
+                self._unchecked_api_keys[api_key] = expected_key_type
 
     def _check_an_api_key(self, str_api_key_to_check):
         """
@@ -101,22 +239,127 @@ class PurpleAirAPI(PurpleAirReadAPI, PurpleAirWriteAPI, PurpleAirLocalAPI):
         """
         request_url = self._base_api_v1_request_string + "keys"
         the_request_text_as_json = send_url_get_request(
-            request_url, api_key_to_use=str_api_key_to_check
+            request_url,
+            api_key_to_use=str_api_key_to_check,
+            session=self._session,
+            timeout=self._timeout,
+            retry_policy=self._retry_policy,
         )
 
         # We good :) get the request information
-        self._api_versions[str_api_key_to_check] = the_request_text_as_json[
-            "api_version"
-        ]
-        self._api_keys_last_checked[str_api_key_to_check] = the_request_text_as_json[
-            "time_stamp"
-        ]
-        self._api_key_types[str_api_key_to_check] = the_request_text_as_json[
-            "api_key_type"
-        ]
+        self._save_key_check(str_api_key_to_check, the_request_text_as_json)
+        if self._key_cache is not None:
+            self._key_cache.put(str_api_key_to_check, the_request_text_as_json)
 
         return True
 
+    def _save_key_check(self, api_key, key_check):
+        """
+        An internal helper to save the response of a key check.
+
+        :param str api_key: The API key that was checked.
+        :param dict key_check: The ``keys`` response with ``api_version``, ``time_stamp`` and
+                               ``api_key_type``.
+        """
+
+        self._api_versions[api_key] = key_check["api_version"]
+        self._api_keys_last_checked[api_key] = key_check["time_stamp"]
+        self._api_key_types[api_key] = key_check["api_key_type"]
+
+    def _verify_api_key_type(self, api_key, expected_key_type, print_success=False):
+        """
+        An internal helper to make sure a checked key is of the type it was passed in as.
+
+        :param str api_key: The API key that was checked.
+        :param str expected_key_type: ``"READ"`` or ``"WRITE"``.
+        :param bool print_success: (optional) Print the success message, only done for a fresh
+                                   check in the constructor. Otherwise it is a debug message, so
+                                   key cache hits and background checks stay quiet.
+
+        :raises PurpleAirAPIError: If the key is of another type.
+        """
+
+        if self._api_key_types[api_key] != expected_key_type:
+            if expected_key_type == "READ":
+                raise PurpleAirAPIError("Ensure 'your_api_read_key' is a read key.")
+
+            raise PurpleAirAPIError("Ensure 'your_api_write_key' is a write key")
+
+        message = (
+            f"PurpleAirAPI: Successfully authenticated {expected_key_type.lower()} key"
+        )
+        if print_success:
+            print(message)
+
+        else:
+            debug_log("%s", message, logger=_logger)
+
+    def _ensure_api_key_checked(self, api_key):
+        """
+        An internal helper to check a key that the lazy or background validation has not
+        checked yet. It waits for a check that is already running in the background.
+
+        :param str api_key: The API key about to be used.
+
+        :raises PurpleAirAPIError: If the key validation request fails or the key is of the wrong type.
+        """
+
+        if api_key not in self._unchecked_api_keys:
+            return
+
+        with self._key_validation_lock:
+            expected_key_type = self._unchecked_api_keys.get(api_key)
+            if expected_key_type is None:
+                return
+
+            self._check_an_api_key(api_key)
+            self._verify_api_key_type(api_key, expected_key_type)
+            del self._unchecked_api_keys[api_key]
+
+    def _check_api_keys_in_background(self):
+        """
+        An internal helper run in a thread to check every unchecked key. A key that fails is
+        left unchecked, so the first request that uses it checks it again and raises the error.
+        """
+
+        for api_key in list(self._unchecked_api_keys):
+            try:
+                self._ensure_api_key_checked(api_key)
+
+            except Exception as e:
+                debug_log(
+                    "_check_api_keys_in_background - a key check failed: %s",
+                    e,
+                    logger=_logger,
+                )
+
+    def _get(self, *args, **kwargs):
+        """
+        An internal helper that checks the read key, if it has not been, before
+        `PurpleAirReadAPI._get` sends the request.
+        """
+
+        self._ensure_api_key_checked(self._your_api_read_key)
+        return PurpleAirReadAPI._get(self, *args, **kwargs)
+
+    def _get_stream(self, *args, **kwargs):
+        """
+        An internal helper that checks the read key, if it has not been, before
+        `PurpleAirReadAPI._get_stream` sends the request.
+        """
+
+        self._ensure_api_key_checked(self._your_api_read_key)
+        return PurpleAirReadAPI._get_stream(self, *args, **kwargs)
+
+    def _send(self, *args, **kwargs):
+        """
+        An internal helper that checks the write key, if it has not been, before
+        `PurpleAirWriteAPI._send` sends the request.
+        """
+
+        self._ensure_api_key_checked(self._your_api_write_key)
+        return PurpleAirWriteAPI._send(self, *args, **kwargs)
+
     @property
     def get_api_versions(self):
         """
@@ -6,14 +6,150 @@ A python file with constants for use in PurpleAirAPI.py
 """
 
 #: A constant to see if debug statements are enabled in the PurpleAirAPI module.
+#: When True, debug messages from every module are printed to stderr in red. It is only read
+#: when PurpleAirAPIHelpers is imported, so changing it afterwards has no effect. Call
+#: `enable_debug_messages` or `set_log_level` to turn debug messages on at run time.
 PRINT_DEBUG_MSGS = False
 
+#: The name of the package's parent logger. Each module logs to a child logger named after the
+#: module, i.e., ``purpleair_api.PurpleAirLocalAPI``, so levels can be set per module.
+LOGGER_NAME = "purpleair_api"
+
 #: Accepted Error Codes
-ERROR_CODES_LIST = [400, 402, 403, 404, 409, 415, 503]
+ERROR_CODES_LIST = [400, 402, 403, 404, 409, 415, 429, 503]
 
 #: Success Code
 SUCCESS_CODE_LIST = [200, 201, 204]
 
+#: The number of per-host connection pools a session caches.
+DEFAULT_POOL_CONNECTIONS = 10
+
+#: The maximum number of connections a session keeps open per host.
+DEFAULT_POOL_MAXSIZE = 10
+
+#: The maximum number of connections an async session keeps open across all hosts.
+DEFAULT_ASYNC_CONNECTION_LIMIT = 100
+
+#: The number of seconds the read and write clients wait for the server when no timeout is
+#: passed, so a stalled connection cannot hang a request forever. Pass ``timeout=None`` to a
+#: client to wait without a limit.
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30
+
+#: The number of seconds the local client waits for each sensor when no timeout is passed, so
+#: one hung sensor cannot stall a sweep. Pass ``timeout=None`` to wait without a limit.
+DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS = 10
+
+#: The number of history windows fetched at once by the ranged history requests.
+DEFAULT_HISTORY_MAX_WORKERS = 4
+
+#: The number of bounding box tiles fetched at once by the tiled sensor requests.
+DEFAULT_TILE_MAX_WORKERS = 4
+
+#: The most sensors a bounding box tile is planned to hold.
+DEFAULT_TILE_MAX_SENSORS = 1000
+
+#: The sensor density, in sensors per square degree, assumed when planning tiles without
+#: known sensor locations. Dense urban areas hold far more, sparse ones far less.
+DEFAULT_SENSORS_PER_SQUARE_DEGREE = 25
+
+#: The most times a bounding box tile is split into quarters.
+DEFAULT_TILE_MAX_DEPTH = 4
+
+#: The most tiles a bounding box is first split into without known sensor locations. A box
+#: large enough to need more, i.e., the whole world, gets larger tiles that are split into
+#: quarters only if their requests time out.
+DEFAULT_TILE_MAX_COUNT = 64
+
+#: The longest request URL sent. Longer `show_only` lists are split into batches that fit.
+DEFAULT_MAX_REQUEST_URL_LENGTH = 2000
+
+#: The number of `show_only` batches fetched at once.
+DEFAULT_SHOW_ONLY_MAX_WORKERS = 4
+
+#: The largest time span, in seconds, one history request may cover for each `average` (in minutes).
+#: Ranges longer than this are split into several requests.
+HISTORY_MAX_TIME_SPAN_SECONDS_DICT = {
+    0: 2 * 24 * 60 * 60,
+    10: 3 * 24 * 60 * 60,
+    30: 7 * 24 * 60 * 60,
+    60: 14 * 24 * 60 * 60,
+    360: 90 * 24 * 60 * 60,
+    1440: 365 * 24 * 60 * 60,
+    10080: 5 * 365 * 24 * 60 * 60,
+    43200: 20 * 365 * 24 * 60 * 60,
+    525600: 100 * 365 * 24 * 60 * 60,
+}
+
+#: The number of bytes read from the connection at a time when streaming a CSV response.
+DEFAULT_CSV_STREAM_CHUNK_SIZE = 64 * 1024
+
+#: The JSON decoders `convert_requests_text_to_json` can use, in the order they are preferred.
+#: The first one that is installed is picked at import time.
+JSON_DECODER_NAMES_LIST = ["orjson", "msgspec", "json"]
+
+#: The API points a request is estimated to cost on its own by `PurpleAirRateLimiter`, and the
+#: cost of endpoints left out of a `points_per_call` dictionary.
+DEFAULT_API_POINTS_PER_CALL = 1
+
+#: The API points each returned field is estimated to cost per row by `PurpleAirRateLimiter`, and
+#: the cost of fields left out of a `points_per_field` dictionary.
+DEFAULT_API_POINTS_PER_FIELD = 1
+
+#: The modes `PurpleAirRateLimiter` can run in.
+RATE_LIMITER_MODES_LIST = ["block", "nonblock", "estimate"]
+
+#: The status codes `PurpleAirRetryPolicy` retries by default.
+DEFAULT_RETRY_STATUS_CODES_LIST = [429, 500, 502, 503, 504]
+
+#: The HTTP methods that are safe to send more than once.
+IDEMPOTENT_HTTP_METHODS_LIST = ["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]
+
+#: The names of the read endpoints, as returned by `get_endpoint_name`. Endpoint specific
+#: settings, i.e., response cache TTLs or API points per call, are keyed by them.
+READ_ENDPOINT_NAMES_LIST = [
+    "sensor",
+    "sensors",
+    "sensor_history",
+    "groups",
+    "group",
+    "member",
+    "members",
+    "member_history",
+    "organization",
+]
+
+#: How long, in seconds, `PurpleAirResponseCache` keeps a response for each read endpoint.
+#: Sensor data updates every 2 minutes, while groups and the organization rarely change.
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT = {
+    "sensor": 120,
+    "sensors": 120,
+    "sensor_history": 600,
+    "groups": 3600,
+    "group": 3600,
+    "member": 120,
+    "members": 120,
+    "member_history": 600,
+    "organization": 3600,
+}
+
+#: The most responses `PurpleAirResponseCache` keeps by default.
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+#: The most bytes, estimated from the parsed responses, `PurpleAirResponseCache` keeps by default.
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+#: How long, in seconds, history must be in the past before `PurpleAirHistoryCache` treats its
+#: range as complete. Recent windows may still gain rows, so they are fetched again.
+DEFAULT_HISTORY_CACHE_SETTLE_SECONDS = 60 * 60
+
+#: When `PurpleAirAPI` checks its API keys:
+#: ``"eager"`` in the constructor, ``"lazy"`` on the first request that uses the key,
+#: ``"background"`` in a thread started by the constructor, or ``"offline"`` never.
+KEY_VALIDATION_MODES_LIST = ["eager", "lazy", "background", "offline"]
+
+#: How long, in seconds, `PurpleAirKeyCache` trusts a key check.
+DEFAULT_KEY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
 #: Store the dict/json keys to access data fields.
 #: And define default empty/null values for them
 #: These keys are derived from the PurpleAir documentation: https://api.purpleair.com/#api-sensors-get-sensor-data
@@ -8,29 +8,115 @@ https://api.purpleair.com/#api-welcome
 
 from purpleair_api.PurpleAirAPIConstants import (
     ACCEPTED_FIELD_NAMES_DICT,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_CSV_STREAM_CHUNK_SIZE,
+    DEFAULT_MAX_REQUEST_URL_LENGTH,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_SENSORS_PER_SQUARE_DEGREE,
+    DEFAULT_TILE_MAX_COUNT,
+    DEFAULT_TILE_MAX_DEPTH,
+    DEFAULT_TILE_MAX_SENSORS,
+    HISTORY_MAX_TIME_SPAN_SECONDS_DICT,
+    JSON_DECODER_NAMES_LIST,
+    LOGGER_NAME,
     PRINT_DEBUG_MSGS,
     SUCCESS_CODE_LIST,
     ERROR_CODES_LIST,
 )
 
 from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
-from requests import get, post, delete
+from requests import Session, get, post, delete
+from requests.adapters import HTTPAdapter
+from csv import reader
 from json import loads
+from math import ceil, sqrt
+from urllib.parse import urlsplit
+from logging import DEBUG, Formatter, StreamHandler, getLogger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def debug_log(debug_msg_string):
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+_logger = getLogger(__name__)
+
+
+class _UseClientTimeout:
+    """
+    The type of `USE_CLIENT_TIMEOUT`.
+    """
+
+    def __repr__(self):
+        return "USE_CLIENT_TIMEOUT"
+
+
+#: The default of the per-request `timeout` parameters. The request uses its client's timeout,
+#: while an explicit ``timeout=None`` waits without a limit.
+USE_CLIENT_TIMEOUT = _UseClientTimeout()
+
+
+def debug_log(debug_msg_string, *args, logger=None):
     """
-    A helper function to print out
-    debug messages only if DEBUG is defined as True in
-    'PurpleAirAPIConstants.py'. Messages will be the color
-    red.
+    A helper function to log debug messages with the `logging` module. The message is
+    formatted with `args` (%-style) only if the logger is enabled for DEBUG, so a disabled
+    debug message costs a single level check. Pass values as `args` instead of formatting
+    them into the message yourself.
+
+    :param str debug_msg_string: The debug message string. i.e., ``"text: %s"``.
+    :param args: (optional) The values to format into the message.
+    :param logging.Logger logger: (optional) The module logger to log to. Defaults to the
+                                  PurpleAirAPIHelpers logger.
+    """
+
+    (_logger if logger is None else logger).debug(debug_msg_string, *args)
+
+
+def set_log_level(level, module_name=None):
+    """
+    A helper to set the log level of the whole package or of one module.
+
+    :param int level: The `logging` level. i.e., ``logging.DEBUG``.
+    :param str module_name: (optional) The module to set the level of. i.e., ``"PurpleAirLocalAPI"``.
+                            When not provided the level is set for every module.
+
+    :return logging.Logger: The logger whose level was set.
+    """
+
+    logger_name = LOGGER_NAME if module_name is None else f"{LOGGER_NAME}.{module_name}"
+    logger = getLogger(logger_name)
+    logger.setLevel(level)
+    return logger
+
 
-    :param str debug_msg_string: The debug message string
+def enable_debug_messages(module_name=None):
     """
+    A helper to print debug messages to stderr in red, as PRINT_DEBUG_MSGS does at import.
+    PRINT_DEBUG_MSGS is only read when this module is imported, so call this to turn the
+    messages on afterwards. The level is set with `set_log_level`, and the handler is only
+    added once.
 
-    if PRINT_DEBUG_MSGS:
+    :param str module_name: (optional) The module to print the messages of. i.e.,
+                            ``"PurpleAirLocalAPI"``. When not provided every module's are printed.
+
+    :return logging.Logger: The logger whose level was set.
+    """
+
+    global _debug_handler
+
+    if _debug_handler is None:
         # Make debug messages red using ANSI escape code.
-        print("\033[1;31m" + str(debug_msg_string) + "\x1b[0m")
+        _debug_handler = StreamHandler()
+        _debug_handler.setFormatter(Formatter("\033[1;31m%(message)s\x1b[0m"))
+        getLogger(LOGGER_NAME).addHandler(_debug_handler)
+
+    return set_log_level(DEBUG, module_name)
 
 
 def verify_request_status_codes(status_code) -> bool:
@@ -53,20 +139,97 @@ def verify_request_status_codes(status_code) -> bool:
         raise PurpleAirAPIError(f"Unknown status code - {status_code}!")
 
 
+def _msgspec_loads(text):
+    """
+    An internal helper to decode JSON with msgspec. Errors are raised as ValueError like the
+    other decoders do.
+
+    :param bytes | str text: The JSON to decode.
+
+    :return dict: The parsed JSON.
+    """
+
+    try:
+        return msgspec.json.decode(text)
+
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+def _available_json_decoders() -> dict:
+    """
+    An internal helper to find the JSON decoders that are installed.
+
+    :return dict: A dictionary mapping each installed decoder name to its decode function.
+    """
+
+    json_decoders = {"json": loads}
+    if orjson is not None:
+        json_decoders["orjson"] = orjson.loads
+
+    if msgspec is not None:
+        json_decoders["msgspec"] = _msgspec_loads
+
+    return json_decoders
+
+
+def set_json_decoder(decoder_name=None) -> str:
+    """
+    A helper to choose the JSON decoder used by `convert_requests_text_to_json`.
+
+    :param str decoder_name: (optional) One of JSON_DECODER_NAMES_LIST. When not provided the
+                             first installed decoder in JSON_DECODER_NAMES_LIST is used.
+
+    :return str: The name of the decoder now in use.
+    :raises PurpleAirAPIError: If the decoder is unknown or not installed.
+    """
+
+    global _json_decoder_name, _json_loads
+
+    json_decoders = _available_json_decoders()
+    if decoder_name is None:
+        decoder_name = next(
+            name for name in JSON_DECODER_NAMES_LIST if name in json_decoders
+        )
+
+    if decoder_name not in JSON_DECODER_NAMES_LIST:
+        raise PurpleAirAPIError(
+            f"`decoder_name: {decoder_name}` must be one of {JSON_DECODER_NAMES_LIST}!"
+        )
+
+    if decoder_name not in json_decoders:
+        raise PurpleAirAPIError(f"The `{decoder_name}` JSON decoder is not installed")
+
+    _json_decoder_name = decoder_name
+    _json_loads = json_decoders[decoder_name]
+    return decoder_name
+
+
+def get_json_decoder() -> str:
+    """
+    A helper to return the name of the JSON decoder used by `convert_requests_text_to_json`.
+
+    :return str: The decoder name. i.e., ``'orjson'``.
+    """
+
+    return _json_decoder_name
+
+
 def convert_requests_text_to_json(text=None) -> dict:
     """
-    A helper to convert request.text to json.
+    A helper to convert a response body to json. Pass the raw ``response.content`` bytes when
+    possible so the decoder can skip decoding them to a str first.
 
-    :param str text: The request.text to convert to json
+    :param bytes | str text: The response body to convert to json
 
     :return dict | None: The parsed JSON as a dictionary, or None if text is empty.
     """
 
     the_request_text_as_json = None
     if text:
-        debug_log(f"convert_requests_text_to_json - text: {text}")
-        the_request_text_as_json = loads(text)
-        debug_log(f"convert_requests_text_to_json - json: {the_request_text_as_json}")
+        debug_log("convert_requests_text_to_json - text: %s", text)
+        the_request_text_as_json = _json_loads(text)
+        debug_log("convert_requests_text_to_json - json: %s", the_request_text_as_json)
 
     return the_request_text_as_json
 
@@ -91,26 +254,463 @@ def sanitize_sensor_data_from_paa(paa_return_data) -> dict:
     return paa_return_data
 
 
-def send_url_get_request(
+def split_history_time_range(start_timestamp, end_timestamp, average=None) -> list:
+    """
+    A helper to split a history time range into windows that one request may cover
+    for the chosen average. The windows are back to back and half open, matching the
+    API's ``start_timestamp <= data_time_stamp < end_timestamp`` query.
+
+    :param int start_timestamp: The UNIX time stamp, in seconds, of the start of the range.
+    :param int end_timestamp: The UNIX time stamp, in seconds, of the end of the range.
+    :param int average: The desired average in minutes. Defaults to 10 like the API does.
+
+    :return list: A list of ``(start_timestamp, end_timestamp)`` tuples in time order.
+    :raises PurpleAirAPIError: If the average is unknown or the range is invalid.
+    """
+
+    if average is None:
+        average = 10
+
+    if average not in HISTORY_MAX_TIME_SPAN_SECONDS_DICT:
+        raise PurpleAirAPIError(
+            f"`average: {average}` must be one of {list(HISTORY_MAX_TIME_SPAN_SECONDS_DICT.keys())}!"
+        )
+
+    for timestamp_name, timestamp in (
+        ("start_timestamp", start_timestamp),
+        ("end_timestamp", end_timestamp),
+    ):
+        if type(timestamp) is not int or timestamp < 0:
+            raise PurpleAirAPIError(
+                f"`{timestamp_name}: {timestamp}` must be a UNIX time stamp in seconds!"
+            )
+
+    if start_timestamp >= end_timestamp:
+        raise PurpleAirAPIError(
+            f"`start_timestamp: {start_timestamp}` must be before `end_timestamp: {end_timestamp}`!"
+        )
+
+    max_time_span = HISTORY_MAX_TIME_SPAN_SECONDS_DICT[average]
+    return [
+        (window_start, min(window_start + max_time_span, end_timestamp))
+        for window_start in range(start_timestamp, end_timestamp, max_time_span)
+    ]
+
+
+def merge_history_responses(history_responses, start_timestamp, end_timestamp) -> dict:
+    """
+    A helper to stitch the JSON history payloads of several windows into one payload.
+    Rows are sorted by ``time_stamp`` and a row that appears in more than one window is
+    kept once.
+
+    :param list history_responses: The history payloads, each with `fields` and `data`.
+    :param int start_timestamp: The start of the whole range, stored in the merged payload.
+    :param int end_timestamp: The end of the whole range, stored in the merged payload.
+
+    :return dict: The first payload's top level keys with the merged `data`.
+    :raises PurpleAirAPIError: If there are no payloads or they have no `time_stamp` field.
+    """
+
+    if not history_responses:
+        raise PurpleAirAPIError(
+            "At least one history payload must be provided to merge"
+        )
+
+    merged_response = dict(history_responses[0])
+    fields = merged_response.get("fields", [])
+    if "time_stamp" not in fields:
+        raise PurpleAirAPIError(
+            "The history payloads must include the `time_stamp` field to be merged"
+        )
+
+    time_stamp_position = fields.index("time_stamp")
+    rows_by_time_stamp = {}
+    for history_response in history_responses:
+        for data_row in history_response.get("data", []):
+            rows_by_time_stamp[data_row[time_stamp_position]] = data_row
+
+    merged_response["data"] = [
+        rows_by_time_stamp[time_stamp] for time_stamp in sorted(rows_by_time_stamp)
+    ]
+    merged_response["start_timestamp"] = start_timestamp
+    merged_response["end_timestamp"] = end_timestamp
+    return merged_response
+
+
+def validate_bounding_box(nwlng, nwlat, selng, selat):
+    """
+    A helper to check a bounding box given by its north west and south east corners.
+
+    :param float nwlng: The longitude of the north west corner.
+    :param float nwlat: The latitude of the north west corner.
+    :param float selng: The longitude of the south east corner.
+    :param float selat: The latitude of the south east corner.
+
+    :raises PurpleAirAPIError: If a corner is out of range, or the box is empty or crosses
+                               the antimeridian.
+    """
+
+    for coordinate_name, coordinate, limit in (
+        ("nwlng", nwlng, 180),
+        ("nwlat", nwlat, 90),
+        ("selng", selng, 180),
+        ("selat", selat, 90),
+    ):
+        if (
+            not isinstance(coordinate, (int, float))
+            or not -limit <= coordinate <= limit
+        ):
+            raise PurpleAirAPIError(
+                f"`{coordinate_name}: {coordinate}` must be a number between {-limit} and {limit}!"
+            )
+
+    if nwlng >= selng or nwlat <= selat:
+        raise PurpleAirAPIError(
+            f"The north west corner ({nwlng}, {nwlat}) must be north and west of the "
+            f"south east corner ({selng}, {selat})!"
+        )
+
+
+def quarter_bounding_box(bounding_box) -> list:
+    """
+    A helper to split a bounding box into four equal quarters.
+
+    :param tuple bounding_box: A ``(nwlng, nwlat, selng, selat)`` tuple.
+
+    :return list: The north west, north east, south west and south east quarters.
+    """
+
+    nwlng, nwlat, selng, selat = bounding_box
+    middle_lng = (nwlng + selng) / 2
+    middle_lat = (nwlat + selat) / 2
+    return [
+        (nwlng, nwlat, middle_lng, middle_lat),
+        (middle_lng, nwlat, selng, middle_lat),
+        (nwlng, middle_lat, middle_lng, selat),
+        (middle_lng, middle_lat, selng, selat),
+    ]
+
+
+def split_bounding_box(
+    nwlng,
+    nwlat,
+    selng,
+    selat,
+    max_sensors_per_tile=DEFAULT_TILE_MAX_SENSORS,
+    sensors_per_square_degree=DEFAULT_SENSORS_PER_SQUARE_DEGREE,
+    sensor_locations=None,
+    max_depth=DEFAULT_TILE_MAX_DEPTH,
+    max_tile_count=DEFAULT_TILE_MAX_COUNT,
+) -> list:
+    """
+    A helper to split a large bounding box into tiles that are each expected to hold at most
+    `max_sensors_per_tile` sensors.
+
+    When `sensor_locations` are known, i.e., from an earlier query, tiles holding too many of
+    them are split into quarters, up to `max_depth` times, so dense areas get small tiles and
+    sparse areas large ones. Otherwise the box is split into an even grid sized for
+    `sensors_per_square_degree`, of at most `max_tile_count` tiles.
+
+    :param float nwlng: The longitude of the north west corner.
+    :param float nwlat: The latitude of the north west corner.
+    :param float selng: The longitude of the south east corner.
+    :param float selat: The latitude of the south east corner.
+    :param int max_sensors_per_tile: (optional) The most sensors a tile should hold.
+    :param float sensors_per_square_degree: (optional) The density assumed without `sensor_locations`.
+    :param list sensor_locations: (optional) ``(latitude, longitude)`` pairs of the known sensors.
+    :param int max_depth: (optional) The most times a tile is split into quarters.
+    :param int max_tile_count: (optional) The most tiles of the even grid.
+
+    :return list: A list of ``(nwlng, nwlat, selng, selat)`` tuples that cover the box.
+    :raises PurpleAirAPIError: If the box, `max_sensors_per_tile` or `max_tile_count` is invalid.
+    """
+
+    validate_bounding_box(nwlng, nwlat, selng, selat)
+    if type(max_sensors_per_tile) is not int or max_sensors_per_tile < 1:
+        raise PurpleAirAPIError(
+            f"`max_sensors_per_tile: {max_sensors_per_tile}` must be a positive integer!"
+        )
+
+    if type(max_tile_count) is not int or max_tile_count < 1:
+        raise PurpleAirAPIError(
+            f"`max_tile_count: {max_tile_count}` must be a positive integer!"
+        )
+
+    if sensor_locations is not None:
+
+        def split_tile(bounding_box, tile_locations, depth):
+            if len(tile_locations) <= max_sensors_per_tile or depth >= max_depth:
+                return [bounding_box]
+
+            tiles = []
+            middle_lng = (bounding_box[0] + bounding_box[2]) / 2
+            middle_lat = (bounding_box[1] + bounding_box[3]) / 2
+            for quarter_index, quarter in enumerate(quarter_bounding_box(bounding_box)):
+                is_east = quarter_index % 2 == 1
+                is_south = quarter_index >= 2
+                quarter_locations = [
+                    (latitude, longitude)
+                    for latitude, longitude in tile_locations
+                    if (longitude >= middle_lng) == is_east
+                    and (latitude < middle_lat) == is_south
+                ]
+                tiles.extend(split_tile(quarter, quarter_locations, depth + 1))
+
+            return tiles
+
+        box_locations = [
+            (latitude, longitude)
+            for latitude, longitude in sensor_locations
+            if latitude is not None
+            and longitude is not None
+            and selat <= latitude <= nwlat
+            and nwlng <= longitude <= selng
+        ]
+        return split_tile((nwlng, nwlat, selng, selat), box_locations, 0)
+
+    width = selng - nwlng
+    height = nwlat - selat
+    tile_count = min(
+        max_tile_count,
+        max(1, ceil(width * height * sensors_per_square_degree / max_sensors_per_tile)),
+    )
+    column_count = min(tile_count, max(1, round(sqrt(tile_count * width / height))))
+    row_count = min(ceil(tile_count / column_count), max_tile_count // column_count)
+    tile_width = width / column_count
+    tile_height = height / row_count
+    return [
+        (
+            nwlng + column * tile_width,
+            nwlat - row * tile_height,
+            selng if column == column_count - 1 else nwlng + (column + 1) * tile_width,
+            selat if row == row_count - 1 else nwlat - (row + 1) * tile_height,
+        )
+        for row in range(row_count)
+        for column in range(column_count)
+    ]
+
+
+def split_show_only(
+    show_only, read_keys=None, max_length=DEFAULT_MAX_REQUEST_URL_LENGTH
+) -> list:
+    """
+    A helper to split a `show_only` list of sensor indexes into batches whose ``show_only``
+    and ``read_keys`` values fit in `max_length` characters. When there is one read key for
+    each sensor index the keys are split with their sensors. Otherwise every batch is sent
+    with all of the read keys.
+
+    :param str | list show_only: A comma separated list of sensor_index values, or a list of them.
+    :param str | list read_keys: (optional) A comma separated list of read keys, or a list of them.
+    :param int max_length: (optional) The most characters the values of a batch may take up.
+
+    :return list: A list of ``(show_only, read_keys)`` tuples of comma separated strings, in the
+                  order the sensor indexes were given. `read_keys` is None if none were given.
+    :raises PurpleAirAPIError: If a single sensor index, with its read keys, does not fit.
+    """
+
+    def to_list(values):
+        if values is None:
+            return []
+
+        if isinstance(values, str):
+            values = values.split(",")
+
+        return [str(value).strip() for value in values if str(value).strip()]
+
+    sensor_indexes = to_list(show_only)
+    read_key_list = to_list(read_keys)
+    is_paired = len(read_key_list) == len(sensor_indexes)
+    shared_read_keys = (
+        None if is_paired or not read_key_list else ",".join(read_key_list)
+    )
+    shared_length = 0 if shared_read_keys is None else len(shared_read_keys)
+
+    batches = []
+    batch_indexes = []
+    batch_read_keys = []
+    batch_length = shared_length
+    for position, sensor_index in enumerate(sensor_indexes):
+        item_length = len(sensor_index) + 1
+        if is_paired and read_key_list:
+            item_length = item_length + len(read_key_list[position]) + 1
+
+        if shared_length + item_length > max_length:
+            raise PurpleAirAPIError(
+                f"`show_only` entry {sensor_index} does not fit in a request URL"
+            )
+
+        if batch_indexes and batch_length + item_length > max_length:
+            batches.append((batch_indexes, batch_read_keys))
+            batch_indexes = []
+            batch_read_keys = []
+            batch_length = shared_length
+
+        batch_indexes.append(sensor_index)
+        if is_paired and read_key_list:
+            batch_read_keys.append(read_key_list[position])
+
+        batch_length = batch_length + item_length
+
+    if batch_indexes:
+        batches.append((batch_indexes, batch_read_keys))
+
+    return [
+        (
+            ",".join(batch_indexes),
+            ",".join(batch_read_keys) if batch_read_keys else shared_read_keys,
+        )
+        for batch_indexes, batch_read_keys in batches
+    ]
+
+
+def merge_sensor_responses(sensor_responses, sensor_index_order=None) -> dict:
+    """
+    A helper to merge the JSON payloads of several multiple sensor requests, i.e., the tiles
+    of a bounding box, into one payload. A sensor that appears in more than one payload, such
+    as one on a tile edge, is kept once. Rows are sorted by ``sensor_index``, or put in
+    `sensor_index_order`, and their columns are put in the first payload's field order.
+
+    The merged ``time_stamp`` and ``data_time_stamp`` are the earliest of the payloads, so a
+    ``modified_since`` poll built from them does not skip updates a later payload saw.
+
+    :param list sensor_responses: The payloads, each with `fields` and `data`.
+    :param list sensor_index_order: (optional) The sensor indexes in the order the rows should
+                                    be in, i.e., the caller's `show_only` list. Rows of other
+                                    sensors follow in payload order.
+
+    :return dict: The first payload's top level keys with the merged `data`.
+    :raises PurpleAirAPIError: If there are no payloads, they have no `sensor_index` field, or
+                               their fields differ.
+    """
+
+    if not sensor_responses:
+        raise PurpleAirAPIError("At least one sensor payload must be provided to merge")
+
+    merged_response = dict(sensor_responses[0])
+    fields = merged_response.get("fields", [])
+    if "sensor_index" not in fields:
+        raise PurpleAirAPIError(
+            "The sensor payloads must include the `sensor_index` field to be merged"
+        )
+
+    sensor_index_position = fields.index("sensor_index")
+    rows_by_sensor_index = {}
+    for sensor_response in sensor_responses:
+        response_fields = sensor_response.get("fields", [])
+        positions = None
+        if response_fields != fields:
+            # Put the columns in the first payload's order
+            if sorted(response_fields) != sorted(fields):
+                raise PurpleAirAPIError(
+                    "The sensor payloads must all have the same fields to be merged"
+                )
+
+            positions = [response_fields.index(field) for field in fields]
+
+        for data_row in sensor_response.get("data", []):
+            if positions is not None:
+                data_row = [data_row[position] for position in positions]
+
+            rows_by_sensor_index.setdefault(data_row[sensor_index_position], data_row)
+
+    for time_stamp_name in ("time_stamp", "data_time_stamp"):
+        time_stamps = [
+            sensor_response[time_stamp_name]
+            for sensor_response in sensor_responses
+            if sensor_response.get(time_stamp_name) is not None
+        ]
+        if time_stamps:
+            merged_response[time_stamp_name] = min(time_stamps)
+
+    if sensor_index_order is None:
+        sensor_indexes = sorted(rows_by_sensor_index)
+
+    else:
+        # Match as strings, since a show_only list may hold strings or integers
+        unordered_sensor_indexes = {
+            str(sensor_index): sensor_index for sensor_index in rows_by_sensor_index
+        }
+        sensor_indexes = [
+            unordered_sensor_indexes.pop(str(sensor_index).strip())
+            for sensor_index in sensor_index_order
+            if str(sensor_index).strip() in unordered_sensor_indexes
+        ]
+        sensor_indexes.extend(unordered_sensor_indexes.values())
+
+    merged_response["data"] = [
+        rows_by_sensor_index[sensor_index] for sensor_index in sensor_indexes
+    ]
+    return merged_response
+
+
+def get_endpoint_name(request_url):
+    """
+    A helper to name the read endpoint a request URL is for.
+
+    :param str request_url: The request URL. i.e., ``https://api.purpleair.com/v1/groups/1234``.
+
+    :return str | None: One of READ_ENDPOINT_NAMES_LIST, or None if the URL is not for a known
+                        read endpoint.
+    """
+
+    segments = [segment for segment in urlsplit(request_url).path.split("/") if segment]
+    if "v1" in segments:
+        segments = segments[segments.index("v1") + 1 :]
+
+    if not segments:
+        return None
+
+    if segments[0] == "sensors":
+        if len(segments) == 1:
+            return "sensors"
+
+        if len(segments) == 2:
+            return "sensor"
+
+        if segments[2] == "history":
+            return "sensor_history"
+
+    elif segments[0] == "groups":
+        if len(segments) == 1:
+            return "groups"
+
+        if len(segments) == 2:
+            return "group"
+
+        if segments[2] == "members":
+            if len(segments) == 3:
+                return "members"
+
+            if len(segments) == 4:
+                return "member"
+
+            if segments[4] == "history":
+                return "member_history"
+
+    elif segments == ["organization"]:
+        return "organization"
+
+    return None
+
+
+def build_request_url(
     request_url,
-    api_key_to_use=None,
     first_optional_parameter_separator=None,
     optional_parameters_dict=None,
 ):
     """
-    A helper to send the url request. It can also add onto the
-    'request_url' string if 'optional_parameters_dict' are provided.
+    A helper to build the final request URL. It adds onto the 'request_url'
+    string if 'optional_parameters_dict' are provided.
 
     :param str request_url: The constructed URL request string.
-    :param str api_key_to_use: An optional API key included in the request header as 'X-API-Key'.
     :param str first_optional_parameter_separator: The separator between first parameter
                                                     in optional_parameters_dict. i.e., ``'?'`` or ``'&'``.
     :param dict optional_parameters_dict: Optional parameters that can be added onto the
                                             request_url.
 
-    :return dict | None: The parsed JSON response as a dictionary.
-    :raises PurpleAirAPIError: If the request URL is None, the separator is invalid, or the
-                               response contains an error status code.
+    :return str: The request URL with the optional parameters added and any quotes or
+                 whitespace stripped.
+    :raises PurpleAirAPIError: If the request URL is None or the separator is invalid.
     """
 
     if request_url is None:
@@ -140,101 +740,512 @@ def send_url_get_request(
     request_url = request_url.replace('"', "")
     # Strip away any whitespace that might persist
     request_url = request_url.replace(" ", "")
-    debug_log(request_url)
+    return request_url
+
+
+def parse_response_text(status_code, text):
+    """
+    A helper to turn a response's status code and text into the parsed JSON payload.
+
+    :param int status_code: The HTTP status code of the response.
+    :param bytes | str text: The response body.
+
+    :return dict | None: The parsed JSON response as a dictionary.
+    :raises PurpleAirAPIError: If the response contains an error status code. Error bodies that
+                               are empty, not JSON, or missing the ``error`` key are described
+                               by the status code and the start of the body instead.
+    """
+
+    if verify_request_status_codes(status_code):
+        return convert_requests_text_to_json(text)
+
+    try:
+        the_request_text_as_json = convert_requests_text_to_json(text)
+
+    except ValueError:
+        the_request_text_as_json = None
+
+    if (
+        isinstance(the_request_text_as_json, dict)
+        and "error" in the_request_text_as_json
+    ):
+        raise PurpleAirAPIError(
+            f"""{status_code}: {the_request_text_as_json['error']} - {the_request_text_as_json.get('description', '')}"""
+        )
+
+    if isinstance(text, (bytes, bytearray)):
+        text = bytes(text).decode("utf-8", errors="replace")
+
+    body_description = repr(text[:200]) if text else "empty body"
+    raise PurpleAirAPIError(
+        f"{status_code}: Unexpected error response - {body_description}"
+    )
+
+
+def create_session(
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    pool_block=False,
+    keep_alive=True,
+):
+    """
+    A helper to create a pooled HTTP session. Connections made through the
+    session are kept open and reused, so repeat requests to the same host skip
+    the TCP and TLS handshakes.
+
+    :param int pool_connections: The number of per-host connection pools to cache.
+    :param int pool_maxsize: The maximum number of connections to keep open per host.
+    :param bool pool_block: Whether to wait for a free connection when a host's pool is
+                            exhausted instead of opening a throwaway one.
+    :param bool keep_alive: Whether connections are kept open between requests.
+
+    :return requests.Session: The configured session.
+    :raises PurpleAirAPIError: If a pool size is not a positive integer.
+    """
+
+    for pool_param_name, pool_param in (
+        ("pool_connections", pool_connections),
+        ("pool_maxsize", pool_maxsize),
+    ):
+        if type(pool_param) is not int or pool_param < 1:
+            raise PurpleAirAPIError(
+                f"`{pool_param_name}: {pool_param}` must be a positive integer!"
+            )
+
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def _wrap_http_function(http_method, http_function, retry_policy=None, deadline=None):
+    """
+    An internal helper to wrap a `requests` style function, i.e., ``session.get``, so failed
+    attempts are sent again as the retry policy allows, and every attempt's timeout is cut
+    down to the time left before the deadline.
+
+    :param str http_method: The HTTP method. i.e., ``"GET"``.
+    :param function http_function: The function that sends the request.
+    :param PurpleAirRetryPolicy retry_policy: (optional) The retry policy.
+    :param PurpleAirDeadline deadline: (optional) The deadline every attempt must finish by.
+
+    :return function: A function with the same signature as `http_function`. When neither
+                      a retry policy nor a deadline is provided `http_function` is returned as is.
+    """
+
+    if retry_policy is None and deadline is None:
+        return http_function
+
+    max_attempts = 1 if retry_policy is None else retry_policy.max_attempts
+
+    def send_with_retries(request_url, **request_kwargs):
+        timeout = request_kwargs.pop("timeout", None)
+        attempt = 1
+        while True:
+            request_kwargs["timeout"] = (
+                timeout if deadline is None else deadline.clip(timeout)
+            )
+            try:
+                my_request = http_function(request_url, **request_kwargs)
+
+            except Exception as e:
+                if (
+                    attempt >= max_attempts
+                    or not retry_policy.should_retry_exception(http_method, e)
+                    or retry_policy.wait(
+                        http_method,
+                        request_url,
+                        attempt,
+                        exception=e,
+                        deadline=deadline,
+                    )
+                    is None
+                ):
+                    raise
+
+            else:
+                if attempt >= max_attempts or not retry_policy.should_retry_status(
+                    http_method, my_request.status_code
+                ):
+                    return my_request
+
+                retry_after = my_request.headers.get("Retry-After")
+                if (
+                    retry_policy.wait(
+                        http_method,
+                        request_url,
+                        attempt,
+                        status_code=my_request.status_code,
+                        retry_after=retry_after,
+                        deadline=deadline,
+                    )
+                    is None
+                ):
+                    return my_request
+
+                my_request.close()
+
+            attempt = attempt + 1
+
+    return send_with_retries
+
+
+def send_url_get_request(
+    request_url,
+    api_key_to_use=None,
+    first_optional_parameter_separator=None,
+    optional_parameters_dict=None,
+    session=None,
+    timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    retry_policy=None,
+    deadline=None,
+    return_body=False,
+):
+    """
+    A helper to send the url request. It can also add onto the
+    'request_url' string if 'optional_parameters_dict' are provided.
+
+    :param str request_url: The constructed URL request string.
+    :param str api_key_to_use: An optional API key included in the request header as 'X-API-Key'.
+    :param str first_optional_parameter_separator: The separator between first parameter
+                                                    in optional_parameters_dict. i.e., ``'?'`` or ``'&'``.
+    :param dict optional_parameters_dict: Optional parameters that can be added onto the
+                                            request_url.
+    :param requests.Session session: An optional session to send the request with. When not
+                                     provided a new connection is opened for the request.
+    :param float | tuple timeout: An optional number of seconds to wait for the server before giving
+                                  up. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS; None waits
+                                  without a limit.
+    :param PurpleAirRetryPolicy retry_policy: An optional policy to send failed requests again with.
+    :param PurpleAirDeadline deadline: An optional deadline the request, including its retries,
+                                       must finish by. Its timeout is cut down to the time left.
+    :param bool return_body: When True the raw response body is returned as well, i.e., for a
+                             cache to keep.
+
+    :return dict | None: The parsed JSON response as a dictionary, or a
+                         ``(parsed response, bytes body)`` tuple when `return_body` is True.
+    :raises PurpleAirAPIError: If the request URL is None, the separator is invalid, or the
+                               response contains an error status code.
+    """
+
+    request_url = build_request_url(
+        request_url, first_optional_parameter_separator, optional_parameters_dict
+    )
+    debug_log("send_url_get_request - request_url: %s", request_url)
     my_request = None
+    http_get = _wrap_http_function(
+        "GET",
+        get if session is None else session.get,
+        retry_policy,
+        deadline,
+    )
 
     # If any API key is provided use it
     if api_key_to_use is not None:
-        my_request = get(request_url, headers={"X-API-Key": str(api_key_to_use)})
+        my_request = http_get(
+            request_url, headers={"X-API-Key": str(api_key_to_use)}, timeout=timeout
+        )
 
     # No API key provided
     else:
-        my_request = get(request_url)
+        my_request = http_get(request_url, timeout=timeout)
 
-    the_request_text_as_json = convert_requests_text_to_json(my_request.text)
+    body = my_request.content
+    the_request_text_as_json = parse_response_text(my_request.status_code, body)
+    my_request.close()
+    del my_request
+    if return_body:
+        return the_request_text_as_json, body
 
-    if verify_request_status_codes(my_request.status_code):
-        my_request.close()
-        del my_request
-        return the_request_text_as_json
-
-    else:
-        raise PurpleAirAPIError(
-            f"""{my_request.status_code}: {the_request_text_as_json['error']} - {the_request_text_as_json['description']}"""
-        )
+    return the_request_text_as_json
 
 
-def send_url_post_request(request_url, api_key_to_use, json_post_parameters={}):
+def send_url_post_request(
+    request_url,
+    api_key_to_use,
+    json_post_parameters={},
+    session=None,
+    timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    retry_policy=None,
+    deadline=None,
+):
     """
     Send a POST request to the given URL.
 
     :param str request_url: The constructed URL request string.
     :param str api_key_to_use: The API key to include in the request header.
     :param dict json_post_parameters: Optional JSON body parameters to include in the request.
+    :param requests.Session session: An optional session to send the request with. When not
+                                     provided a new connection is opened for the request.
+    :param float | tuple timeout: An optional number of seconds to wait for the server before giving
+                                  up. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS; None waits
+                                  without a limit.
+    :param PurpleAirRetryPolicy retry_policy: An optional policy to send failed requests again with.
+    :param PurpleAirDeadline deadline: An optional deadline the request, including its retries,
+                                       must finish by. Its timeout is cut down to the time left.
 
     :return dict | None: The parsed JSON response as a dictionary.
     :raises PurpleAirAPIError: If the response contains an error status code.
     """
 
-    debug_log(request_url)
+    debug_log("send_url_post_request - request_url: %s", request_url)
     my_request = None
+    http_post = _wrap_http_function(
+        "POST",
+        post if session is None else session.post,
+        retry_policy,
+        deadline,
+    )
     if json_post_parameters:
-        debug_log(json_post_parameters)
-        my_request = post(
+        debug_log("send_url_post_request - json: %s", json_post_parameters)
+        my_request = http_post(
             request_url,
             headers={"X-API-Key": str(api_key_to_use)},
             json=json_post_parameters,
+            timeout=timeout,
         )
 
     else:
-        debug_log(json_post_parameters)
-        my_request = post(request_url, headers={"X-API-Key": str(api_key_to_use)})
-
-    the_request_text_as_json = convert_requests_text_to_json(my_request.text)
-
-    if verify_request_status_codes(my_request.status_code):
-        my_request.close()
-        del my_request
-        return the_request_text_as_json
-
-    else:
-        raise PurpleAirAPIError(
-            f"""{my_request.status_code}: {the_request_text_as_json['error']} - {the_request_text_as_json['description']}"""
+        debug_log("send_url_post_request - json: %s", json_post_parameters)
+        my_request = http_post(
+            request_url, headers={"X-API-Key": str(api_key_to_use)}, timeout=timeout
         )
 
+    the_request_text_as_json = parse_response_text(
+        my_request.status_code, my_request.content
+    )
+    my_request.close()
+    del my_request
+    return the_request_text_as_json
+
 
-def send_url_delete_request(request_url, api_key_to_use, json_post_parameters={}):
+def send_url_delete_request(
+    request_url,
+    api_key_to_use,
+    json_post_parameters={},
+    session=None,
+    timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    retry_policy=None,
+    deadline=None,
+):
     """
     Send a DELETE request to the given URL.
 
     :param str request_url: The constructed URL request string.
     :param str api_key_to_use: The API key to include in the request header.
     :param dict json_post_parameters: Optional JSON body parameters to include in the request.
+    :param requests.Session session: An optional session to send the request with. When not
+                                     provided a new connection is opened for the request.
+    :param float | tuple timeout: An optional number of seconds to wait for the server before giving
+                                  up. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS; None waits
+                                  without a limit.
+    :param PurpleAirRetryPolicy retry_policy: An optional policy to send failed requests again with.
+    :param PurpleAirDeadline deadline: An optional deadline the request, including its retries,
+                                       must finish by. Its timeout is cut down to the time left.
 
     :return dict | None: The parsed JSON response as a dictionary.
     :raises PurpleAirAPIError: If the response contains an error status code.
     """
 
-    debug_log(request_url)
+    debug_log("send_url_delete_request - request_url: %s", request_url)
     my_request = None
+    http_delete = _wrap_http_function(
+        "DELETE",
+        delete if session is None else session.delete,
+        retry_policy,
+        deadline,
+    )
     if json_post_parameters:
-        my_request = delete(
+        my_request = http_delete(
             request_url,
             headers={"X-API-Key": str(api_key_to_use)},
             json=json_post_parameters,
+            timeout=timeout,
         )
 
     else:
-        my_request = delete(request_url, headers={"X-API-Key": str(api_key_to_use)})
+        my_request = http_delete(
+            request_url, headers={"X-API-Key": str(api_key_to_use)}, timeout=timeout
+        )
 
-    the_request_text_as_json = convert_requests_text_to_json(my_request.text)
+    the_request_text_as_json = parse_response_text(
+        my_request.status_code, my_request.content
+    )
+    my_request.close()
+    del my_request
+    return the_request_text_as_json
 
-    if verify_request_status_codes(my_request.status_code):
-        my_request.close()
-        del my_request
-        return the_request_text_as_json
 
-    else:
+def _csv_value_converter(field_name):
+    """
+    An internal helper to pick the function that turns one CSV cell of a field into its type.
+    The type comes from the field's default in ACCEPTED_FIELD_NAMES_DICT. Fields not found
+    there, i.e., ``time_stamp``, become an int, then a float, and otherwise stay a string.
+    Empty cells become None.
+
+    :param str field_name: The PurpleAir field name of the column.
+
+    :return function: A function that converts one cell string.
+    """
+
+    default_value = ACCEPTED_FIELD_NAMES_DICT.get(field_name)
+
+    if isinstance(default_value, str):
+        return lambda value: value if value != "" else None
+
+    if isinstance(default_value, float):
+
+        def convert_float(value):
+            try:
+                return float(value)
+
+            except ValueError:
+                return value if value != "" else None
+
+        return convert_float
+
+    def convert_number(value):
+        try:
+            return int(value)
+
+        except ValueError:
+            try:
+                return float(value)
+
+            except ValueError:
+                return value if value != "" else None
+
+    return convert_number
+
+
+def parse_csv_lines(lines, batch_size=None):
+    """
+    A helper to turn an iterable of CSV lines, starting with the header line, into typed rows.
+    Lines are consumed one at a time so the whole body is never held in memory. Blank lines
+    are skipped.
+
+    :param iterable lines: The CSV lines as strings, with their line endings so a quoted value
+                           can span lines. i.e., `send_url_get_stream_request` or a file opened
+                           with ``newline=""``.
+    :param int batch_size: (optional) When provided, yield dictionaries mapping each field name
+                           to a list of up to `batch_size` values instead of one row at a time.
+
+    :return generator: Yields one dictionary per row, or one dictionary of columns per batch.
+    :raises PurpleAirAPIError: If `batch_size` is not a positive integer.
+    """
+
+    if batch_size is not None and (type(batch_size) is not int or batch_size < 1):
         raise PurpleAirAPIError(
-            f"""{my_request.status_code}: {the_request_text_as_json['error']} - {the_request_text_as_json['description']}"""
+            f"`batch_size: {batch_size}` must be a positive integer!"
         )
+
+    csv_rows = (csv_row for csv_row in reader(lines) if csv_row)
+    fields = next(csv_rows, None)
+    if fields is None:
+        return
+
+    converters = [_csv_value_converter(field_name) for field_name in fields]
+
+    if batch_size is None:
+        for csv_row in csv_rows:
+            yield {
+                field_name: converter(value)
+                for field_name, converter, value in zip(fields, converters, csv_row)
+            }
+
+        return
+
+    batch = {field_name: [] for field_name in fields}
+    batch_row_count = 0
+    for csv_row in csv_rows:
+        for field_name, converter, value in zip(fields, converters, csv_row):
+            batch[field_name].append(converter(value))
+
+        batch_row_count = batch_row_count + 1
+        if batch_row_count == batch_size:
+            yield batch
+            batch = {field_name: [] for field_name in fields}
+            batch_row_count = 0
+
+    if batch_row_count:
+        yield batch
+
+
+def send_url_get_stream_request(
+    request_url,
+    api_key_to_use=None,
+    first_optional_parameter_separator=None,
+    optional_parameters_dict=None,
+    session=None,
+    timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    chunk_size=DEFAULT_CSV_STREAM_CHUNK_SIZE,
+    retry_policy=None,
+    deadline=None,
+):
+    """
+    A helper to send a GET request and yield the response body line by line as it arrives.
+    Each line keeps its line ending, so `csv.reader` can tell a quoted CSV value that holds a
+    newline from the end of a row. An error response is read in full, since it
+    is a small JSON payload, and raised.
+
+    See `send_url_get_request` for the other parameters.
+
+    :param int chunk_size: The number of bytes to read from the connection at a time.
+
+    :return generator: Yields each line of the response body as a string, with its line ending.
+    :raises PurpleAirAPIError: If the request URL is None, the separator is invalid, or the
+                               response contains an error status code.
+    """
+
+    request_url = build_request_url(
+        request_url, first_optional_parameter_separator, optional_parameters_dict
+    )
+    debug_log("send_url_get_stream_request - request_url: %s", request_url)
+    http_get = _wrap_http_function(
+        "GET",
+        get if session is None else session.get,
+        retry_policy,
+        deadline,
+    )
+    headers = {} if api_key_to_use is None else {"X-API-Key": str(api_key_to_use)}
+    my_request = http_get(request_url, headers=headers, timeout=timeout, stream=True)
+
+    try:
+        if my_request.status_code not in SUCCESS_CODE_LIST:
+            parse_response_text(my_request.status_code, my_request.content)
+
+        if my_request.encoding is None:
+            my_request.encoding = "utf-8"
+
+        # Split on "\n" only, so "\r\n" stays in one line and no line ending is dropped
+        partial_line = ""
+        for text in my_request.iter_content(chunk_size=chunk_size, decode_unicode=True):
+            lines = (partial_line + text).split("\n")
+            partial_line = lines.pop()
+            for line in lines:
+                yield line + "\n"
+
+        if partial_line:
+            yield partial_line
+
+    finally:
+        my_request.close()
+
+
+# Module setup, run once every helper above is defined
+_json_decoder_name = None
+_json_loads = loads
+_debug_handler = None
+set_json_decoder()
+
+if PRINT_DEBUG_MSGS:
+    enable_debug_messages()
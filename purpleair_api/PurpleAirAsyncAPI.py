@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class designed to fetch data from Purple Air's new API with asyncio.
+https://api.purpleair.com/#api-welcome
+"""
+
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import debug_log
+from purpleair_api.PurpleAirAsyncHelpers import async_send_url_get_request
+from purpleair_api.PurpleAirAsyncReadAPI import AsyncPurpleAirReadAPI
+from purpleair_api.PurpleAirAsyncWriteAPI import AsyncPurpleAirWriteAPI
+from purpleair_api.PurpleAirAsyncLocalAPI import AsyncPurpleAirLocalAPI
+
+_logger = getLogger(__name__)
+
+
+class AsyncPurpleAirAPI(
+    AsyncPurpleAirReadAPI, AsyncPurpleAirWriteAPI, AsyncPurpleAirLocalAPI
+):
+    """
+    The AsyncPurpleAirAPI class designed to send valid PurpleAirAPI
+    requests from an asyncio event loop. The API keys are checked over
+    the network, so build instances with the awaitable `create`::
+
+        async with await AsyncPurpleAirAPI.create(your_api_read_key) as my_paa:
+            retval = await my_paa.request_sensor_data(1234)
+    """
+
+    def __init__(
+        self,
+        your_api_read_key=None,
+        your_api_write_key=None,
+        your_ipv4_address=None,
+        session=None,
+    ):
+        """
+        :param str your_api_read_key: A valid PurpleAirAPI Read key
+        :param str your_api_write_key: A valid PurpleAirAPI Write key
+        :param list your_ipv4_address: A list of IPv4 address strings for your PurpleAir sensor(s).
+        :param aiohttp.ClientSession session: (optional) A session shared by the read, write and
+                                              local requests. When not provided one is created
+                                              with `create_async_session` on the first request.
+        """
+
+        # We can not have all three parameters be empty
+        if (
+            your_api_read_key is None
+            and your_api_write_key is None
+            and your_ipv4_address is None
+        ):
+            raise PurpleAirAPIError(
+                "Ensure that the right combination of parameters have been provided! "
+                + "`your_api_read_key` or `your_api_write_key` for external internet requests. Or "
+                + "just `your_ipv4_address` for local network requests"
+            )
+
+        # Place holders for information we care about
+        self._api_versions = {}
+        self._api_keys_last_checked = {}
+        self._api_key_types = {}
+
+        self._your_api_read_key = your_api_read_key
+        self._your_api_write_key = your_api_write_key
+        self._base_api_v1_request_string = None
+
+        if your_api_read_key is not None:
+            AsyncPurpleAirReadAPI.__init__(
+                self, api_read_key=your_api_read_key, session=session
+            )
+
+        if your_api_write_key is not None:
+            AsyncPurpleAirWriteAPI.__init__(
+                self, api_write_key=your_api_write_key, session=session
+            )
+
+        if your_ipv4_address is not None:
+            AsyncPurpleAirLocalAPI.__init__(
+                self, ipv4_address_list=your_ipv4_address, session=session
+            )
+
+        # One pooled session is shared by the read, write and local requests
+        self._owns_session = session is None
+        self._session = session
+
+    @classmethod
+    async def create(
+        cls,
+        your_api_read_key=None,
+        your_api_write_key=None,
+        your_ipv4_address=None,
+        session=None,
+    ):
+        """
+        A method to build an AsyncPurpleAirAPI and check its API keys.
+
+        :param str your_api_read_key: A valid PurpleAirAPI Read key
+        :param str your_api_write_key: A valid PurpleAirAPI Write key
+        :param list your_ipv4_address: A list of IPv4 address strings for your PurpleAir sensor(s).
+        :param aiohttp.ClientSession session: (optional) A session shared by all requests.
+
+        :return AsyncPurpleAirAPI: The instance with its API keys checked.
+        :raises PurpleAirAPIError: If a key fails validation or is the wrong key type.
+        """
+
+        my_paa = cls(your_api_read_key, your_api_write_key, your_ipv4_address, session)
+
+        try:
+            await my_paa.check_api_keys()
+
+        except BaseException:
+            await my_paa.close()
+            raise
+
+        return my_paa
+
+    async def check_api_keys(self):
+        """
+        A method to check that the read and write keys are valid and of the right type.
+
+        :raises PurpleAirAPIError: If a key fails validation or is the wrong key type.
+        """
+
+        if self._your_api_read_key is not None:
+            await self._check_an_api_key(self._your_api_read_key)
+            if self._api_key_types[self._your_api_read_key] != "READ":
+                raise PurpleAirAPIError("Ensure 'your_api_read_key' is a read key.")
+
+        if self._your_api_write_key is not None:
+            await self._check_an_api_key(self._your_api_write_key)
+            if self._api_key_types[self._your_api_write_key] != "WRITE":
+                raise PurpleAirAPIError("Ensure 'your_api_write_key' is a write key")
+
+        debug_log(
+            "_api_key_types contains %s key(s)",
+            len(self._api_key_types),
+            logger=_logger,
+        )
+
+    async def _check_an_api_key(self, str_api_key_to_check):
+        """
+        An internal class helper method to check if an API key is valid.
+
+        :param str str_api_key_to_check: A valid PurpleAirAPI key to check
+
+        :return bool: True if the API key can be successfully verified.
+        :raises PurpleAirAPIError: If the key validation request fails.
+        """
+
+        request_url = self._base_api_v1_request_string + "keys"
+        the_request_text_as_json = await async_send_url_get_request(
+            request_url, self._get_session(), api_key_to_use=str_api_key_to_check
+        )
+
+        self._api_versions[str_api_key_to_check] = the_request_text_as_json[
+            "api_version"
+        ]
+        self._api_keys_last_checked[str_api_key_to_check] = the_request_text_as_json[
+            "time_stamp"
+        ]
+        self._api_key_types[str_api_key_to_check] = the_request_text_as_json[
+            "api_key_type"
+        ]
+
+        return True
+
+    @property
+    def get_api_versions(self):
+        """
+        A method to return the API versions being used for both read/write keys.
+        """
+
+        return self._api_versions
+
+    @property
+    def get_api_key_last_checked(self):
+        """
+        A method to return the timestamp of when the API read/write keys were last checked.
+        """
+
+        return self._api_keys_last_checked
+
+    @property
+    def get_api_key_type(self):
+        """
+        A method to return the API key types being used.
+        """
+
+        return self._api_key_types
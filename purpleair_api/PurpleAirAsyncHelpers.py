@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 file containing asyncio helper functions for the AsyncPurpleAirAPI files.
+Requests are sent with aiohttp, which is installed with ``pip install purpleair_api[async]``.
+https://api.purpleair.com/#api-welcome
+"""
+
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_ASYNC_CONNECTION_LIMIT,
+    DEFAULT_POOL_MAXSIZE,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import (
+    build_request_url,
+    debug_log,
+    parse_response_text,
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_logger = getLogger(__name__)
+
+
+def create_async_session(
+    limit=DEFAULT_ASYNC_CONNECTION_LIMIT,
+    limit_per_host=DEFAULT_POOL_MAXSIZE,
+    keepalive_timeout=15.0,
+):
+    """
+    A helper to create a pooled aiohttp session. This must be called while an
+    event loop is running.
+
+    :param int limit: The maximum number of connections open at once across all hosts.
+    :param int limit_per_host: The maximum number of connections open at once per host.
+    :param float keepalive_timeout: The number of seconds an idle connection is kept open.
+
+    :return aiohttp.ClientSession: The configured session.
+    :raises PurpleAirAPIError: If aiohttp is not installed.
+    """
+
+    if aiohttp is None:
+        raise PurpleAirAPIError(
+            "The async API requires aiohttp. Install it with `pip install purpleair_api[async]`"
+        )
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def _send_async_request(http_method, request_url, headers, json_parameters):
+    """
+    An internal helper to send a request with an aiohttp style method and parse the response.
+
+    :param http_method: The session method to call. i.e., ``session.get``.
+    :param str request_url: The final request URL.
+    :param dict headers: The request headers, or None.
+    :param dict json_parameters: The JSON body to send, or None.
+
+    :return dict | None: The parsed JSON response as a dictionary.
+    :raises PurpleAirAPIError: If the response contains an error status code.
+    """
+
+    request_kwargs = {}
+    if headers is not None:
+        request_kwargs["headers"] = headers
+
+    if json_parameters:
+        request_kwargs["json"] = json_parameters
+
+    async with http_method(request_url, **request_kwargs) as my_response:
+        text = await my_response.read()
+        status_code = my_response.status
+
+    return parse_response_text(status_code, text)
+
+
+async def async_send_url_get_request(
+    request_url,
+    session,
+    api_key_to_use=None,
+    first_optional_parameter_separator=None,
+    optional_parameters_dict=None,
+):
+    """
+    The asyncio counterpart of `send_url_get_request`.
+
+    :param str request_url: The constructed URL request string.
+    :param aiohttp.ClientSession session: The session to send the request with.
+    :param str api_key_to_use: An optional API key included in the request header as 'X-API-Key'.
+    :param str first_optional_parameter_separator: The separator between first parameter
+                                                    in optional_parameters_dict. i.e., ``'?'`` or ``'&'``.
+    :param dict optional_parameters_dict: Optional parameters that can be added onto the
+                                            request_url.
+
+    :return dict | None: The parsed JSON response as a dictionary.
+    :raises PurpleAirAPIError: If the request URL is None, the separator is invalid, or the
+                               response contains an error status code.
+    """
+
+    request_url = build_request_url(
+        request_url, first_optional_parameter_separator, optional_parameters_dict
+    )
+    debug_log(
+        "async_send_url_get_request - request_url: %s", request_url, logger=_logger
+    )
+
+    headers = None
+    if api_key_to_use is not None:
+        headers = {"X-API-Key": str(api_key_to_use)}
+
+    return await _send_async_request(session.get, request_url, headers, None)
+
+
+async def async_send_url_post_request(
+    request_url, session, api_key_to_use, json_post_parameters=None
+):
+    """
+    The asyncio counterpart of `send_url_post_request`.
+
+    :param str request_url: The constructed URL request string.
+    :param aiohttp.ClientSession session: The session to send the request with.
+    :param str api_key_to_use: The API key to include in the request header.
+    :param dict json_post_parameters: Optional JSON body parameters to include in the request.
+
+    :return dict | None: The parsed JSON response as a dictionary.
+    :raises PurpleAirAPIError: If the response contains an error status code.
+    """
+
+    debug_log(
+        "async_send_url_post_request - request_url: %s", request_url, logger=_logger
+    )
+    return await _send_async_request(
+        session.post,
+        request_url,
+        {"X-API-Key": str(api_key_to_use)},
+        json_post_parameters,
+    )
+
+
+async def async_send_url_delete_request(
+    request_url, session, api_key_to_use, json_post_parameters=None
+):
+    """
+    The asyncio counterpart of `send_url_delete_request`.
+
+    :param str request_url: The constructed URL request string.
+    :param aiohttp.ClientSession session: The session to send the request with.
+    :param str api_key_to_use: The API key to include in the request header.
+    :param dict json_post_parameters: Optional JSON body parameters to include in the request.
+
+    :return dict | None: The parsed JSON response as a dictionary.
+    :raises PurpleAirAPIError: If the response contains an error status code.
+    """
+
+    debug_log(
+        "async_send_url_delete_request - request_url: %s", request_url, logger=_logger
+    )
+    return await _send_async_request(
+        session.delete,
+        request_url,
+        {"X-API-Key": str(api_key_to_use)},
+        json_post_parameters,
+    )
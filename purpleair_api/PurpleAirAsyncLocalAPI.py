@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class designed to fetch data from PurpleAir sensors on the local network with asyncio.
+This class will handle all async `local` requests
+https://api.purpleair.com/#api-welcome
+"""
+
+from asyncio import TimeoutError as AsyncTimeoutError, gather, wait_for
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import USE_CLIENT_TIMEOUT, debug_log
+from purpleair_api.PurpleAirLocalAPI import PurpleAirLocalAPI
+from purpleair_api.PurpleAirAsyncHelpers import (
+    aiohttp,
+    async_send_url_get_request,
+    create_async_session,
+)
+
+_logger = getLogger(__name__)
+
+# The failures of one sensor that are returned as its error entry instead of raised
+_SENSOR_REQUEST_EXCEPTIONS = (PurpleAirAPIError, AsyncTimeoutError, ValueError)
+if aiohttp is not None:
+    _SENSOR_REQUEST_EXCEPTIONS += (aiohttp.ClientError,)
+
+
+class AsyncPurpleAirLocalAPI:
+    """
+    The AsyncPurpleAirLocalAPI class designed to send valid local network
+    requests from an asyncio event loop. All sensors are requested at once.
+    """
+
+    def __init__(
+        self,
+        ipv4_address_list=None,
+        session=None,
+        timeout=DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS,
+    ):
+        """
+        :param list ipv4_address_list: A list of strings with valid IPv4 addresses for your
+                                       sensors. The addresses do not need a CIDR prefix.
+        :param aiohttp.ClientSession session: (optional) A session to send requests with. When
+                                              not provided one is created with
+                                              `create_async_session` on the first request.
+        :param (optional) float | tuple timeout: The number of seconds to wait for each sensor,
+                                                 or a ``(connect, read)`` tuple whose parts are
+                                                 added up, used when a request does not pass
+                                                 its own. Defaults to
+                                                 DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS; None
+                                                 waits without a limit.
+        """
+        # Reuse the synchronous address validation, it never touches the network
+        PurpleAirLocalAPI._validate_ipv4_address_list(ipv4_address_list)
+
+        self._base_api_local_network_request_string_dict = dict()
+        for address in ipv4_address_list:
+            self._base_api_local_network_request_string_dict[address] = (
+                f"http://{address}/json"
+            )
+
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = session
+        self._timeout = timeout
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        """
+        An internal helper to return the session, creating it inside the running event loop
+        on first use.
+
+        :return aiohttp.ClientSession: The session to send requests with.
+        """
+
+        if self._session is None:
+            self._session = create_async_session()
+
+        return self._session
+
+    async def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request_one_sensor(self, address, session, timeout, deadline):
+        """
+        An internal helper to request one local sensor, turning its failure into an error entry
+        so the other sensors of the sweep still return their data.
+
+        :param str address: The IPv4 address of the sensor.
+        :param aiohttp.ClientSession session: The session to send the request with.
+        :param float | tuple timeout: The number of seconds to wait for the sensor, or None.
+        :param PurpleAirDeadline deadline: A deadline the request must finish by, or None.
+
+        :return dict: The sensor data payload, or
+                      ``{"error": "<exception name>", "description": "<message>"}``.
+        """
+
+        try:
+            if deadline is not None:
+                timeout = deadline.clip(timeout)
+
+            if isinstance(timeout, tuple):
+                timeout = None if None in timeout else sum(timeout)
+
+            return await wait_for(
+                async_send_url_get_request(
+                    self._base_api_local_network_request_string_dict[address], session
+                ),
+                timeout,
+            )
+
+        except _SENSOR_REQUEST_EXCEPTIONS as e:
+            debug_log(
+                "request_local_sensor_data - %s failed: %s",
+                address,
+                e,
+                logger=_logger,
+            )
+            return {"error": type(e).__name__, "description": str(e)}
+
+    async def request_local_sensor_data(
+        self, timeout=USE_CLIENT_TIMEOUT, deadline=None
+    ) -> dict:
+        """
+        A method to request data from one or more local sensors. Each sensor must be accessible
+        on the local network. The sensors are requested concurrently, like the concurrent mode
+        of `PurpleAirLocalAPI.request_local_sensor_data`: a sensor that fails or times out gets
+        an error entry of the form ``{"error": "<exception name>", "description": "<message>"}``
+        while the others still return their data.
+
+        :param (optional) float | tuple timeout: The number of seconds to wait for each sensor.
+                                                 Defaults to the client's timeout. None waits
+                                                 without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline the whole sweep must finish by.
+                                                      A sensor that runs out of time gets an
+                                                      error entry.
+
+        :return dict: A dictionary mapping each IPv4 address to its sensor data payload.
+        """
+
+        if timeout is USE_CLIENT_TIMEOUT:
+            timeout = self._timeout
+
+        session = self._get_session()
+        addresses = list(self._base_api_local_network_request_string_dict.keys())
+        request_values = await gather(
+            *(
+                self._request_one_sensor(address, session, timeout, deadline)
+                for address in addresses
+            )
+        )
+
+        return dict(zip(addresses, request_values))
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class designed to fetch data from Purple Air's new API with asyncio.
+This class will handle all async `read` requests
+https://api.purpleair.com/#api-welcome
+"""
+
+from asyncio import Semaphore, gather
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_HISTORY_MAX_WORKERS
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import (
+    merge_history_responses,
+    split_history_time_range,
+)
+from purpleair_api.PurpleAirColumnarData import PurpleAirColumnarData
+from purpleair_api.PurpleAirAsyncHelpers import (
+    async_send_url_get_request,
+    create_async_session,
+)
+
+
+class AsyncPurpleAirReadAPI:
+    """
+    The AsyncPurpleAirReadAPI class designed to send valid
+    read requests from an asyncio event loop. Every method mirrors
+    its `PurpleAirReadAPI` counterpart and must be awaited.
+    """
+
+    def __init__(self, api_read_key=None, session=None):
+        """
+        :param str api_read_key: A valid PurpleAir API read key.
+        :param aiohttp.ClientSession session: (optional) A session to send requests with. When
+                                              not provided one is created with
+                                              `create_async_session` on the first request.
+        """
+        # Save off the API key for internal usage
+        self._your_api_read_key = api_read_key
+        self._base_api_v1_request_string = "https://api.purpleair.com/v1/"
+
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        """
+        An internal helper to return the session, creating it inside the running event loop
+        on first use.
+
+        :return aiohttp.ClientSession: The session to send requests with.
+        """
+
+        if self._session is None:
+            self._session = create_async_session()
+
+        return self._session
+
+    async def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get(
+        self,
+        request_url,
+        first_optional_parameter_separator=None,
+        optional_parameters_dict=None,
+    ):
+        """
+        An internal helper to send a GET request with the read key.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        return await async_send_url_get_request(
+            request_url,
+            self._get_session(),
+            self._your_api_read_key,
+            first_optional_parameter_separator,
+            optional_parameters_dict,
+        )
+
+    async def request_sensor_data(self, sensor_index, read_key=None, fields=None):
+        """
+        A method to retrieve sensor data from one sensor.
+        See `PurpleAirReadAPI.request_sensor_data` for the parameters.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        request_url = self._base_api_v1_request_string + "sensors/" + f"{sensor_index}"
+        optional_parameters_dict = {"read_key": read_key, "fields": fields}
+        return await self._get(request_url, "?", optional_parameters_dict)
+
+    async def request_multiple_sensors_data(
+        self,
+        fields,
+        location_type=None,
+        read_keys=None,
+        show_only=None,
+        modified_since=None,
+        max_age=None,
+        nwlng=None,
+        nwlat=None,
+        selng=None,
+        selat=None,
+        columnar=False,
+    ):
+        """
+        A method to retrieve sensor data from multiple sensors.
+        See `PurpleAirReadAPI.request_multiple_sensors_data` for the parameters.
+
+        :return dict | PurpleAirColumnarData | None: A python dictionary containing the payload response,
+                                                      or its typed columns when `columnar` is True
+        """
+
+        request_url = (
+            self._base_api_v1_request_string + "sensors/" + f"?fields={fields}"
+        )
+        optional_parameters_dict = {
+            "location_type": location_type,
+            "read_keys": read_keys,
+            "show_only": show_only,
+            "modified_since": modified_since,
+            "max_age": max_age,
+            "nwlng": nwlng,
+            "nwlat": nwlat,
+            "selng": selng,
+            "selat": selat,
+        }
+        the_request_text_as_json = await self._get(
+            request_url, "&", optional_parameters_dict
+        )
+
+        if columnar:
+            return PurpleAirColumnarData.from_response(the_request_text_as_json)
+
+        return the_request_text_as_json
+
+    async def request_sensor_historic_data(
+        self,
+        sensor_index,
+        fields,
+        csv_data_format=False,
+        read_key=None,
+        privacy=None,
+        start_timestamp=None,
+        end_timestamp=None,
+        average=None,
+    ):
+        """
+        A method to request historic data from a single sensor.
+        See `PurpleAirReadAPI.request_sensor_historic_data` for the parameters.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        history_url_portion = "/history/csv" if csv_data_format else "/history"
+        request_url = (
+            self._base_api_v1_request_string
+            + "sensors/"
+            + f"{sensor_index}"
+            + f"{history_url_portion}"
+            + f"?fields={fields}"
+        )
+        optional_parameters_dict = {
+            "read_key": read_key,
+            "privacy": privacy,
+            "start_timestamp": start_timestamp,
+            "end_timestamp": end_timestamp,
+            "average": average,
+        }
+        return await self._get(request_url, "&", optional_parameters_dict)
+
+    async def request_sensor_historic_data_range(
+        self,
+        sensor_index,
+        fields,
+        start_timestamp,
+        end_timestamp,
+        average=None,
+        read_key=None,
+        privacy=None,
+        max_workers=DEFAULT_HISTORY_MAX_WORKERS,
+    ):
+        """
+        A method to request historic data from a single sensor over a range longer than one
+        request may cover. At most `max_workers` windows are requested at once.
+        See `PurpleAirReadAPI.request_sensor_historic_data_range` for the parameters.
+
+        :return dict: A python dictionary containing the merged payload response
+        """
+
+        time_windows = split_history_time_range(start_timestamp, end_timestamp, average)
+
+        if type(max_workers) is not int or max_workers < 1:
+            raise PurpleAirAPIError(
+                f"`max_workers: {max_workers}` must be a positive integer!"
+            )
+
+        semaphore = Semaphore(max_workers)
+
+        async def request_time_window(time_window):
+            async with semaphore:
+                return await self.request_sensor_historic_data(
+                    sensor_index,
+                    fields,
+                    read_key=read_key,
+                    privacy=privacy,
+                    start_timestamp=time_window[0],
+                    end_timestamp=time_window[1],
+                    average=average,
+                )
+
+        history_responses = await gather(
+            *(request_time_window(time_window) for time_window in time_windows)
+        )
+
+        return merge_history_responses(
+            list(history_responses), start_timestamp, end_timestamp
+        )
+
+    async def request_group_detail_data(self, group_id):
+        """
+        A method to retrieve a list of all members of a specified group.
+
+        :param int group_id: The group_id of the requested group. This group must be owned by the api_key.
+
+        :return dict | None: A dictionary containing the group detail payload response.
+        """
+
+        request_url = self._base_api_v1_request_string + f"groups/{group_id}"
+        return await self._get(request_url)
+
+    async def request_group_list_data(self):
+        """
+        A method to retrieve a list of all groups owned by the provided api_key.
+
+        :return dict | None: A dictionary containing the list of groups.
+        """
+
+        request_url = self._base_api_v1_request_string + f"groups/"
+        return await self._get(request_url)
+
+    async def request_member_data(self, group_id, member_id, fields=None):
+        """
+        A method to get a members' data from a group to which said member belongs.
+        See `PurpleAirReadAPI.request_member_data` for the parameters.
+
+        :return dict | None: A dictionary containing the member data payload.
+        """
+
+        request_url = (
+            self._base_api_v1_request_string + f"groups/{group_id}/members/{member_id}"
+        )
+        return await self._get(request_url, "?", {"fields": fields})
+
+    async def request_member_historic_data(
+        self,
+        group_id,
+        member_id,
+        fields,
+        privacy=None,
+        start_timestamp=None,
+        end_timestamp=None,
+        average=None,
+    ):
+        """
+        A method to get a member's historic data from a group to which said member belongs.
+        See `PurpleAirReadAPI.request_member_historic_data` for the parameters.
+
+        :return dict | None: A dictionary containing the member historic data payload.
+        """
+
+        request_url = (
+            self._base_api_v1_request_string
+            + f"groups/{group_id}/members/{member_id}/history?fields={fields}"
+        )
+        optional_parameters_dict = {
+            "privacy": privacy,
+            "start_timestamp": start_timestamp,
+            "end_timestamp": end_timestamp,
+            "average": average,
+        }
+        return await self._get(request_url, "&", optional_parameters_dict)
+
+    async def request_members_data(
+        self,
+        group_id,
+        fields,
+        location_type=None,
+        read_keys=None,
+        show_only=None,
+        modified_since=None,
+        max_age=None,
+        nwlng=None,
+        nwlat=None,
+        selng=None,
+        selat=None,
+    ):
+        """
+        A method to get multiple members' data from a group to which said members belong.
+        See `PurpleAirReadAPI.request_members_data` for the parameters.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        request_url = (
+            self._base_api_v1_request_string
+            + f"groups/{group_id}/members?fields={fields}"
+        )
+        optional_parameters_dict = {
+            "location_type": location_type,
+            "read_keys": read_keys,
+            "show_only": show_only,
+            "modified_since": modified_since,
+            "max_age": max_age,
+            "nwlng": nwlng,
+            "nwlat": nwlat,
+            "selng": selng,
+            "selat": selat,
+        }
+        return await self._get(request_url, "&", optional_parameters_dict)
+
+    async def request_organization_data(self):
+        """
+        Retrieves information for the organization using the api key of this class instance.
+
+        :return dict | None: A dictionary containing the organization information.
+        """
+
+        request_url = self._base_api_v1_request_string + "organization"
+        return await self._get(request_url)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class designed to send write requests to Purple Air's API with asyncio.
+This class will handle all async `write` requests
+https://api.purpleair.com/#api-welcome
+"""
+
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import debug_log
+from purpleair_api.PurpleAirAsyncHelpers import (
+    async_send_url_delete_request,
+    async_send_url_post_request,
+    create_async_session,
+)
+
+_logger = getLogger(__name__)
+
+
+class AsyncPurpleAirWriteAPI:
+    """
+    The AsyncPurpleAirWriteAPI class designed to send valid
+    write requests from an asyncio event loop. Every method mirrors
+    its `PurpleAirWriteAPI` counterpart and must be awaited.
+    """
+
+    def __init__(self, api_write_key=None, session=None):
+        """
+        :param str api_write_key: A valid PurpleAir API write key.
+        :param aiohttp.ClientSession session: (optional) A session to send requests with. When
+                                              not provided one is created with
+                                              `create_async_session` on the first request.
+        """
+        # Save off the API key for internal usage
+        self._your_api_write_key = api_write_key
+        self._base_api_v1_request_string = "https://api.purpleair.com/v1/"
+
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        """
+        An internal helper to return the session, creating it inside the running event loop
+        on first use.
+
+        :return aiohttp.ClientSession: The session to send requests with.
+        """
+
+        if self._session is None:
+            self._session = create_async_session()
+
+        return self._session
+
+    async def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def post_create_group_data(self, name):
+        """
+        A method to create a group for sensors.
+
+        :param str name: The name of the group to create.
+
+        :return dict | None: A dictionary containing the created group data.
+        """
+
+        post_url = self._base_api_v1_request_string + f"groups"
+
+        return await async_send_url_post_request(
+            post_url, self._get_session(), self._your_api_write_key, {"name": name}
+        )
+
+    async def post_create_member(
+        self,
+        group_id,
+        sensor_index=None,
+        sensor_id=None,
+        owner_email=None,
+        location_type=None,
+    ):
+        """
+        Add a sensor as a member of a group. The group must be owned by the api_key used.
+        See `PurpleAirWriteAPI.post_create_member` for the supported parameter combinations.
+
+        :return dict | None: A dictionary containing the created member data.
+        :raises PurpleAirAPIError: If an invalid combination of parameters is provided or the API request fails.
+        """
+
+        post_url = self._base_api_v1_request_string + f"groups/{group_id}/members"
+
+        if (
+            sensor_index is None
+            and sensor_id is not None
+            and owner_email is None
+            and location_type is None
+        ):
+            debug_log("post_create_member - option 1", logger=_logger)
+            json_post_parameters = {"sensor_id": str(sensor_id)}
+
+        elif (
+            sensor_index is not None
+            and sensor_id is None
+            and owner_email is None
+            and location_type is None
+        ):
+            debug_log("post_create_member - option 2", logger=_logger)
+            json_post_parameters = {"sensor_index": sensor_index}
+
+        elif sensor_index is None and sensor_id is not None and owner_email is not None:
+            debug_log("post_create_member - option 3", logger=_logger)
+            json_post_parameters = {
+                "sensor_id": str(sensor_id),
+                "owner_email": owner_email,
+                "location_type": location_type,
+            }
+
+        else:
+            raise PurpleAirAPIError("Invalid configuration of method parameters!")
+
+        return await async_send_url_post_request(
+            post_url,
+            self._get_session(),
+            self._your_api_write_key,
+            json_post_parameters,
+        )
+
+    async def post_delete_group(self, group_id):
+        """
+        A method to delete a group for sensors.
+
+        :param int group_id: The group_id of the group to delete
+
+        :return dict | None: A dictionary containing the deletion response.
+        """
+
+        post_url = self._base_api_v1_request_string + f"groups/{group_id}"
+
+        return await async_send_url_delete_request(
+            post_url, self._get_session(), self._your_api_write_key
+        )
+
+    async def post_delete_member(self, group_id, member_id):
+        """
+        Delete a member from a group.
+
+        :param int group_id: The group_id of the group in which member_id is in.
+        :param int member_id: The member_id to delete.
+
+        :return dict | None: A dictionary containing the deletion response.
+        """
+
+        post_url = (
+            self._base_api_v1_request_string + f"groups/{group_id}/members/{member_id}"
+        )
+
+        return await async_send_url_delete_request(
+            post_url, self._get_session(), self._your_api_write_key
+        )
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that decodes the compact `fields` + `data` payloads returned
+by the multiple sensors endpoint into typed columns.
+https://api.purpleair.com/#api-sensors-get-sensors-data
+"""
+
+from array import array
+from math import nan
+
+from purpleair_api.PurpleAirAPIConstants import ACCEPTED_FIELD_NAMES_DICT
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _decode_column(field_name, values):
+    """
+    An internal helper to store one column of values in the most compact type that holds it.
+
+    Integer fields become ``array('q')``, float fields become ``array('d')`` and text fields
+    stay a list. An integer column with a missing (null) value is stored as ``array('d')``
+    with ``nan`` in its place. Fields not found in ACCEPTED_FIELD_NAMES_DICT are typed from
+    their values.
+
+    :param str field_name: The PurpleAir field name of the column.
+    :param list values: The column values in row order.
+
+    :return array.array | list: The decoded column.
+    """
+
+    default_value = 0 if field_name == "sensor_index" else None
+    default_value = ACCEPTED_FIELD_NAMES_DICT.get(field_name, default_value)
+
+    if isinstance(default_value, str):
+        return list(values)
+
+    if not isinstance(default_value, float):
+        try:
+            return array("q", values)
+
+        except (TypeError, OverflowError):
+            pass
+
+    try:
+        return array("d", [nan if value is None else value for value in values])
+
+    except TypeError:
+        return list(values)
+
+
+class PurpleAirColumnarData:
+    """
+    Typed columns decoded from a `fields` + `data` payload. Columns are keyed by
+    field name and rows can be looked up by `sensor_index`::
+
+        columns = PurpleAirColumnarData.from_response(payload)
+        pm25_column = columns["pm2.5"]
+        one_sensor = columns.row(1234)
+    """
+
+    def __init__(self, fields, columns, metadata=None):
+        """
+        :param list fields: The field names, in the order the API returned them.
+        :param dict columns: A dictionary mapping each field name to its column.
+        :param dict metadata: (optional) The other top level keys of the payload. i.e., ``time_stamp``.
+        """
+
+        self._fields = list(fields)
+        self._columns = columns
+        self._metadata = {} if metadata is None else metadata
+        self._row_count = len(columns[self._fields[0]]) if self._fields else 0
+        self._row_positions = None
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        A method to decode a payload returned by `request_multiple_sensors_data`.
+
+        This is a convenience applied after the JSON is decoded: the rows are transposed into
+        columns, so both are held in memory while it runs and peak memory is higher than for
+        the rows alone. Once the row payload is released only the compact columns remain.
+
+        :param dict response: The payload with a `fields` list and a `data` list of rows.
+
+        :return PurpleAirColumnarData: The decoded columns.
+        :raises PurpleAirAPIError: If the payload does not have `fields` and `data`.
+        """
+
+        if (
+            not isinstance(response, dict)
+            or "fields" not in response
+            or "data" not in response
+        ):
+            raise PurpleAirAPIError(
+                "A payload with `fields` and `data` must be provided to decode into columns"
+            )
+
+        fields = response["fields"]
+        rows = response["data"]
+        columns = {
+            field_name: _decode_column(field_name, [row[position] for row in rows])
+            for position, field_name in enumerate(fields)
+        }
+        metadata = {
+            key: value
+            for key, value in response.items()
+            if key not in ("fields", "data")
+        }
+
+        return cls(fields, columns, metadata)
+
+    @property
+    def fields(self):
+        """
+        A method to return the field names in column order.
+        """
+
+        return list(self._fields)
+
+    @property
+    def metadata(self):
+        """
+        A method to return the other top level keys of the payload. i.e., ``time_stamp``.
+        """
+
+        return self._metadata
+
+    def __len__(self):
+        return self._row_count
+
+    def __contains__(self, field_name):
+        return field_name in self._columns
+
+    def __getitem__(self, field_name):
+        return self._columns[field_name]
+
+    def column(self, field_name):
+        """
+        A method to return one column.
+
+        :param str field_name: The field name of the column.
+
+        :return array.array | list: The column values in row order.
+        :raises PurpleAirAPIError: If the field is not in the data.
+        """
+
+        if field_name not in self._columns:
+            raise PurpleAirAPIError(f"`{field_name}` is not a field in this data")
+
+        return self._columns[field_name]
+
+    def index_of(self, sensor_index):
+        """
+        A method to return the row position of a sensor.
+
+        :param int sensor_index: The sensor_index to look up.
+
+        :return int: The row position of the sensor.
+        :raises PurpleAirAPIError: If the data has no `sensor_index` field or the sensor is missing.
+        """
+
+        if self._row_positions is None:
+            self._row_positions = {
+                value: position
+                for position, value in enumerate(self.column("sensor_index"))
+            }
+
+        if sensor_index not in self._row_positions:
+            raise PurpleAirAPIError(f"Sensor `{sensor_index}` is not in this data")
+
+        return self._row_positions[sensor_index]
+
+    def row(self, sensor_index):
+        """
+        A method to return one sensor's values.
+
+        :param int sensor_index: The sensor_index to look up.
+
+        :return dict: A dictionary mapping each field name to the sensor's value.
+        :raises PurpleAirAPIError: If the data has no `sensor_index` field or the sensor is missing.
+        """
+
+        position = self.index_of(sensor_index)
+        return {
+            field_name: self._columns[field_name][position]
+            for field_name in self._fields
+        }
+
+    def to_numpy(self):
+        """
+        A method to return the columns as NumPy arrays. Numeric columns share memory with
+        the ``array.array`` columns instead of being copied.
+
+        :return dict: A dictionary mapping each field name to a ``numpy.ndarray``.
+        :raises PurpleAirAPIError: If NumPy is not installed.
+        """
+
+        if numpy is None:
+            raise PurpleAirAPIError("NumPy must be installed to use `to_numpy`")
+
+        numpy_columns = {}
+        for field_name in self._fields:
+            column_values = self._columns[field_name]
+            if isinstance(column_values, array):
+                numpy_columns[field_name] = numpy.frombuffer(
+                    column_values, dtype=numpy.dtype(column_values.typecode)
+                )
+
+            else:
+                numpy_columns[field_name] = numpy.array(column_values, dtype=object)
+
+        return numpy_columns
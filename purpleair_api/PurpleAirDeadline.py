@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that gives several requests one shared time budget.
+https://api.purpleair.com/#api-welcome
+"""
+
+from time import monotonic
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+
+
+class PurpleAirDeadline:
+    """
+    The PurpleAirDeadline class is a point in time that a group of requests must finish by.
+    Pass the same deadline to every request of a composite operation, i.e., a chunked history
+    fetch or a LAN sweep, and each request's timeout is cut down to the time that is left::
+
+        deadline = PurpleAirDeadline(5.0)
+        my_paa.request_sensor_data(1234, deadline=deadline)
+        my_paa.request_local_sensor_data(deadline=deadline)
+    """
+
+    def __init__(self, seconds):
+        """
+        :param float seconds: The number of seconds from now until the deadline.
+        """
+
+        if seconds is None or seconds <= 0:
+            raise PurpleAirAPIError(f"`seconds: {seconds}` must be a positive number!")
+
+        self._expires_at = monotonic() + seconds
+
+    @property
+    def remaining(self):
+        """
+        A method to return the number of seconds left before the deadline. Never negative.
+        """
+
+        return max(0.0, self._expires_at - monotonic())
+
+    @property
+    def expired(self):
+        """
+        A method to return True once the deadline has passed.
+        """
+
+        return self.remaining <= 0
+
+    def clip(self, timeout=None):
+        """
+        A method to cut a request timeout down to the time left before the deadline.
+
+        :param float | tuple timeout: (optional) A timeout in seconds, or a ``(connect, read)`` tuple.
+                                      When not provided the time left is used.
+
+        :return float | tuple: The clipped timeout, in the same form as `timeout`.
+        :raises PurpleAirAPIError: If the deadline has passed.
+        """
+
+        remaining = self.remaining
+        if remaining <= 0:
+            raise PurpleAirAPIError("The deadline passed before the request was sent")
+
+        if timeout is None:
+            return remaining
+
+        if isinstance(timeout, tuple):
+            return tuple(
+                remaining if part is None else min(part, remaining) for part in timeout
+            )
+
+        return min(timeout, remaining)
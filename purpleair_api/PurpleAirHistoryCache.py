@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that keeps downloaded sensor history in a local SQLite
+database, so only the time ranges that are missing are requested again.
+https://api.purpleair.com/#api-welcome
+"""
+
+import json
+import sqlite3
+from logging import getLogger
+from threading import Lock
+from time import time
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_HISTORY_CACHE_SETTLE_SECONDS
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import debug_log
+
+_logger = getLogger(__name__)
+
+_CREATE_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS history_series (
+    sensor_index INTEGER NOT NULL,
+    average INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    response_fields TEXT NOT NULL,
+    PRIMARY KEY (sensor_index, average, fields)
+);
+CREATE TABLE IF NOT EXISTS history_rows (
+    sensor_index INTEGER NOT NULL,
+    average INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    time_stamp INTEGER NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (sensor_index, average, fields, time_stamp)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history_ranges (
+    sensor_index INTEGER NOT NULL,
+    average INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    start_timestamp INTEGER NOT NULL,
+    end_timestamp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_ranges_series
+    ON history_ranges (sensor_index, average, fields, start_timestamp);
+"""
+
+
+class PurpleAirHistoryCache:
+    """
+    The PurpleAirHistoryCache class stores sensor history rows in a SQLite database, keyed by
+    sensor_index, average and the set of requested fields, along with the time ranges that
+    have been downloaded in full. `missing_ranges` returns the parts of a range that still
+    have to be requested, so repeated analyses only cost API points for new data.
+
+    Ranges are half open, ``start_timestamp <= time_stamp < end_timestamp``, like the API's.
+    History newer than `settle_seconds` is stored but its range is not marked as downloaded,
+    since the sensor may still report rows for it.
+    """
+
+    def __init__(
+        self, database_path, settle_seconds=DEFAULT_HISTORY_CACHE_SETTLE_SECONDS
+    ):
+        """
+        :param str database_path: The path of the SQLite database file. It is created if it
+                                  does not exist. ``":memory:"`` keeps the cache in memory.
+        :param int settle_seconds: (optional) How long history must be in the past before its
+                                   range is treated as complete.
+        """
+
+        self._lock = Lock()
+        self._settle_seconds = settle_seconds
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_CREATE_TABLES_SQL)
+
+    def close(self):
+        """
+        A method to close the database connection.
+        """
+
+        self._connection.close()
+
+    @staticmethod
+    def _series_key(sensor_index, fields, average):
+        """
+        An internal helper to build the key a sensor's history is stored under.
+
+        :param int sensor_index: The sensor_index of the sensor.
+        :param str | list fields: The comma separated field names or a list of them.
+        :param int average: The average in minutes. 10 if None, like the API.
+
+        :return tuple: ``(sensor_index, average, fields)`` with the fields sorted and joined.
+        """
+
+        if isinstance(fields, str):
+            fields = fields.split(",")
+
+        field_names = sorted(
+            {field.strip() for field in fields if field.strip()} - {"time_stamp"}
+        )
+        return (
+            int(sensor_index),
+            10 if average is None else average,
+            ",".join(field_names),
+        )
+
+    def missing_ranges(
+        self, sensor_index, fields, start_timestamp, end_timestamp, average=None
+    ):
+        """
+        A method to find the parts of a time range that have not been downloaded.
+
+        :param int sensor_index: The sensor_index of the sensor.
+        :param str | list fields: The requested fields.
+        :param int start_timestamp: The UNIX time stamp, in seconds, the range starts at.
+        :param int end_timestamp: The UNIX time stamp, in seconds, the range ends before.
+        :param int average: (optional) The average in minutes.
+
+        :return list: A list of ``(start_timestamp, end_timestamp)`` tuples in time order.
+        """
+
+        series_key = self._series_key(sensor_index, fields, average)
+        with self._lock:
+            covered_ranges = self._connection.execute(
+                "SELECT start_timestamp, end_timestamp FROM history_ranges "
+                "WHERE sensor_index = ? AND average = ? AND fields = ? "
+                "AND start_timestamp < ? AND end_timestamp > ? ORDER BY start_timestamp",
+                series_key + (end_timestamp, start_timestamp),
+            ).fetchall()
+
+        retval = []
+        cursor = start_timestamp
+        for covered_start, covered_end in covered_ranges:
+            if covered_start > cursor:
+                retval.append((cursor, covered_start))
+
+            cursor = max(cursor, covered_end)
+
+        if cursor < end_timestamp:
+            retval.append((cursor, end_timestamp))
+
+        return retval
+
+    def store(
+        self,
+        sensor_index,
+        fields,
+        start_timestamp,
+        end_timestamp,
+        history_response,
+        average=None,
+    ):
+        """
+        A method to store the JSON payload of a history request and mark its range as downloaded.
+
+        :param int sensor_index: The sensor_index of the sensor.
+        :param str | list fields: The requested fields.
+        :param int start_timestamp: The `start_timestamp` the payload was requested with.
+        :param int end_timestamp: The `end_timestamp` the payload was requested with.
+        :param dict history_response: The payload, with `fields` and `data`.
+        :param int average: (optional) The average in minutes.
+
+        :raises PurpleAirAPIError: If the payload has no `time_stamp` field.
+        """
+
+        response_fields = list(history_response.get("fields", []))
+        if "time_stamp" not in response_fields:
+            raise PurpleAirAPIError(
+                "The history payload must include the `time_stamp` field to be cached"
+            )
+
+        series_key = self._series_key(sensor_index, fields, average)
+        covered_end = min(end_timestamp, int(time()) - self._settle_seconds)
+
+        with self._lock, self._connection:
+            stored_fields = self._connection.execute(
+                "SELECT response_fields FROM history_series "
+                "WHERE sensor_index = ? AND average = ? AND fields = ?",
+                series_key,
+            ).fetchone()
+
+            if stored_fields is not None:
+                stored_fields = json.loads(stored_fields[0])
+
+            if stored_fields is not None and set(stored_fields) != set(response_fields):
+                # The API returned other columns than before, so start the series over
+                debug_log(
+                    "store - the fields of sensor %s changed, clearing its history",
+                    sensor_index,
+                    logger=_logger,
+                )
+                for table_name in ("history_rows", "history_ranges", "history_series"):
+                    self._connection.execute(
+                        f"DELETE FROM {table_name} "
+                        "WHERE sensor_index = ? AND average = ? AND fields = ?",
+                        series_key,
+                    )
+                stored_fields = None
+
+            if stored_fields is None:
+                stored_fields = response_fields
+                self._connection.execute(
+                    "INSERT INTO history_series VALUES (?, ?, ?, ?)",
+                    series_key + (json.dumps(stored_fields),),
+                )
+
+            # Keep every row in the column order the series was first stored with
+            positions = [response_fields.index(field) for field in stored_fields]
+            time_stamp_position = stored_fields.index("time_stamp")
+            stored_rows = []
+            for data_row in history_response.get("data", []):
+                stored_row = [data_row[position] for position in positions]
+                stored_rows.append(
+                    series_key
+                    + (stored_row[time_stamp_position], json.dumps(stored_row))
+                )
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO history_rows VALUES (?, ?, ?, ?, ?)",
+                stored_rows,
+            )
+
+            if covered_end > start_timestamp:
+                self._add_covered_range(series_key, start_timestamp, covered_end)
+
+    def _add_covered_range(self, series_key, start_timestamp, end_timestamp):
+        """
+        An internal helper to mark a range as downloaded, merging it with the ranges it
+        overlaps or touches. Must be called with the lock held, inside a transaction.
+
+        :param tuple series_key: The key from `_series_key`.
+        :param int start_timestamp: The start of the range.
+        :param int end_timestamp: The end of the range.
+        """
+
+        touching_ranges = self._connection.execute(
+            "SELECT start_timestamp, end_timestamp FROM history_ranges "
+            "WHERE sensor_index = ? AND average = ? AND fields = ? "
+            "AND start_timestamp <= ? AND end_timestamp >= ?",
+            series_key + (end_timestamp, start_timestamp),
+        ).fetchall()
+
+        for touching_start, touching_end in touching_ranges:
+            start_timestamp = min(start_timestamp, touching_start)
+            end_timestamp = max(end_timestamp, touching_end)
+
+        self._connection.execute(
+            "DELETE FROM history_ranges "
+            "WHERE sensor_index = ? AND average = ? AND fields = ? "
+            "AND start_timestamp <= ? AND end_timestamp >= ?",
+            series_key + (end_timestamp, start_timestamp),
+        )
+        self._connection.execute(
+            "INSERT INTO history_ranges VALUES (?, ?, ?, ?, ?)",
+            series_key + (start_timestamp, end_timestamp),
+        )
+
+    def load(self, sensor_index, fields, start_timestamp, end_timestamp, average=None):
+        """
+        A method to read the stored rows of a time range.
+
+        :param int sensor_index: The sensor_index of the sensor.
+        :param str | list fields: The requested fields.
+        :param int start_timestamp: The UNIX time stamp, in seconds, the range starts at.
+        :param int end_timestamp: The UNIX time stamp, in seconds, the range ends before.
+        :param int average: (optional) The average in minutes.
+
+        :return dict | None: A dictionary with the stored `fields` and the `data` rows sorted by
+                             ``time_stamp``, or None if nothing is stored for the sensor.
+        """
+
+        series_key = self._series_key(sensor_index, fields, average)
+        with self._lock:
+            stored_fields = self._connection.execute(
+                "SELECT response_fields FROM history_series "
+                "WHERE sensor_index = ? AND average = ? AND fields = ?",
+                series_key,
+            ).fetchone()
+
+            if stored_fields is None:
+                return None
+
+            stored_rows = self._connection.execute(
+                "SELECT row FROM history_rows "
+                "WHERE sensor_index = ? AND average = ? AND fields = ? "
+                "AND time_stamp >= ? AND time_stamp < ? ORDER BY time_stamp",
+                series_key + (start_timestamp, end_timestamp),
+            ).fetchall()
+
+        return {
+            "fields": json.loads(stored_fields[0]),
+            "data": [json.loads(stored_row[0]) for stored_row in stored_rows],
+        }
+
+    def clear(self, sensor_index=None):
+        """
+        A method to drop stored history.
+
+        :param int sensor_index: (optional) Only drop this sensor's history. When not provided
+                                 everything is dropped.
+        """
+
+        with self._lock, self._connection:
+            for table_name in ("history_rows", "history_ranges", "history_series"):
+                if sensor_index is None:
+                    self._connection.execute(f"DELETE FROM {table_name}")
+
+                else:
+                    self._connection.execute(
+                        f"DELETE FROM {table_name} WHERE sensor_index = ?",
+                        (int(sensor_index),),
+                    )
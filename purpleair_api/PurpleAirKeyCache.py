@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that keeps the results of API key checks in a file, so
+short lived processes do not have to check their keys on every start.
+https://api.purpleair.com/#api-welcome
+"""
+
+import json
+import os
+import tempfile
+from hashlib import sha256
+from logging import getLogger
+from threading import Lock
+from time import time
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_KEY_CACHE_TTL_SECONDS
+from purpleair_api.PurpleAirAPIHelpers import debug_log
+
+_logger = getLogger(__name__)
+
+
+class PurpleAirKeyCache:
+    """
+    The PurpleAirKeyCache class stores the response of the ``keys`` endpoint for each API key
+    in a JSON file, and returns it until `ttl_seconds` have passed. Keys are stored as SHA-256
+    digests, never in plain text.
+    """
+
+    def __init__(self, cache_path, ttl_seconds=DEFAULT_KEY_CACHE_TTL_SECONDS):
+        """
+        :param str cache_path: The path of the JSON file. It is created when the first key is stored.
+        :param float ttl_seconds: (optional) How long a key check is trusted.
+        """
+
+        self._cache_path = cache_path
+        self._ttl_seconds = ttl_seconds
+        self._lock = Lock()
+
+    @staticmethod
+    def _digest(api_key):
+        """
+        An internal helper to turn an API key into the digest it is stored under.
+
+        :param str api_key: The API key.
+
+        :return str: The hex SHA-256 digest of the key.
+        """
+
+        return sha256(api_key.encode("utf-8")).hexdigest()
+
+    def _read(self):
+        """
+        An internal helper to read the cache file. A missing or unreadable file is treated as empty.
+
+        :return dict: The cached key checks keyed by digest.
+        """
+
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as cache_file:
+                cached_keys = json.load(cache_file)
+
+        except (OSError, ValueError) as e:
+            debug_log("_read - no usable key cache: %s", e, logger=_logger)
+            return {}
+
+        return cached_keys if isinstance(cached_keys, dict) else {}
+
+    def get(self, api_key):
+        """
+        A method to look up the last check of an API key.
+
+        :param str api_key: The API key.
+
+        :return dict | None: The ``keys`` response with ``api_version``, ``time_stamp`` and
+                             ``api_key_type``, or None if the key was not checked within the TTL.
+        """
+
+        with self._lock:
+            key_check = self._read().get(self._digest(api_key))
+
+        if not isinstance(key_check, dict):
+            return None
+
+        if time() - key_check.get("checked_at", 0) >= self._ttl_seconds:
+            return None
+
+        return key_check
+
+    def put(self, api_key, key_check):
+        """
+        A method to store the check of an API key. The file is replaced atomically, so a reader
+        never sees it half written.
+
+        :param str api_key: The API key.
+        :param dict key_check: The ``keys`` response with ``api_version``, ``time_stamp`` and
+                               ``api_key_type``.
+        """
+
+        with self._lock:
+            cached_keys = self._read()
+            cached_keys[self._digest(api_key)] = {
+                "api_version": key_check["api_version"],
+                "time_stamp": key_check["time_stamp"],
+                "api_key_type": key_check["api_key_type"],
+                "checked_at": time(),
+            }
+
+            cache_dir = os.path.dirname(os.path.abspath(self._cache_path))
+            os.makedirs(cache_dir, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as cache_file:
+                    json.dump(cached_keys, cache_file)
+
+                os.replace(temp_path, self._cache_path)
+
+            except OSError:
+                os.remove(temp_path)
+                raise
+
+    def clear(self):
+        """
+        A method to remove the cache file.
+        """
+
+        with self._lock:
+            try:
+                os.remove(self._cache_path)
+
+            except FileNotFoundError:
+                pass
@@ -7,8 +7,20 @@ This class will handle all `local` requests
 https://api.purpleair.com/#api-welcome
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS
 from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
-from purpleair_api.PurpleAirAPIHelpers import send_url_get_request
+from purpleair_api.PurpleAirAPIHelpers import (
+    USE_CLIENT_TIMEOUT,
+    create_session,
+    debug_log,
+    send_url_get_request,
+)
+from requests.exceptions import RequestException
+
+_logger = getLogger(__name__)
 
 
 class PurpleAirLocalAPI:
@@ -17,12 +29,54 @@ class PurpleAirLocalAPI:
     local network requests. It can work with one or many IPv4 addresses.
     """
 
-    def __init__(self, ipv4_address_list=None):
+    def __init__(
+        self,
+        ipv4_address_list=None,
+        session=None,
+        retry_policy=None,
+        timeout=DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS,
+    ):
         """
         :param list ipv4_address_list: A list of strings with valid IPv4 addresses for your
                                        sensors. The addresses do not need a CIDR prefix.
+        :param requests.Session session: (optional) A session to send requests with. Pass one in to
+                                         share a connection pool between clients or to inject a
+                                         custom session for tests. When not provided one is created
+                                         with `create_session`.
+        :param PurpleAirRetryPolicy retry_policy: (optional) A policy to send failed requests
+                                                  again with. When not provided failures are
+                                                  raised right away.
+        :param float | tuple timeout: (optional) The number of seconds to wait for each sensor, or
+                                      a ``(connect, read)`` tuple, used when a request does not
+                                      pass its own. Defaults to
+                                      DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS; None waits without a
+                                      limit.
         """
+        self._validate_ipv4_address_list(ipv4_address_list)
+
         # Create the base API request string for local networks.
+        self._base_api_local_network_request_string_dict = dict()
+        for address in ipv4_address_list:
+            self._base_api_local_network_request_string_dict[address] = (
+                f"http://{address}/json"
+            )
+
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = create_session() if session is None else session
+        self._retry_policy = retry_policy
+        self._timeout = timeout
+
+    @staticmethod
+    def _validate_ipv4_address_list(ipv4_address_list):
+        """
+        An internal helper to check the IPv4 address list passed in by the caller.
+
+        :param list ipv4_address_list: A list of strings with valid IPv4 addresses.
+
+        :raises PurpleAirAPIError: If the list is missing, not a list, or has an invalid address.
+        """
+
         error_msg = (
             "Must provide the IPv4 address list for the sensor(s) on your local network"
         )
@@ -37,22 +91,95 @@ class PurpleAirLocalAPI:
             if len(address) == 0 or len(address) > 15:
                 raise PurpleAirAPIError(error_msg)
 
-        self._base_api_local_network_request_string_dict = dict()
-        for address in ipv4_address_list:
-            self._base_api_local_network_request_string_dict[address] = (
-                f"http://{address}/json"
-            )
+    def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
 
-    def request_local_sensor_data(self) -> dict:
+        if self._owns_session:
+            self._session.close()
+
+    def request_local_sensor_data(
+        self, max_workers=None, timeout=USE_CLIENT_TIMEOUT, deadline=None
+    ) -> dict:
         """
         A method to request data from one or more local sensors. Each sensor must be accessible on the local network.
 
+        By default the sensors are requested one after another and the first failure is raised.
+        When `max_workers` is provided the sensors are requested concurrently instead, and a
+        sensor that fails or times out gets an error entry of the form
+        ``{"error": "<exception name>", "description": "<message>"}`` while the others still
+        return their data.
+
+        :param (optional) int max_workers: The number of sensors to request at once. Setting it
+                                           turns on the concurrent mode.
+        :param (optional) float | tuple timeout: The number of seconds to wait for each sensor.
+                                                 Defaults to the client's timeout. None waits
+                                                 without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline the whole sweep must finish by.
+                                                      In the concurrent mode a sensor that runs
+                                                      out of time gets an error entry.
+
         :return dict: A dictionary mapping each IPv4 address to its sensor data payload.
+        :raises PurpleAirAPIError: If `max_workers` is not a positive integer, or a request
+                                   fails while not in the concurrent mode.
         """
 
-        retval = {}
-        for key, value in self._base_api_local_network_request_string_dict.items():
-            request_value = send_url_get_request(value)
-            retval[key] = request_value
+        if timeout is USE_CLIENT_TIMEOUT:
+            timeout = self._timeout
+
+        if max_workers is None:
+            retval = {}
+            for key, value in self._base_api_local_network_request_string_dict.items():
+                request_value = send_url_get_request(
+                    value,
+                    session=self._session,
+                    timeout=timeout,
+                    retry_policy=self._retry_policy,
+                    deadline=deadline,
+                )
+                retval[key] = request_value
+
+            return retval
+
+        if type(max_workers) is not int or max_workers < 1:
+            raise PurpleAirAPIError(
+                f"`max_workers: {max_workers}` must be a positive integer!"
+            )
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_address = {
+                executor.submit(
+                    send_url_get_request,
+                    value,
+                    session=self._session,
+                    timeout=timeout,
+                    retry_policy=self._retry_policy,
+                    deadline=deadline,
+                ): key
+                for key, value in self._base_api_local_network_request_string_dict.items()
+            }
+
+            for future in as_completed(future_to_address):
+                address = future_to_address[future]
+                try:
+                    results[address] = future.result()
+
+                except (PurpleAirAPIError, RequestException, ValueError) as e:
+                    debug_log(
+                        "request_local_sensor_data - %s failed: %s",
+                        address,
+                        e,
+                        logger=_logger,
+                    )
+                    results[address] = {
+                        "error": type(e).__name__,
+                        "description": str(e),
+                    }
 
-        return retval
+        # Keep the same order the addresses were provided in
+        return {
+            key: results[key]
+            for key in self._base_api_local_network_request_string_dict.keys()
+        }
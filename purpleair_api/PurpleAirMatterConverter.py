@@ -26,8 +26,16 @@ Repository: <https://github.com/carlkidcrypto/purpleair_api>
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from math import isnan
+from typing import Any, ClassVar, Iterator, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # =============================================================================
 # Matter 1.5.1 — Air Quality Sensor Device Type
@@ -114,6 +122,40 @@ class MatterAirQualityRating(Enum):
             return cls.VERY_POOR
         return cls.EXTREMELY_POOR
 
+    @classmethod
+    def from_aqi_batch(cls, aqi_values: Sequence[float] | Any) -> list[int] | Any:
+        """
+        Derive Matter Air Quality Rating codes for many EPA AQI values at once.
+
+        Each value is placed with a binary search over the upper AQI bound of
+        every rating. Missing (``None`` or NaN) and negative values map to
+        :attr:`UNKNOWN`.
+
+        :param aqi_values: A sequence or NumPy array of EPA AQI values.
+        :return: The rating codes (the enum ``value``) as a ``numpy.ndarray``
+            of ``int8``, or a ``list`` of ``int`` when NumPy is not installed.
+        """
+        if numpy is not None:
+            aqi_array = numpy.asarray(aqi_values, dtype=float)
+            ratings = (
+                numpy.searchsorted(_RATING_UPPER_AQI, aqi_array, side="left") + 1
+            ).astype(numpy.int8)
+            ratings[~(aqi_array >= 0)] = cls.UNKNOWN.value
+            return ratings
+
+        return [
+            (
+                cls.UNKNOWN.value
+                if aqi is None or isnan(aqi) or aqi < 0
+                else bisect_left(_RATING_UPPER_AQI, aqi) + 1
+            )
+            for aqi in aqi_values
+        ]
+
+
+#: The upper AQI bound of each :class:`MatterAirQualityRating` from EXCELLENT to VERY_POOR.
+_RATING_UPPER_AQI = (50, 100, 150, 200, 300)
+
 
 # =============================================================================
 # EPA AQI Calculator
@@ -157,6 +199,10 @@ class EpaAqiCalculator:
         """
         Convert a 24-hour average PM2.5 concentration to an EPA AQI.
 
+        For the current AQI, pass the NowCast from
+        :class:`PurpleAirNowCast.PurpleAirNowCast`, the EPA's real-time
+        estimate of the 24-hour average, rather than an instantaneous reading.
+
         Uses the EPA formula::
 
             AQI = ((I_high - I_low) / (C_high - C_low)) * (C - C_low) + I_low
@@ -209,6 +255,140 @@ class EpaAqiCalculator:
             return "Hazardous"
         return "Beyond Hazardous"
 
+    @classmethod
+    def _breakpoint_columns(
+        cls,
+    ) -> tuple[list[float], list[float], list[int], list[int]]:
+        """
+        Split :attr:`BREAKPOINTS` into its ``C_low``, ``C_high``, ``I_low``
+        and ``I_high`` columns for the batch methods.
+
+        :return: The four columns, in breakpoint order.
+        """
+        c_lows, c_highs, i_lows, i_highs = zip(*cls.BREAKPOINTS)
+        return list(c_lows), list(c_highs), list(i_lows), list(i_highs)
+
+    @classmethod
+    def pm25_to_aqi_batch(cls, pm25_values: Sequence[float] | Any) -> list[float] | Any:
+        """
+        Convert many PM2.5 concentrations to EPA AQI values at once.
+
+        Gives the same values as :meth:`pm25_to_aqi`, but finds the breakpoint
+        of every value with a binary search over the ``C_high`` column
+        (``numpy.searchsorted`` when NumPy is installed, :func:`bisect.bisect_left`
+        otherwise) instead of calling :meth:`pm25_to_aqi` for each one. The
+        concentrations are rounded to tenths with :func:`round` either way,
+        since ``numpy.round`` rounds values such as 35.45 the other way.
+
+        Missing (``None`` or NaN) and negative concentrations give NaN rather
+        than raising, so one bad sensor does not stop the batch.
+
+        :param pm25_values: A sequence or NumPy array of PM2.5 concentrations in µg/m³.
+        :return: The AQI values as a ``numpy.ndarray`` of ``float64``, or a
+            ``list`` when NumPy is not installed.
+        """
+        c_lows, c_highs, i_lows, i_highs = cls._breakpoint_columns()
+
+        if numpy is not None:
+            pm25_array = numpy.array(
+                [
+                    round(pm25, 1)
+                    for pm25 in numpy.asarray(pm25_values, dtype=float).tolist()
+                ],
+                dtype=float,
+            )
+            positions = numpy.searchsorted(c_highs, pm25_array, side="left")
+            in_table = positions < len(c_highs)
+            positions = numpy.minimum(positions, len(c_highs) - 1)
+
+            c_low = numpy.asarray(c_lows, dtype=float)[positions]
+            c_high = numpy.asarray(c_highs, dtype=float)[positions]
+            i_low = numpy.asarray(i_lows, dtype=float)[positions]
+            i_high = numpy.asarray(i_highs, dtype=float)[positions]
+            in_table = in_table & (pm25_array >= c_low)
+
+            # Guard against zero-division (C_high == C_low should not occur)
+            zero_width = c_high == c_low
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                aqi = numpy.rint(
+                    ((i_high - i_low) / (c_high - c_low)) * (pm25_array - c_low) + i_low
+                )
+
+            aqi = numpy.where(zero_width, i_low, aqi)
+            # Outside the table (or in a gap between breakpoints) — cap at 500
+            aqi = numpy.where(in_table, aqi, 500.0)
+            aqi = numpy.where(pm25_array <= 0.0, 0.0, aqi)
+            aqi[~(pm25_array >= 0.0)] = numpy.nan
+            return aqi
+
+        retval = []
+        for pm25 in pm25_values:
+            if pm25 is None or isnan(pm25) or pm25 < 0:
+                retval.append(float("nan"))
+                continue
+
+            pm25 = round(pm25, 1)
+            position = bisect_left(c_highs, pm25)
+            if pm25 <= 0.0:
+                retval.append(0.0)
+            elif position == len(c_highs) or pm25 < c_lows[position]:
+                retval.append(500.0)
+            elif c_highs[position] == c_lows[position]:
+                retval.append(float(i_lows[position]))
+            else:
+                aqi = (
+                    (i_highs[position] - i_lows[position])
+                    / (c_highs[position] - c_lows[position])
+                ) * (pm25 - c_lows[position]) + i_lows[position]
+                retval.append(round(aqi))
+
+        return retval
+
+    @classmethod
+    def aqi_to_epa_category_batch(
+        cls, aqi_values: Sequence[float] | Any
+    ) -> list[str] | Any:
+        """
+        Return the EPA AQI category names for many AQI values at once.
+
+        Each value is placed with a binary search over the upper AQI bound of
+        every category. Missing (``None`` or NaN) values give ``"Unknown"``.
+
+        :param aqi_values: A sequence or NumPy array of EPA AQI values.
+        :return: The category names as a ``numpy.ndarray`` of objects, or a
+            ``list`` when NumPy is not installed.
+        """
+        if numpy is not None:
+            aqi_array = numpy.asarray(aqi_values, dtype=float)
+            positions = numpy.searchsorted(_CATEGORY_UPPER_AQI, aqi_array, side="left")
+            positions[numpy.isnan(aqi_array)] = len(_CATEGORY_NAMES) - 1
+            return numpy.array(_CATEGORY_NAMES, dtype=object)[positions]
+
+        return [
+            (
+                _CATEGORY_NAMES[-1]
+                if aqi is None or isnan(aqi)
+                else _CATEGORY_NAMES[bisect_left(_CATEGORY_UPPER_AQI, aqi)]
+            )
+            for aqi in aqi_values
+        ]
+
+
+#: The upper AQI bound of each EPA category, in :func:`EpaAqiCalculator.aqi_to_epa_category` order.
+_CATEGORY_UPPER_AQI = (50, 100, 150, 200, 300, 500)
+
+#: The EPA category names for each bound in ``_CATEGORY_UPPER_AQI``, then above 500, then missing.
+_CATEGORY_NAMES = (
+    "Good",
+    "Moderate",
+    "Unhealthy for Sensitive Groups",
+    "Unhealthy",
+    "Very Unhealthy",
+    "Hazardous",
+    "Beyond Hazardous",
+    "Unknown",
+)
+
 
 # =============================================================================
 # Unit Conversion Helpers
@@ -282,6 +462,49 @@ def _nullable_float(value: Any) -> float | None:
         return None
 
 
+#: The PurpleAir fields :meth:`PurpleAirMatterConverter._normalise` keeps.
+#: Only these are ever copied — absent fields stay absent (not defaulted to
+#: 0 / 0.0) so the converter can distinguish "no reading" from "zero reading".
+_CANONICAL_FIELDS = (
+    "pm2.5",
+    "pm1.0",
+    "pm10.0",
+    "voc",
+    "temperature",
+    "humidity",
+    "pressure",
+    "name",
+    "latitude",
+    "longitude",
+    "firmware_version",
+    "hardware",
+    "sensor_index",
+)
+
+#: The device types :meth:`PurpleAirMatterConverter.to_matter_devices` can
+#: emit, in the order they are emitted by default.
+MATTER_DEVICE_TYPE_NAMES = (
+    "air_quality_sensor",
+    "temperature_sensor",
+    "environmental_sensor",
+)
+
+
+class _InstantaneousPm25:
+    """
+    The type of :data:`INSTANTANEOUS_PM25`.
+    """
+
+    def __repr__(self) -> str:
+        return "INSTANTANEOUS_PM25"
+
+
+#: The default ``nowcast_pm25`` of the single sensor conversions: compute the
+#: EPA AQI from the instantaneous ``pm2.5`` reading. An explicit None instead
+#: means the sensor has no NowCast yet.
+INSTANTANEOUS_PM25 = _InstantaneousPm25()
+
+
 # =============================================================================
 # Primary Converter Class
 # =============================================================================
@@ -341,7 +564,10 @@ class PurpleAirMatterConverter:
     def to_air_quality_sensor(
         purpleair_data: dict[str, Any],
         sensor_name: str | None = None,
-    ) -> dict[str, Any]:
+        as_record: bool = False,
+        nowcast_pm25: float | None | _InstantaneousPm25 = INSTANTANEOUS_PM25,
+        nowcast_fallback: bool = False,
+    ) -> dict[str, Any] | AirQualityEndpoint:
         """
         Convert PurpleAir sensor data into a **Matter Air Quality Sensor**
         device type structure (Matter 1.5.1, Device Type 0x002D).
@@ -363,14 +589,289 @@ class PurpleAirMatterConverter:
         ==========================  ===============================  ===========
 
         EPA AQI is computed from the PM2.5 concentration using
-        :class:`EpaAqiCalculator`.
+        :class:`EpaAqiCalculator`. Pass the sensor's PM2.5 NowCast (see
+        :class:`PurpleAirNowCast.PurpleAirNowCast`) as ``nowcast_pm25`` to
+        compute it the way AirNow does instead of from the instantaneous
+        reading. Like AirNow, a sensor whose NowCast is None (not enough
+        recent hours) reports no AQI: a NaN ``epa_aqi``, an ``"Unknown"``
+        category and the UNKNOWN rating.
 
         :param purpleair_data: Raw PurpleAir sensor data dict.
         :param sensor_name: Optional display name override for the device.
-        :return: Dictionary representing a Matter Air Quality Sensor endpoint.
+        :param as_record: When True, return a compact, immutable
+            :class:`AirQualityEndpoint` record instead of a dictionary. Its
+            :meth:`AirQualityEndpoint.to_dict` returns the dictionary.
+        :param nowcast_pm25: Optional PM2.5 NowCast in µg/m³ to compute the
+            EPA AQI, category and rating from. ``measuredValue`` stays the
+            instantaneous reading. Defaults to :data:`INSTANTANEOUS_PM25`,
+            which uses the instantaneous reading. None gives the UNKNOWN
+            rating.
+        :param nowcast_fallback: When True, a None ``nowcast_pm25`` uses the
+            instantaneous reading instead of giving the UNKNOWN rating.
+        :return: Dictionary (or record) representing a Matter Air Quality
+            Sensor endpoint.
         """
+        return PurpleAirMatterConverter._air_quality_sensor_from_data(
+            PurpleAirMatterConverter._normalise(purpleair_data),
+            sensor_name,
+            as_record,
+            nowcast_pm25,
+            nowcast_fallback,
+        )
+
+    @staticmethod
+    def to_matter_devices(
+        purpleair_data: dict[str, Any],
+        device_types: Sequence[str] = MATTER_DEVICE_TYPE_NAMES,
+        sensor_name: str | None = None,
+        nowcast_pm25: float | None | _InstantaneousPm25 = INSTANTANEOUS_PM25,
+        nowcast_fallback: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Convert PurpleAir sensor data into several Matter device types at
+        once, normalising the data a single time instead of once per device
+        type.
+
+        Each device type matches what its own method returns:
+
+        ========================  ===================================
+        Device type name          Same as
+        ========================  ===================================
+        ``air_quality_sensor``    :meth:`to_air_quality_sensor`
+        ``temperature_sensor``    :meth:`to_temperature_sensor`
+        ``environmental_sensor``  :meth:`to_environmental_sensor`
+        ========================  ===================================
+
+        :param purpleair_data: Raw PurpleAir sensor data dict.
+        :param device_types: The device type names to emit. Defaults to all
+            of :data:`MATTER_DEVICE_TYPE_NAMES`.
+        :param sensor_name: Optional display name override for every device.
+        :param nowcast_pm25: Optional PM2.5 NowCast for the air quality sensor,
+            see :meth:`to_air_quality_sensor`.
+        :param nowcast_fallback: When True, a None ``nowcast_pm25`` uses the
+            instantaneous reading, see :meth:`to_air_quality_sensor`.
+        :return: ``{device_type_name: endpoint}`` in ``device_types`` order.
+        :raises ValueError: If a device type name is not known.
+        """
+        unknown_device_types = [
+            device_type
+            for device_type in device_types
+            if device_type not in MATTER_DEVICE_TYPE_NAMES
+        ]
+        if unknown_device_types:
+            raise ValueError(
+                f"Unknown Matter device type(s) {unknown_device_types}, "
+                f"expected any of {list(MATTER_DEVICE_TYPE_NAMES)}"
+            )
+
         data = PurpleAirMatterConverter._normalise(purpleair_data)
+        retval = {}
+        for device_type in device_types:
+            if device_type == "air_quality_sensor":
+                retval[device_type] = (
+                    PurpleAirMatterConverter._air_quality_sensor_from_data(
+                        data,
+                        sensor_name,
+                        nowcast_pm25=nowcast_pm25,
+                        nowcast_fallback=nowcast_fallback,
+                    )
+                )
+            elif device_type == "temperature_sensor":
+                retval[device_type] = (
+                    PurpleAirMatterConverter._build_temperature_sensor(
+                        data, sensor_name
+                    )
+                )
+            else:
+                retval[device_type] = (
+                    PurpleAirMatterConverter._build_environmental_sensor(
+                        data, sensor_name
+                    )
+                )
+
+        return retval
+
+    @staticmethod
+    def _air_quality_sensor_from_data(
+        data: dict[str, Any],
+        sensor_name: str | None = None,
+        as_record: bool = False,
+        nowcast_pm25: float | None | _InstantaneousPm25 = INSTANTANEOUS_PM25,
+        nowcast_fallback: bool = False,
+    ) -> dict[str, Any] | AirQualityEndpoint:
+        """
+        Compute the EPA AQI of normalised sensor data and build its
+        **Matter Air Quality Sensor** endpoint structure.
 
+        :param data: Normalised sensor data, as returned by :meth:`_normalise`.
+        :param sensor_name: Optional display name override for the device.
+        :param as_record: When True, return an :class:`AirQualityEndpoint`
+            record instead of a dictionary.
+        :param nowcast_pm25: Optional PM2.5 NowCast to compute the EPA AQI
+            from instead of the instantaneous reading. None gives the UNKNOWN
+            rating.
+        :param nowcast_fallback: When True, a None ``nowcast_pm25`` uses the
+            instantaneous reading.
+        :return: Dictionary (or record) representing a Matter Air Quality
+            Sensor endpoint.
+        """
+        if nowcast_pm25 is None and not nowcast_fallback:
+            # Like AirNow, report no AQI until the sensor has a NowCast
+            aqi = float("nan")
+            aqi_category = "Unknown"
+            rating = MatterAirQualityRating.UNKNOWN
+
+        else:
+            # Compute EPA AQI from the PM2.5 NowCast, or the instantaneous PM2.5
+            if nowcast_pm25 is None or nowcast_pm25 is INSTANTANEOUS_PM25:
+                nowcast_pm25 = _safe_float(data.get("pm2.5"))
+            aqi = EpaAqiCalculator.pm25_to_aqi(nowcast_pm25)
+            aqi_category = EpaAqiCalculator.aqi_to_epa_category(aqi)
+            rating = MatterAirQualityRating.from_aqi(aqi)
+
+        return PurpleAirMatterConverter._build_air_quality_sensor(
+            data,
+            aqi,
+            aqi_category,
+            rating,
+            None if as_record else _air_quality_sensor_fragments(),
+            sensor_name,
+            as_record,
+        )
+
+    @staticmethod
+    def to_air_quality_sensors(
+        purpleair_response: dict[str, Any],
+        lazy: bool = False,
+        as_record: bool = False,
+        nowcast_pm25: Sequence[float | None] | None = None,
+        nowcast_fallback: bool = False,
+    ) -> (
+        list[dict[str, Any] | AirQualityEndpoint]
+        | Iterator[dict[str, Any] | AirQualityEndpoint]
+    ):
+        """
+        Convert a whole :meth:`PurpleAirReadAPI.request_multiple_sensors_data`
+        (or :meth:`PurpleAirReadAPI.request_members_data`) response into
+        **Matter Air Quality Sensor** endpoint structures, one per data row.
+
+        Each endpoint matches what :meth:`to_air_quality_sensor` returns for
+        that row, but the work shared by every row is done once: the field
+        positions are looked up once, the EPA AQI, category and rating of all
+        rows are computed together with :meth:`EpaAqiCalculator.pm25_to_aqi_batch`,
+        and the static ``device_type`` and ``references`` fragments are built
+        once and shared by every endpoint. Treat the shared fragments as read
+        only. Unlike :meth:`to_air_quality_sensor`, a negative PM2.5 reading
+        does not raise; that endpoint gets a NaN ``epa_aqi``, an ``"Unknown"``
+        category and the UNKNOWN rating.
+
+        :param purpleair_response: Raw PurpleAir response with ``fields`` and ``data``.
+        :param lazy: When True, return an iterator that builds each endpoint
+            as it is consumed, instead of a list of all of them.
+        :param as_record: When True, build :class:`AirQualityEndpoint` records
+            instead of dictionaries. Records keep the static ``device_type``
+            and ``references`` on their classes, so a large fleet holds only
+            the per-sensor values.
+        :param nowcast_pm25: Optional PM2.5 NowCast of each data row, i.e.,
+            from :meth:`PurpleAirNowCast.PurpleAirNowCast.nowcast_many`, to
+            compute the EPA AQI from. Like AirNow, rows with a None NowCast
+            report no AQI: a NaN ``epa_aqi``, an ``"Unknown"`` category and
+            the UNKNOWN rating.
+        :param nowcast_fallback: When True, rows with a None NowCast use
+            their instantaneous reading instead.
+        :return: A list (or iterator when ``lazy``) of Matter Air Quality
+            Sensor endpoint dictionaries (or records) in data row order.
+        """
+        if not isinstance(purpleair_response, dict):
+            purpleair_response = {}
+        fields = purpleair_response.get("fields", [])
+        rows = purpleair_response.get("data", [])
+        if nowcast_pm25 is not None and len(nowcast_pm25) != len(rows):
+            raise ValueError(
+                f"Expected one PM2.5 NowCast per data row ({len(rows)}); "
+                f"got {len(nowcast_pm25)}"
+            )
+
+        # Look up the positions of the fields _normalise keeps once, not per row
+        canonical_field_names = PurpleAirMatterConverter._normalise(
+            dict.fromkeys(fields)
+        )
+        field_positions = [
+            (field_name, fields.index(field_name))
+            for field_name in canonical_field_names
+        ]
+        pm25_position = fields.index("pm2.5") if "pm2.5" in fields else None
+        pm25_values = [
+            _safe_float(None if pm25_position is None else row[pm25_position])
+            for row in rows
+        ]
+        if nowcast_pm25 is not None:
+            pm25_values = [
+                (
+                    nowcast
+                    if nowcast is not None
+                    else (pm25 if nowcast_fallback else float("nan"))
+                )
+                for pm25, nowcast in zip(pm25_values, nowcast_pm25)
+            ]
+
+        aqi_values = EpaAqiCalculator.pm25_to_aqi_batch(pm25_values)
+        aqi_categories = EpaAqiCalculator.aqi_to_epa_category_batch(aqi_values)
+        rating_codes = MatterAirQualityRating.from_aqi_batch(aqi_values)
+        if numpy is not None:
+            aqi_values = aqi_values.tolist()
+            aqi_categories = aqi_categories.tolist()
+            rating_codes = rating_codes.tolist()
+
+        fragments = None if as_record else _air_quality_sensor_fragments()
+
+        def build_endpoints() -> Iterator[dict[str, Any] | AirQualityEndpoint]:
+            for row, aqi, aqi_category, rating_code in zip(
+                rows, aqi_values, aqi_categories, rating_codes
+            ):
+                yield PurpleAirMatterConverter._build_air_quality_sensor(
+                    {
+                        field_name: row[position]
+                        for field_name, position in field_positions
+                    },
+                    aqi if isnan(aqi) else int(aqi),
+                    aqi_category,
+                    MatterAirQualityRating(rating_code),
+                    fragments,
+                    as_record=as_record,
+                )
+
+        if lazy:
+            return build_endpoints()
+
+        return list(build_endpoints())
+
+    @staticmethod
+    def _build_air_quality_sensor(
+        data: dict[str, Any],
+        aqi: float,
+        aqi_category: str,
+        rating: MatterAirQualityRating,
+        fragments: dict[str, Any] | None,
+        sensor_name: str | None = None,
+        as_record: bool = False,
+    ) -> dict[str, Any] | AirQualityEndpoint:
+        """
+        Build a **Matter Air Quality Sensor** endpoint structure from
+        normalised sensor data and its already computed EPA AQI.
+
+        :param data: Normalised sensor data, as returned by :meth:`_normalise`.
+        :param aqi: EPA AQI computed from the PM2.5 reading.
+        :param aqi_category: EPA category of ``aqi``.
+        :param rating: Matter Air Quality Rating of ``aqi``.
+        :param fragments: Static fragments from ``_air_quality_sensor_fragments``.
+            Not used, and may be None, when ``as_record`` is True.
+        :param sensor_name: Optional display name override for the device.
+        :param as_record: When True, return an :class:`AirQualityEndpoint`
+            record instead of a dictionary.
+        :return: Dictionary (or record) representing a Matter Air Quality
+            Sensor endpoint.
+        """
         # All sensor fields are nullable — use _nullable_float so that
         # absent/None values remain None (not coerced to 0), letting the
         # Matter ecosystem report "unavailable" instead of "0 °C / 0 %".
@@ -384,11 +885,6 @@ class PurpleAirMatterConverter:
         humidity = _safe_float(data.get("humidity"))
         pressure_psi = _safe_float(data.get("pressure"))
 
-        # Compute EPA AQI from PM2.5
-        aqi = EpaAqiCalculator.pm25_to_aqi(pm25_raw if pm25_raw is not None else 0.0)
-        aqi_category = EpaAqiCalculator.aqi_to_epa_category(aqi)
-        rating = MatterAirQualityRating.from_aqi(aqi)
-
         # Unit conversions
         temp_c = fahrenheit_to_celsius(temp_f) if temp_f is not None else None
         pressure_kpa = (
@@ -405,16 +901,56 @@ class PurpleAirMatterConverter:
         #   Humidity   : value × 100   (e.g. 45.6%   → 4560)
         #   Pressure   : value × 10    (e.g. 101.325 kPa → 1013)
         #   Air Quality densities : value × 100
-        return {
-            "device_type": {
-                "id": MATTER_DEVICE_TYPE_AIR_QUALITY_SENSOR,
-                "label": "Air Quality Sensor",
-                "matter_version": PurpleAirMatterConverter.MATTER_VERSION,
-                "spec_reference": (
-                    "Matter 1.5.1 Core Spec — Air Quality Sensor Device Type "
-                    "(Section 11.3, CSA 2024)"
+        pm25_value = int(round(pm25_raw * 100)) if pm25_raw is not None else None
+        pm1_value = int(round(pm1_raw * 100)) if pm1_raw is not None else None
+        pm10_value = int(round(pm10_raw * 100)) if pm10_raw is not None else None
+        voc_value = int(round(voc_raw * 100)) if voc_raw is not None else None
+        temp_value = int(round(temp_c * 100)) if temp_c is not None else None
+        humidity_value = int(round(humidity * 100)) if humidity is not None else None
+        pressure_value = (
+            int(round(pressure_kpa * 10)) if pressure_kpa is not None else None
+        )
+
+        if as_record:
+            return AirQualityEndpoint(
+                sensor_index=sensor_index,
+                sensor_name=device_name,
+                latitude=data.get("latitude"),
+                longitude=data.get("longitude"),
+                firmware_version=data.get("firmware_version"),
+                hardware_model=data.get("hardware"),
+                air_quality=AirQualityMeasurementCluster(
+                    measured_value=pm25_value,
+                    pm1_density=pm1_value,
+                    pm10_density=pm10_value,
+                    voc_density=voc_value,
+                    air_quality=rating.value,
+                    aqi_rating=rating.value,
+                    pm25_ug_m3=pm25_raw,
+                    pm1_ug_m3=pm1_raw,
+                    pm10_ug_m3=pm10_raw,
+                    voc_ug_m3=voc_raw,
                 ),
-            },
+                temperature=TemperatureCluster(
+                    measured_value=temp_value,
+                    raw_celsius=temp_c,
+                    raw_fahrenheit=temp_f,
+                ),
+                humidity=HumidityCluster(
+                    measured_value=humidity_value, raw_percent=humidity
+                ),
+                pressure=PressureCluster(
+                    measured_value=pressure_value,
+                    raw_kpa=pressure_kpa,
+                    raw_psi=pressure_psi,
+                ),
+                summary=AirQualitySummary(
+                    epa_aqi=aqi, epa_category=aqi_category, rating=rating
+                ),
+            )
+
+        return {
+            "device_type": fragments["device_type"],
             "endpoint": 1,
             "sensor_index": sensor_index,
             "sensor_name": device_name,
@@ -428,18 +964,10 @@ class PurpleAirMatterConverter:
                     "cluster_id": MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT,
                     "attributes": {
                         # Matter stores µg/m³ × 100 as INTEGER
-                        "measuredValue": (
-                            int(round(pm25_raw * 100)) if pm25_raw is not None else None
-                        ),
-                        "pm1Density": (
-                            int(round(pm1_raw * 100)) if pm1_raw is not None else None
-                        ),
-                        "pm10Density": (
-                            int(round(pm10_raw * 100)) if pm10_raw is not None else None
-                        ),
-                        "vocDensity": (
-                            int(round(voc_raw * 100)) if voc_raw is not None else None
-                        ),
+                        "measuredValue": pm25_value,
+                        "pm1Density": pm1_value,
+                        "pm10Density": pm10_value,
+                        "vocDensity": voc_value,
                         # airQuality: Matter::AirQuality enum (0x0007), mapped from AQI
                         "airQuality": rating.value,
                         # aqiRating: Matter::AirQualityRating enum (0x0008)
@@ -451,63 +979,42 @@ class PurpleAirMatterConverter:
                         "pm10_ug_m3": pm10_raw,
                         "voc_ug_m3": voc_raw,
                     },
-                    "references": [
-                        "Matter 1.5.1 CD — Air Quality Measurement Cluster (0x005D)",
-                        "Matter Spec DCL — AirQuality Attribute (Attribute 0x0007)",
-                        "Matter Spec DCL — AirQualityRating Attribute (0x0008)",
-                    ],
+                    "references": fragments["air_quality_references"],
                 },
                 # ---- Temperature Measurement (optional, 0x0402) ----
                 "temperature_measurement": {
                     "cluster_id": MATTER_CLUSTER_TEMP_MEASUREMENT,
                     "attributes": {
-                        "measuredValue": (
-                            int(round(temp_c * 100)) if temp_c is not None else None
-                        ),
+                        "measuredValue": temp_value,
                         "minMeasuredValue": -27315,  # -273.15 °C
                         "maxMeasuredValue": 20000,  # 200.00 °C
                     },
                     "_raw_celsius": temp_c,
                     "_raw_fahrenheit": temp_f,
-                    "references": [
-                        "Matter 1.5.1 CD — Temperature Measurement Cluster (0x0402)",
-                        "Matter Spec DCL — MeasuredValue Attribute",
-                    ],
+                    "references": fragments["temperature_references"],
                 },
                 # ---- Relative Humidity Measurement (optional, 0x0405) ----
                 "humidity_measurement": {
                     "cluster_id": MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
                     "attributes": {
-                        "measuredValue": (
-                            int(round(humidity * 100)) if humidity is not None else None
-                        ),
+                        "measuredValue": humidity_value,
                         "minMeasuredValue": 0,
                         "maxMeasuredValue": 10000,  # 100.00 %
                     },
                     "_raw_percent": humidity,
-                    "references": [
-                        "Matter 1.5.1 CD — Relative Humidity Measurement (0x0405)",
-                        "Matter Spec DCL — MeasuredValue Attribute",
-                    ],
+                    "references": fragments["humidity_references"],
                 },
                 # ---- Barometric Pressure Measurement (optional, 0x0403) ----
                 "pressure_measurement": {
                     "cluster_id": MATTER_CLUSTER_PRESSURE_MEASUREMENT,
                     "attributes": {
-                        "measuredValue": (
-                            int(round(pressure_kpa * 10))
-                            if pressure_kpa is not None
-                            else None
-                        ),
+                        "measuredValue": pressure_value,
                         "minMeasuredValue": 0,  # 0 kPa
                         "maxMeasuredValue": 11500,  # 1150.0 kPa
                     },
                     "_raw_kpa": pressure_kpa,
                     "_raw_psi": pressure_psi,
-                    "references": [
-                        "Matter 1.5.1 CD — Barometric Pressure Measurement (0x0403)",
-                        "Matter Spec DCL — MeasuredValue Attribute",
-                    ],
+                    "references": fragments["pressure_references"],
                 },
             },
             # ---- Computed air quality summary ----
@@ -516,11 +1023,7 @@ class PurpleAirMatterConverter:
                 "epa_category": aqi_category,
                 "matter_air_quality_rating": rating.name,
                 "matter_air_quality_rating_value": rating.value,
-                "references": [
-                    "EPA AQI Technical Assistance Document (2012 revision)",
-                    "<https://www.airnow.gov/sites/default/files/2022-05/AQI-"
-                    "Basics-Calculation.pdf>",
-                ],
+                "references": fragments["summary_references"],
             },
         }
 
@@ -537,7 +1040,23 @@ class PurpleAirMatterConverter:
         :param sensor_name: Optional display name override.
         :return: Matter Temperature Sensor endpoint structure.
         """
-        data = PurpleAirMatterConverter._normalise(purpleair_data)
+        return PurpleAirMatterConverter._build_temperature_sensor(
+            PurpleAirMatterConverter._normalise(purpleair_data), sensor_name
+        )
+
+    @staticmethod
+    def _build_temperature_sensor(
+        data: dict[str, Any],
+        sensor_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a **Matter Temperature Sensor** endpoint structure from
+        normalised sensor data.
+
+        :param data: Normalised sensor data, as returned by :meth:`_normalise`.
+        :param sensor_name: Optional display name override.
+        :return: Matter Temperature Sensor endpoint structure.
+        """
         temp_f = _nullable_float(data.get("temperature"))
         temp_c = fahrenheit_to_celsius(temp_f) if temp_f is not None else None
         device_name = sensor_name or data.get("name") or "PurpleAir Temperature"
@@ -550,6 +1069,9 @@ class PurpleAirMatterConverter:
                 "spec_reference": "Matter 1.5.1 CD — Temperature Sensor Device Type",
             },
             "endpoint": 1,
+            "sensor_index": data.get(
+                "sensor_index", PurpleAirMatterConverter.DEFAULT_SENSOR_INDEX
+            ),
             "sensor_name": device_name,
             "clusters": {
                 "temperature_measurement": {
@@ -586,7 +1108,23 @@ class PurpleAirMatterConverter:
         :param sensor_name: Optional display name override.
         :return: Matter Environmental Sensor endpoint structure.
         """
-        data = PurpleAirMatterConverter._normalise(purpleair_data)
+        return PurpleAirMatterConverter._build_environmental_sensor(
+            PurpleAirMatterConverter._normalise(purpleair_data), sensor_name
+        )
+
+    @staticmethod
+    def _build_environmental_sensor(
+        data: dict[str, Any],
+        sensor_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a **Matter Environmental Sensor** endpoint structure from
+        normalised sensor data.
+
+        :param data: Normalised sensor data, as returned by :meth:`_normalise`.
+        :param sensor_name: Optional display name override.
+        :return: Matter Environmental Sensor endpoint structure.
+        """
         temp_f = _nullable_float(data.get("temperature"))
         temp_c = fahrenheit_to_celsius(temp_f) if temp_f is not None else None
         humidity = _nullable_float(data.get("humidity"))
@@ -604,6 +1142,9 @@ class PurpleAirMatterConverter:
                 "spec_reference": "Matter 1.5.1 CD — Environmental Sensor Device Type",
             },
             "endpoint": 1,
+            "sensor_index": data.get(
+                "sensor_index", PurpleAirMatterConverter.DEFAULT_SENSOR_INDEX
+            ),
             "sensor_name": device_name,
             "clusters": {
                 "temperature_measurement": {
@@ -677,22 +1218,286 @@ class PurpleAirMatterConverter:
         if not isinstance(inner, dict):
             inner = {}
 
-        # Only ever copy the 13 canonical fields — absent fields stay absent
-        # (not defaulted to 0 / 0.0) so the converter can distinguish
-        # "no reading" from "zero reading".
-        _CANONICAL_FIELDS = (
-            "pm2.5",
-            "pm1.0",
-            "pm10.0",
-            "voc",
-            "temperature",
-            "humidity",
-            "pressure",
-            "name",
-            "latitude",
-            "longitude",
-            "firmware_version",
-            "hardware",
-            "sensor_index",
-        )
         return {key: inner[key] for key in _CANONICAL_FIELDS if key in inner}
+
+
+# =============================================================================
+# Static Matter Fragments
+# =============================================================================
+
+
+def _air_quality_sensor_fragments() -> dict[str, Any]:
+    """
+    Build the parts of a Matter Air Quality Sensor endpoint that are the same
+    for every sensor, so a batch conversion can share one copy of them.
+
+    :return: Dictionary of the ``device_type`` and ``references`` fragments.
+    """
+    return {
+        "device_type": {
+            "id": MATTER_DEVICE_TYPE_AIR_QUALITY_SENSOR,
+            "label": "Air Quality Sensor",
+            "matter_version": PurpleAirMatterConverter.MATTER_VERSION,
+            "spec_reference": (
+                "Matter 1.5.1 Core Spec — Air Quality Sensor Device Type "
+                "(Section 11.3, CSA 2024)"
+            ),
+        },
+        "air_quality_references": [
+            "Matter 1.5.1 CD — Air Quality Measurement Cluster (0x005D)",
+            "Matter Spec DCL — AirQuality Attribute (Attribute 0x0007)",
+            "Matter Spec DCL — AirQualityRating Attribute (0x0008)",
+        ],
+        "temperature_references": [
+            "Matter 1.5.1 CD — Temperature Measurement Cluster (0x0402)",
+            "Matter Spec DCL — MeasuredValue Attribute",
+        ],
+        "humidity_references": [
+            "Matter 1.5.1 CD — Relative Humidity Measurement (0x0405)",
+            "Matter Spec DCL — MeasuredValue Attribute",
+        ],
+        "pressure_references": [
+            "Matter 1.5.1 CD — Barometric Pressure Measurement (0x0403)",
+            "Matter Spec DCL — MeasuredValue Attribute",
+        ],
+        "summary_references": [
+            "EPA AQI Technical Assistance Document (2012 revision)",
+            "<https://www.airnow.gov/sites/default/files/2022-05/AQI-"
+            "Basics-Calculation.pdf>",
+        ],
+    }
+
+
+# =============================================================================
+# Compact Matter Records
+# Immutable, slotted alternatives to the endpoint dictionaries. Values that
+# are the same for every sensor (cluster IDs, min/max measured values,
+# device type and references) are class attributes, shared by every record.
+# =============================================================================
+
+_STATIC_FRAGMENTS = _air_quality_sensor_fragments()
+
+
+@dataclass(frozen=True, slots=True)
+class AirQualityMeasurementCluster:
+    """
+    Matter Air Quality Measurement cluster (0x005D) values of one sensor.
+    """
+
+    cluster_id: ClassVar[int] = MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT
+    references: ClassVar[tuple[str, ...]] = tuple(
+        _STATIC_FRAGMENTS["air_quality_references"]
+    )
+
+    measured_value: int | None
+    pm1_density: int | None
+    pm10_density: int | None
+    voc_density: int | None
+    air_quality: int
+    aqi_rating: int
+    pm25_ug_m3: float | None
+    pm1_ug_m3: float | None
+    pm10_ug_m3: float | None
+    voc_ug_m3: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The cluster as it appears in the endpoint dictionary.
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "attributes": {
+                "measuredValue": self.measured_value,
+                "pm1Density": self.pm1_density,
+                "pm10Density": self.pm10_density,
+                "vocDensity": self.voc_density,
+                "airQuality": self.air_quality,
+                "aqiRating": self.aqi_rating,
+            },
+            "_raw": {
+                "pm25_ug_m3": self.pm25_ug_m3,
+                "pm1_ug_m3": self.pm1_ug_m3,
+                "pm10_ug_m3": self.pm10_ug_m3,
+                "voc_ug_m3": self.voc_ug_m3,
+            },
+            "references": list(self.references),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TemperatureCluster:
+    """
+    Matter Temperature Measurement cluster (0x0402) values of one sensor.
+    """
+
+    cluster_id: ClassVar[int] = MATTER_CLUSTER_TEMP_MEASUREMENT
+    min_measured_value: ClassVar[int] = -27315  # -273.15 °C
+    max_measured_value: ClassVar[int] = 20000  # 200.00 °C
+    references: ClassVar[tuple[str, ...]] = tuple(
+        _STATIC_FRAGMENTS["temperature_references"]
+    )
+
+    measured_value: int | None
+    raw_celsius: float | None
+    raw_fahrenheit: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The cluster as it appears in the endpoint dictionary.
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "attributes": {
+                "measuredValue": self.measured_value,
+                "minMeasuredValue": self.min_measured_value,
+                "maxMeasuredValue": self.max_measured_value,
+            },
+            "_raw_celsius": self.raw_celsius,
+            "_raw_fahrenheit": self.raw_fahrenheit,
+            "references": list(self.references),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class HumidityCluster:
+    """
+    Matter Relative Humidity Measurement cluster (0x0405) values of one sensor.
+    """
+
+    cluster_id: ClassVar[int] = MATTER_CLUSTER_HUMIDITY_MEASUREMENT
+    min_measured_value: ClassVar[int] = 0
+    max_measured_value: ClassVar[int] = 10000  # 100.00 %
+    references: ClassVar[tuple[str, ...]] = tuple(
+        _STATIC_FRAGMENTS["humidity_references"]
+    )
+
+    measured_value: int | None
+    raw_percent: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The cluster as it appears in the endpoint dictionary.
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "attributes": {
+                "measuredValue": self.measured_value,
+                "minMeasuredValue": self.min_measured_value,
+                "maxMeasuredValue": self.max_measured_value,
+            },
+            "_raw_percent": self.raw_percent,
+            "references": list(self.references),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PressureCluster:
+    """
+    Matter Barometric Pressure Measurement cluster (0x0403) values of one sensor.
+    """
+
+    cluster_id: ClassVar[int] = MATTER_CLUSTER_PRESSURE_MEASUREMENT
+    min_measured_value: ClassVar[int] = 0  # 0 kPa
+    max_measured_value: ClassVar[int] = 11500  # 1150.0 kPa
+    references: ClassVar[tuple[str, ...]] = tuple(
+        _STATIC_FRAGMENTS["pressure_references"]
+    )
+
+    measured_value: int | None
+    raw_kpa: float | None
+    raw_psi: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The cluster as it appears in the endpoint dictionary.
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "attributes": {
+                "measuredValue": self.measured_value,
+                "minMeasuredValue": self.min_measured_value,
+                "maxMeasuredValue": self.max_measured_value,
+            },
+            "_raw_kpa": self.raw_kpa,
+            "_raw_psi": self.raw_psi,
+            "references": list(self.references),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AirQualitySummary:
+    """
+    EPA AQI, category and Matter Air Quality Rating of one sensor.
+    """
+
+    references: ClassVar[tuple[str, ...]] = tuple(
+        _STATIC_FRAGMENTS["summary_references"]
+    )
+
+    epa_aqi: float
+    epa_category: str
+    rating: MatterAirQualityRating
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The summary as it appears in the endpoint dictionary.
+        """
+        return {
+            "epa_aqi": self.epa_aqi,
+            "epa_category": self.epa_category,
+            "matter_air_quality_rating": self.rating.name,
+            "matter_air_quality_rating_value": self.rating.value,
+            "references": list(self.references),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AirQualityEndpoint:
+    """
+    A **Matter Air Quality Sensor** endpoint (Device Type 0x002D), as returned
+    by :meth:`PurpleAirMatterConverter.to_air_quality_sensor` with
+    ``as_record=True``.
+
+    Records are immutable and hold only the per-sensor values, so they can be
+    shared across threads and kept for large fleets cheaply.
+    :meth:`to_dict` returns the same dictionary the converter returns by
+    default, for consumers that expect one.
+    """
+
+    endpoint: ClassVar[int] = 1
+    device_type: ClassVar[dict[str, Any]] = _STATIC_FRAGMENTS["device_type"]
+
+    sensor_index: Any
+    sensor_name: str
+    latitude: float | None
+    longitude: float | None
+    firmware_version: str | None
+    hardware_model: str | None
+    air_quality: AirQualityMeasurementCluster
+    temperature: TemperatureCluster
+    humidity: HumidityCluster
+    pressure: PressureCluster
+    summary: AirQualitySummary
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The endpoint as a dictionary, equal to what
+            :meth:`PurpleAirMatterConverter.to_air_quality_sensor` returns.
+        """
+        return {
+            "device_type": dict(self.device_type),
+            "endpoint": self.endpoint,
+            "sensor_index": self.sensor_index,
+            "sensor_name": self.sensor_name,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "firmware_version": self.firmware_version,
+            "hardware_model": self.hardware_model,
+            "clusters": {
+                "air_quality_measurement": self.air_quality.to_dict(),
+                "temperature_measurement": self.temperature.to_dict(),
+                "humidity_measurement": self.humidity.to_dict(),
+                "pressure_measurement": self.pressure.to_dict(),
+            },
+            "air_quality_summary": self.summary.to_dict(),
+        }
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+
+Matter attribute delta reporting for PurpleAir Sensors.
+
+Remembers the attribute values last reported for each sensor and returns
+only the cluster attributes that changed by at least their reportable
+change, the way a Matter bridge reports attributes to its subscribers.
+
+References:
+  - Matter 1.5.1 Core Specification (CSA, 2024), Interaction Model —
+    Subscribe Interaction and Reportable Change
+    <https://csa-iot.org/developer-resource/specifications/>
+
+Author: carlkidcrypto
+Repository: <https://github.com/carlkidcrypto/purpleair_api>
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Iterable
+
+from purpleair_api.PurpleAirMatterConverter import PurpleAirMatterConverter
+
+#: The smallest change of each ``(cluster, attribute)`` that is reported, in the
+#: attribute's Matter scaled units. Attributes not listed report any change.
+DEFAULT_MATTER_REPORTABLE_CHANGES: dict[tuple[str, str], int] = {
+    # Air Quality densities are µg/m³ × 100, so 10 is 0.1 µg/m³
+    ("air_quality_measurement", "measuredValue"): 10,
+    ("air_quality_measurement", "pm1Density"): 10,
+    ("air_quality_measurement", "pm10Density"): 10,
+    ("air_quality_measurement", "vocDensity"): 10,
+    # Temperature is °C × 100, so 10 is 0.1 °C
+    ("temperature_measurement", "measuredValue"): 10,
+    # Humidity is % × 100, so 100 is 1 %
+    ("humidity_measurement", "measuredValue"): 100,
+    # Pressure is kPa × 10, so 1 is 0.1 kPa
+    ("pressure_measurement", "measuredValue"): 1,
+}
+
+
+class PurpleAirMatterDeltaReporter:
+    """
+    Tracks the cluster attributes last reported for each ``sensor_index`` and
+    returns only what changed since.
+
+    Endpoints of different device types are tracked apart, so a sensor's Air
+    Quality Sensor and Temperature Sensor endpoints each get their own first
+    full report. Endpoints may be dictionaries or the records returned with
+    ``as_record=True``.
+
+    A numeric attribute is reported when it has moved by at least its
+    reportable change from the value last *reported*, so slow drift is
+    reported once it adds up. Any other change, including to or from
+    ``None``, is always reported. The first endpoint seen for a sensor is
+    reported in full.
+
+    Example — Matter bridge refresh::
+
+        reporter = PurpleAirMatterDeltaReporter(
+            {("temperature_measurement", "measuredValue"): 50}  # 0.5 °C
+        )
+        for endpoint in PurpleAirMatterConverter.to_air_quality_sensors(response):
+            changes = reporter.diff(endpoint)
+            if changes:
+                bridge.report(endpoint["sensor_index"], changes)
+    """
+
+    def __init__(
+        self, reportable_changes: dict[tuple[str, str], float] | None = None
+    ) -> None:
+        """
+        :param reportable_changes: Optional ``{(cluster, attribute): change}``
+            thresholds, in the attribute's Matter scaled units, that replace
+            the ones in :data:`DEFAULT_MATTER_REPORTABLE_CHANGES`. A change of
+            0 reports every change.
+        """
+        self._reportable_changes = dict(DEFAULT_MATTER_REPORTABLE_CHANGES)
+        if reportable_changes is not None:
+            self._reportable_changes.update(reportable_changes)
+
+        self._lock = Lock()
+        self._reported_values: dict[Any, dict[Any, dict[tuple[str, str], Any]]] = {}
+
+    @property
+    def tracked_count(self) -> int:
+        """
+        The number of sensors with reported attribute values.
+        """
+        return len(self._reported_values)
+
+    def _has_changed(
+        self, key: tuple[str, str], old_value: Any, new_value: Any
+    ) -> bool:
+        """
+        Decide whether an attribute moved enough to be reported.
+
+        :param key: The ``(cluster, attribute)`` of the attribute.
+        :param old_value: The value last reported.
+        :param new_value: The current value.
+        :return: True if the attribute should be reported.
+        """
+        if (
+            isinstance(old_value, (int, float))
+            and isinstance(new_value, (int, float))
+            and not isinstance(old_value, bool)
+            and not isinstance(new_value, bool)
+        ):
+            reportable_change = self._reportable_changes.get(key, 0)
+            if reportable_change:
+                return abs(new_value - old_value) >= reportable_change
+
+        return new_value != old_value
+
+    @staticmethod
+    def _endpoint_key(endpoint: dict[str, Any], key: Any) -> Any:
+        """
+        Return the key an endpoint's reported values are tracked under.
+
+        :param endpoint: A Matter endpoint dictionary.
+        :param key: The key passed by the caller, or None.
+        :return: ``key``, or the endpoint's ``sensor_index``.
+        :raises ValueError: If ``key`` is None and the endpoint has no
+            ``sensor_index``.
+        """
+        if key is not None:
+            return key
+
+        sensor_index = endpoint.get("sensor_index")
+        if (
+            sensor_index is None
+            or sensor_index == PurpleAirMatterConverter.DEFAULT_SENSOR_INDEX
+        ):
+            raise ValueError(
+                "The endpoint has no sensor_index; request the sensor_index field "
+                "or pass a key to track the endpoint under"
+            )
+
+        return sensor_index
+
+    def diff(
+        self, endpoint: dict[str, Any] | Any, key: Any = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Return the cluster attributes of an endpoint that changed since they
+        were last reported, and remember them as reported.
+
+        :param endpoint: A Matter endpoint from :class:`PurpleAirMatterConverter`,
+            with ``sensor_index`` and ``clusters``, or a record with ``to_dict()``.
+        :param key: Optional key to track the endpoint under instead of its
+            ``sensor_index``.
+        :return: ``{cluster: {attribute: value}}`` of the changed attributes.
+            Empty when nothing changed enough to report.
+        :raises ValueError: If ``key`` is None and the endpoint has no
+            ``sensor_index``.
+        """
+        if hasattr(endpoint, "to_dict"):
+            endpoint = endpoint.to_dict()
+
+        key = self._endpoint_key(endpoint, key)
+        device_type_id = (endpoint.get("device_type") or {}).get("id")
+        clusters = endpoint.get("clusters") or {}
+
+        changes: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            reported_values = self._reported_values.setdefault(key, {}).setdefault(
+                device_type_id, {}
+            )
+            for cluster_name, cluster in clusters.items():
+                for attribute_name, value in cluster.get("attributes", {}).items():
+                    attribute_key = (cluster_name, attribute_name)
+                    if attribute_key in reported_values and not self._has_changed(
+                        attribute_key, reported_values[attribute_key], value
+                    ):
+                        continue
+
+                    reported_values[attribute_key] = value
+                    changes.setdefault(cluster_name, {})[attribute_name] = value
+
+        return changes
+
+    def diff_many(
+        self, endpoints: Iterable[dict[str, Any] | Any]
+    ) -> dict[Any, dict[str, dict[str, Any]]]:
+        """
+        Run :meth:`diff` over many endpoints, i.e., the output of
+        :meth:`PurpleAirMatterConverter.to_air_quality_sensors`.
+
+        :param endpoints: An iterable of Matter endpoints or records, each
+            with a ``sensor_index``.
+        :return: ``{sensor_index: changes}`` for the sensors with changes only.
+        :raises ValueError: If an endpoint has no ``sensor_index``.
+        """
+        retval = {}
+        for endpoint in endpoints:
+            if hasattr(endpoint, "to_dict"):
+                endpoint = endpoint.to_dict()
+
+            changes = self.diff(endpoint)
+            if changes:
+                retval[endpoint["sensor_index"]] = changes
+
+        return retval
+
+    def forget(self, sensor_index: Any = None) -> None:
+        """
+        Drop the reported values of a sensor, or of every sensor, so the next
+        endpoint seen for it is reported in full. i.e., after a subscriber
+        resubscribes or a sensor is removed from the bridge.
+
+        :param sensor_index: Optional sensor, or key passed to :meth:`diff`, to
+            forget. When not provided every sensor is forgotten.
+        """
+        with self._lock:
+            if sensor_index is None:
+                self._reported_values.clear()
+            else:
+                self._reported_values.pop(sensor_index, None)
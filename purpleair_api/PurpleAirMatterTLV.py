@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+
+Matter TLV encoder and decoder for PurpleAir Sensors.
+
+Encodes the Matter cluster attributes of a PurpleAir sensor straight into
+Matter TLV (Tag-Length-Value) byte buffers, without building the endpoint
+dictionary that :class:`PurpleAirMatterConverter` returns, and decodes them
+back for tests and debugging.
+
+The Air Quality density attributes have no ids in the Matter specification,
+so the Air Quality buffers use this package's ids and are not interoperable
+with other Matter stacks. See :data:`MATTER_ATTRIBUTE_IDS`.
+
+References:
+  - Matter 1.5.1 Core Specification (CSA, 2024), Appendix A — Tag-length-value
+    (TLV) Encoding Format
+    <https://csa-iot.org/developer-resource/specifications/>
+
+Author: carlkidcrypto
+Repository: <https://github.com/carlkidcrypto/purpleair_api>
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+from purpleair_api.PurpleAirMatterConverter import (
+    MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT,
+    MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
+    MATTER_CLUSTER_PRESSURE_MEASUREMENT,
+    MATTER_CLUSTER_TEMP_MEASUREMENT,
+    EpaAqiCalculator,
+    MatterAirQualityRating,
+    PurpleAirMatterConverter,
+    _safe_float,
+    _safe_temperature_fahrenheit,
+    fahrenheit_to_celsius,
+    pressure_psi_to_kpa,
+)
+
+# =============================================================================
+# Matter TLV element types and tag controls (Appendix A.7)
+# =============================================================================
+
+TLV_TYPE_SIGNED_INT = 0x00
+TLV_TYPE_UNSIGNED_INT = 0x04
+TLV_TYPE_FALSE = 0x08
+TLV_TYPE_TRUE = 0x09
+TLV_TYPE_FLOAT32 = 0x0A
+TLV_TYPE_FLOAT64 = 0x0B
+TLV_TYPE_UTF8_STRING = 0x0C
+TLV_TYPE_BYTE_STRING = 0x10
+TLV_TYPE_NULL = 0x14
+TLV_TYPE_STRUCTURE = 0x15
+TLV_TYPE_ARRAY = 0x16
+TLV_TYPE_LIST = 0x17
+TLV_TYPE_END_OF_CONTAINER = 0x18
+
+TLV_TAG_ANONYMOUS = 0x00
+TLV_TAG_CONTEXT = 0x20
+
+# Integer (and length) widths, by the low two bits of the element type
+_SIGNED_INT_FORMATS = ("<b", "<h", "<i", "<q")
+_UNSIGNED_INT_FORMATS = ("<B", "<H", "<I", "<Q")
+
+# =============================================================================
+# Attribute ids
+# =============================================================================
+
+#: ``{cluster_id: {attribute_name: (attribute_id, value_format)}}`` for the
+#: attributes :class:`PurpleAirMatterConverter` reports. ``value_format`` is the
+#: :mod:`struct` format of the attribute's Matter type, i.e., ``"h"`` for int16.
+#: The Temperature, Humidity and Pressure Measurement clusters use the Matter
+#: ids. The Air Quality ids are this package's own: the Matter Air Quality
+#: cluster has no density attributes (the specification reports them in the
+#: separate concentration measurement clusters), so these ids are not
+#: interoperable and only :func:`decode_tlv` should read them.
+MATTER_ATTRIBUTE_IDS: dict[int, dict[str, tuple[int, str]]] = {
+    MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT: {
+        "measuredValue": (0x0000, "I"),
+        "pm1Density": (0x0001, "I"),
+        "pm10Density": (0x0002, "I"),
+        "vocDensity": (0x0003, "I"),
+        "airQuality": (0x0007, "B"),
+        "aqiRating": (0x0008, "B"),
+    },
+    MATTER_CLUSTER_TEMP_MEASUREMENT: {
+        "measuredValue": (0x0000, "h"),
+        "minMeasuredValue": (0x0001, "h"),
+        "maxMeasuredValue": (0x0002, "h"),
+    },
+    MATTER_CLUSTER_HUMIDITY_MEASUREMENT: {
+        "measuredValue": (0x0000, "H"),
+        "minMeasuredValue": (0x0001, "H"),
+        "maxMeasuredValue": (0x0002, "H"),
+    },
+    MATTER_CLUSTER_PRESSURE_MEASUREMENT: {
+        "measuredValue": (0x0000, "h"),
+        "minMeasuredValue": (0x0001, "h"),
+        "maxMeasuredValue": (0x0002, "h"),
+    },
+}
+
+
+# =============================================================================
+# Encoder
+# =============================================================================
+
+
+def _encode_control(element_type: int, tag: int | None) -> bytes:
+    """
+    Encode the control byte and tag of an element.
+
+    :param element_type: The TLV element type.
+    :param tag: Context tag 0-255, or None for an anonymous element.
+    :return: The control byte, followed by the tag byte for a context tag.
+    :raises ValueError: if ``tag`` does not fit in a context tag.
+    """
+    if tag is None:
+        return bytes((TLV_TAG_ANONYMOUS | element_type,))
+    if not 0 <= tag <= 0xFF:
+        raise ValueError(f"TLV context tags must be 0-255; got {tag}")
+    return bytes((TLV_TAG_CONTEXT | element_type, tag))
+
+
+def _width_code(bit_count: int) -> int:
+    """
+    Return the width code (0-3 for 1, 2, 4 or 8 bytes) that holds ``bit_count`` bits.
+
+    :param bit_count: The number of bits needed.
+    :return: The width code, or 4 when more than 64 bits are needed.
+    """
+    if bit_count <= 8:
+        return 0
+    if bit_count <= 16:
+        return 1
+    if bit_count <= 32:
+        return 2
+    if bit_count <= 64:
+        return 3
+    return 4
+
+
+def _encode_int(value: int, tag: int | None, signed: bool | None) -> bytes:
+    """
+    Encode an integer in the smallest width that holds it.
+
+    :param value: The integer.
+    :param tag: Context tag, or None for an anonymous element.
+    :param signed: True for a signed integer, False for unsigned, or None to
+        use signed only for negative values.
+    :return: The encoded element.
+    :raises ValueError: if ``value`` does not fit in 64 bits.
+    """
+    if signed is None:
+        signed = value < 0
+
+    if signed:
+        width_code = _width_code((value if value >= 0 else ~value).bit_length() + 1)
+    elif value >= 0:
+        width_code = _width_code(value.bit_length())
+    else:
+        width_code = 4
+
+    if width_code == 4:
+        raise ValueError(f"Integer {value} does not fit in a 64-bit TLV integer")
+
+    element_type = (
+        TLV_TYPE_SIGNED_INT if signed else TLV_TYPE_UNSIGNED_INT
+    ) + width_code
+    return _encode_control(element_type, tag) + value.to_bytes(
+        1 << width_code, "little", signed=signed
+    )
+
+
+def _encode_string(value: bytes, base_type: int, tag: int | None) -> bytes:
+    """
+    Encode a UTF-8 or byte string with the smallest length field that holds it.
+
+    :param value: The string bytes.
+    :param base_type: TLV_TYPE_UTF8_STRING or TLV_TYPE_BYTE_STRING.
+    :param tag: Context tag, or None for an anonymous element.
+    :return: The encoded element.
+    """
+    width_code = _width_code(len(value).bit_length())
+    return (
+        _encode_control(base_type + width_code, tag)
+        + len(value).to_bytes(1 << width_code, "little")
+        + value
+    )
+
+
+def encode_tlv(value: Any, tag: int | None = None, signed: bool | None = None) -> bytes:
+    """
+    Encode a Python value as a Matter TLV element.
+
+    ==================  ===========================================
+    Python type         TLV element
+    ==================  ===========================================
+    ``None``            Null
+    ``bool``            Boolean
+    ``int``             Signed / unsigned integer, smallest width
+    ``float``           Double precision float
+    ``str``             UTF-8 string
+    ``bytes``           Byte string
+    ``dict``            Structure, keys are context tags 0-255
+    ``list``/``tuple``  Array of anonymous elements
+    ==================  ===========================================
+
+    :param value: The value to encode.
+    :param tag: Optional context tag 0-255. Anonymous when not provided.
+    :param signed: Optional integer signedness. By default only negative
+        integers are encoded as signed.
+    :return: The TLV bytes.
+    :raises ValueError: if the value (or a value inside it) cannot be encoded.
+    """
+    if value is None:
+        return _encode_control(TLV_TYPE_NULL, tag)
+    if value is True:
+        return _encode_control(TLV_TYPE_TRUE, tag)
+    if value is False:
+        return _encode_control(TLV_TYPE_FALSE, tag)
+    if isinstance(value, int):
+        return _encode_int(value, tag, signed)
+    if isinstance(value, float):
+        return _encode_control(TLV_TYPE_FLOAT64, tag) + struct.pack("<d", value)
+    if isinstance(value, str):
+        return _encode_string(value.encode("utf-8"), TLV_TYPE_UTF8_STRING, tag)
+    if isinstance(value, (bytes, bytearray)):
+        return _encode_string(bytes(value), TLV_TYPE_BYTE_STRING, tag)
+    if isinstance(value, dict):
+        return (
+            _encode_control(TLV_TYPE_STRUCTURE, tag)
+            + b"".join(
+                encode_tlv(member, member_tag) for member_tag, member in value.items()
+            )
+            + bytes((TLV_TYPE_END_OF_CONTAINER,))
+        )
+    if isinstance(value, (list, tuple)):
+        return (
+            _encode_control(TLV_TYPE_ARRAY, tag)
+            + b"".join(encode_tlv(member) for member in value)
+            + bytes((TLV_TYPE_END_OF_CONTAINER,))
+        )
+
+    raise ValueError(f"Cannot TLV encode a {type(value).__name__}")
+
+
+def _make_attribute_encoder(attribute_id: int, value_format: str) -> tuple:
+    """
+    Precompute how an attribute is encoded: its context tag, the control byte
+    of its Matter type, and a :class:`struct.Struct` that packs the control
+    byte, tag and value in one call.
+
+    :param attribute_id: The attribute id, used as the context tag.
+    :param value_format: The :mod:`struct` format of the attribute's type.
+    :return: ``(attribute_id, type_name, lowest, highest, control, packer)``,
+        where ``lowest`` and ``highest`` bound the values the type holds.
+    """
+    signed = value_format.islower()
+    formats = _SIGNED_INT_FORMATS if signed else _UNSIGNED_INT_FORMATS
+    width_code = formats.index("<" + value_format)
+    bit_count = 8 << width_code
+    element_type = (
+        TLV_TYPE_SIGNED_INT if signed else TLV_TYPE_UNSIGNED_INT
+    ) + width_code
+    return (
+        attribute_id,
+        f"{'int' if signed else 'uint'}{bit_count}",
+        -(1 << (bit_count - 1)) if signed else 0,
+        (1 << (bit_count - 1 if signed else bit_count)) - 1,
+        TLV_TAG_CONTEXT | element_type,
+        struct.Struct("<BB" + value_format),
+    )
+
+
+# The MATTER_ATTRIBUTE_IDS encoders, built once at import
+_ATTRIBUTE_ENCODERS = {
+    cluster_id: {
+        attribute_name: _make_attribute_encoder(attribute_id, value_format)
+        for attribute_name, (attribute_id, value_format) in attribute_ids.items()
+    }
+    for cluster_id, attribute_ids in MATTER_ATTRIBUTE_IDS.items()
+}
+
+_STRUCTURE_START = bytes((TLV_TAG_ANONYMOUS | TLV_TYPE_STRUCTURE,))
+_CONTAINER_END = bytes((TLV_TYPE_END_OF_CONTAINER,))
+
+
+def _encode_attribute_members(cluster_id: int, attributes: dict[str, Any]) -> bytes:
+    """
+    Encode named attributes as the members of a cluster's attribute structure.
+
+    A value is packed as its attribute's Matter type.
+
+    :param cluster_id: The Matter cluster id, a key of :data:`MATTER_ATTRIBUTE_IDS`.
+    :param attributes: ``{attribute_name: value}``.
+    :return: The TLV bytes of the members, without the structure start and end.
+    :raises ValueError: if the cluster or an attribute name is unknown, or a
+        value is not an integer its attribute's type holds, i.e., a negative
+        density.
+    """
+    attribute_encoders = _ATTRIBUTE_ENCODERS.get(cluster_id)
+    if attribute_encoders is None:
+        raise ValueError(f"Unknown Matter cluster id {cluster_id:#06x}")
+
+    members = []
+    for attribute_name, value in attributes.items():
+        if attribute_name not in attribute_encoders:
+            raise ValueError(
+                f"Unknown attribute {attribute_name!r} for cluster {cluster_id:#06x}"
+            )
+        attribute_id, type_name, lowest, highest, control, packer = attribute_encoders[
+            attribute_name
+        ]
+        if value is None:
+            members.append(bytes((TLV_TAG_CONTEXT | TLV_TYPE_NULL, attribute_id)))
+            continue
+
+        if not isinstance(value, int) or not lowest <= value <= highest:
+            raise ValueError(
+                f"Attribute {attribute_name!r} of cluster {cluster_id:#06x} is a "
+                f"{type_name} ({lowest} to {highest}); got {value!r}"
+            )
+        members.append(packer.pack(control, attribute_id, value))
+
+    return b"".join(members)
+
+
+def encode_cluster_attributes(cluster_id: int, attributes: dict[str, Any]) -> bytes:
+    """
+    Encode named cluster attributes, i.e., a cluster's ``attributes`` from
+    :class:`PurpleAirMatterConverter` or its changes from
+    :class:`PurpleAirMatterDeltaReporter`, as a TLV structure whose context
+    tags are the attribute ids.
+
+    :param cluster_id: The Matter cluster id, a key of :data:`MATTER_ATTRIBUTE_IDS`.
+    :param attributes: ``{attribute_name: value}``.
+    :return: The TLV bytes of the structure.
+    :raises ValueError: if the cluster or an attribute name is unknown, or a
+        value does not fit its attribute's type.
+    """
+    return (
+        _STRUCTURE_START
+        + _encode_attribute_members(cluster_id, attributes)
+        + _CONTAINER_END
+    )
+
+
+# The min / max attributes are the same for every sensor, so encode them once
+_TEMPERATURE_LIMITS = _encode_attribute_members(
+    MATTER_CLUSTER_TEMP_MEASUREMENT,
+    {"minMeasuredValue": -27315, "maxMeasuredValue": 20000},
+)
+_HUMIDITY_LIMITS = _encode_attribute_members(
+    MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
+    {"minMeasuredValue": 0, "maxMeasuredValue": 10000},
+)
+_PRESSURE_LIMITS = _encode_attribute_members(
+    MATTER_CLUSTER_PRESSURE_MEASUREMENT,
+    {"minMeasuredValue": 0, "maxMeasuredValue": 11500},
+)
+
+
+def _scaled(value: float | None, scale: int) -> int | None:
+    """
+    Scale a reading to its Matter integer, keeping None as None.
+
+    :param value: The reading.
+    :param scale: The Matter scale, i.e., 100 for °C × 100.
+    :return: ``round(value × scale)``, or None.
+    """
+    return int(round(value * scale)) if value is not None else None
+
+
+def encode_air_quality_sensor_tlv(purpleair_data: dict[str, Any]) -> dict[int, bytes]:
+    """
+    Encode the cluster attributes of a **Matter Air Quality Sensor** straight
+    from PurpleAir sensor data.
+
+    The attribute values match those of
+    :meth:`PurpleAirMatterConverter.to_air_quality_sensor`, but no endpoint
+    dictionary, ``references`` or ``_raw`` values are built, and the min /
+    max attributes are encoded once for every sensor.
+
+    .. warning::
+       The Air Quality structure is **not interoperable**. Its density
+       attributes (``measuredValue``, ``pm1Density``, ``pm10Density`` and
+       ``vocDensity``) have no ids in the Matter specification, so they are
+       tagged with this package's ids from :data:`MATTER_ATTRIBUTE_IDS`.
+       Decode it with :func:`decode_tlv`, not another Matter stack. The
+       Temperature, Humidity and Pressure structures use the Matter ids.
+
+    :param purpleair_data: Raw PurpleAir sensor data dict.
+    :return: ``{cluster_id: TLV bytes}`` with one attribute structure for each
+        of the Air Quality, Temperature, Humidity and Pressure clusters.
+    :raises ValueError: if a reading does not fit its attribute's type, i.e.,
+        a negative PM1.0 density.
+    """
+    data = PurpleAirMatterConverter._normalise(purpleair_data)
+    pm25_raw = _safe_float(data.get("pm2.5"))
+    rating = MatterAirQualityRating.from_aqi(EpaAqiCalculator.pm25_to_aqi(pm25_raw))
+    temp_c = fahrenheit_to_celsius(
+        _safe_temperature_fahrenheit(data.get("temperature"))
+    )
+    pressure_kpa = pressure_psi_to_kpa(_safe_float(data.get("pressure")))
+
+    return {
+        MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT: encode_cluster_attributes(
+            MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT,
+            {
+                "measuredValue": _scaled(pm25_raw, 100),
+                "pm1Density": _scaled(_safe_float(data.get("pm1.0")), 100),
+                "pm10Density": _scaled(_safe_float(data.get("pm10.0")), 100),
+                "vocDensity": _scaled(_safe_float(data.get("voc")), 100),
+                "airQuality": rating.value,
+                "aqiRating": rating.value,
+            },
+        ),
+        MATTER_CLUSTER_TEMP_MEASUREMENT: _STRUCTURE_START
+        + _encode_attribute_members(
+            MATTER_CLUSTER_TEMP_MEASUREMENT, {"measuredValue": _scaled(temp_c, 100)}
+        )
+        + _TEMPERATURE_LIMITS
+        + _CONTAINER_END,
+        MATTER_CLUSTER_HUMIDITY_MEASUREMENT: _STRUCTURE_START
+        + _encode_attribute_members(
+            MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
+            {"measuredValue": _scaled(_safe_float(data.get("humidity")), 100)},
+        )
+        + _HUMIDITY_LIMITS
+        + _CONTAINER_END,
+        MATTER_CLUSTER_PRESSURE_MEASUREMENT: _STRUCTURE_START
+        + _encode_attribute_members(
+            MATTER_CLUSTER_PRESSURE_MEASUREMENT,
+            {"measuredValue": _scaled(pressure_kpa, 10)},
+        )
+        + _PRESSURE_LIMITS
+        + _CONTAINER_END,
+    }
+
+
+# =============================================================================
+# Decoder
+# =============================================================================
+
+
+def _decode_element(buffer: bytes, offset: int) -> tuple[int | None, Any, int]:
+    """
+    Decode one element, and everything inside it for a container.
+
+    :param buffer: The TLV bytes.
+    :param offset: The position of the element's control byte.
+    :return: ``(tag, value, next_offset)``. ``tag`` is None for an anonymous element.
+    :raises ValueError: if the element is truncated or uses an unsupported
+        element type or tag control.
+    """
+    try:
+        control = buffer[offset]
+        offset += 1
+        tag_control = control & 0xE0
+        element_type = control & 0x1F
+
+        tag = None
+        if tag_control == TLV_TAG_CONTEXT:
+            tag = buffer[offset]
+            offset += 1
+        elif tag_control != TLV_TAG_ANONYMOUS:
+            raise ValueError(f"Unsupported TLV tag control {tag_control:#04x}")
+
+        if element_type < TLV_TYPE_FALSE:
+            value_format = (
+                _SIGNED_INT_FORMATS
+                if element_type < TLV_TYPE_UNSIGNED_INT
+                else _UNSIGNED_INT_FORMATS
+            )[element_type & 0x03]
+            (value,) = struct.unpack_from(value_format, buffer, offset)
+            return tag, value, offset + struct.calcsize(value_format)
+
+        if element_type in (TLV_TYPE_FALSE, TLV_TYPE_TRUE):
+            return tag, element_type == TLV_TYPE_TRUE, offset
+        if element_type == TLV_TYPE_FLOAT32:
+            return tag, struct.unpack_from("<f", buffer, offset)[0], offset + 4
+        if element_type == TLV_TYPE_FLOAT64:
+            return tag, struct.unpack_from("<d", buffer, offset)[0], offset + 8
+
+        if TLV_TYPE_UTF8_STRING <= element_type < TLV_TYPE_NULL:
+            length_format = _UNSIGNED_INT_FORMATS[element_type & 0x03]
+            (length,) = struct.unpack_from(length_format, buffer, offset)
+            offset += struct.calcsize(length_format)
+            if offset + length > len(buffer):
+                raise ValueError("Truncated TLV string")
+            value = bytes(buffer[offset : offset + length])
+            if element_type < TLV_TYPE_BYTE_STRING:
+                value = value.decode("utf-8")
+            return tag, value, offset + length
+
+        if element_type == TLV_TYPE_NULL:
+            return tag, None, offset
+
+        if element_type in (TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY, TLV_TYPE_LIST):
+            members = []
+            while buffer[offset] != TLV_TYPE_END_OF_CONTAINER:
+                member_tag, member, offset = _decode_element(buffer, offset)
+                members.append((member_tag, member))
+            offset += 1
+
+            if element_type == TLV_TYPE_ARRAY:
+                return tag, [member for _, member in members], offset
+            if element_type == TLV_TYPE_STRUCTURE:
+                return tag, dict(members), offset
+            return tag, members, offset
+
+    except (IndexError, struct.error) as e:
+        raise ValueError("Truncated TLV element") from e
+
+    raise ValueError(f"Unsupported TLV element type {element_type:#04x}")
+
+
+def decode_tlv(buffer: bytes) -> Any:
+    """
+    Decode a Matter TLV element, i.e., one made by :func:`encode_tlv`.
+
+    Structures decode to a ``dict`` keyed by context tag, arrays to a
+    ``list``, and lists to a ``list`` of ``(tag, value)`` pairs. The tag of
+    the outer element is dropped.
+
+    :param buffer: The TLV bytes of exactly one element.
+    :return: The decoded value.
+    :raises ValueError: if the bytes are not one valid element.
+    """
+    _, value, offset = _decode_element(buffer, 0)
+    if offset != len(buffer):
+        raise ValueError(f"{len(buffer) - offset} trailing bytes after the TLV element")
+    return value
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+
+Incremental EPA NowCast for PurpleAir Sensors.
+
+Keeps the last 12 hourly PM2.5 averages of each sensor in a fixed-size ring
+buffer and computes the NowCast, the EPA's real-time estimate of the 24-hour
+average that AirNow reports its current AQI from. Feed the NowCast to
+:class:`PurpleAirMatterConverter` so the reported ``aqiRating`` matches AirNow
+instead of following every instantaneous reading.
+
+References:
+  - EPA Technical Assistance Document for the Reporting of Daily Air Quality
+    (2018), NowCast for PM2.5
+    <https://www.airnow.gov/sites/default/files/2018-09/technical-assistance-document.pdf>
+  - AirNow — How is the NowCast algorithm used to report current air quality?
+    <https://usepa.servicenowservices.com/airnow?id=kb_article_view&sysparm_article=KB0011856>
+
+Author: carlkidcrypto
+Repository: <https://github.com/carlkidcrypto/purpleair_api>
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import floor, isnan
+from threading import Lock
+from time import time
+from typing import Any, Iterable
+
+from purpleair_api.PurpleAirMatterConverter import EpaAqiCalculator, _nullable_float
+
+#: The number of hourly averages the NowCast is computed over.
+NOWCAST_HOURS = 12
+
+#: The lowest weight factor allowed for PM2.5, so the NowCast never ignores
+#: older hours entirely when the concentration is changing quickly.
+NOWCAST_MIN_WEIGHT_FACTOR = 0.5
+
+_SECONDS_PER_HOUR = 3600
+
+
+# =============================================================================
+# Per-sensor history
+# =============================================================================
+
+
+class _NowCastHistory:
+    """
+    The hourly PM2.5 history of one sensor.
+
+    ``hourly_averages`` is a ring buffer indexed by ``hour % NOWCAST_HOURS``.
+    It holds the 12 completed hours before ``current_hour``, with NaN for hours
+    without readings. Readings of ``current_hour`` are summed until a reading
+    of a later hour completes it.
+    """
+
+    __slots__ = ("hourly_averages", "current_hour", "hour_sum", "hour_count")
+
+    def __init__(self, hour: int) -> None:
+        """
+        :param hour: The hour (seconds since the epoch // 3600) of the first reading.
+        """
+        self.hourly_averages = array("d", [float("nan")]) * NOWCAST_HOURS
+        self.current_hour = hour
+        self.hour_sum = 0.0
+        self.hour_count = 0
+
+    def add(self, hour: int, pm25: float) -> bool:
+        """
+        Add a reading. Completes ``current_hour`` when the reading is of a
+        later hour, marking any hours skipped in between as missing.
+
+        :param hour: The hour of the reading.
+        :param pm25: The PM2.5 concentration in µg/m³.
+        :return: False if the reading is of an already completed hour and was
+            ignored, otherwise True.
+        """
+        if hour < self.current_hour:
+            return False
+
+        if hour > self.current_hour:
+            self.hourly_averages[self.current_hour % NOWCAST_HOURS] = (
+                self.hour_sum / self.hour_count if self.hour_count else float("nan")
+            )
+            # At most NOWCAST_HOURS hours can be skipped, so this stays O(1)
+            for skipped_hour in range(
+                self.current_hour + 1, min(hour, self.current_hour + NOWCAST_HOURS + 1)
+            ):
+                self.hourly_averages[skipped_hour % NOWCAST_HOURS] = float("nan")
+
+            self.current_hour = hour
+            self.hour_sum = 0.0
+            self.hour_count = 0
+
+        self.hour_sum += pm25
+        self.hour_count += 1
+        return True
+
+    def recent_hours(self, hour: int) -> list[float]:
+        """
+        Return the averages of the 12 hours before ``hour``, most recent first.
+
+        :param hour: The hour the NowCast is for. Hours from ``current_hour``
+            up to it are complete; later readings have not arrived.
+        :return: 12 hourly averages, NaN where an hour has no readings.
+        """
+        retval = []
+        for hours_ago in range(1, NOWCAST_HOURS + 1):
+            past_hour = hour - hours_ago
+            if past_hour == self.current_hour:
+                retval.append(
+                    self.hour_sum / self.hour_count if self.hour_count else float("nan")
+                )
+            elif self.current_hour - NOWCAST_HOURS <= past_hour < self.current_hour:
+                retval.append(self.hourly_averages[past_hour % NOWCAST_HOURS])
+            else:
+                retval.append(float("nan"))
+
+        return retval
+
+
+# =============================================================================
+# NowCast
+# =============================================================================
+
+
+def nowcast_pm25(hourly_averages: Iterable[float | None]) -> float | None:
+    """
+    Compute the EPA PM2.5 NowCast from hourly averages.
+
+    The weight factor is the lowest over the highest hourly average, but no
+    less than 0.5. Each hour is weighted by the weight factor to the power of
+    how many hours ago it was, and missing hours are left out. The result is
+    truncated to 0.1 µg/m³.
+
+    :param hourly_averages: Up to 12 hourly PM2.5 averages in µg/m³, most
+        recent first. None or NaN marks an hour without readings.
+    :return: The NowCast in µg/m³, or None when fewer than 2 of the 3 most
+        recent hours have readings.
+    """
+    concentrations = [
+        (hours_ago, concentration)
+        for hours_ago, concentration in enumerate(hourly_averages)
+        if hours_ago < NOWCAST_HOURS
+        and concentration is not None
+        and not isnan(concentration)
+    ]
+    if sum(1 for hours_ago, _ in concentrations if hours_ago < 3) < 2:
+        return None
+
+    lowest = min(concentration for _, concentration in concentrations)
+    highest = max(concentration for _, concentration in concentrations)
+    weight_factor = max(
+        lowest / highest if highest > 0 else 1.0, NOWCAST_MIN_WEIGHT_FACTOR
+    )
+
+    weighted_sum = 0.0
+    weight_total = 0.0
+    for hours_ago, concentration in concentrations:
+        weight = weight_factor**hours_ago
+        weighted_sum += weight * concentration
+        weight_total += weight
+
+    # Truncate, not round, per the EPA; the epsilon keeps 12.3 from becoming 12.2
+    return floor(weighted_sum / weight_total * 10 + 1e-9) / 10
+
+
+class PurpleAirNowCast:
+    """
+    Tracks the hourly PM2.5 averages of many sensors and returns their EPA
+    NowCast.
+
+    Each reading updates its sensor in O(1): it is added to the sum of its
+    hour, and an hour's average is written to the sensor's 12 slot ring
+    buffer once a reading of a later hour arrives. A sensor costs a few
+    hundred bytes, so tens of thousands of sensors fit in a few megabytes.
+    Readings of an hour that was already completed are ignored, as are
+    missing and negative readings.
+
+    Like AirNow, the NowCast is computed over completed hours only; the hour
+    still being collected counts once a later ``timestamp`` is asked for.
+
+    Example — Matter bridge refresh::
+
+        nowcast = PurpleAirNowCast()
+        response = pa.request_multiple_sensors_data("pm2.5,last_seen")
+        nowcast.update_many(response)
+
+        position = response["fields"].index("sensor_index")
+        endpoints = PurpleAirMatterConverter.to_air_quality_sensors(
+            response,
+            nowcast_pm25=nowcast.nowcast_many(
+                row[position] for row in response["data"]
+            ),
+        )
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._histories: dict[Any, _NowCastHistory] = {}
+
+    @property
+    def tracked_count(self) -> int:
+        """
+        The number of sensors with PM2.5 history.
+        """
+        return len(self._histories)
+
+    def update(
+        self, sensor_index: Any, pm25: Any, timestamp: float | None = None
+    ) -> bool:
+        """
+        Add a PM2.5 reading of a sensor.
+
+        :param sensor_index: The sensor the reading is from.
+        :param pm25: The PM2.5 concentration in µg/m³.
+        :param timestamp: Optional time of the reading in seconds since the
+            epoch, i.e., the sensor's ``last_seen``. Defaults to now.
+        :return: True if the reading was added, False if it was missing,
+            negative or of an already completed hour.
+        """
+        pm25 = _nullable_float(pm25)
+        if pm25 is None or isnan(pm25) or pm25 < 0:
+            return False
+
+        hour = int((time() if timestamp is None else timestamp) // _SECONDS_PER_HOUR)
+        with self._lock:
+            history = self._histories.get(sensor_index)
+            if history is None:
+                history = self._histories[sensor_index] = _NowCastHistory(hour)
+
+            return history.add(hour, pm25)
+
+    def update_many(self, purpleair_response: dict[str, Any]) -> int:
+        """
+        Add the PM2.5 readings of a whole
+        :meth:`PurpleAirReadAPI.request_multiple_sensors_data` (or
+        :meth:`PurpleAirReadAPI.request_members_data`) response.
+
+        Each row's ``last_seen`` is its time when requested, otherwise the
+        response's ``data_time_stamp`` or ``time_stamp``.
+
+        :param purpleair_response: Raw PurpleAir response with ``fields``
+            (including ``sensor_index`` and ``pm2.5``) and ``data``.
+        :return: The number of readings added.
+        """
+        if not isinstance(purpleair_response, dict):
+            return 0
+
+        fields = purpleair_response.get("fields", [])
+        if "sensor_index" not in fields or "pm2.5" not in fields:
+            return 0
+
+        sensor_index_position = fields.index("sensor_index")
+        pm25_position = fields.index("pm2.5")
+        last_seen_position = (
+            fields.index("last_seen") if "last_seen" in fields else None
+        )
+        response_timestamp = purpleair_response.get(
+            "data_time_stamp", purpleair_response.get("time_stamp")
+        )
+
+        retval = 0
+        for row in purpleair_response.get("data", []):
+            timestamp = response_timestamp
+            if last_seen_position is not None and row[last_seen_position] is not None:
+                timestamp = row[last_seen_position]
+
+            if self.update(row[sensor_index_position], row[pm25_position], timestamp):
+                retval += 1
+
+        return retval
+
+    def hourly_averages(
+        self, sensor_index: Any, timestamp: float | None = None
+    ) -> list[float]:
+        """
+        Return the hourly PM2.5 averages a sensor's NowCast is computed from.
+
+        :param sensor_index: The sensor.
+        :param timestamp: Optional time to compute the NowCast for, in seconds
+            since the epoch. Hours without readings up to it count as missing.
+            Defaults to the hour of the sensor's latest reading.
+        :return: 12 hourly averages in µg/m³, most recent first, NaN where an
+            hour has no readings. All NaN for an unknown sensor.
+        """
+        with self._lock:
+            history = self._histories.get(sensor_index)
+            if history is None:
+                return [float("nan")] * NOWCAST_HOURS
+
+            hour = history.current_hour
+            if timestamp is not None:
+                hour = max(hour, int(timestamp // _SECONDS_PER_HOUR))
+
+            return history.recent_hours(hour)
+
+    def nowcast(
+        self, sensor_index: Any, timestamp: float | None = None
+    ) -> float | None:
+        """
+        Return the PM2.5 NowCast of a sensor.
+
+        :param sensor_index: The sensor.
+        :param timestamp: Optional time to compute the NowCast for, see
+            :meth:`hourly_averages`.
+        :return: The NowCast in µg/m³, or None without enough recent hours.
+        """
+        return nowcast_pm25(self.hourly_averages(sensor_index, timestamp))
+
+    def nowcast_many(
+        self, sensor_indices: Iterable[Any], timestamp: float | None = None
+    ) -> list[float | None]:
+        """
+        Return the PM2.5 NowCast of many sensors, i.e., one per data row to
+        pass to :meth:`PurpleAirMatterConverter.to_air_quality_sensors`.
+
+        :param sensor_indices: The sensors.
+        :param timestamp: Optional time to compute the NowCasts for, see
+            :meth:`hourly_averages`.
+        :return: The NowCasts in µg/m³, None where there are not enough
+            recent hours, in ``sensor_indices`` order.
+        """
+        return [
+            self.nowcast(sensor_index, timestamp) for sensor_index in sensor_indices
+        ]
+
+    def aqi(self, sensor_index: Any, timestamp: float | None = None) -> float | None:
+        """
+        Return the EPA AQI of a sensor's PM2.5 NowCast, as AirNow reports it.
+
+        :param sensor_index: The sensor.
+        :param timestamp: Optional time to compute the NowCast for, see
+            :meth:`hourly_averages`.
+        :return: The EPA AQI, or None without enough recent hours.
+        """
+        concentration = self.nowcast(sensor_index, timestamp)
+        if concentration is None:
+            return None
+
+        return EpaAqiCalculator.pm25_to_aqi(concentration)
+
+    def forget(self, sensor_index: Any = None) -> None:
+        """
+        Drop the history of a sensor, or of every sensor.
+
+        :param sensor_index: Optional sensor to forget. When not provided
+            every sensor is forgotten.
+        """
+        with self._lock:
+            if sensor_index is None:
+                self._histories.clear()
+            else:
+                self._histories.pop(sensor_index, None)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that paces requests to stay within an API points budget.
+It can be shared by several clients and threads that use the same API key.
+https://api.purpleair.com/#api-welcome
+"""
+
+from threading import Lock
+from time import monotonic, sleep
+
+from purpleair_api.PurpleAirAPIConstants import (
+    ACCEPTED_FIELD_NAMES_DICT,
+    DEFAULT_API_POINTS_PER_CALL,
+    DEFAULT_API_POINTS_PER_FIELD,
+    RATE_LIMITER_MODES_LIST,
+    READ_ENDPOINT_NAMES_LIST,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+
+
+class PurpleAirRateLimiter:
+    """
+    A thread safe token bucket measured in API points. The bucket holds up to `burst_points`
+    and refills at `points_per_second`. Each request takes the points it is estimated to
+    cost, and the bucket may go into debt when a response turns out to cost more, which
+    slows the requests that follow.
+
+    The limiter runs in one of three modes:
+
+    * ``"block"`` - wait until enough points are available.
+    * ``"nonblock"`` - raise `PurpleAirAPIError` instead of waiting.
+    * ``"estimate"`` - never wait or raise, only add up the points spent.
+
+    Requests can cost different points per endpoint and per field. Pass dictionaries as
+    `points_per_call` and `points_per_field` to match the costs of your plan.
+    """
+
+    def __init__(
+        self,
+        points_per_second,
+        burst_points=None,
+        mode="block",
+        points_per_call=DEFAULT_API_POINTS_PER_CALL,
+        points_per_field=DEFAULT_API_POINTS_PER_FIELD,
+    ):
+        """
+        :param float points_per_second: The rate the bucket refills at.
+        :param float burst_points: (optional) The most points the bucket holds. Defaults to
+                                   one second's worth of `points_per_second`.
+        :param str mode: (optional) One of RATE_LIMITER_MODES_LIST.
+        :param int | dict points_per_call: (optional) The points a request costs on its own, or a
+                                           dictionary of them keyed by endpoint name (one of
+                                           READ_ENDPOINT_NAMES_LIST). Endpoints
+                                           not in it cost DEFAULT_API_POINTS_PER_CALL.
+        :param int | dict points_per_field: (optional) The points each returned field costs per
+                                            row, or a dictionary of them keyed by field name.
+                                            Fields not in it cost DEFAULT_API_POINTS_PER_FIELD.
+
+        :raises PurpleAirAPIError: If a rate, the mode, or an endpoint name is invalid.
+        """
+
+        if points_per_second is None or points_per_second <= 0:
+            raise PurpleAirAPIError(
+                f"`points_per_second: {points_per_second}` must be a positive number!"
+            )
+
+        if burst_points is None:
+            burst_points = points_per_second
+
+        if burst_points <= 0:
+            raise PurpleAirAPIError(
+                f"`burst_points: {burst_points}` must be a positive number!"
+            )
+
+        self._validate_mode(mode)
+
+        if isinstance(points_per_call, dict):
+            unknown_endpoint_names = set(points_per_call) - set(
+                READ_ENDPOINT_NAMES_LIST
+            )
+            if unknown_endpoint_names:
+                raise PurpleAirAPIError(
+                    f"Unknown endpoint name(s) {sorted(unknown_endpoint_names)} in `points_per_call`!"
+                )
+
+        self._points_per_second = points_per_second
+        self._burst_points = burst_points
+        self._mode = mode
+        self._points_per_call = points_per_call
+        self._points_per_field = points_per_field
+
+        self._lock = Lock()
+        self._available_points = burst_points
+        self._last_refill = monotonic()
+        self._spent_points = 0
+
+    @staticmethod
+    def _validate_mode(mode):
+        """
+        An internal helper to check a limiter mode.
+
+        :param str mode: The mode to check.
+
+        :raises PurpleAirAPIError: If the mode is not in RATE_LIMITER_MODES_LIST.
+        """
+
+        if mode not in RATE_LIMITER_MODES_LIST:
+            raise PurpleAirAPIError(
+                f"`mode: {mode}` must be one of {RATE_LIMITER_MODES_LIST}!"
+            )
+
+    def _refill(self):
+        """
+        An internal helper to add the points earned since the last refill. Must be called
+        with the lock held.
+        """
+
+        now = monotonic()
+        self._available_points = min(
+            self._burst_points,
+            self._available_points
+            + (now - self._last_refill) * self._points_per_second,
+        )
+        self._last_refill = now
+
+    @property
+    def mode(self):
+        """
+        A method to return the limiter mode.
+        """
+
+        return self._mode
+
+    @property
+    def available_points(self):
+        """
+        A method to return the points available now. Negative while in debt.
+        """
+
+        with self._lock:
+            self._refill()
+            return self._available_points
+
+    @property
+    def spent_points(self):
+        """
+        A method to return the total points taken from the limiter.
+        """
+
+        return self._spent_points
+
+    def estimate_points(self, fields=None, row_count=1, endpoint_name=None):
+        """
+        A method to estimate the points a request costs.
+
+        :param str | list fields: (optional) The comma separated field names or a list of them.
+                                  When not provided every field in ACCEPTED_FIELD_NAMES_DICT
+                                  is assumed, since the API returns all of them.
+        :param int row_count: (optional) The number of rows (sensors or history entries) returned.
+        :param str endpoint_name: (optional) The endpoint the request is for, i.e., ``"sensors"``.
+                                  See `get_endpoint_name`.
+
+        :return int: The estimated points.
+        """
+
+        if fields is None:
+            field_names = list(ACCEPTED_FIELD_NAMES_DICT)
+
+        elif isinstance(fields, str):
+            field_names = [
+                field.strip() for field in fields.split(",") if field.strip()
+            ]
+
+        else:
+            field_names = list(fields)
+
+        if isinstance(self._points_per_call, dict):
+            points_per_call = self._points_per_call.get(
+                endpoint_name, DEFAULT_API_POINTS_PER_CALL
+            )
+
+        else:
+            points_per_call = self._points_per_call
+
+        if isinstance(self._points_per_field, dict):
+            points_per_row = sum(
+                self._points_per_field.get(field_name, DEFAULT_API_POINTS_PER_FIELD)
+                for field_name in field_names
+            )
+
+        else:
+            points_per_row = self._points_per_field * len(field_names)
+
+        return points_per_call + points_per_row * max(row_count, 1)
+
+    def acquire(self, points, mode=None):
+        """
+        A method to take points from the limiter before a request is sent.
+
+        :param float points: The points the request is estimated to cost.
+        :param str mode: (optional) A mode to use for this request instead of the limiter's.
+
+        :return float: The number of seconds waited.
+        :raises PurpleAirAPIError: If the mode is invalid, or the mode is ``"nonblock"`` and
+                                   not enough points are available. A request that costs more
+                                   than `burst_points` raises right away, since the bucket can
+                                   never hold enough points for it.
+        """
+
+        mode = self._mode if mode is None else mode
+        self._validate_mode(mode)
+
+        if mode == "nonblock" and points > self._burst_points:
+            raise PurpleAirAPIError(
+                f"{points} point(s) requested, more than `burst_points: {self._burst_points}` - "
+                "the request can never be sent without waiting"
+            )
+
+        with self._lock:
+            self._spent_points = self._spent_points + points
+            if mode == "estimate":
+                return 0.0
+
+            self._refill()
+            if mode == "nonblock" and self._available_points < points:
+                self._spent_points = self._spent_points - points
+                raise PurpleAirAPIError(
+                    f"Rate limit reached - {points} point(s) requested, "
+                    f"{self._available_points:.2f} available"
+                )
+
+            # Reserve the points now so threads that arrive later wait behind this one
+            self._available_points = self._available_points - points
+            wait_seconds = max(0.0, -self._available_points / self._points_per_second)
+
+        if wait_seconds:
+            sleep(wait_seconds)
+
+        return wait_seconds
+
+    def charge(self, points):
+        """
+        A method to take points a request cost beyond its estimate, once the response is known.
+        It never waits. The requests that follow wait instead.
+
+        :param float points: The extra points to take.
+        """
+
+        with self._lock:
+            self._spent_points = self._spent_points + points
+            if self._mode == "estimate":
+                return
+
+            self._refill()
+            self._available_points = self._available_points - points
@@ -7,7 +7,41 @@ This class will handle all `read` requests
 https://api.purpleair.com/#api-welcome
 """
 
-from purpleair_api.PurpleAirAPIHelpers import send_url_get_request
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_HISTORY_MAX_WORKERS,
+    DEFAULT_MAX_REQUEST_URL_LENGTH,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_SENSORS_PER_SQUARE_DEGREE,
+    DEFAULT_SHOW_ONLY_MAX_WORKERS,
+    DEFAULT_TILE_MAX_COUNT,
+    DEFAULT_TILE_MAX_DEPTH,
+    DEFAULT_TILE_MAX_SENSORS,
+    DEFAULT_TILE_MAX_WORKERS,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import (
+    USE_CLIENT_TIMEOUT,
+    build_request_url,
+    create_session,
+    debug_log,
+    get_endpoint_name,
+    merge_history_responses,
+    merge_sensor_responses,
+    parse_csv_lines,
+    send_url_get_request,
+    send_url_get_stream_request,
+    quarter_bounding_box,
+    split_bounding_box,
+    split_history_time_range,
+    split_show_only,
+)
+from purpleair_api.PurpleAirColumnarData import PurpleAirColumnarData
+from requests.exceptions import ChunkedEncodingError, Timeout
+
+_logger = getLogger(__name__)
 
 
 class PurpleAirReadAPI:
@@ -16,15 +50,299 @@ class PurpleAirReadAPI:
     read requests.
     """
 
-    def __init__(self, api_read_key=None):
+    def __init__(
+        self,
+        api_read_key=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        single_flight=None,
+        response_cache=None,
+        history_cache=None,
+    ):
         """
         :param str api_read_key: A valid PurpleAir API read key.
+        :param requests.Session session: (optional) A session to send requests with. Pass one in to
+                                         share a connection pool between clients or to inject a
+                                         custom session for tests. When not provided one is created
+                                         with `create_session`.
+        :param PurpleAirRateLimiter rate_limiter: (optional) A limiter every request takes its
+                                                  estimated API points from. Share one between
+                                                  clients that use the same key.
+        :param PurpleAirRetryPolicy retry_policy: (optional) A policy to send failed requests
+                                                  again with. When not provided failures are
+                                                  raised right away.
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or
+                                      a ``(connect, read)`` tuple, used when a request does not
+                                      pass its own. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS;
+                                      None waits without a limit.
+        :param PurpleAirSingleFlight single_flight: (optional) Lets identical GET requests that are
+                                                    in flight at the same time share one request.
+                                                    Share it between clients to coalesce their
+                                                    requests too.
+        :param PurpleAirResponseCache response_cache: (optional) A cache GET responses are kept in
+                                                      for the TTL of their endpoint.
+        :param PurpleAirHistoryCache history_cache: (optional) A local store of downloaded history.
+                                                    `request_sensor_historic_data_range` only
+                                                    requests the time ranges it is missing.
         """
         # Save off the API key for internal usage
         self._your_api_read_key = api_read_key
         self._base_api_v1_request_string = "https://api.purpleair.com/v1/"
 
-    def request_sensor_data(self, sensor_index, read_key=None, fields=None):
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = create_session() if session is None else session
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._timeout = timeout
+        self._single_flight = single_flight
+        self._response_cache = response_cache
+        self._history_cache = history_cache
+
+    def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
+
+        if self._owns_session:
+            self._session.close()
+
+    def _get(
+        self,
+        request_url,
+        first_optional_parameter_separator=None,
+        optional_parameters_dict=None,
+        fields=None,
+        row_count=1,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        An internal helper to send a GET request with the read key. When a rate limiter is set
+        the request first takes its estimated points, and a response with more rows than
+        estimated is charged for the difference. When a single flight is set, a request that
+        is identical to one in flight waits for it and is not charged. When a response cache
+        is set, a fresh cached response is returned without sending a request.
+
+        :param list | str fields: (optional) The requested fields, used to estimate the points.
+        :param int row_count: (optional) The number of rows expected, used to estimate the points.
+        :param float | tuple timeout: (optional) The request timeout. Defaults to the client's.
+        :param PurpleAirDeadline deadline: (optional) The deadline the request must finish by.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        final_request_url = None
+        if self._single_flight is not None or self._response_cache is not None:
+            final_request_url = build_request_url(
+                request_url,
+                first_optional_parameter_separator,
+                optional_parameters_dict,
+            )
+
+        if self._response_cache is not None:
+            cached_response = self._response_cache.get(
+                self._your_api_read_key, final_request_url
+            )
+            if cached_response is not None:
+                return cached_response
+
+        endpoint_name = get_endpoint_name(request_url)
+
+        def send_request():
+            if self._rate_limiter is not None:
+                estimated_points = self._rate_limiter.estimate_points(
+                    fields, row_count, endpoint_name
+                )
+                self._rate_limiter.acquire(estimated_points)
+
+            the_request_text_as_json = send_url_get_request(
+                request_url,
+                self._your_api_read_key,
+                first_optional_parameter_separator,
+                optional_parameters_dict,
+                session=self._session,
+                timeout=self._timeout if timeout is USE_CLIENT_TIMEOUT else timeout,
+                retry_policy=self._retry_policy,
+                deadline=deadline,
+                return_body=self._response_cache is not None,
+            )
+            if self._response_cache is not None:
+                the_request_text_as_json, body = the_request_text_as_json
+
+            if (
+                self._rate_limiter is not None
+                and isinstance(the_request_text_as_json, dict)
+                and isinstance(the_request_text_as_json.get("data"), list)
+            ):
+                actual_points = self._rate_limiter.estimate_points(
+                    the_request_text_as_json.get("fields", fields),
+                    len(the_request_text_as_json["data"]),
+                    endpoint_name,
+                )
+                if actual_points > estimated_points:
+                    self._rate_limiter.charge(actual_points - estimated_points)
+
+            if self._response_cache is not None:
+                self._response_cache.put(
+                    self._your_api_read_key,
+                    final_request_url,
+                    the_request_text_as_json,
+                    body,
+                )
+
+            return the_request_text_as_json
+
+        if self._single_flight is None:
+            return send_request()
+
+        return self._single_flight.do(
+            (self._your_api_read_key, final_request_url), send_request, deadline
+        )
+
+    def _get_stream(
+        self,
+        request_url,
+        first_optional_parameter_separator=None,
+        optional_parameters_dict=None,
+        fields=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        An internal helper to stream the lines of a GET request with the read key. When a rate
+        limiter is set the request first takes its estimated points.
+
+        :param list | str fields: (optional) The requested fields, used to estimate the points.
+        :param float | tuple timeout: (optional) The request timeout. Defaults to the client's.
+        :param PurpleAirDeadline deadline: (optional) The deadline the request must finish by.
+
+        :return generator: The decoded lines of the response body, with their line endings.
+        """
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(
+                self._rate_limiter.estimate_points(
+                    fields, endpoint_name=get_endpoint_name(request_url)
+                )
+            )
+
+        return send_url_get_stream_request(
+            request_url,
+            self._your_api_read_key,
+            first_optional_parameter_separator,
+            optional_parameters_dict,
+            session=self._session,
+            timeout=self._timeout if timeout is USE_CLIENT_TIMEOUT else timeout,
+            retry_policy=self._retry_policy,
+            deadline=deadline,
+        )
+
+    def _get_show_only_batches(
+        self,
+        request_url,
+        optional_parameters_dict,
+        fields=None,
+        max_workers=DEFAULT_SHOW_ONLY_MAX_WORKERS,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        An internal helper to send a multiple sensor or members request whose `show_only` list
+        may not fit in one URL. A request that fits is sent as is. Otherwise `show_only`, and
+        `read_keys` when they pair up, are split into batches that fit in
+        DEFAULT_MAX_REQUEST_URL_LENGTH, the batches are fetched in parallel, and their payloads
+        are merged into one with the first batch's field order. The rows are put in `show_only`
+        order and the merged time stamps are the earliest of the batches.
+
+        :param str request_url: The request URL, with its ``fields`` parameter.
+        :param dict optional_parameters_dict: The optional parameters, with `show_only` and `read_keys`.
+        :param list | str fields: (optional) The requested fields, used to estimate the points.
+        :param int max_workers: (optional) The number of batches fetched at once.
+        :param float | tuple timeout: (optional) The request timeout. Defaults to the client's.
+        :param PurpleAirDeadline deadline: (optional) The deadline every batch must finish by.
+
+        :return dict | None: A python dictionary containing the payload response
+        :raises PurpleAirAPIError: If `max_workers` is not a positive integer.
+        """
+
+        if type(max_workers) is not int or max_workers < 1:
+            raise PurpleAirAPIError(
+                f"`max_workers: {max_workers}` must be a positive integer!"
+            )
+
+        optional_parameters_dict = dict(optional_parameters_dict)
+        for parameter_name in ("show_only", "read_keys"):
+            if isinstance(optional_parameters_dict[parameter_name], (list, tuple)):
+                optional_parameters_dict[parameter_name] = ",".join(
+                    str(value) for value in optional_parameters_dict[parameter_name]
+                )
+
+        show_only = optional_parameters_dict["show_only"]
+        row_count = len(str(show_only).split(",")) if show_only else 1
+        full_request_url = build_request_url(request_url, "&", optional_parameters_dict)
+        if not show_only or len(full_request_url) <= DEFAULT_MAX_REQUEST_URL_LENGTH:
+            return self._get(
+                request_url,
+                "&",
+                optional_parameters_dict,
+                fields=fields,
+                row_count=row_count,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        # Everything but the show_only and read_keys values counts against the URL budget
+        base_request_url = build_request_url(
+            request_url,
+            "&",
+            dict(optional_parameters_dict, show_only="", read_keys=""),
+        )
+        show_only_batches = split_show_only(
+            show_only,
+            optional_parameters_dict["read_keys"],
+            DEFAULT_MAX_REQUEST_URL_LENGTH - len(base_request_url),
+        )
+        debug_log(
+            "_get_show_only_batches - %s sensors split into %s batches",
+            row_count,
+            len(show_only_batches),
+            logger=_logger,
+        )
+
+        def request_batch(show_only_batch):
+            batch_show_only, batch_read_keys = show_only_batch
+            return self._get(
+                request_url,
+                "&",
+                dict(
+                    optional_parameters_dict,
+                    show_only=batch_show_only,
+                    read_keys=batch_read_keys,
+                ),
+                fields=fields,
+                row_count=len(batch_show_only.split(",")),
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batch_responses = list(executor.map(request_batch, show_only_batches))
+
+        return merge_sensor_responses(
+            batch_responses, sensor_index_order=str(show_only).split(",")
+        )
+
+    def request_sensor_data(
+        self,
+        sensor_index,
+        read_key=None,
+        fields=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
         """
         A method to retrieve sensor data from one sensor. Will return the
         response payload as a python dictionary.
@@ -48,6 +366,12 @@ class PurpleAirReadAPI:
                                       information:
                                       https://api.purpleair.com/#api-sensors-get-sensor-data
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A python dictionary containing the payload response
         """
 
@@ -56,11 +380,13 @@ class PurpleAirReadAPI:
         optional_parameters_dict = {"read_key": read_key, "fields": fields}
 
         first_optional_parameter_separator = "?"
-        return send_url_get_request(
+        return self._get(
             request_url,
-            self._your_api_read_key,
             first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     def request_multiple_sensors_data(
@@ -75,6 +401,10 @@ class PurpleAirReadAPI:
         nwlat=None,
         selng=None,
         selat=None,
+        columnar=False,
+        max_workers=DEFAULT_SHOW_ONLY_MAX_WORKERS,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
     ):
         """
         A method to retrieve sensor data from multiple sensors. Will return the
@@ -117,8 +447,10 @@ class PurpleAirReadAPI:
         :param (optional) str read_keys: A read_key is required for private devices. It is separate to the api_key and each sensor has its own read_key.
                                          Submit multiple keys by separating them with a comma (,) character for example: key-one,key-two,key-three
 
-        :param (optional) str show_only: A comma (,) separated list of sensor_index values. When provided, the results are limited only to
-                                         the sensors included in this list.
+        :param (optional) str | list show_only: A comma (,) separated list of sensor_index values. When provided, the results are limited only to
+                                                the sensors included in this list. A list too long for one request URL is split into
+                                                batches, with `read_keys` when there is one key for each sensor, that are fetched
+                                                in parallel and merged into one payload.
 
         :param (optional) str modified_since: The modified_since parameter causes only sensors modified after
                                               the provided time stamp to be included in the results. Using the
@@ -140,7 +472,23 @@ class PurpleAirReadAPI:
 
         :param (optional) float selat: A south east latitude for the bounding box.
 
-        :return dict | None: A python dictionary containing the payload response
+        :param (optional) bool columnar: When True the `fields` + `data` payload is decoded into
+                                         typed columns keyed by field name, with rows looked up by
+                                         `sensor_index`. The columns are built after the JSON is
+                                         decoded, so this does not lower peak memory. See
+                                         `PurpleAirColumnarData`.
+
+        :param (optional) int max_workers: The number of `show_only` batches fetched at once.
+
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
+        :return dict | PurpleAirColumnarData | None: A python dictionary containing the payload response,
+                                                      or its typed columns when `columnar` is True
+        :raises PurpleAirAPIError: If `max_workers` is not a positive integer.
         """
 
         request_url = (
@@ -161,14 +509,142 @@ class PurpleAirReadAPI:
             "selat": selat,
         }
 
-        first_optional_parameter_separator = "&"
-        return send_url_get_request(
+        the_request_text_as_json = self._get_show_only_batches(
             request_url,
-            self._your_api_read_key,
-            first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            max_workers=max_workers,
+            timeout=timeout,
+            deadline=deadline,
         )
 
+        if columnar:
+            return PurpleAirColumnarData.from_response(the_request_text_as_json)
+
+        return the_request_text_as_json
+
+    def request_multiple_sensors_data_tiled(
+        self,
+        fields,
+        nwlng,
+        nwlat,
+        selng,
+        selat,
+        location_type=None,
+        read_keys=None,
+        max_age=None,
+        modified_since=None,
+        max_sensors_per_tile=DEFAULT_TILE_MAX_SENSORS,
+        sensors_per_square_degree=DEFAULT_SENSORS_PER_SQUARE_DEGREE,
+        sensor_locations=None,
+        max_depth=DEFAULT_TILE_MAX_DEPTH,
+        max_workers=DEFAULT_TILE_MAX_WORKERS,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+        max_tile_count=DEFAULT_TILE_MAX_COUNT,
+    ):
+        """
+        A method to retrieve sensor data from a bounding box too large for one response. The
+        box is split into tiles sized for the expected sensor density (see `split_bounding_box`),
+        the tiles are requested concurrently, and their rows are merged into one JSON payload
+        with each sensor kept once. A tile that times out or whose response is cut off is split
+        into quarters and requested again, up to `max_depth` times. Without `sensor_locations`
+        the box is first split into at most `max_tile_count` tiles, so a huge box such as the
+        whole world starts from a few large tiles instead of thousands of small ones.
+
+        :param str fields: The 'Fields' parameter. See `request_multiple_sensors_data`.
+        :param float nwlng: The longitude of the north west corner of the box.
+        :param float nwlat: The latitude of the north west corner of the box.
+        :param float selng: The longitude of the south east corner of the box.
+        :param float selat: The latitude of the south east corner of the box.
+        :param (optional) int location_type: See `request_multiple_sensors_data`.
+        :param (optional) str read_keys: See `request_multiple_sensors_data`.
+        :param (optional) int max_age: See `request_multiple_sensors_data`.
+        :param (optional) int modified_since: See `request_multiple_sensors_data`.
+        :param (optional) int max_sensors_per_tile: The most sensors a tile is planned to hold.
+        :param (optional) float sensors_per_square_degree: The density assumed when planning tiles
+                                                           without `sensor_locations`.
+        :param (optional) list sensor_locations: ``(latitude, longitude)`` pairs of known sensors,
+                                                 i.e., from an earlier query, used to give dense
+                                                 areas smaller tiles.
+        :param (optional) int max_depth: The most times a tile is split into quarters.
+        :param (optional) int max_workers: The number of tiles to request at once.
+        :param (optional) float | tuple timeout: The timeout of each tile request. Defaults to the
+                                                 client's timeout. None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline every tile request must finish by.
+        :param (optional) int max_tile_count: The most tiles the box is first split into without
+                                              `sensor_locations`.
+
+        :return dict: A python dictionary containing the merged payload response
+        :raises PurpleAirAPIError: If the box, `max_workers` or `max_tile_count` is invalid, or a
+                                   tile request fails.
+        """
+
+        tiles = split_bounding_box(
+            nwlng,
+            nwlat,
+            selng,
+            selat,
+            max_sensors_per_tile=max_sensors_per_tile,
+            sensors_per_square_degree=sensors_per_square_degree,
+            sensor_locations=sensor_locations,
+            max_depth=max_depth,
+            max_tile_count=max_tile_count,
+        )
+
+        if type(max_workers) is not int or max_workers < 1:
+            raise PurpleAirAPIError(
+                f"`max_workers: {max_workers}` must be a positive integer!"
+            )
+
+        def request_tile(tile, depth=0):
+            try:
+                return [
+                    self.request_multiple_sensors_data(
+                        fields,
+                        location_type=location_type,
+                        read_keys=read_keys,
+                        modified_since=modified_since,
+                        max_age=max_age,
+                        nwlng=tile[0],
+                        nwlat=tile[1],
+                        selng=tile[2],
+                        selat=tile[3],
+                        timeout=timeout,
+                        deadline=deadline,
+                    )
+                ]
+
+            except (ChunkedEncodingError, Timeout) as e:
+                if depth >= max_depth:
+                    raise
+
+                debug_log(
+                    "request_multiple_sensors_data_tiled - splitting tile %s: %s",
+                    tile,
+                    e,
+                    logger=_logger,
+                )
+                return [
+                    sensor_response
+                    for quarter in quarter_bounding_box(tile)
+                    for sensor_response in request_tile(quarter, depth + 1)
+                ]
+
+        debug_log(
+            "request_multiple_sensors_data_tiled - requesting %s tile(s)",
+            len(tiles),
+            logger=_logger,
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sensor_responses = [
+                sensor_response
+                for tile_responses in executor.map(request_tile, tiles)
+                for sensor_response in tile_responses
+            ]
+
+        return merge_sensor_responses(sensor_responses)
+
     def request_sensor_historic_data(
         self,
         sensor_index,
@@ -179,6 +655,8 @@ class PurpleAirReadAPI:
         start_timestamp=None,
         end_timestamp=None,
         average=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
     ):
         """
         A method to request historic data from a single sensor.
@@ -235,7 +713,15 @@ class PurpleAirReadAPI:
 
                            For field descriptions, please see the 'sensor data fields' section.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A python dictionary containing the payload response
+
+        .. note:: To read a large CSV export row by row use `stream_sensor_historic_data`.
         """
 
         history_url_portion = ""
@@ -264,36 +750,245 @@ class PurpleAirReadAPI:
         }
 
         first_optional_parameter_separator = "&"
-        return send_url_get_request(
+        return self._get(
+            request_url,
+            first_optional_parameter_separator,
+            optional_parameters_dict,
+            fields=fields,
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def stream_sensor_historic_data(
+        self,
+        sensor_index,
+        fields,
+        read_key=None,
+        privacy=None,
+        start_timestamp=None,
+        end_timestamp=None,
+        average=None,
+        batch_size=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        A method to stream historic data from a single sensor using the CSV endpoint
+        https://api.purpleair.com/#api-sensors-get-sensor-history-csv. The response is read
+        and parsed a line at a time, so multi year exports never have to fit in memory as
+        one string. Values are converted to the type of their field and empty cells become None.
+
+        The request is sent when the first row is requested.
+
+        See `request_sensor_historic_data` for the other parameters.
+
+        :param (optional) int batch_size: When provided, yield dictionaries mapping each field
+                                          name to a list of up to `batch_size` values instead
+                                          of one row at a time.
+
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
+        :return generator: Yields one dictionary per row, or one dictionary of columns per batch.
+        :raises PurpleAirAPIError: If `batch_size` is invalid or the response contains an error status code.
+        """
+
+        request_url = (
+            self._base_api_v1_request_string
+            + "sensors/"
+            + f"{sensor_index}"
+            + "/history/csv"
+            + f"?fields={fields}"
+        )
+
+        optional_parameters_dict = {
+            "read_key": read_key,
+            "privacy": privacy,
+            "start_timestamp": start_timestamp,
+            "end_timestamp": end_timestamp,
+            "average": average,
+        }
+
+        first_optional_parameter_separator = "&"
+        lines = self._get_stream(
             request_url,
-            self._your_api_read_key,
             first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            timeout=timeout,
+            deadline=deadline,
         )
+        return parse_csv_lines(lines, batch_size)
 
-    def request_group_detail_data(self, group_id):
+    def request_sensor_historic_data_range(
+        self,
+        sensor_index,
+        fields,
+        start_timestamp,
+        end_timestamp,
+        average=None,
+        read_key=None,
+        privacy=None,
+        max_workers=DEFAULT_HISTORY_MAX_WORKERS,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        A method to request historic data from a single sensor over a range longer than one
+        request may cover. The range is split into windows that are valid for the `average`
+        (see HISTORY_MAX_TIME_SPAN_SECONDS_DICT), the windows are requested concurrently, and
+        their rows are stitched into one JSON payload sorted by ``time_stamp``. If any window
+        fails the error is raised.
+
+        When the client has a history cache, only the parts of the range it is missing are
+        requested. They are stored, and the whole range is then read back from the cache. The
+        cache is not used when `read_key` or `privacy` is passed, since it is not keyed on them
+        and would otherwise serve a private sensor's history to requests without its key.
+
+        :param int sensor_index: The sensor_index as found in the JSON for this specific sensor.
+        :param str fields: The 'Fields' parameter. See `request_sensor_historic_data`. The
+                           ``time_stamp`` column is always returned by the API.
+        :param int start_timestamp: The UNIX time stamp, in seconds, of the first required history entry.
+        :param int end_timestamp: The UNIX time stamp, in seconds, the history ends before.
+        :param (optional) int average: The desired average in minutes. 10 if not specified.
+        :param (optional) str read_key: This read_key is required for private devices.
+        :param (optional) str privacy: The privacy of returned data. See `request_sensor_historic_data`.
+        :param (optional) int max_workers: The number of windows to request at once.
+
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
+        :return dict: A python dictionary containing the merged payload response
+        :raises PurpleAirAPIError: If the range, average or `max_workers` is invalid, or a
+                                   window request fails.
+        """
+
+        time_windows = split_history_time_range(start_timestamp, end_timestamp, average)
+
+        history_cache = self._history_cache
+        if read_key is not None or privacy is not None:
+            history_cache = None
+
+        if history_cache is not None:
+            time_windows = [
+                time_window
+                for missing_range in history_cache.missing_ranges(
+                    sensor_index, fields, start_timestamp, end_timestamp, average
+                )
+                for time_window in split_history_time_range(
+                    missing_range[0], missing_range[1], average
+                )
+            ]
+
+        if type(max_workers) is not int or max_workers < 1:
+            raise PurpleAirAPIError(
+                f"`max_workers: {max_workers}` must be a positive integer!"
+            )
+
+        def request_time_window(time_window):
+            return self.request_sensor_historic_data(
+                sensor_index,
+                fields,
+                read_key=read_key,
+                privacy=privacy,
+                start_timestamp=time_window[0],
+                end_timestamp=time_window[1],
+                average=average,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            history_responses = list(executor.map(request_time_window, time_windows))
+
+        if history_cache is None:
+            return merge_history_responses(
+                history_responses, start_timestamp, end_timestamp
+            )
+
+        for time_window, history_response in zip(time_windows, history_responses):
+            history_cache.store(
+                sensor_index,
+                fields,
+                time_window[0],
+                time_window[1],
+                history_response,
+                average,
+            )
+
+        debug_log(
+            "request_sensor_historic_data_range - requested %s of the window(s) for sensor %s",
+            len(time_windows),
+            sensor_index,
+            logger=_logger,
+        )
+        cached_history = history_cache.load(
+            sensor_index, fields, start_timestamp, end_timestamp, average
+        )
+        retval = (
+            dict(history_responses[0])
+            if history_responses
+            else {
+                "sensor_index": sensor_index,
+                "average": 10 if average is None else average,
+            }
+        )
+        retval["fields"] = cached_history["fields"]
+        retval["data"] = cached_history["data"]
+        retval["start_timestamp"] = start_timestamp
+        retval["end_timestamp"] = end_timestamp
+        return retval
+
+    def request_group_detail_data(
+        self, group_id, timeout=USE_CLIENT_TIMEOUT, deadline=None
+    ):
         """
         A method to retrieve a list of all members of a specified group.
 
         :param int group_id: The group_id of the requested group. This group must be owned by the api_key.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A dictionary containing the group detail payload response.
         """
 
         request_url = self._base_api_v1_request_string + f"groups/{group_id}"
-        return send_url_get_request(request_url, self._your_api_read_key)
+        return self._get(request_url, fields=[], timeout=timeout, deadline=deadline)
 
-    def request_group_list_data(self):
+    def request_group_list_data(self, timeout=USE_CLIENT_TIMEOUT, deadline=None):
         """
         A method to retrieve a list of all groups owned by the provided api_key.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A dictionary containing the list of groups.
         """
 
         request_url = self._base_api_v1_request_string + f"groups/"
-        return send_url_get_request(request_url, self._your_api_read_key)
+        return self._get(request_url, fields=[], timeout=timeout, deadline=deadline)
 
-    def request_member_data(self, group_id, member_id, fields=None):
+    def request_member_data(
+        self,
+        group_id,
+        member_id,
+        fields=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
         """
         A method to get a members' data from a group to which said member belongs.
 
@@ -332,6 +1027,12 @@ class PurpleAirReadAPI:
 
             For field descriptions, please see the 'sensor data fields' section.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A dictionary containing the member data payload.
         """
 
@@ -344,11 +1045,13 @@ class PurpleAirReadAPI:
         optional_parameters_dict = {"fields": fields}
 
         first_optional_parameter_separator = "?"
-        return send_url_get_request(
+        return self._get(
             request_url,
-            self._your_api_read_key,
             first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     def request_member_historic_data(
@@ -360,6 +1063,8 @@ class PurpleAirReadAPI:
         start_timestamp=None,
         end_timestamp=None,
         average=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
     ):
         """
         A method to get a member's historic data from a group to which said member belongs.
@@ -411,6 +1116,12 @@ class PurpleAirReadAPI:
 
                             For field descriptions, please see the 'sensor data fields' section.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A dictionary containing the member historic data payload.
         """
 
@@ -429,11 +1140,13 @@ class PurpleAirReadAPI:
         }
 
         first_optional_parameter_separator = "&"
-        return send_url_get_request(
+        return self._get(
             request_url,
-            self._your_api_read_key,
             first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            timeout=timeout,
+            deadline=deadline,
         )
 
     def request_members_data(
@@ -449,6 +1162,10 @@ class PurpleAirReadAPI:
         nwlat=None,
         selng=None,
         selat=None,
+        columnar=False,
+        max_workers=DEFAULT_SHOW_ONLY_MAX_WORKERS,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
     ):
         """
         A method to get multiple members' data from a group to which said members belong.
@@ -494,7 +1211,8 @@ class PurpleAirReadAPI:
 
         :param (optional) str read_keys: A read_key is required for private devices. It is separate to the api_key and each sensor has its own read_key. Submit multiple keys by separating them with a comma (,) character for example: key-one,key-two,key-three.
 
-        :param (optional) str show_only: A comma (,) separated list of sensor_index values. When provided, the results are limited only to the sensors included in this list.
+        :param (optional) str | list show_only: A comma (,) separated list of sensor_index values. When provided, the results are limited only to the sensors included in this list.
+                                                A list too long for one request URL is split into batches, with `read_keys` when there is one key for each sensor, that are fetched in parallel and merged into one payload.
 
         :param (optional) int modified_since: The modified_since parameter causes only sensors modified after the provided time stamp to be included in the results. Using the time_stamp value from a previous call (recommended) will limit results to those with new values since the last request. Using a value of 0 will match sensors modified at any time.
 
@@ -510,7 +1228,23 @@ class PurpleAirReadAPI:
 
         :param (optional) int selat: A south east latitude for the bounding box.
 
-        :return dict | None: A python dictionary containing the payload response
+        :param (optional) bool columnar: When True the `fields` + `data` payload is decoded into
+                                         typed columns keyed by field name, with rows looked up by
+                                         `sensor_index`. The columns are built after the JSON is
+                                         decoded, so this does not lower peak memory. See
+                                         `PurpleAirColumnarData`.
+
+        :param (optional) int max_workers: The number of `show_only` batches fetched at once.
+
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
+        :return dict | PurpleAirColumnarData | None: A python dictionary containing the payload response,
+                                                      or its typed columns when `columnar` is True
+        :raises PurpleAirAPIError: If `max_workers` is not a positive integer.
         """
 
         request_url = (
@@ -532,21 +1266,33 @@ class PurpleAirReadAPI:
             "selat": selat,
         }
 
-        first_optional_parameter_separator = "&"
-        return send_url_get_request(
+        the_request_text_as_json = self._get_show_only_batches(
             request_url,
-            self._your_api_read_key,
-            first_optional_parameter_separator,
             optional_parameters_dict,
+            fields=fields,
+            max_workers=max_workers,
+            timeout=timeout,
+            deadline=deadline,
         )
 
-    def request_organization_data(self):
+        if columnar:
+            return PurpleAirColumnarData.from_response(the_request_text_as_json)
+
+        return the_request_text_as_json
+
+    def request_organization_data(self, timeout=USE_CLIENT_TIMEOUT, deadline=None):
         """
         Retrieves information for the organization using the api key of this class instance.
 
+        :param (optional) float | tuple timeout: The number of seconds to wait for the server, or a
+                                                 ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                                 None waits without a limit.
+        :param (optional) PurpleAirDeadline deadline: A deadline shared with other requests. The timeout is
+                                                      cut down to the time left before it.
+
         :return dict | None: A dictionary containing the organization information.
         """
 
         request_url = self._base_api_v1_request_string + "organization"
 
-        return send_url_get_request(request_url, self._your_api_read_key)
+        return self._get(request_url, fields=[], timeout=timeout, deadline=deadline)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that keeps recent read responses in memory so repeated
+requests do not cost API points.
+https://api.purpleair.com/#api-welcome
+"""
+
+from collections import OrderedDict
+from json import dumps
+from threading import Lock
+from time import monotonic
+from urllib.parse import urlsplit
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT,
+    READ_ENDPOINT_NAMES_LIST,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import (
+    convert_requests_text_to_json,
+    get_endpoint_name,
+)
+
+
+def _get_group_id(request_url):
+    """
+    An internal helper to return the group id of a ``groups/<group_id>`` request URL.
+
+    :param str request_url: The request URL.
+
+    :return str | None: The group id, or None if the URL is not for a single group.
+    """
+
+    segments = [segment for segment in urlsplit(request_url).path.split("/") if segment]
+    if "v1" in segments:
+        segments = segments[segments.index("v1") + 1 :]
+
+    if len(segments) >= 2 and segments[0] == "groups":
+        return segments[1]
+
+    return None
+
+
+class _CacheEntry:
+    """
+    An internal record of a cached response. The response is kept as its JSON body, so each
+    hit decodes a new copy and callers can not change what other callers get.
+    """
+
+    def __init__(self, body, expires_at, endpoint_name, group_id):
+        self.body = body
+        self.expires_at = expires_at
+        self.endpoint_name = endpoint_name
+        self.group_id = group_id
+
+    @property
+    def size(self):
+        """
+        A method to return the byte length of the cached body.
+        """
+
+        return len(self.body)
+
+
+class PurpleAirResponseCache:
+    """
+    The PurpleAirResponseCache class is a thread safe, in memory cache of read responses.
+    Each response is kept for the TTL of its endpoint, and the least recently used responses
+    are evicted once the cache holds more than `max_entries` responses or `max_bytes` bytes.
+    Responses are keyed on the API key and the final request URL.
+
+    Responses are kept as their JSON response bodies and measured by their byte length. Each hit
+    decodes the body again, so every caller gets its own copy it is free to change.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds_dict=None,
+        max_entries=DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    ):
+        """
+        :param dict ttl_seconds_dict: (optional) TTLs, in seconds, keyed by endpoint name, that
+                                      replace the ones in DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT.
+                                      A TTL of 0 or None turns caching off for that endpoint.
+        :param int max_entries: (optional) The most responses to keep.
+        :param int max_bytes: (optional) The most bytes of response bodies to keep.
+        """
+
+        if type(max_entries) is not int or max_entries < 1:
+            raise PurpleAirAPIError(
+                f"`max_entries: {max_entries}` must be a positive integer!"
+            )
+
+        if type(max_bytes) is not int or max_bytes < 1:
+            raise PurpleAirAPIError(
+                f"`max_bytes: {max_bytes}` must be a positive integer!"
+            )
+
+        self._ttl_seconds_dict = dict(DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT)
+        if ttl_seconds_dict is not None:
+            unknown_endpoint_names = set(ttl_seconds_dict) - set(
+                READ_ENDPOINT_NAMES_LIST
+            )
+            if unknown_endpoint_names:
+                raise PurpleAirAPIError(
+                    f"Unknown endpoint name(s) {sorted(unknown_endpoint_names)} in `ttl_seconds_dict`!"
+                )
+
+            self._ttl_seconds_dict.update(ttl_seconds_dict)
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._byte_count = 0
+        self._evictions = 0
+        self._endpoint_stats = {
+            endpoint_name: {"hits": 0, "misses": 0}
+            for endpoint_name in self._ttl_seconds_dict
+        }
+
+    @property
+    def entry_count(self):
+        """
+        A method to return the number of responses cached.
+        """
+
+        return len(self._entries)
+
+    @property
+    def byte_count(self):
+        """
+        A method to return the bytes the cached response bodies take up.
+        """
+
+        return self._byte_count
+
+    @property
+    def hits(self):
+        """
+        A method to return the number of requests answered from the cache.
+        """
+
+        with self._lock:
+            return sum(stats["hits"] for stats in self._endpoint_stats.values())
+
+    @property
+    def misses(self):
+        """
+        A method to return the number of cacheable requests that had to be sent.
+        """
+
+        with self._lock:
+            return sum(stats["misses"] for stats in self._endpoint_stats.values())
+
+    @property
+    def evictions(self):
+        """
+        A method to return the number of responses evicted to stay within the limits.
+        """
+
+        return self._evictions
+
+    @property
+    def endpoint_stats(self):
+        """
+        A method to return the hits and misses of each endpoint, i.e.,
+        ``{"sensor": {"hits": 10, "misses": 2}, ...}``, to help tune the TTLs.
+        """
+
+        with self._lock:
+            return {
+                endpoint_name: dict(stats)
+                for endpoint_name, stats in self._endpoint_stats.items()
+            }
+
+    def _remove(self, key):
+        """
+        An internal helper to remove an entry. Must be called with the lock held.
+
+        :param tuple key: The key of the entry.
+        """
+
+        cache_entry = self._entries.pop(key)
+        self._byte_count = self._byte_count - cache_entry.size
+
+    def get(self, api_key, request_url):
+        """
+        A method to look up a cached response.
+
+        :param str api_key: The API key the request is sent with.
+        :param str request_url: The final request URL, with its query string.
+
+        :return dict | None: A new copy of the cached response, or None if there is no fresh one.
+        """
+
+        endpoint_name = get_endpoint_name(request_url)
+        if not self._ttl_seconds_dict.get(endpoint_name):
+            return None
+
+        key = (api_key, request_url)
+        with self._lock:
+            cache_entry = self._entries.get(key)
+            if cache_entry is not None and cache_entry.expires_at <= monotonic():
+                self._remove(key)
+                cache_entry = None
+
+            if cache_entry is None:
+                self._endpoint_stats[endpoint_name]["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._endpoint_stats[endpoint_name]["hits"] += 1
+            body = cache_entry.body
+
+        # Decode outside the lock so large responses do not hold up other callers
+        return convert_requests_text_to_json(body)
+
+    def put(self, api_key, request_url, payload, body=None):
+        """
+        A method to cache a response. Responses for endpoints with caching turned off, None
+        payloads, and bodies larger than `max_bytes` are not kept.
+
+        :param str api_key: The API key the request was sent with.
+        :param str request_url: The final request URL, with its query string.
+        :param dict payload: The parsed response.
+        :param bytes body: (optional) The raw response body `payload` was decoded from. When not
+                           provided `payload` is encoded as JSON.
+        """
+
+        endpoint_name = get_endpoint_name(request_url)
+        ttl_seconds = self._ttl_seconds_dict.get(endpoint_name)
+        if not ttl_seconds or payload is None:
+            return
+
+        if body is None:
+            body = dumps(payload, separators=(",", ":")).encode("utf-8")
+
+        else:
+            body = bytes(body)
+
+        size = len(body)
+        if size > self._max_bytes:
+            return
+
+        key = (api_key, request_url)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                body,
+                monotonic() + ttl_seconds,
+                endpoint_name,
+                _get_group_id(request_url),
+            )
+            self._byte_count = self._byte_count + size
+
+            while (
+                len(self._entries) > self._max_entries
+                or self._byte_count > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions = self._evictions + 1
+
+    def invalidate_group(self, group_id):
+        """
+        A method to drop the cached responses for a group, its members and the group list.
+        Called by `PurpleAirWriteAPI` after it changes a group.
+
+        :param int group_id: The group_id of the group that changed.
+        """
+
+        group_id = str(group_id)
+        with self._lock:
+            for key in [
+                key
+                for key, cache_entry in self._entries.items()
+                if cache_entry.group_id == group_id
+                or cache_entry.endpoint_name == "groups"
+            ]:
+                self._remove(key)
+
+    def invalidate_endpoint(self, endpoint_name):
+        """
+        A method to drop every cached response for an endpoint.
+
+        :param str endpoint_name: One of READ_ENDPOINT_NAMES_LIST.
+        """
+
+        with self._lock:
+            for key in [
+                key
+                for key, cache_entry in self._entries.items()
+                if cache_entry.endpoint_name == endpoint_name
+            ]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        A method to drop every cached response. The counters are kept.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._byte_count = 0
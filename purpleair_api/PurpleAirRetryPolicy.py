@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that decides when and how long to wait before a failed
+request is sent again.
+https://api.purpleair.com/#api-welcome
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import random
+from time import sleep
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_RETRY_STATUS_CODES_LIST,
+    IDEMPOTENT_HTTP_METHODS_LIST,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+
+class PurpleAirRetryPolicy:
+    """
+    The PurpleAirRetryPolicy class holds the retry settings used by the `send_url_*`
+    helpers. A request is retried when its response has a retryable status code or sending
+    it raised a retryable exception, waiting an exponentially growing, jittered delay between
+    attempts. A ``Retry-After`` header from the server is honored instead of the backoff.
+
+    Requests that are not idempotent, i.e., POST, are only retried when the server can not
+    have acted on them: a 429 response or a timeout while connecting.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        jitter=0.5,
+        retry_status_codes=None,
+        retry_exceptions=(ConnectionError, Timeout),
+        max_retry_after=120.0,
+        metrics_hook=None,
+    ):
+        """
+        :param int max_attempts: (optional) The most times a request is sent, counting the first.
+        :param float backoff_base: (optional) The delay, in seconds, before the first retry. It
+                                   doubles for each retry after that.
+        :param float backoff_max: (optional) The longest backoff delay, in seconds.
+        :param float jitter: (optional) The fraction, from 0 to 1, of each delay that is randomized
+                             so clients that failed together do not retry together.
+        :param list retry_status_codes: (optional) The status codes to retry. Defaults to
+                                        DEFAULT_RETRY_STATUS_CODES_LIST.
+        :param tuple retry_exceptions: (optional) The exception types to retry.
+        :param float max_retry_after: (optional) The longest ``Retry-After`` delay, in seconds, to honor.
+        :param function metrics_hook: (optional) Called with a dictionary describing each retry,
+                                      with the keys ``method``, ``url``, ``attempt``, ``delay``,
+                                      ``status_code`` and ``exception``.
+        """
+
+        if type(max_attempts) is not int or max_attempts < 1:
+            raise PurpleAirAPIError(
+                f"`max_attempts: {max_attempts}` must be a positive integer!"
+            )
+
+        if not 0 <= jitter <= 1:
+            raise PurpleAirAPIError(f"`jitter: {jitter}` must be between 0 and 1!")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_status_codes = (
+            list(DEFAULT_RETRY_STATUS_CODES_LIST)
+            if retry_status_codes is None
+            else list(retry_status_codes)
+        )
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.max_retry_after = max_retry_after
+        self.metrics_hook = metrics_hook
+
+    def backoff_delay(self, attempt):
+        """
+        A method to compute the jittered backoff delay before a retry.
+
+        :param int attempt: The attempt that just failed, starting at 1.
+
+        :return float: The number of seconds to wait.
+        """
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter * random())
+
+    def retry_after_delay(self, retry_after):
+        """
+        A method to turn a ``Retry-After`` header into a delay.
+
+        :param str retry_after: The header value, either seconds or an HTTP date.
+
+        :return float | None: The number of seconds to wait, capped at `max_retry_after`, or
+                              None if the header is missing or can not be read.
+        """
+
+        if not retry_after:
+            return None
+
+        try:
+            delay = float(retry_after)
+
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+
+            except (TypeError, ValueError):
+                return None
+
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def should_retry_status(self, http_method, status_code):
+        """
+        A method to check if a response status code should be retried.
+
+        :param str http_method: The HTTP method. i.e., ``"GET"``.
+        :param int status_code: The response status code.
+
+        :return bool: True if the request should be sent again.
+        """
+
+        if http_method.upper() not in IDEMPOTENT_HTTP_METHODS_LIST:
+            return status_code == 429
+
+        return status_code in self.retry_status_codes
+
+    def should_retry_exception(self, http_method, exception):
+        """
+        A method to check if an exception raised while sending should be retried.
+
+        :param str http_method: The HTTP method. i.e., ``"GET"``.
+        :param Exception exception: The exception that was raised.
+
+        :return bool: True if the request should be sent again.
+        """
+
+        if http_method.upper() not in IDEMPOTENT_HTTP_METHODS_LIST:
+            return isinstance(exception, ConnectTimeout)
+
+        return isinstance(exception, self.retry_exceptions)
+
+    def wait(
+        self,
+        http_method,
+        request_url,
+        attempt,
+        status_code=None,
+        exception=None,
+        retry_after=None,
+        deadline=None,
+    ):
+        """
+        A method to report a retry to the metrics hook and wait before it is sent.
+        No retry is made when the wait would run past the deadline.
+
+        :param str http_method: The HTTP method. i.e., ``"GET"``.
+        :param str request_url: The request URL.
+        :param int attempt: The attempt that just failed, starting at 1.
+        :param int status_code: (optional) The status code of the failed response.
+        :param Exception exception: (optional) The exception raised by the failed attempt.
+        :param str retry_after: (optional) The ``Retry-After`` header of the failed response.
+        :param PurpleAirDeadline deadline: (optional) The deadline the retry must be sent by.
+
+        :return float | None: The number of seconds waited, or None if there is no time left
+                              to retry before the deadline.
+        """
+
+        delay = self.retry_after_delay(retry_after)
+        if delay is None:
+            delay = self.backoff_delay(attempt)
+
+        if deadline is not None and delay >= deadline.remaining:
+            return None
+
+        if self.metrics_hook is not None:
+            self.metrics_hook(
+                {
+                    "method": http_method,
+                    "url": request_url,
+                    "attempt": attempt,
+                    "delay": delay,
+                    "status_code": status_code,
+                    "exception": exception,
+                }
+            )
+
+        sleep(delay)
+        return delay
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that lets identical concurrent requests share one
+in-flight request and its parsed result.
+https://api.purpleair.com/#api-welcome
+"""
+
+from threading import Event, Lock
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+
+
+class _InFlightRequest:
+    """
+    An internal record of a request that is being sent, and its outcome once it is done.
+    """
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.exception = None
+
+
+class PurpleAirSingleFlight:
+    """
+    The PurpleAirSingleFlight class coalesces identical requests that are in flight at the
+    same time. The first caller for a key sends the request, and callers that arrive with the
+    same key before it finishes wait for it and get the same parsed result, or the same
+    exception, back. Nothing is kept once the request finishes, so this is not a cache.
+
+    Callers that share a request share the returned object, so it should be treated as read only.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._in_flight_requests = {}
+        self._shared_count = 0
+
+    @property
+    def in_flight_count(self):
+        """
+        A method to return the number of requests being sent right now.
+        """
+
+        with self._lock:
+            return len(self._in_flight_requests)
+
+    @property
+    def shared_count(self):
+        """
+        A method to return the number of calls that were answered by another call's request.
+        """
+
+        return self._shared_count
+
+    def do(self, key, send_request, deadline=None):
+        """
+        A method to send a request, or wait for an identical one already in flight.
+
+        :param tuple key: Identifies identical requests. i.e., the API key and the final request URL.
+        :param function send_request: Called with no arguments to send the request when none
+                                      with the same key is in flight.
+        :param PurpleAirDeadline deadline: (optional) The longest a caller waits for a shared request.
+
+        :return: The result of `send_request`.
+        :raises PurpleAirAPIError: If the deadline passes while waiting for a shared request.
+        """
+
+        with self._lock:
+            in_flight_request = self._in_flight_requests.get(key)
+            is_sender = in_flight_request is None
+            if is_sender:
+                in_flight_request = _InFlightRequest()
+                self._in_flight_requests[key] = in_flight_request
+
+            else:
+                self._shared_count = self._shared_count + 1
+
+        if is_sender:
+            try:
+                in_flight_request.result = send_request()
+
+            except Exception as e:
+                in_flight_request.exception = e
+                raise
+
+            finally:
+                with self._lock:
+                    del self._in_flight_requests[key]
+
+                in_flight_request.done.set()
+
+            return in_flight_request.result
+
+        if not in_flight_request.done.wait(
+            None if deadline is None else deadline.remaining
+        ):
+            raise PurpleAirAPIError(
+                "The deadline passed while waiting for a shared request"
+            )
+
+        if in_flight_request.exception is not None:
+            raise in_flight_request.exception
+
+        return in_flight_request.result
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2024 carlkidcrypto, All rights reserved.
+A python3 class that keeps an up to date copy of many sensors by polling
+the multiple sensors endpoint with `modified_since`.
+https://api.purpleair.com/#api-sensors-get-sensors-data
+"""
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+
+
+class PurpleAirSnapshot:
+    """
+    The PurpleAirSnapshot class keeps the latest row of every sensor returned by
+    `request_multiple_sensors_data`. The first poll fetches every sensor. Each later poll
+    passes the previous response's `time_stamp` as `modified_since`, so only the sensors
+    that changed are downloaded and merged in::
+
+        snapshot = PurpleAirSnapshot(my_paa, "name,pm2.5", location_type=0)
+        while True:
+            changed_sensor_indexes = snapshot.poll()
+            ...
+            sleep(60)
+    """
+
+    def __init__(self, read_api, fields, **request_parameters):
+        """
+        :param PurpleAirReadAPI read_api: A PurpleAirReadAPI (or PurpleAirAPI) instance to poll with.
+        :param str fields: The 'Fields' parameter passed to `request_multiple_sensors_data`.
+        :param request_parameters: (optional) Any other `request_multiple_sensors_data` parameters.
+                                   i.e., ``location_type``, ``show_only`` or ``nwlng``.
+        """
+
+        if "modified_since" in request_parameters:
+            raise PurpleAirAPIError(
+                "`modified_since` is managed by PurpleAirSnapshot and can not be provided"
+            )
+
+        self._read_api = read_api
+        self._fields = fields
+        self._request_parameters = request_parameters
+        self._sensors = {}
+        self._last_time_stamp = None
+        self._last_changed = set()
+
+    @property
+    def sensors(self):
+        """
+        A method to return the latest row of every sensor, keyed by `sensor_index`.
+        """
+
+        return self._sensors
+
+    @property
+    def last_time_stamp(self):
+        """
+        A method to return the `time_stamp` of the last poll. None before the first poll.
+        """
+
+        return self._last_time_stamp
+
+    @property
+    def last_changed(self):
+        """
+        A method to return the sensor indexes that changed on the last poll.
+        """
+
+        return self._last_changed
+
+    def __len__(self):
+        return len(self._sensors)
+
+    def __contains__(self, sensor_index):
+        return sensor_index in self._sensors
+
+    def __getitem__(self, sensor_index):
+        return self._sensors[sensor_index]
+
+    def reset(self):
+        """
+        A method to forget every sensor so the next poll fetches all of them again.
+        """
+
+        self._sensors = {}
+        self._last_time_stamp = None
+        self._last_changed = set()
+
+    def apply(self, response):
+        """
+        A method to merge one `request_multiple_sensors_data` payload into the snapshot.
+        A sensor counts as changed when it is new or any of its values differ from the
+        stored row.
+
+        :param dict response: The payload with `time_stamp`, `fields` and `data` keys.
+
+        :return set: The sensor indexes that changed.
+        :raises PurpleAirAPIError: If the payload has no `fields`, `data` or `sensor_index` field.
+        """
+
+        if (
+            not isinstance(response, dict)
+            or "fields" not in response
+            or "data" not in response
+        ):
+            raise PurpleAirAPIError(
+                "A payload with `fields` and `data` must be provided to update the snapshot"
+            )
+
+        fields = response["fields"]
+        if "sensor_index" not in fields:
+            raise PurpleAirAPIError(
+                "The payload must include the `sensor_index` field to update the snapshot"
+            )
+
+        sensor_index_position = fields.index("sensor_index")
+        changed_sensor_indexes = set()
+        for data_row in response["data"]:
+            sensor_index = data_row[sensor_index_position]
+            new_row = dict(zip(fields, data_row))
+            if self._sensors.get(sensor_index) != new_row:
+                self._sensors[sensor_index] = new_row
+                changed_sensor_indexes.add(sensor_index)
+
+        self._last_time_stamp = response.get("time_stamp", self._last_time_stamp)
+        self._last_changed = changed_sensor_indexes
+        return changed_sensor_indexes
+
+    def poll(self):
+        """
+        A method to request the sensors modified since the last poll and merge them in.
+
+        :return set: The sensor indexes that changed on this poll.
+        """
+
+        response = self._read_api.request_multiple_sensors_data(
+            self._fields,
+            modified_since=self._last_time_stamp,
+            **self._request_parameters,
+        )
+        return self.apply(response)
@@ -7,13 +7,20 @@ This class will handle all `write` requests
 https://api.purpleair.com/#api-welcome
 """
 
+from logging import getLogger
+
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_REQUEST_TIMEOUT_SECONDS
 from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
 from purpleair_api.PurpleAirAPIHelpers import (
+    USE_CLIENT_TIMEOUT,
     debug_log,
+    create_session,
     send_url_post_request,
     send_url_delete_request,
 )
 
+_logger = getLogger(__name__)
+
 
 class PurpleAirWriteAPI:
     """
@@ -21,26 +28,122 @@ class PurpleAirWriteAPI:
     write requests.
     """
 
-    def __init__(self, api_write_key=None):
+    def __init__(
+        self,
+        api_write_key=None,
+        session=None,
+        retry_policy=None,
+        timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        response_cache=None,
+    ):
         """
         :param str api_write_key: A valid PurpleAir API write key.
+        :param requests.Session session: (optional) A session to send requests with. Pass one in to
+                                         share a connection pool between clients or to inject a
+                                         custom session for tests. When not provided one is created
+                                         with `create_session`.
+        :param PurpleAirRetryPolicy retry_policy: (optional) A policy to send failed requests
+                                                  again with. Only POSTs the server can not have
+                                                  acted on are retried.
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or
+                                      a ``(connect, read)`` tuple, used when a request does not
+                                      pass its own. Defaults to DEFAULT_REQUEST_TIMEOUT_SECONDS;
+                                      None waits without a limit.
+        :param PurpleAirResponseCache response_cache: (optional) A read response cache to drop
+                                                      the group entries from after a group or
+                                                      its members change.
         """
         # Save off the API key for internal usage
         self._your_api_write_key = api_write_key
         self._base_api_v1_request_string = "https://api.purpleair.com/v1/"
 
-    def post_create_group_data(self, name):
+        # Only close sessions this class created
+        self._owns_session = session is None
+        self._session = create_session() if session is None else session
+        self._retry_policy = retry_policy
+        self._timeout = timeout
+        self._response_cache = response_cache
+
+    def close(self):
+        """
+        A method to close the pooled HTTP session. A session passed in by the caller is left open.
+        """
+
+        if self._owns_session:
+            self._session.close()
+
+    def _invalidate_group(self, group_id=None):
+        """
+        An internal helper to drop the cached read responses for a group that changed.
+
+        :param int group_id: (optional) The group_id of the group. When not provided only the
+                             group list is dropped.
+        """
+
+        if self._response_cache is None:
+            return
+
+        if group_id is None:
+            self._response_cache.invalidate_endpoint("groups")
+
+        else:
+            self._response_cache.invalidate_group(group_id)
+
+    def _send(
+        self,
+        send_url_function,
+        request_url,
+        json_post_parameters=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        An internal helper to send a POST or DELETE request with the write key.
+
+        :param function send_url_function: `send_url_post_request` or `send_url_delete_request`.
+        :param str request_url: The constructed URL request string.
+        :param dict json_post_parameters: (optional) The JSON body of the request.
+        :param float | tuple timeout: (optional) The request timeout. Defaults to the client's.
+        :param PurpleAirDeadline deadline: (optional) The deadline the request must finish by.
+
+        :return dict | None: A python dictionary containing the payload response
+        """
+
+        return send_url_function(
+            request_url,
+            self._your_api_write_key,
+            {} if json_post_parameters is None else json_post_parameters,
+            session=self._session,
+            timeout=self._timeout if timeout is USE_CLIENT_TIMEOUT else timeout,
+            retry_policy=self._retry_policy,
+            deadline=deadline,
+        )
+
+    def post_create_group_data(self, name, timeout=USE_CLIENT_TIMEOUT, deadline=None):
         """
         A method to create a group for sensors.
 
         :param str name: The name of the group to create.
 
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or a
+                                      ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                      None waits without a limit.
+        :param PurpleAirDeadline deadline: (optional) A deadline shared with other requests.
+
         :return dict | None: A dictionary containing the created group data.
         """
 
         post_url = self._base_api_v1_request_string + f"groups"
 
-        return send_url_post_request(post_url, self._your_api_write_key, {"name": name})
+        retval = self._send(
+            send_url_post_request,
+            post_url,
+            {"name": name},
+            timeout=timeout,
+            deadline=deadline,
+        )
+        self._invalidate_group()
+        return retval
 
     def post_create_member(
         self,
@@ -49,6 +152,8 @@ class PurpleAirWriteAPI:
         sensor_id=None,
         owner_email=None,
         location_type=None,
+        timeout=USE_CLIENT_TIMEOUT,
+        deadline=None,
     ):
         """
         Add a sensor as a member of a group. The group must be owned by the api_key used.
@@ -70,6 +175,11 @@ class PurpleAirWriteAPI:
                                   Possible values are: 0 = Outside or 1 = Inside.
                                   Required when the target sensor is marked as 'private'.
 
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or a
+                                      ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                      None waits without a limit.
+        :param PurpleAirDeadline deadline: (optional) A deadline shared with other requests.
+
         :return dict | None: A dictionary containing the created member data.
         :raises PurpleAirAPIError: If an invalid combination of parameters is provided or the API request fails.
         """
@@ -83,10 +193,8 @@ class PurpleAirWriteAPI:
             and location_type is None
         ):
             # We good, use the sensor id
-            debug_log("post_create_member - option 1")
-            return send_url_post_request(
-                post_url, self._your_api_write_key, {"sensor_id": str(sensor_id)}
-            )
+            debug_log("post_create_member - option 1", logger=_logger)
+            json_post_parameters = {"sensor_id": str(sensor_id)}
 
         elif (
             sensor_index is not None
@@ -95,47 +203,70 @@ class PurpleAirWriteAPI:
             and location_type is None
         ):
             # We good, use the sensor index
-            debug_log("post_create_member - option 2")
-            return send_url_post_request(
-                post_url, self._your_api_write_key, {"sensor_index": sensor_index}
-            )
+            debug_log("post_create_member - option 2", logger=_logger)
+            json_post_parameters = {"sensor_index": sensor_index}
 
         elif sensor_index is None and sensor_id is not None and owner_email is not None:
             # We good, use the private sensor id.
-            debug_log("post_create_member - option 3")
-            return send_url_post_request(
-                post_url,
-                self._your_api_write_key,
-                {
-                    "sensor_id": str(sensor_id),
-                    "owner_email": owner_email,
-                    "location_type": location_type,
-                },
-            )
+            debug_log("post_create_member - option 3", logger=_logger)
+            json_post_parameters = {
+                "sensor_id": str(sensor_id),
+                "owner_email": owner_email,
+                "location_type": location_type,
+            }
 
         else:
             raise PurpleAirAPIError("Invalid configuration of method parameters!")
 
-    def post_delete_group(self, group_id):
+        retval = self._send(
+            send_url_post_request,
+            post_url,
+            json_post_parameters,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        self._invalidate_group(group_id)
+        return retval
+
+    def post_delete_group(self, group_id, timeout=USE_CLIENT_TIMEOUT, deadline=None):
         """
         A method to delete a group for sensors.
 
         :param int group_id: The group_id of the group to delete
 
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or a
+                                      ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                      None waits without a limit.
+        :param PurpleAirDeadline deadline: (optional) A deadline shared with other requests.
+
         :return dict | None: A dictionary containing the deletion response.
         """
 
         post_url = self._base_api_v1_request_string + f"groups/{group_id}"
 
-        return send_url_delete_request(post_url, self._your_api_write_key)
+        retval = self._send(
+            send_url_delete_request,
+            post_url,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        self._invalidate_group(group_id)
+        return retval
 
-    def post_delete_member(self, group_id, member_id):
+    def post_delete_member(
+        self, group_id, member_id, timeout=USE_CLIENT_TIMEOUT, deadline=None
+    ):
         """
         Delete a member from a group.
 
         :param int group_id: The group_id of the group in which member_id is in.
         :param int member_id: The member_id to delete.
 
+        :param float | tuple timeout: (optional) The number of seconds to wait for the server, or a
+                                      ``(connect, read)`` tuple. Defaults to the client's timeout.
+                                      None waits without a limit.
+        :param PurpleAirDeadline deadline: (optional) A deadline shared with other requests.
+
         :return dict | None: A dictionary containing the deletion response.
         """
 
@@ -143,4 +274,11 @@ class PurpleAirWriteAPI:
             self._base_api_v1_request_string + f"groups/{group_id}/members/{member_id}"
         )
 
-        return send_url_delete_request(post_url, self._your_api_write_key)
+        retval = self._send(
+            send_url_delete_request,
+            post_url,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        self._invalidate_group(group_id)
+        return retval
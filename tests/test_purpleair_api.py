@@ -4,13 +4,27 @@
 Copyright 2023 carlkidcrypto, All rights reserved.
 """
 
+import io
+import os
+import tempfile
 import unittest
 import requests_mock
 import sys
+from contextlib import redirect_stdout
+from unittest.mock import patch
 
 sys.path.append("../")
 
 from purpleair_api.PurpleAirAPI import PurpleAirAPI, PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import create_session
+from purpleair_api.PurpleAirKeyCache import PurpleAirKeyCache
+
+READ_KEY_TEXT = (
+    '{"api_version" : "1.1.1", "time_stamp": 123456789, "api_key_type": "READ"}'
+)
+WRITE_KEY_TEXT = (
+    '{"api_version" : "1.1.1", "time_stamp": 123456789, "api_key_type": "WRITE"}'
+)
 
 
 class PurpleAirAPITest(unittest.TestCase):
@@ -197,6 +211,220 @@ class PurpleAirAPITest(unittest.TestCase):
         self.assertEqual(paa.get_api_key_type["readkey123"], "READ")
         self.assertEqual(paa.get_api_key_type["writekey456"], "WRITE")
 
+    def test_purpleairapi_shares_one_session(self):
+        """
+        Test that the read, write and local APIs share the injected session.
+        """
+
+        # Setup
+        session = create_session()
+        adapter = requests_mock.Adapter()
+        session.mount("https://", adapter)
+        adapter.register_uri(
+            "GET",
+            "https://api.purpleair.com/v1/keys",
+            [
+                {
+                    "text": '{"api_version" : "1.1.1", "time_stamp": 123456789, "api_key_type": "READ"}'
+                },
+                {
+                    "text": '{"api_version" : "1.1.1", "time_stamp": 123456789, "api_key_type": "WRITE"}'
+                },
+            ],
+        )
+
+        # Action
+        paa = PurpleAirAPI(
+            your_api_read_key="123",
+            your_api_write_key="456",
+            your_ipv4_address=["192.168.1.2"],
+            session=session,
+        )
+
+        # Expected Result
+        self.assertIs(paa._session, session)
+        self.assertFalse(paa._owns_session)
+        self.assertEqual(adapter.call_count, 2)
+
+    def test_purpleairapi_lazy_key_validation(self):
+        """
+        Test that lazy validation checks each key on its first request only.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text=READ_KEY_TEXT, status_code=200)
+            m.get(
+                "https://api.purpleair.com/v1/organization",
+                text='{"test": 5}',
+                status_code=200,
+            )
+
+            paa = PurpleAirAPI(your_api_read_key="123456789", key_validation="lazy")
+            self.assertEqual(m.call_count, 0)
+            self.assertEqual(paa.get_api_key_type, {})
+
+            paa.request_organization_data()
+            paa.request_organization_data()
+            self.assertEqual(m.call_count, 3)
+            self.assertEqual(paa.get_api_key_type["123456789"], "READ")
+
+    def test_purpleairapi_lazy_key_validation_wrong_type(self):
+        """
+        Test that lazy validation raises on the first request when the key is the wrong type.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text=WRITE_KEY_TEXT, status_code=200)
+            paa = PurpleAirAPI(your_api_read_key="123456789", key_validation="lazy")
+
+            with self.assertRaises(PurpleAirAPIError):
+                paa.request_organization_data()
+
+            self.assertEqual(m.call_count, 1)
+
+    def test_purpleairapi_background_key_validation(self):
+        """
+        Test that background validation checks the keys without blocking the constructor,
+        and a request waits for the check.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text=WRITE_KEY_TEXT, status_code=200)
+            m.delete("https://api.purpleair.com/v1/groups/1", text="", status_code=204)
+            paa = PurpleAirAPI(
+                your_api_write_key="123456789", key_validation="background"
+            )
+            paa.post_delete_group(1)
+
+        # Expected Result
+        self.assertEqual(paa.get_api_key_type["123456789"], "WRITE")
+        self.assertEqual(
+            [request.method for request in m.request_history].count("GET"), 1
+        )
+
+    def test_purpleairapi_offline_key_validation(self):
+        """
+        Test that offline validation trusts the declared key types and sends no request.
+        """
+
+        # Action
+        with requests_mock.Mocker() as m:
+            paa = PurpleAirAPI(
+                your_api_read_key="readkey123",
+                your_api_write_key="writekey456",
+                key_validation="offline",
+            )
+
+        # Expected Result
+        self.assertEqual(m.call_count, 0)
+        self.assertEqual(paa.get_api_key_type["readkey123"], "READ")
+        self.assertEqual(paa.get_api_key_type["writekey456"], "WRITE")
+        self.assertEqual(paa.get_api_versions, {})
+
+    def test_purpleairapi_invalid_key_validation(self):
+        """
+        Test that an unknown validation mode raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirAPI(your_api_read_key="123456789", key_validation="later")
+
+    def test_purpleairapi_key_cache(self):
+        """
+        Test that a key checked by one client is not checked again by the next one.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            key_cache = PurpleAirKeyCache(os.path.join(cache_dir, "keys.json"))
+
+            # Action
+            with requests_mock.Mocker() as m:
+                m.get(fake_url_request, text=READ_KEY_TEXT, status_code=200)
+                PurpleAirAPI(your_api_read_key="123456789", key_cache=key_cache)
+                paa = PurpleAirAPI(your_api_read_key="123456789", key_cache=key_cache)
+
+            # Expected Result
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(paa.get_api_versions["123456789"], "1.1.1")
+            self.assertEqual(paa.get_api_key_type["123456789"], "READ")
+
+    def test_purpleairapi_prints_only_fresh_key_checks(self):
+        """
+        Test that only a key checked in the constructor prints its success message, not a
+        key cache hit or a background check.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            key_cache = PurpleAirKeyCache(os.path.join(cache_dir, "keys.json"))
+
+            # Action
+            with requests_mock.Mocker() as m:
+                m.get(fake_url_request, text=READ_KEY_TEXT, status_code=200)
+                with redirect_stdout(io.StringIO()) as fresh_output:
+                    PurpleAirAPI(your_api_read_key="123456789", key_cache=key_cache)
+
+                with redirect_stdout(io.StringIO()) as cached_output:
+                    PurpleAirAPI(your_api_read_key="123456789", key_cache=key_cache)
+
+                with redirect_stdout(io.StringIO()) as background_output:
+                    paa = PurpleAirAPI(
+                        your_api_read_key="987654321", key_validation="background"
+                    )
+                    paa._ensure_api_key_checked("987654321")
+
+        # Expected Result
+        self.assertEqual(
+            fresh_output.getvalue(),
+            "PurpleAirAPI: Successfully authenticated read key\n",
+        )
+        self.assertEqual(cached_output.getvalue(), "")
+        self.assertEqual(background_output.getvalue(), "")
+
+    def test_purpleairapi_closes_its_session_when_the_constructor_raises(self):
+        """
+        Test that a constructor that raises closes the session it created, and that invalid
+        local addresses raise before a session is created.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/keys"
+
+        # Action
+        with patch(
+            "purpleair_api.PurpleAirAPI.create_session", wraps=create_session
+        ) as mock_create_session:
+            with requests_mock.Mocker() as m:
+                m.get(fake_url_request, text=WRITE_KEY_TEXT, status_code=200)
+                with patch("requests.Session.close") as mock_close:
+                    with self.assertRaises(PurpleAirAPIError):
+                        PurpleAirAPI(your_api_read_key="123456789")
+
+            with self.assertRaises(PurpleAirAPIError):
+                PurpleAirAPI(your_api_read_key="123456789", your_ipv4_address=[""])
+
+        # Expected Result
+        self.assertEqual(mock_create_session.call_count, 1)
+        mock_close.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,8 @@ from purpleair_api.PurpleAirAPIConstants import (
     ERROR_CODES_LIST,
     SUCCESS_CODE_LIST,
     ACCEPTED_FIELD_NAMES_DICT,
+    DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT,
+    READ_ENDPOINT_NAMES_LIST,
 )
 
 
@@ -48,6 +50,16 @@ class PurpleAirAPIConstantsTest(unittest.TestCase):
         overlap = set(ERROR_CODES_LIST) & set(SUCCESS_CODE_LIST)
         self.assertEqual(len(overlap), 0)
 
+    def test_response_cache_ttls_cover_the_read_endpoints(self):
+        """
+        Test that DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT has a TTL for each of
+        READ_ENDPOINT_NAMES_LIST.
+        """
+        self.assertEqual(
+            sorted(DEFAULT_RESPONSE_CACHE_TTL_SECONDS_DICT),
+            sorted(READ_ENDPOINT_NAMES_LIST),
+        )
+
     def test_accepted_field_names_dict_is_dict(self):
         """
         Test that ACCEPTED_FIELD_NAMES_DICT is a dict with string keys.
@@ -4,6 +4,7 @@
 Copyright 2023 carlkidcrypto, All rights reserved.
 """
 
+import logging
 import unittest
 from random import choice
 from copy import deepcopy
@@ -31,18 +32,68 @@ class PurpleAirAPIHelpersTest(unittest.TestCase):
         except Exception as e:
             self.fail(f"debug_log raised an exception: {e}")
 
-    def test_debug_log_prints_when_enabled(self):
+    def test_debug_log_logs_when_enabled(self):
         """
-        Test that debug_log prints a message when PRINT_DEBUG_MSGS is True
+        Test that debug_log logs a formatted message when the logger is enabled for DEBUG
         """
         # Setup
-        msg_str = "debug enabled message"
+        msg_str = "debug enabled message %s"
 
-        # Action and Expected Result - patch PRINT_DEBUG_MSGS to True and verify print is called
-        with patch.object(helpers_module, "PRINT_DEBUG_MSGS", True):
-            with patch("builtins.print") as mock_print:
-                debug_log(msg_str)
-                mock_print.assert_called_once_with("\033[1;31m" + msg_str + "\x1b[0m")
+        # Action and Expected Result
+        with self.assertLogs(
+            "purpleair_api.PurpleAirAPIHelpers", logging.DEBUG
+        ) as logs:
+            debug_log(msg_str, 5)
+
+        self.assertEqual(logs.records[0].getMessage(), "debug enabled message 5")
+
+    def test_enable_debug_messages(self):
+        """
+        Test that enable_debug_messages sets the DEBUG level and adds its handler only once
+        """
+        # Setup
+        package_logger = logging.getLogger("purpleair_api")
+        original_level = package_logger.level
+        original_handlers = list(package_logger.handlers)
+
+        # Action and Expected Result
+        try:
+            self.assertIs(enable_debug_messages(), package_logger)
+            enable_debug_messages()
+            self.assertTrue(package_logger.isEnabledFor(logging.DEBUG))
+            self.assertEqual(len(package_logger.handlers), len(original_handlers) + 1)
+
+        finally:
+            package_logger.setLevel(original_level)
+            for handler in package_logger.handlers[len(original_handlers) :]:
+                package_logger.removeHandler(handler)
+            helpers_module._debug_handler = None
+
+    def test_set_log_level_per_module(self):
+        """
+        Test that set_log_level sets the package logger or a single module logger
+        """
+        # Setup
+        package_logger = logging.getLogger("purpleair_api")
+        local_logger = logging.getLogger("purpleair_api.PurpleAirLocalAPI")
+        original_levels = (package_logger.level, local_logger.level)
+
+        # Action and Expected Result
+        try:
+            self.assertIs(set_log_level(logging.WARNING), package_logger)
+            self.assertIs(
+                set_log_level(logging.DEBUG, "PurpleAirLocalAPI"), local_logger
+            )
+            self.assertTrue(local_logger.isEnabledFor(logging.DEBUG))
+            self.assertFalse(
+                logging.getLogger("purpleair_api.PurpleAirAPIHelpers").isEnabledFor(
+                    logging.DEBUG
+                )
+            )
+
+        finally:
+            package_logger.setLevel(original_levels[0])
+            local_logger.setLevel(original_levels[1])
 
     def test_verify_request_status_code_true(self):
         """
@@ -115,6 +166,76 @@ class PurpleAirAPIHelpersTest(unittest.TestCase):
         # Expected Result
         self.assertDictEqual(retval, {"test_key": "test_value"})
 
+    def test_convert_requests_text_to_json_bytes(self):
+        """
+        Test that the method parses raw response bytes with every installed decoder.
+        """
+
+        # Setup
+        input_bytes = b'{"test_key": [1, 2.5, null]}'
+        decoder_names = [
+            name
+            for name in JSON_DECODER_NAMES_LIST
+            if name in helpers_module._available_json_decoders()
+        ]
+        original_decoder_name = get_json_decoder()
+
+        # Action and Expected Result
+        try:
+            for decoder_name in decoder_names:
+                self.assertEqual(set_json_decoder(decoder_name), decoder_name)
+                retval = convert_requests_text_to_json(input_bytes)
+                self.assertEqual(retval, {"test_key": [1, 2.5, None]})
+
+                with self.assertRaises(ValueError):
+                    convert_requests_text_to_json(b"not json")
+
+        finally:
+            set_json_decoder(original_decoder_name)
+
+    def test_set_json_decoder_default_and_errors(self):
+        """
+        Test that the fastest installed decoder is picked, falling back to json, and that
+        unknown or missing decoders raise `PurpleAirAPIError`.
+        """
+
+        # Setup
+        original_decoder_name = get_json_decoder()
+
+        # Action and Expected Result
+        try:
+            with patch.object(helpers_module, "orjson", None):
+                with patch.object(helpers_module, "msgspec", None):
+                    self.assertEqual(set_json_decoder(), "json")
+                    self.assertDictEqual(
+                        convert_requests_text_to_json(b'{"a": 1}'), {"a": 1}
+                    )
+
+                    with self.assertRaises(PurpleAirAPIError):
+                        set_json_decoder("orjson")
+
+            with self.assertRaises(PurpleAirAPIError):
+                set_json_decoder("simplejson")
+
+        finally:
+            set_json_decoder(original_decoder_name)
+
+    @unittest.skipIf(helpers_module.orjson is None, "orjson is not installed")
+    def test_set_json_decoder_prefers_orjson(self):
+        """
+        Test that orjson is picked by default when it is installed.
+        """
+
+        # Setup
+        original_decoder_name = get_json_decoder()
+
+        # Action and Expected Result
+        try:
+            self.assertEqual(set_json_decoder(), "orjson")
+
+        finally:
+            set_json_decoder(original_decoder_name)
+
     def test_sanitize_sensor_data_from_paa(self):
         """
         Test that the sanitize function adds missing keys if they don't exist
@@ -281,6 +402,28 @@ class PurpleAirAPIHelpersTest(unittest.TestCase):
                     optional_parameters_dict=optional_parameters_dict,
                 )
 
+    def test_parse_response_text_malformed_error_bodies(self):
+        """
+        Test that error responses with an empty, non-JSON or unexpected body raise
+        `PurpleAirAPIError` instead of `TypeError`, `KeyError` or `ValueError`.
+        """
+
+        # Setup, Action, and Expected Result
+        for status_code, text in [
+            (503, b""),
+            (503, None),
+            (404, b"<html>Not Found</html>"),
+            (400, '{"message": "no error key"}'),
+            (400, "[1, 2]"),
+        ]:
+            with self.assertRaises(PurpleAirAPIError) as context:
+                parse_response_text(status_code, text)
+            self.assertIn(str(status_code), str(context.exception))
+
+        with self.assertRaises(PurpleAirAPIError) as context:
+            parse_response_text(404, '{"error": "NotFound"}')
+        self.assertEqual(str(context.exception), "404: NotFound - ")
+
     def test_send_url_post_request_json_param(self):
         """
         Test that we can provide json parameters
@@ -483,20 +626,55 @@ class PurpleAirAPIHelpersTest(unittest.TestCase):
 
     def test_convert_requests_text_to_json_with_debug_enabled(self):
         """
-        Test that convert_requests_text_to_json logs debug messages when PRINT_DEBUG_MSGS is True.
+        Test that convert_requests_text_to_json logs debug messages when DEBUG is enabled.
         """
 
         # Setup
         input_text = '{"debug_key": "debug_value"}'
 
         # Action and Expected Result — both debug_log calls inside the function should fire
-        with patch.object(helpers_module, "PRINT_DEBUG_MSGS", True):
-            with patch("builtins.print") as mock_print:
-                result = convert_requests_text_to_json(input_text)
-                self.assertEqual(mock_print.call_count, 2)
+        with self.assertLogs(
+            "purpleair_api.PurpleAirAPIHelpers", logging.DEBUG
+        ) as logs:
+            result = convert_requests_text_to_json(input_text)
 
+        self.assertEqual(len(logs.records), 2)
         self.assertDictEqual(result, {"debug_key": "debug_value"})
 
+    def test_convert_requests_text_to_json_no_work_when_debug_disabled(self):
+        """
+        Test that with debug off the parsed payload is never formatted.
+        """
+
+        # Setup
+        format_calls = []
+
+        class CountingPayload(dict):
+            def __repr__(self):
+                format_calls.append("repr")
+                return dict.__repr__(self)
+
+            def __str__(self):
+                format_calls.append("str")
+                return dict.__str__(self)
+
+        logging.getLogger("purpleair_api.PurpleAirAPIHelpers").setLevel(logging.INFO)
+
+        # Action
+        try:
+            with patch.object(
+                helpers_module, "_json_loads", lambda text: CountingPayload(a=1)
+            ):
+                convert_requests_text_to_json(b'{"a": 1}')
+
+        finally:
+            logging.getLogger("purpleair_api.PurpleAirAPIHelpers").setLevel(
+                logging.NOTSET
+            )
+
+        # Expected Result
+        self.assertEqual(format_calls, [])
+
     def test_send_url_get_request_no_optional_params_dict(self):
         """
         Test that send_url_get_request works correctly when optional_parameters_dict is None
@@ -566,6 +744,484 @@ class PurpleAirAPIHelpersTest(unittest.TestCase):
             )
         self.assertEqual(result, {"stripped": True})
 
+    def test_create_session_configures_pool(self):
+        """
+        Test that create_session mounts a pooled adapter for both http and https.
+        """
+
+        # Setup and Action
+        session = create_session(pool_connections=3, pool_maxsize=7, pool_block=True)
+
+        # Expected Result
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(prefix + "api.purpleair.com")
+            self.assertEqual(adapter._pool_connections, 3)
+            self.assertEqual(adapter._pool_maxsize, 7)
+            self.assertTrue(adapter._pool_block)
+
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+        session.close()
+
+    def test_create_session_no_keep_alive(self):
+        """
+        Test that keep_alive=False asks the server to close each connection.
+        """
+
+        # Setup and Action
+        session = create_session(keep_alive=False)
+
+        # Expected Result
+        self.assertEqual(session.headers["Connection"], "close")
+        session.close()
+
+    def test_create_session_invalid_pool_size(self):
+        """
+        Test that a pool size that is not a positive integer raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            create_session(pool_connections=0)
+
+        with self.assertRaises(PurpleAirAPIError):
+            create_session(pool_maxsize="10")
+
+    def test_send_url_requests_use_injected_session(self):
+        """
+        Test that the GET, POST and DELETE helpers send through an injected session.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/groups/1"
+        session = create_session()
+        adapter = requests_mock.Adapter()
+        session.mount("https://", adapter)
+        adapter.register_uri("GET", fake_url_request, text='{"verb": "get"}')
+        adapter.register_uri("POST", fake_url_request, text='{"verb": "post"}')
+        adapter.register_uri("DELETE", fake_url_request, text='{"verb": "delete"}')
+
+        # Action
+        get_result = send_url_get_request(fake_url_request, "111", session=session)
+        post_result = send_url_post_request(
+            fake_url_request, "111", {"name": "x"}, session=session
+        )
+        delete_result = send_url_delete_request(
+            fake_url_request, "111", session=session
+        )
+
+        # Expected Result
+        self.assertEqual(get_result, {"verb": "get"})
+        self.assertEqual(post_result, {"verb": "post"})
+        self.assertEqual(delete_result, {"verb": "delete"})
+        self.assertEqual(adapter.call_count, 3)
+        self.assertEqual(adapter.last_request.headers["X-API-Key"], "111")
+
+    def test_split_history_time_range(self):
+        """
+        Test that a range is split into back to back windows no longer than the average allows.
+        """
+
+        # Setup
+        day = 24 * 60 * 60
+
+        # Action
+        retval = split_history_time_range(0, 7 * day, 10)
+
+        # Expected Result
+        self.assertEqual(retval, [(0, 3 * day), (3 * day, 6 * day), (6 * day, 7 * day)])
+        self.assertEqual(split_history_time_range(5, 10), [(5, 10)])
+
+    def test_split_history_time_range_invalid(self):
+        """
+        Test that an unknown average or an invalid range raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            split_history_time_range(0, 10, 15)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_history_time_range(10, 10, 60)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_history_time_range("2024-01-01T00:00:00Z", 10, 60)
+
+    def test_merge_history_responses(self):
+        """
+        Test that history payloads are stitched, sorted and de-duplicated by time_stamp.
+        """
+
+        # Setup
+        first_response = {
+            "sensor_index": 1,
+            "start_timestamp": 100,
+            "end_timestamp": 200,
+            "fields": ["time_stamp", "pm2.5"],
+            "data": [[150, 2.0], [100, 1.0]],
+        }
+        second_response = {
+            "sensor_index": 1,
+            "start_timestamp": 200,
+            "end_timestamp": 300,
+            "fields": ["time_stamp", "pm2.5"],
+            "data": [[250, 4.0], [150, 2.0], [200, 3.0]],
+        }
+
+        # Action
+        retval = merge_history_responses([second_response, first_response], 100, 300)
+
+        # Expected Result
+        self.assertEqual(
+            retval["data"], [[100, 1.0], [150, 2.0], [200, 3.0], [250, 4.0]]
+        )
+        self.assertEqual(retval["start_timestamp"], 100)
+        self.assertEqual(retval["end_timestamp"], 300)
+        self.assertEqual(second_response["start_timestamp"], 200)
+
+        with self.assertRaises(PurpleAirAPIError):
+            merge_history_responses([], 100, 300)
+
+        with self.assertRaises(PurpleAirAPIError):
+            merge_history_responses([{"fields": ["pm2.5"], "data": []}], 100, 300)
+
+    def test_split_bounding_box_even_grid(self):
+        """
+        Test that a box is split into a grid that covers it, sized for the assumed density.
+        """
+
+        # Action
+        retval = split_bounding_box(
+            -10, 10, 10, -10, max_sensors_per_tile=100, sensors_per_square_degree=1
+        )
+
+        # Expected Result
+        self.assertEqual(len(retval), 4)
+        self.assertEqual(retval[0], (-10, 10, 0, 0))
+        self.assertEqual(retval[-1], (0, 0, 10, -10))
+        self.assertEqual(split_bounding_box(0, 1, 1, 0), [(0, 1, 1, 0)])
+
+    def test_split_bounding_box_tile_count_is_capped(self):
+        """
+        Test that a world sized box is split into at most `max_tile_count` tiles that cover it.
+        """
+
+        # Action
+        retval = split_bounding_box(-180, 90, 180, -90)
+        capped = split_bounding_box(-180, 90, 180, -90, max_tile_count=10)
+
+        # Expected Result
+        self.assertLessEqual(len(retval), DEFAULT_TILE_MAX_COUNT)
+        self.assertLessEqual(len(capped), 10)
+        for tiles in (retval, capped):
+            area = sum(
+                (selng - nwlng) * (nwlat - selat)
+                for nwlng, nwlat, selng, selat in tiles
+            )
+            self.assertAlmostEqual(area, 360 * 180)
+
+    def test_split_bounding_box_by_sensor_locations(self):
+        """
+        Test that only the quarters holding too many known sensors are split again.
+        """
+
+        # Setup
+        dense_locations = [(7.5 + i * 0.01, -7.5 + i * 0.01) for i in range(10)]
+        sparse_locations = [(-5.0, 5.0)]
+
+        # Action
+        retval = split_bounding_box(
+            -10,
+            10,
+            10,
+            -10,
+            max_sensors_per_tile=4,
+            sensor_locations=dense_locations + sparse_locations,
+            max_depth=2,
+        )
+
+        # Expected Result
+        self.assertEqual(len(retval), 7)
+        self.assertIn((-10, 10, -5.0, 5.0), retval)
+        self.assertIn((0.0, 0.0, 10, -10), retval)
+
+    def test_split_bounding_box_invalid(self):
+        """
+        Test that invalid boxes raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            split_bounding_box(10, 10, -10, -10)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_bounding_box(-10, -10, 10, 10)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_bounding_box(-200, 10, 10, -10)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_bounding_box(-10, 10, 10, -10, max_sensors_per_tile=0)
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_bounding_box(-10, 10, 10, -10, max_tile_count=0)
+
+    def test_get_endpoint_name(self):
+        """
+        Test that request URLs are named after the read endpoint they are for.
+        """
+
+        # Setup, Action, and Expected Result
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "sensors/1234"),
+            "sensor",
+        )
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "sensors/?fields=name"),
+            "sensors",
+        )
+        self.assertEqual(
+            get_endpoint_name(
+                "https://api.purpleair.com/v1/" + "sensors/1234/history/csv?fields=name"
+            ),
+            "sensor_history",
+        )
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "groups/"), "groups"
+        )
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "groups/1"), "group"
+        )
+        self.assertEqual(
+            get_endpoint_name(
+                "https://api.purpleair.com/v1/" + "groups/1/members?fields=name"
+            ),
+            "members",
+        )
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "groups/1/members/2"),
+            "member",
+        )
+        self.assertEqual(
+            get_endpoint_name(
+                "https://api.purpleair.com/v1/"
+                + "groups/1/members/2/history?fields=name"
+            ),
+            "member_history",
+        )
+        self.assertEqual(
+            get_endpoint_name("https://api.purpleair.com/v1/" + "organization"),
+            "organization",
+        )
+        self.assertIsNone(get_endpoint_name("https://api.purpleair.com/v1/" + "keys"))
+
+    def test_merge_sensor_responses(self):
+        """
+        Test that sensor payloads are merged, sorted and de-duplicated by sensor_index.
+        """
+
+        # Setup
+        first_response = {
+            "fields": ["sensor_index", "pm2.5"],
+            "data": [[3, 3.0], [1, 1.0]],
+        }
+        second_response = {
+            "fields": ["sensor_index", "pm2.5"],
+            "data": [[2, 2.0], [3, 3.0]],
+        }
+
+        # Action
+        retval = merge_sensor_responses([first_response, second_response])
+
+        # Expected Result
+        self.assertEqual(retval["data"], [[1, 1.0], [2, 2.0], [3, 3.0]])
+        self.assertEqual(first_response["data"], [[3, 3.0], [1, 1.0]])
+
+        with self.assertRaises(PurpleAirAPIError):
+            merge_sensor_responses([])
+
+        with self.assertRaises(PurpleAirAPIError):
+            merge_sensor_responses([{"fields": ["pm2.5"], "data": []}])
+
+    def test_merge_sensor_responses_sensor_index_order_and_earliest_time_stamps(self):
+        """
+        Test that rows are put in `sensor_index_order`, with other sensors after them, and
+        that the earliest time stamps of the payloads are kept.
+        """
+
+        # Setup
+        first_response = {
+            "time_stamp": 200,
+            "data_time_stamp": 190,
+            "fields": ["sensor_index", "pm2.5"],
+            "data": [[30, 3.0], [10, 1.0]],
+        }
+        second_response = {
+            "time_stamp": 150,
+            "data_time_stamp": 140,
+            "fields": ["sensor_index", "pm2.5"],
+            "data": [[20, 2.0], [30, 3.0]],
+        }
+
+        # Action
+        retval = merge_sensor_responses(
+            [first_response, second_response], sensor_index_order=["20", " 30"]
+        )
+
+        # Expected Result
+        self.assertEqual(retval["data"], [[20, 2.0], [30, 3.0], [10, 1.0]])
+        self.assertEqual(retval["time_stamp"], 150)
+        self.assertEqual(retval["data_time_stamp"], 140)
+        self.assertEqual(first_response["data_time_stamp"], 190)
+
+    def test_merge_sensor_responses_reorders_fields(self):
+        """
+        Test that payloads with their fields in another order are put in the first one's order.
+        """
+
+        # Setup
+        first_response = {"fields": ["sensor_index", "name"], "data": [[2, "b"]]}
+        second_response = {"fields": ["name", "sensor_index"], "data": [["a", 1]]}
+
+        # Action
+        retval = merge_sensor_responses([first_response, second_response])
+
+        # Expected Result
+        self.assertEqual(retval["fields"], ["sensor_index", "name"])
+        self.assertEqual(retval["data"], [[1, "a"], [2, "b"]])
+
+        with self.assertRaises(PurpleAirAPIError):
+            merge_sensor_responses(
+                [first_response, {"fields": ["sensor_index"], "data": [[3]]}]
+            )
+
+    def test_split_show_only(self):
+        """
+        Test that show_only is split into batches that fit, with paired read keys kept together.
+        """
+
+        # Setup, Action, and Expected Result
+        self.assertEqual(
+            split_show_only("1,2,3,44", max_length=5), [("1,2", None), ("3,44", None)]
+        )
+        self.assertEqual(
+            split_show_only([1, 2, 3], "a,b,c", max_length=8),
+            [("1,2", "a,b"), ("3", "c")],
+        )
+        self.assertEqual(
+            split_show_only([1, 2, 3], "k", max_length=6), [("1,2", "k"), ("3", "k")]
+        )
+        self.assertEqual(split_show_only("1, 2", max_length=100), [("1,2", None)])
+
+        with self.assertRaises(PurpleAirAPIError):
+            split_show_only("12345", max_length=4)
+
+    def test_parse_csv_lines_typed_rows(self):
+        """
+        Test that CSV lines become rows typed by their field and that empty cells become None.
+        """
+
+        # Setup
+        lines = iter(
+            [
+                "time_stamp,sensor_index,name,humidity,pm2.5_atm",
+                "1704067200,1234,My Sensor,27,3.5",
+                "",
+                "1704067800,1234,,,4",
+            ]
+        )
+
+        # Action
+        retval = list(parse_csv_lines(lines))
+
+        # Expected Result
+        self.assertEqual(
+            retval[0],
+            {
+                "time_stamp": 1704067200,
+                "sensor_index": 1234,
+                "name": "My Sensor",
+                "humidity": 27,
+                "pm2.5_atm": 3.5,
+            },
+        )
+        self.assertIsNone(retval[1]["name"])
+        self.assertIsNone(retval[1]["humidity"])
+        self.assertIsInstance(retval[1]["pm2.5_atm"], float)
+
+    def test_parse_csv_lines_quoted_newlines(self):
+        """
+        Test that a quoted value that holds a newline stays in one row.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/sensors/1/history/csv"
+        body = 'time_stamp,name\r\n1,"Line one\r\nLine two"\r\n\r\n2,Other\r\n'
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text=body, status_code=200)
+            retval = list(
+                parse_csv_lines(
+                    send_url_get_stream_request(fake_url_request, "111", chunk_size=3)
+                )
+            )
+
+        # Expected Result
+        self.assertEqual(
+            retval,
+            [
+                {"time_stamp": 1, "name": "Line one\r\nLine two"},
+                {"time_stamp": 2, "name": "Other"},
+            ],
+        )
+
+    def test_parse_csv_lines_batches(self):
+        """
+        Test that batch_size groups rows into column batches and that bad sizes raise `PurpleAirAPIError`.
+        """
+
+        # Setup
+        lines = ["time_stamp,pm2.5_atm", "1,1.0", "2,2.0", "3,3.0"]
+
+        # Action
+        retval = list(parse_csv_lines(lines, batch_size=2))
+
+        # Expected Result
+        self.assertEqual(
+            retval,
+            [
+                {"time_stamp": [1, 2], "pm2.5_atm": [1.0, 2.0]},
+                {"time_stamp": [3], "pm2.5_atm": [3.0]},
+            ],
+        )
+        self.assertEqual(list(parse_csv_lines([])), [])
+
+        with self.assertRaises(PurpleAirAPIError):
+            list(parse_csv_lines(lines, batch_size=0))
+
+    def test_send_url_get_stream_request(self):
+        """
+        Test that the stream helper yields the body line by line and raises on error responses.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/sensors/1/history/csv"
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text="time_stamp\n1\n2\n", status_code=200)
+            retval = list(send_url_get_stream_request(fake_url_request, "111"))
+            self.assertEqual(retval, ["time_stamp\n", "1\n", "2\n"])
+            self.assertEqual(m.last_request.headers["X-API-Key"], "111")
+
+            m.get(
+                fake_url_request,
+                text='{"error": "NotFoundError", "description": "Not found"}',
+                status_code=404,
+            )
+            with self.assertRaises(PurpleAirAPIError):
+                list(send_url_get_stream_request(fake_url_request, "111"))
+
 
 if __name__ == "__main__":
     unittest.main()
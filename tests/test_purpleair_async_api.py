@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import asyncio
+import unittest
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAsyncAPI import AsyncPurpleAirAPI
+from purpleair_api.PurpleAirAsyncLocalAPI import AsyncPurpleAirLocalAPI
+from purpleair_api.PurpleAirAsyncReadAPI import AsyncPurpleAirReadAPI
+from purpleair_api.PurpleAirAsyncWriteAPI import AsyncPurpleAirWriteAPI
+from purpleair_api.PurpleAirDeadline import PurpleAirDeadline
+from test_purpleair_async_helpers import FakeAsyncResponse, FakeAsyncSession
+
+KEYS_URL = "https://api.purpleair.com/v1/keys"
+
+
+def keys_response(api_key_type):
+    return (
+        200,
+        '{"api_version": "V1.0.14", "time_stamp": 123456789, "api_key_type": "'
+        + api_key_type
+        + '"}',
+    )
+
+
+class AsyncPurpleAirAPITest(unittest.IsolatedAsyncioTestCase):
+    async def test_create_with_valid_read_key(self):
+        """
+        Test that create checks the read key and stores the key information.
+        """
+
+        # Setup
+        session = FakeAsyncSession({("GET", KEYS_URL): keys_response("READ")})
+
+        # Action
+        my_paa = await AsyncPurpleAirAPI.create(
+            your_api_read_key="123", session=session
+        )
+
+        # Expected Result
+        self.assertEqual(my_paa.get_api_key_type, {"123": "READ"})
+        self.assertEqual(my_paa.get_api_versions, {"123": "V1.0.14"})
+        self.assertEqual(my_paa.get_api_key_last_checked, {"123": 123456789})
+
+    async def test_create_with_wrong_key_types(self):
+        """
+        Test that create raises `PurpleAirAPIError` when a key is the wrong type.
+        """
+
+        # Setup
+        session = FakeAsyncSession({("GET", KEYS_URL): keys_response("WRITE")})
+
+        # Action and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            await AsyncPurpleAirAPI.create(your_api_read_key="123", session=session)
+
+        session.routes[("GET", KEYS_URL)] = keys_response("READ")
+        with self.assertRaises(PurpleAirAPIError):
+            await AsyncPurpleAirAPI.create(your_api_write_key="456", session=session)
+
+        # A caller's session is never closed for them
+        self.assertFalse(session.closed)
+
+    async def test_no_parameters_provided(self):
+        """
+        Test that providing no parameters raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            AsyncPurpleAirAPI()
+
+    async def test_shared_session_for_all_requests(self):
+        """
+        Test that read, write and local requests share one session.
+        """
+
+        # Setup
+        session = FakeAsyncSession(
+            {
+                ("GET", KEYS_URL): keys_response("READ"),
+                ("GET", "https://api.purpleair.com/v1/sensors/1234"): (200, '{"a": 1}'),
+                ("GET", "http://192.168.1.2/json"): (200, '{"b": 2}'),
+            }
+        )
+        my_paa = await AsyncPurpleAirAPI.create(
+            your_api_read_key="123",
+            your_ipv4_address=["192.168.1.2"],
+            session=session,
+        )
+
+        # Action
+        sensor_retval = await my_paa.request_sensor_data(1234)
+        local_retval = await my_paa.request_local_sensor_data()
+
+        # Expected Result
+        self.assertEqual(sensor_retval, {"a": 1})
+        self.assertEqual(local_retval, {"192.168.1.2": {"b": 2}})
+        self.assertEqual(len(session.calls), 3)
+
+
+class AsyncPurpleAirReadAPITest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.session = FakeAsyncSession({})
+        self.para = AsyncPurpleAirReadAPI("123456789", session=self.session)
+
+    async def assert_get(self, expected_url, awaitable):
+        self.session.routes[("GET", expected_url)] = (200, '{"test": 5}')
+        self.assertEqual(await awaitable, {"test": 5})
+        self.assertEqual(self.session.calls[-1][1], expected_url)
+
+    async def test_read_requests_build_the_same_urls(self):
+        """
+        Test that each read method builds the same URL as its synchronous counterpart.
+        """
+
+        base = "https://api.purpleair.com/v1/"
+
+        # Action and Expected Result
+        await self.assert_get(
+            base + "sensors/1234?read_key=56789&fields=a,b",
+            self.para.request_sensor_data(1234, 56789, "a, b"),
+        )
+        await self.assert_get(
+            base + "sensors/?fields=name&location_type=0&max_age=60",
+            self.para.request_multiple_sensors_data(
+                "name", location_type=0, max_age=60
+            ),
+        )
+        await self.assert_get(
+            base + "sensors/1234/history?fields=name&average=60",
+            self.para.request_sensor_historic_data(1234, "name", average=60),
+        )
+        await self.assert_get(
+            base + "sensors/1234/history/csv?fields=name",
+            self.para.request_sensor_historic_data(1234, "name", csv_data_format=True),
+        )
+        await self.assert_get(base + "groups/7", self.para.request_group_detail_data(7))
+        await self.assert_get(base + "groups/", self.para.request_group_list_data())
+        await self.assert_get(
+            base + "groups/7/members/8?fields=name",
+            self.para.request_member_data(7, 8, "name"),
+        )
+        await self.assert_get(
+            base + "groups/7/members/8/history?fields=name&privacy=both",
+            self.para.request_member_historic_data(7, 8, "name", privacy="both"),
+        )
+        await self.assert_get(
+            base + "groups/7/members?fields=name&show_only=1,2",
+            self.para.request_members_data(7, "name", show_only="1,2"),
+        )
+        await self.assert_get(
+            base + "organization", self.para.request_organization_data()
+        )
+
+    async def test_request_sensor_historic_data_range(self):
+        """
+        Test that each window is requested and the rows are merged in time order.
+        """
+
+        # Setup
+        day = 24 * 60 * 60
+        base = "https://api.purpleair.com/v1/sensors/1234/history?fields=pm2.5"
+        for start, end in ((0, 14 * day), (14 * day, 20 * day)):
+            self.session.routes[
+                (
+                    "GET",
+                    f"{base}&start_timestamp={start}&end_timestamp={end}&average=60",
+                )
+            ] = (
+                200,
+                f'{{"fields": ["time_stamp", "pm2.5"], "data": [[{start}, 1.0]]}}',
+            )
+
+        # Action
+        retval = await self.para.request_sensor_historic_data_range(
+            1234, "pm2.5", 0, 20 * day, average=60, max_workers=1
+        )
+
+        # Expected Result
+        self.assertEqual(retval["data"], [[0, 1.0], [14 * day, 1.0]])
+        self.assertEqual(len(self.session.calls), 2)
+
+    async def test_close_leaves_injected_session_open(self):
+        """
+        Test that closing the API never closes a session passed in by the caller.
+        """
+
+        # Action
+        async with self.para:
+            pass
+
+        # Expected Result
+        self.assertFalse(self.session.closed)
+
+    async def test_close_owned_session(self):
+        """
+        Test that close closes the session the class created for itself.
+        """
+
+        # Setup
+        para = AsyncPurpleAirReadAPI("123456789")
+        para._session = self.session
+
+        # Action
+        await para.close()
+
+        # Expected Result
+        self.assertTrue(self.session.closed)
+        self.assertIsNone(para._session)
+
+
+class AsyncPurpleAirWriteAPITest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.session = FakeAsyncSession({})
+        self.pawa = AsyncPurpleAirWriteAPI("123456789", session=self.session)
+
+    async def test_post_create_member_options(self):
+        """
+        Test that each supported parameter combination posts the matching JSON body.
+        """
+
+        # Setup
+        fake_url = "https://api.purpleair.com/v1/groups/1/members"
+        self.session.routes[("POST", fake_url)] = (201, '{"member_id": 2}')
+
+        # Action
+        await self.pawa.post_create_member(1, sensor_id="abc")
+        await self.pawa.post_create_member(1, sensor_index=5)
+        await self.pawa.post_create_member(
+            1, sensor_id="abc", owner_email="me@example.com", location_type=0
+        )
+
+        # Expected Result
+        bodies = [call[2]["json"] for call in self.session.calls]
+        self.assertEqual(bodies[0], {"sensor_id": "abc"})
+        self.assertEqual(bodies[1], {"sensor_index": 5})
+        self.assertEqual(bodies[2]["owner_email"], "me@example.com")
+
+    async def test_post_create_member_invalid_options(self):
+        """
+        Test that an invalid parameter combination raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            await self.pawa.post_create_member(1)
+
+    async def test_group_requests(self):
+        """
+        Test that the group create and delete requests use the expected URLs.
+        """
+
+        # Setup
+        base = "https://api.purpleair.com/v1/"
+        self.session.routes[("POST", base + "groups")] = (201, '{"group_id": 1}')
+        self.session.routes[("DELETE", base + "groups/1")] = (204, "")
+        self.session.routes[("DELETE", base + "groups/1/members/2")] = (204, "")
+
+        # Action
+        create_retval = await self.pawa.post_create_group_data("my group")
+        await self.pawa.post_delete_group(1)
+        await self.pawa.post_delete_member(1, 2)
+
+        # Expected Result
+        self.assertEqual(create_retval, {"group_id": 1})
+        self.assertEqual(
+            [call[0] for call in self.session.calls], ["POST", "DELETE", "DELETE"]
+        )
+
+
+class AsyncPurpleAirLocalAPITest(unittest.IsolatedAsyncioTestCase):
+    async def test_request_local_sensor_data_multiple_ips(self):
+        """
+        Test that every local sensor is requested and keyed by its address.
+        """
+
+        # Setup
+        session = FakeAsyncSession(
+            {
+                ("GET", "http://192.168.1.2/json"): (200, '{"sensor": 1}'),
+                ("GET", "http://192.168.1.3/json"): (200, '{"sensor": 2}'),
+            }
+        )
+        pala = AsyncPurpleAirLocalAPI(["192.168.1.2", "192.168.1.3"], session=session)
+
+        # Action
+        retval = await pala.request_local_sensor_data()
+
+        # Expected Result
+        self.assertEqual(
+            retval, {"192.168.1.2": {"sensor": 1}, "192.168.1.3": {"sensor": 2}}
+        )
+
+    async def test_request_local_sensor_data_failed_sensors(self):
+        """
+        Test that a sensor that fails or hangs gets an error entry while the others still
+        return their data.
+        """
+
+        # Setup
+        class HangingResponse(FakeAsyncResponse):
+            async def read(self):
+                await asyncio.sleep(10)
+
+        session = FakeAsyncSession(
+            {
+                ("GET", "http://192.168.1.2/json"): (200, '{"sensor": 1}'),
+                ("GET", "http://192.168.1.3/json"): (500, '{"error": "Oops"}'),
+            }
+        )
+        real_request = session._request
+
+        def request(method, url, **kwargs):
+            if url == "http://192.168.1.4/json":
+                return HangingResponse(200, "")
+
+            return real_request(method, url, **kwargs)
+
+        session._request = request
+        pala = AsyncPurpleAirLocalAPI(
+            ["192.168.1.2", "192.168.1.3", "192.168.1.4"], session=session
+        )
+
+        # Action
+        retval = await pala.request_local_sensor_data(timeout=0.05)
+
+        # Expected Result
+        self.assertEqual(list(retval), ["192.168.1.2", "192.168.1.3", "192.168.1.4"])
+        self.assertEqual(retval["192.168.1.2"], {"sensor": 1})
+        self.assertEqual(retval["192.168.1.3"]["error"], "PurpleAirAPIError")
+        self.assertEqual(retval["192.168.1.4"]["error"], "TimeoutError")
+
+    async def test_request_local_sensor_data_deadline(self):
+        """
+        Test that every sensor gets an error entry once the deadline has passed.
+        """
+
+        # Setup
+        session = FakeAsyncSession(
+            {("GET", "http://192.168.1.2/json"): (200, '{"sensor": 1}')}
+        )
+        pala = AsyncPurpleAirLocalAPI(["192.168.1.2"], session=session, timeout=None)
+        deadline = PurpleAirDeadline(0.001)
+        await asyncio.sleep(0.01)
+
+        # Action
+        retval = await pala.request_local_sensor_data(deadline=deadline)
+
+        # Expected Result
+        self.assertEqual(retval["192.168.1.2"]["error"], "PurpleAirAPIError")
+        self.assertEqual(session.calls, [])
+
+    async def test_invalid_ip_list(self):
+        """
+        Test that the same address validation as `PurpleAirLocalAPI` is applied.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            AsyncPurpleAirLocalAPI(None)
+
+        with self.assertRaises(PurpleAirAPIError):
+            AsyncPurpleAirLocalAPI([""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+
+sys.path.append("../")
+
+import purpleair_api.PurpleAirAsyncHelpers as async_helpers_module
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAsyncHelpers import (
+    async_send_url_delete_request,
+    async_send_url_get_request,
+    async_send_url_post_request,
+    create_async_session,
+)
+
+
+class FakeAsyncResponse:
+    """
+    A stand in for an aiohttp response.
+    """
+
+    def __init__(self, status, text):
+        self.status = status
+        self._text = text
+
+    async def read(self):
+        return self._text.encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class FakeAsyncSession:
+    """
+    A stand in for an aiohttp session that answers from a dict of routes.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.closed = False
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        status, text = self.routes[(method, url)]
+        return FakeAsyncResponse(status, text)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._request("DELETE", url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+class PurpleAirAsyncHelpersTest(unittest.IsolatedAsyncioTestCase):
+    async def test_async_send_url_get_request_optional_parameters(self):
+        """
+        Test that the optional parameters and API key are sent with the GET request.
+        """
+
+        # Setup
+        expected_fake_url = "https://api.purpleair.com/v1/keys?param_1=abc&param_2=5"
+        session = FakeAsyncSession({("GET", expected_fake_url): (200, '{"test": 5}')})
+
+        # Action
+        retval = await async_send_url_get_request(
+            "https://api.purpleair.com/v1/keys",
+            session,
+            "1111-2222",
+            "?",
+            {"param_1": "abc", "param_2": 5, "param_3": None},
+        )
+
+        # Expected Result
+        self.assertEqual(retval, {"test": 5})
+        self.assertEqual(session.calls[0][2], {"headers": {"X-API-Key": "1111-2222"}})
+
+    async def test_async_send_url_get_request_no_api_key(self):
+        """
+        Test that no headers are sent when no API key is provided.
+        """
+
+        # Setup
+        fake_url = "http://192.168.1.2/json"
+        session = FakeAsyncSession({("GET", fake_url): (200, '{"test": 5}')})
+
+        # Action
+        await async_send_url_get_request(fake_url, session)
+
+        # Expected Result
+        self.assertEqual(session.calls[0][2], {})
+
+    async def test_async_send_url_get_request_error_response(self):
+        """
+        Test that if our response returns an error, we raise `PurpleAirAPIError`.
+        """
+
+        # Setup
+        fake_url = "https://api.purpleair.com/v1/keys"
+        session = FakeAsyncSession(
+            {("GET", fake_url): (403, '{"error": "BAD!", "description": "BAD BAD!"}')}
+        )
+
+        # Action and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            await async_send_url_get_request(fake_url, session, "111")
+
+    async def test_async_send_url_post_and_delete_request(self):
+        """
+        Test that the POST and DELETE helpers send the JSON body only when provided.
+        """
+
+        # Setup
+        fake_url = "https://api.purpleair.com/v1/groups"
+        session = FakeAsyncSession(
+            {
+                ("POST", fake_url): (201, '{"group_id": 1}'),
+                ("DELETE", fake_url): (204, ""),
+            }
+        )
+
+        # Action
+        post_retval = await async_send_url_post_request(
+            fake_url, session, "111", {"name": "x"}
+        )
+        delete_retval = await async_send_url_delete_request(fake_url, session, "111")
+
+        # Expected Result
+        self.assertEqual(post_retval, {"group_id": 1})
+        self.assertIsNone(delete_retval)
+        self.assertEqual(session.calls[0][2]["json"], {"name": "x"})
+        self.assertNotIn("json", session.calls[1][2])
+
+    async def test_create_async_session_without_aiohttp(self):
+        """
+        Test that creating a session without aiohttp installed raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with patch.object(async_helpers_module, "aiohttp", None):
+            with self.assertRaises(PurpleAirAPIError):
+                create_async_session()
+
+    @unittest.skipIf(async_helpers_module.aiohttp is None, "aiohttp is not installed")
+    async def test_create_async_session_with_aiohttp(self):
+        """
+        Test that create_async_session configures the connection limits.
+        """
+
+        # Setup and Action
+        session = create_async_session(limit=20, limit_per_host=5)
+
+        # Expected Result
+        self.assertEqual(session.connector.limit, 20)
+        self.assertEqual(session.connector.limit_per_host, 5)
+        await session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
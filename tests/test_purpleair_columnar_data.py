@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from array import array
+from math import isnan
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+import purpleair_api.PurpleAirColumnarData as columnar_module
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirColumnarData import PurpleAirColumnarData
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+
+SAMPLE_SENSORS_PAYLOAD = {
+    "api_version": "V1.0.14-0.0.71",
+    "time_stamp": 1736000000,
+    "data_time_stamp": 1735999990,
+    "max_age": 604800,
+    "fields": ["sensor_index", "name", "humidity", "pm2.5", "my_custom_field"],
+    "data": [
+        [131075, "Mariners Bluff", 27, 3.4, 7],
+        [131079, "BRSKBV-outside", None, 1.0, 8],
+        [131077, "BEE Patio", 30, None, 9],
+    ],
+}
+
+
+class PurpleAirColumnarDataTest(unittest.TestCase):
+    def setUp(self):
+        self.columns = PurpleAirColumnarData.from_response(SAMPLE_SENSORS_PAYLOAD)
+
+    def test_from_response_column_types(self):
+        """
+        Test that each column is stored in the most compact type that holds it.
+        """
+
+        # Expected Result
+        self.assertEqual(self.columns["sensor_index"].typecode, "q")
+        self.assertEqual(self.columns["pm2.5"].typecode, "d")
+        self.assertEqual(self.columns["my_custom_field"].typecode, "q")
+        self.assertEqual(
+            self.columns["name"], ["Mariners Bluff", "BRSKBV-outside", "BEE Patio"]
+        )
+
+        # An integer field with a missing value falls back to floats with nan
+        self.assertEqual(self.columns["humidity"].typecode, "d")
+        self.assertTrue(isnan(self.columns["humidity"][1]))
+        self.assertTrue(isnan(self.columns["pm2.5"][2]))
+
+    def test_from_response_metadata_and_fields(self):
+        """
+        Test that the field order, row count and other top level keys are kept.
+        """
+
+        # Expected Result
+        self.assertEqual(self.columns.fields, SAMPLE_SENSORS_PAYLOAD["fields"])
+        self.assertEqual(len(self.columns), 3)
+        self.assertIn("pm2.5", self.columns)
+        self.assertEqual(self.columns.metadata["time_stamp"], 1736000000)
+        self.assertNotIn("data", self.columns.metadata)
+
+    def test_row_by_sensor_index(self):
+        """
+        Test that a sensor's row can be looked up by its sensor_index.
+        """
+
+        # Action
+        retval = self.columns.row(131079)
+
+        # Expected Result
+        self.assertEqual(self.columns.index_of(131077), 2)
+        self.assertEqual(retval["name"], "BRSKBV-outside")
+        self.assertEqual(retval["pm2.5"], 1.0)
+
+    def test_row_missing_sensor_or_field(self):
+        """
+        Test that missing sensors and fields raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            self.columns.row(1)
+
+        with self.assertRaises(PurpleAirAPIError):
+            self.columns.column("pm10.0")
+
+        no_index = PurpleAirColumnarData.from_response(
+            {"fields": ["name"], "data": [["a"]]}
+        )
+        with self.assertRaises(PurpleAirAPIError):
+            no_index.row(1)
+
+    def test_from_response_invalid_payload(self):
+        """
+        Test that a payload without `fields` and `data` raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirColumnarData.from_response({"sensor": {}})
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirColumnarData.from_response(None)
+
+    def test_from_response_no_rows(self):
+        """
+        Test that a payload with no rows decodes into empty columns.
+        """
+
+        # Action
+        retval = PurpleAirColumnarData.from_response(
+            {"fields": ["sensor_index", "pm2.5"], "data": []}
+        )
+
+        # Expected Result
+        self.assertEqual(len(retval), 0)
+        self.assertEqual(retval["pm2.5"], array("d"))
+
+    def test_to_numpy_without_numpy(self):
+        """
+        Test that to_numpy raises `PurpleAirAPIError` when NumPy is not installed.
+        """
+
+        # Setup, Action, and Expected Result
+        with patch.object(columnar_module, "numpy", None):
+            with self.assertRaises(PurpleAirAPIError):
+                self.columns.to_numpy()
+
+    @unittest.skipIf(columnar_module.numpy is None, "NumPy is not installed")
+    def test_to_numpy_shares_memory(self):
+        """
+        Test that numeric columns become NumPy arrays without being copied.
+        """
+
+        # Action
+        retval = self.columns.to_numpy()
+
+        # Expected Result
+        self.assertEqual(retval["sensor_index"].dtype.kind, "i")
+        self.assertEqual(retval["pm2.5"][0], 3.4)
+        self.assertEqual(retval["name"].dtype, object)
+        self.columns["pm2.5"][0] = 5.0
+        self.assertEqual(retval["pm2.5"][0], 5.0)
+
+    def test_request_multiple_sensors_data_columnar(self):
+        """
+        Test that the read API returns typed columns when asked to.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789")
+        fake_url_request = "https://api.purpleair.com/v1/sensors/?fields=name,pm2.5"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                fake_url_request,
+                json={
+                    "fields": ["sensor_index", "name", "pm2.5"],
+                    "data": [[1, "a", 2.5]],
+                },
+                status_code=200,
+            )
+            retval = para.request_multiple_sensors_data("name,pm2.5", columnar=True)
+
+        # Expected Result
+        self.assertIsInstance(retval, PurpleAirColumnarData)
+        self.assertEqual(retval.row(1)["pm2.5"], 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
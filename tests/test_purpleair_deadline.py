@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIConstants import (
+    DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+)
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import send_url_get_request
+from purpleair_api.PurpleAirDeadline import PurpleAirDeadline
+from purpleair_api.PurpleAirLocalAPI import PurpleAirLocalAPI
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+from purpleair_api.PurpleAirRetryPolicy import PurpleAirRetryPolicy
+from purpleair_api.PurpleAirWriteAPI import PurpleAirWriteAPI
+
+FAKE_URL = "https://api.purpleair.com/v1/organization"
+ERROR_TEXT = '{"error": "ServiceUnavailable", "description": "Try again"}'
+
+
+class FakeClock:
+    """
+    A stand in for time.monotonic. Tests move the clock forward by hand.
+    """
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+class PurpleAirDeadlineTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        monotonic_patcher = patch(
+            "purpleair_api.PurpleAirDeadline.monotonic", self.clock.monotonic
+        )
+        monotonic_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+
+    def test_remaining_and_expired(self):
+        """
+        Test that the time left counts down to zero and the deadline then expires.
+        """
+
+        # Setup
+        deadline = PurpleAirDeadline(5.0)
+
+        # Action and Expected Result
+        self.assertEqual(deadline.remaining, 5.0)
+        self.assertFalse(deadline.expired)
+
+        self.clock.now = 107.0
+        self.assertEqual(deadline.remaining, 0.0)
+        self.assertTrue(deadline.expired)
+
+    def test_clip(self):
+        """
+        Test that floats, tuples and a missing timeout are cut down to the time left.
+        """
+
+        # Setup
+        deadline = PurpleAirDeadline(5.0)
+        self.clock.now = 102.0
+
+        # Action and Expected Result
+        self.assertEqual(deadline.clip(), 3.0)
+        self.assertEqual(deadline.clip(1.0), 1.0)
+        self.assertEqual(deadline.clip(10.0), 3.0)
+        self.assertEqual(deadline.clip((1.0, 10.0)), (1.0, 3.0))
+        self.assertEqual(deadline.clip((None, 2.0)), (3.0, 2.0))
+
+    def test_clip_after_deadline_raises(self):
+        """
+        Test that clipping once the deadline has passed raises `PurpleAirAPIError`.
+        """
+
+        # Setup
+        deadline = PurpleAirDeadline(1.0)
+        self.clock.now = 101.0
+
+        # Action and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            deadline.clip(5.0)
+
+    def test_invalid_seconds(self):
+        """
+        Test that a deadline that is not in the future raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirDeadline(0)
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirDeadline(None)
+
+    def test_send_url_get_request_clips_timeout(self):
+        """
+        Test that the request is sent with the timeout cut down to the time left.
+        """
+
+        # Setup
+        deadline = PurpleAirDeadline(2.0)
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, text='{"test": 5}', status_code=200)
+            send_url_get_request(FAKE_URL, timeout=(1.0, 30.0), deadline=deadline)
+
+        # Expected Result
+        self.assertEqual(m.last_request.timeout, (1.0, 2.0))
+
+    def test_send_url_get_request_after_deadline_raises(self):
+        """
+        Test that no request is sent once the deadline has passed.
+        """
+
+        # Setup
+        deadline = PurpleAirDeadline(1.0)
+        self.clock.now = 200.0
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, text='{"test": 5}', status_code=200)
+            with self.assertRaises(PurpleAirAPIError):
+                send_url_get_request(FAKE_URL, deadline=deadline)
+
+        self.assertEqual(m.call_count, 0)
+
+    def test_retry_is_skipped_when_the_deadline_is_too_close(self):
+        """
+        Test that a retry whose backoff runs past the deadline is not made.
+        """
+
+        # Setup
+        sleeps = []
+        retry_policy = PurpleAirRetryPolicy(max_attempts=3, backoff_base=5.0, jitter=0)
+        deadline = PurpleAirDeadline(2.0)
+
+        # Action
+        with patch("purpleair_api.PurpleAirRetryPolicy.sleep", sleeps.append):
+            with requests_mock.Mocker() as m:
+                m.get(FAKE_URL, text=ERROR_TEXT, status_code=503)
+                with self.assertRaises(PurpleAirAPIError):
+                    send_url_get_request(
+                        FAKE_URL, retry_policy=retry_policy, deadline=deadline
+                    )
+
+        # Expected Result
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(sleeps, [])
+
+    def test_read_api_timeouts(self):
+        """
+        Test that the client timeout is used, a per call timeout overrides it, and a
+        deadline clips it.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", timeout=10.0)
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, text='{"test": 5}', status_code=200)
+
+            para.request_organization_data()
+            self.assertEqual(m.last_request.timeout, 10.0)
+
+            para.request_organization_data(timeout=3.0)
+            self.assertEqual(m.last_request.timeout, 3.0)
+
+            para.request_organization_data(deadline=PurpleAirDeadline(1.5))
+            self.assertEqual(m.last_request.timeout, 1.5)
+
+    def test_default_timeouts_are_finite(self):
+        """
+        Test that clients wait a finite time by default, and that None waits without a limit
+        for the client or for a single request.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789")
+        pawa = PurpleAirWriteAPI("123456789")
+        pala = PurpleAirLocalAPI(["192.168.1.2"])
+        para_no_limit = PurpleAirReadAPI("123456789", timeout=None)
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, text='{"test": 5}', status_code=200)
+            m.delete("https://api.purpleair.com/v1/groups/1", text="", status_code=204)
+            m.get("http://192.168.1.2/json", text='{"test": 5}', status_code=200)
+
+            para.request_organization_data()
+            self.assertEqual(m.last_request.timeout, DEFAULT_REQUEST_TIMEOUT_SECONDS)
+
+            pawa.post_delete_group(1)
+            self.assertEqual(m.last_request.timeout, DEFAULT_REQUEST_TIMEOUT_SECONDS)
+
+            pala.request_local_sensor_data()
+            self.assertEqual(
+                m.last_request.timeout, DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS
+            )
+
+            para.request_organization_data(timeout=None)
+            self.assertIsNone(m.last_request.timeout)
+
+            para_no_limit.request_organization_data()
+            self.assertIsNone(m.last_request.timeout)
+
+    def test_write_api_timeouts(self):
+        """
+        Test that write requests use the client timeout and a deadline clips it.
+        """
+
+        # Setup
+        pawa = PurpleAirWriteAPI("123456789", timeout=10.0)
+        fake_url_request = "https://api.purpleair.com/v1/groups/1"
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.delete(fake_url_request, text="", status_code=204)
+
+            pawa.post_delete_group(1)
+            self.assertEqual(m.last_request.timeout, 10.0)
+
+            pawa.post_delete_group(1, deadline=PurpleAirDeadline(0.5))
+            self.assertEqual(m.last_request.timeout, 0.5)
+
+    def test_local_sweep_shares_a_deadline(self):
+        """
+        Test that a concurrent sweep gives sensors an error entry once the deadline passes.
+        """
+
+        # Setup
+        pala = PurpleAirLocalAPI(["192.168.1.2", "192.168.1.3"], timeout=10.0)
+        deadline = PurpleAirDeadline(1.0)
+        self.clock.now = 200.0
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", text='{"test": 5}', status_code=200)
+            m.get("http://192.168.1.3/json", text='{"test": 6}', status_code=200)
+            retval = pala.request_local_sensor_data(max_workers=2, deadline=deadline)
+
+        # Expected Result
+        self.assertEqual(m.call_count, 0)
+        self.assertEqual(retval["192.168.1.2"]["error"], "PurpleAirAPIError")
+        self.assertEqual(retval["192.168.1.3"]["error"], "PurpleAirAPIError")
+
+
+if __name__ == "__main__":
+    unittest.main()
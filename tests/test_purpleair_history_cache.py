@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirHistoryCache import PurpleAirHistoryCache
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+
+NOW = 10000000
+DAY = 24 * 60 * 60
+
+
+def make_history_response(start_timestamp, end_timestamp, step=3600):
+    """
+    Build a JSON history payload with one row every `step` seconds.
+    """
+
+    return {
+        "sensor_index": 1234,
+        "fields": ["time_stamp", "pm2.5_atm"],
+        "data": [
+            [time_stamp, time_stamp / 1000]
+            for time_stamp in range(start_timestamp, end_timestamp, step)
+        ],
+    }
+
+
+class PurpleAirHistoryCacheTest(unittest.TestCase):
+    def setUp(self):
+        time_patcher = patch("purpleair_api.PurpleAirHistoryCache.time", lambda: NOW)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+        self.cache = PurpleAirHistoryCache(":memory:", settle_seconds=3600)
+        self.addCleanup(self.cache.close)
+
+    def test_missing_ranges(self):
+        """
+        Test that the gaps between downloaded ranges are found, and touching ranges merge.
+        """
+
+        # Setup
+        self.cache.store(1234, "pm2.5_atm", 100, 200, make_history_response(100, 200))
+        self.cache.store(1234, "pm2.5_atm", 300, 400, make_history_response(300, 400))
+        self.cache.store(1234, "pm2.5_atm", 400, 500, make_history_response(400, 500))
+
+        # Action
+        retval = self.cache.missing_ranges(1234, "pm2.5_atm", 0, 600)
+
+        # Expected Result
+        self.assertEqual(retval, [(0, 100), (200, 300), (500, 600)])
+        self.assertEqual(self.cache.missing_ranges(1234, "pm2.5_atm", 320, 480), [])
+        self.assertEqual(
+            self.cache.missing_ranges(1234, "pm2.5_atm", 150, 350), [(200, 300)]
+        )
+
+    def test_series_are_keyed_on_average_and_field_set(self):
+        """
+        Test that history is kept apart by average and field set, in any field order.
+        """
+
+        # Setup
+        self.cache.store(1, "humidity, pm2.5_atm", 0, 100, make_history_response(0, 0))
+
+        # Action and Expected Result
+        self.assertEqual(self.cache.missing_ranges(1, "pm2.5_atm,humidity", 0, 100), [])
+        self.assertEqual(self.cache.missing_ranges(1, "pm2.5_atm", 0, 100), [(0, 100)])
+        self.assertEqual(
+            self.cache.missing_ranges(1, "humidity,pm2.5_atm", 0, 100, average=60),
+            [(0, 100)],
+        )
+        self.assertEqual(
+            self.cache.missing_ranges(2, "humidity,pm2.5_atm", 0, 100), [(0, 100)]
+        )
+
+    def test_recent_history_is_not_marked_downloaded(self):
+        """
+        Test that rows newer than `settle_seconds` are stored but fetched again next time.
+        """
+
+        # Setup
+        start_timestamp = NOW - DAY
+
+        # Action
+        self.cache.store(
+            1234,
+            "pm2.5_atm",
+            start_timestamp,
+            NOW,
+            make_history_response(start_timestamp, NOW),
+        )
+
+        # Expected Result
+        self.assertEqual(
+            self.cache.missing_ranges(1234, "pm2.5_atm", start_timestamp, NOW),
+            [(NOW - 3600, NOW)],
+        )
+        self.assertEqual(
+            len(self.cache.load(1234, "pm2.5_atm", start_timestamp, NOW)["data"]), 24
+        )
+
+    def test_load_reorders_columns_and_sorts_rows(self):
+        """
+        Test that rows stored in another column order are read back in the first one.
+        """
+
+        # Setup
+        self.cache.store(
+            1234, "pm2.5_atm", 200, 300, make_history_response(200, 300, 50)
+        )
+        self.cache.store(
+            1234,
+            "pm2.5_atm",
+            0,
+            200,
+            {"fields": ["pm2.5_atm", "time_stamp"], "data": [[0.1, 100], [0.0, 0]]},
+        )
+
+        # Action
+        retval = self.cache.load(1234, "pm2.5_atm", 0, 300)
+
+        # Expected Result
+        self.assertEqual(retval["fields"], ["time_stamp", "pm2.5_atm"])
+        self.assertEqual(
+            retval["data"], [[0, 0.0], [100, 0.1], [200, 0.2], [250, 0.25]]
+        )
+        self.assertIsNone(self.cache.load(99, "pm2.5_atm", 0, 300))
+
+    def test_store_without_time_stamp_raises(self):
+        """
+        Test that a payload without `time_stamp` raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            self.cache.store(
+                1, "pm2.5_atm", 0, 100, {"fields": ["pm2.5_atm"], "data": []}
+            )
+
+    def test_clear(self):
+        """
+        Test that one sensor's history, or all of it, can be dropped.
+        """
+
+        # Setup
+        self.cache.store(1, "pm2.5_atm", 0, 100, make_history_response(0, 100, 10))
+        self.cache.store(2, "pm2.5_atm", 0, 100, make_history_response(0, 100, 10))
+
+        # Action and Expected Result
+        self.cache.clear(1)
+        self.assertEqual(self.cache.missing_ranges(1, "pm2.5_atm", 0, 100), [(0, 100)])
+        self.assertEqual(self.cache.missing_ranges(2, "pm2.5_atm", 0, 100), [])
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.load(2, "pm2.5_atm", 0, 100))
+
+    def test_history_persists_across_instances(self):
+        """
+        Test that a cache opened on the same file sees the stored history.
+        """
+
+        # Setup
+        with tempfile.TemporaryDirectory() as cache_dir:
+            database_path = os.path.join(cache_dir, "history.sqlite")
+            first_cache = PurpleAirHistoryCache(database_path)
+            first_cache.store(1, "pm2.5_atm", 0, 100, make_history_response(0, 100, 10))
+            first_cache.close()
+
+            # Action
+            second_cache = PurpleAirHistoryCache(database_path)
+            retval = second_cache.load(1, "pm2.5_atm", 0, 100)
+            second_cache.close()
+
+        # Expected Result
+        self.assertEqual(len(retval["data"]), 10)
+
+    def test_read_api_only_requests_missing_ranges(self):
+        """
+        Test that a ranged history request only asks the API for what the cache is missing,
+        and a repeat request is served from the cache.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", history_cache=self.cache)
+        start_timestamp = NOW - 30 * DAY
+        end_timestamp = start_timestamp + 10 * DAY
+        self.cache.store(
+            1234,
+            "pm2.5_atm",
+            start_timestamp,
+            start_timestamp + 5 * DAY,
+            make_history_response(start_timestamp, start_timestamp + 5 * DAY),
+        )
+        requested_windows = []
+
+        def history_callback(request, context):
+            window = (
+                int(request.qs["start_timestamp"][0]),
+                int(request.qs["end_timestamp"][0]),
+            )
+            requested_windows.append(window)
+            return make_history_response(*window)
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.purpleair.com/v1/sensors/1234/history",
+                json=history_callback,
+                status_code=200,
+            )
+            first = para.request_sensor_historic_data_range(
+                1234, "pm2.5_atm", start_timestamp, end_timestamp
+            )
+            second = para.request_sensor_historic_data_range(
+                1234, "pm2.5_atm", start_timestamp, end_timestamp
+            )
+
+        # Expected Result
+        self.assertEqual(
+            sorted(requested_windows),
+            [
+                (start_timestamp + 5 * DAY, start_timestamp + 8 * DAY),
+                (start_timestamp + 8 * DAY, end_timestamp),
+            ],
+        )
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(len(first["data"]), 10 * 24)
+        self.assertEqual(first["data"], second["data"])
+        self.assertEqual(first["data"][0][0], start_timestamp)
+        self.assertEqual(second["sensor_index"], 1234)
+        self.assertEqual(second["start_timestamp"], start_timestamp)
+
+    def test_read_api_skips_the_cache_for_private_history(self):
+        """
+        Test that history requested with a sensor `read_key` or `privacy` is neither served
+        from nor stored in the cache, which is not keyed on them.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", history_cache=self.cache)
+        start_timestamp = NOW - 30 * DAY
+        end_timestamp = start_timestamp + DAY
+        self.cache.store(
+            1234,
+            "pm2.5_atm",
+            start_timestamp,
+            end_timestamp,
+            make_history_response(start_timestamp, end_timestamp),
+        )
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.purpleair.com/v1/sensors/1234/history",
+                json=make_history_response(start_timestamp, end_timestamp, step=7200),
+                status_code=200,
+            )
+            private = para.request_sensor_historic_data_range(
+                1234, "pm2.5_atm", start_timestamp, end_timestamp, read_key="secret"
+            )
+            both = para.request_sensor_historic_data_range(
+                1234, "pm2.5_atm", start_timestamp, end_timestamp, privacy="both"
+            )
+
+        # Expected Result
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.request_history[0].qs["read_key"], ["secret"])
+        self.assertEqual(len(private["data"]), 12)
+        self.assertEqual(len(both["data"]), 12)
+        self.assertEqual(
+            len(
+                self.cache.load(1234, "pm2.5_atm", start_timestamp, end_timestamp)[
+                    "data"
+                ]
+            ),
+            24,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
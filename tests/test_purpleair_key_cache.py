@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirKeyCache import PurpleAirKeyCache
+
+KEY_CHECK = {"api_version": "1.1.1", "time_stamp": 123456789, "api_key_type": "READ"}
+
+
+class PurpleAirKeyCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache_path = os.path.join(self.cache_dir.name, "keys", "keys.json")
+
+    def test_put_and_get(self):
+        """
+        Test that a stored key check is read back, and by another instance on the same file.
+        """
+
+        # Setup
+        key_cache = PurpleAirKeyCache(self.cache_path)
+
+        # Action
+        key_cache.put("123456789", KEY_CHECK)
+
+        # Expected Result
+        self.assertEqual(key_cache.get("123456789")["api_key_type"], "READ")
+        self.assertEqual(
+            PurpleAirKeyCache(self.cache_path).get("123456789")["api_version"], "1.1.1"
+        )
+        self.assertIsNone(key_cache.get("987654321"))
+
+    def test_keys_are_not_stored_in_plain_text(self):
+        """
+        Test that the cache file does not contain the API key.
+        """
+
+        # Setup
+        key_cache = PurpleAirKeyCache(self.cache_path)
+
+        # Action
+        key_cache.put("my-secret-api-key", KEY_CHECK)
+
+        # Expected Result
+        with open(self.cache_path, "r", encoding="utf-8") as cache_file:
+            self.assertNotIn("my-secret-api-key", cache_file.read())
+
+    def test_entries_expire(self):
+        """
+        Test that a key check older than the TTL is not returned.
+        """
+
+        # Setup
+        key_cache = PurpleAirKeyCache(self.cache_path, ttl_seconds=60)
+        with patch("purpleair_api.PurpleAirKeyCache.time", lambda: 1000.0):
+            key_cache.put("123456789", KEY_CHECK)
+
+        # Action and Expected Result
+        with patch("purpleair_api.PurpleAirKeyCache.time", lambda: 1059.0):
+            self.assertIsNotNone(key_cache.get("123456789"))
+
+        with patch("purpleair_api.PurpleAirKeyCache.time", lambda: 1060.0):
+            self.assertIsNone(key_cache.get("123456789"))
+
+    def test_unreadable_file_is_treated_as_empty(self):
+        """
+        Test that a corrupt cache file is ignored and replaced on the next put.
+        """
+
+        # Setup
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("{not json")
+        key_cache = PurpleAirKeyCache(self.cache_path)
+
+        # Action and Expected Result
+        self.assertIsNone(key_cache.get("123456789"))
+        key_cache.put("123456789", KEY_CHECK)
+        self.assertIsNotNone(key_cache.get("123456789"))
+
+        key_cache.clear()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,15 @@ Copyright 2023 carlkidcrypto, All rights reserved.
 """
 
 import unittest
+import requests
 import requests_mock
 import sys
+import time
+from unittest.mock import patch
 
 sys.path.append("../")
 
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS
 from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
 from purpleair_api.PurpleAirLocalAPI import PurpleAirLocalAPI
 
@@ -106,6 +110,130 @@ class PurpleAirLocalAPITest(unittest.TestCase):
         self.assertIn("192.168.1.2", retval)
         self.assertIn("192.168.1.3", retval)
 
+    def test_request_local_sensor_data_concurrent_partial_results(self):
+        """
+        Test that in the concurrent mode an offline sensor gets an error entry and the
+        other sensors still return their data in the order they were provided.
+        """
+
+        # Setup
+        pala = PurpleAirLocalAPI(["192.168.1.3", "192.168.1.2", "192.168.1.4"])
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", text='{"sensor": 2}', status_code=200)
+            m.get("http://192.168.1.3/json", exc=requests.exceptions.ConnectTimeout)
+            m.get(
+                "http://192.168.1.4/json",
+                text='{"error": "NotFound", "description": "Gone"}',
+                status_code=404,
+            )
+            retval = pala.request_local_sensor_data(max_workers=3, timeout=1.5)
+
+        # Expected Result
+        self.assertEqual(
+            list(retval.keys()), ["192.168.1.3", "192.168.1.2", "192.168.1.4"]
+        )
+        self.assertEqual(retval["192.168.1.2"], {"sensor": 2})
+        self.assertEqual(retval["192.168.1.3"]["error"], "ConnectTimeout")
+        self.assertEqual(retval["192.168.1.4"]["error"], "PurpleAirAPIError")
+        self.assertIn("404", retval["192.168.1.4"]["description"])
+
+    def test_request_local_sensor_data_concurrent_malformed_error_bodies(self):
+        """
+        Test that in the concurrent mode a sensor answering an error status with an empty or
+        non-JSON body gets an error entry instead of aborting the sweep.
+        """
+
+        # Setup
+        pala = PurpleAirLocalAPI(["192.168.1.2", "192.168.1.3", "192.168.1.4"])
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", text='{"sensor": 2}', status_code=200)
+            m.get("http://192.168.1.3/json", text="", status_code=503)
+            m.get("http://192.168.1.4/json", text="Not Found", status_code=404)
+            retval = pala.request_local_sensor_data(max_workers=3)
+
+        # Expected Result
+        self.assertEqual(retval["192.168.1.2"], {"sensor": 2})
+        self.assertEqual(retval["192.168.1.3"]["error"], "PurpleAirAPIError")
+        self.assertEqual(retval["192.168.1.4"]["error"], "PurpleAirAPIError")
+
+    def test_request_local_sensor_data_concurrent_default_timeout(self):
+        """
+        Test that the concurrent mode waits a finite time for each sensor by default.
+        """
+
+        # Setup and Action
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", text='{"test": 5}', status_code=200)
+            self.pala.request_local_sensor_data(max_workers=1)
+
+        # Expected Result
+        self.assertEqual(m.last_request.timeout, DEFAULT_LOCAL_SENSOR_TIMEOUT_SECONDS)
+
+    def test_request_local_sensor_data_passes_timeout(self):
+        """
+        Test that the per-sensor timeout is passed to every request.
+        """
+
+        # Setup and Action
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", text='{"test": 5}', status_code=200)
+            self.pala.request_local_sensor_data(timeout=2.5)
+
+        # Expected Result
+        self.assertEqual(m.last_request.timeout, 2.5)
+
+    def test_request_local_sensor_data_sequential_raises(self):
+        """
+        Test that without `max_workers` the first failure is raised as before.
+        """
+
+        # Setup, Action, and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get("http://192.168.1.2/json", exc=requests.exceptions.ConnectTimeout)
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                self.pala.request_local_sensor_data()
+
+    def test_request_local_sensor_data_concurrent_sweep_time(self):
+        """
+        Test that the concurrent sweep takes about as long as the slowest sensor.
+        """
+
+        # Setup
+        addresses = [f"192.168.1.{i}" for i in range(10, 14)]
+        pala = PurpleAirLocalAPI(addresses)
+
+        def slow_send_url_get_request(
+            request_url, session=None, timeout=None, retry_policy=None, deadline=None
+        ):
+            time.sleep(0.2)
+            return {"test": 5}
+
+        # Action - patch the transport so the requests really overlap
+        with patch(
+            "purpleair_api.PurpleAirLocalAPI.send_url_get_request",
+            side_effect=slow_send_url_get_request,
+        ):
+            start = time.monotonic()
+            retval = pala.request_local_sensor_data(max_workers=len(addresses))
+            elapsed = time.monotonic() - start
+
+        # Expected Result - four 0.2 second sensors in well under 0.8 seconds
+        self.assertEqual(len(retval), 4)
+        self.assertLess(elapsed, 0.6)
+
+    def test_request_local_sensor_data_invalid_max_workers(self):
+        """
+        Test that a `max_workers` that is not a positive integer raises `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            self.pala.request_local_sensor_data(max_workers=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,14 +5,16 @@ Copyright 2023 carlkidcrypto, All rights reserved.
 Tests for the Matter device converter module.
 """
 
+import math
 import os
 import sys
 import unittest
+from unittest.mock import patch
 
 # Make purpleair_api importable from the repo root.
 sys.path.append("../")
 
-
+import purpleair_api.PurpleAirMatterConverter as matter_converter_module
 from purpleair_api.PurpleAirMatterConverter import (
     EpaAqiCalculator,
     PurpleAirMatterConverter,
@@ -27,6 +29,9 @@ from purpleair_api.PurpleAirMatterConverter import (
     MATTER_CLUSTER_TEMP_MEASUREMENT,
     MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
     MATTER_CLUSTER_PRESSURE_MEASUREMENT,
+    AirQualityEndpoint,
+    TemperatureCluster,
+    MATTER_DEVICE_TYPE_NAMES,
 )
 
 # =============================================================================
@@ -220,6 +225,80 @@ class MatterAirQualityRatingTest(unittest.TestCase):
         )
 
 
+# =============================================================================
+# Batch AQI Tests
+# =============================================================================
+
+# Two decimal readings, e.g. 35.45, round to tenths differently with numpy.round
+BATCH_PM25_VALUES = (
+    [i / 7 for i in range(0, 4200)]
+    + [i / 100 for i in range(5, 60000, 10)]
+    + [12.04, 35.46, 500.4, 600.0]
+)
+
+
+class EpaAqiBatchTest(unittest.TestCase):
+    """Tests for the batch methods of :class:`EpaAqiCalculator` and
+    :class:`MatterAirQualityRating`, with and without NumPy."""
+
+    def _check_batch_matches_scalar(self):
+        aqi_values = list(EpaAqiCalculator.pm25_to_aqi_batch(BATCH_PM25_VALUES))
+        self.assertEqual(
+            aqi_values,
+            [EpaAqiCalculator.pm25_to_aqi(pm25) for pm25 in BATCH_PM25_VALUES],
+        )
+        self.assertEqual(
+            list(EpaAqiCalculator.aqi_to_epa_category_batch(aqi_values)),
+            [EpaAqiCalculator.aqi_to_epa_category(aqi) for aqi in aqi_values],
+        )
+        self.assertEqual(
+            list(MatterAirQualityRating.from_aqi_batch(aqi_values)),
+            [MatterAirQualityRating.from_aqi(aqi).value for aqi in aqi_values],
+        )
+
+    def _check_missing_values(self):
+        aqi_values = list(
+            EpaAqiCalculator.pm25_to_aqi_batch([None, -1.0, float("nan"), 8.0])
+        )
+        self.assertTrue(all(math.isnan(aqi) for aqi in aqi_values[:3]))
+        self.assertEqual(aqi_values[3], EpaAqiCalculator.pm25_to_aqi(8.0))
+        self.assertEqual(
+            list(EpaAqiCalculator.aqi_to_epa_category_batch(aqi_values)),
+            ["Unknown", "Unknown", "Unknown", "Good"],
+        )
+        self.assertEqual(
+            list(MatterAirQualityRating.from_aqi_batch(aqi_values)), [0, 0, 0, 1]
+        )
+
+    @unittest.skipIf(matter_converter_module.numpy is None, "NumPy is not installed")
+    def test_batch_matches_scalar_with_numpy(self):
+        self._check_batch_matches_scalar()
+        retval = EpaAqiCalculator.pm25_to_aqi_batch(
+            matter_converter_module.numpy.array([8.0, 80.0])
+        )
+        self.assertIsInstance(retval, matter_converter_module.numpy.ndarray)
+
+    @unittest.skipIf(matter_converter_module.numpy is None, "NumPy is not installed")
+    def test_batch_missing_values_with_numpy(self):
+        self._check_missing_values()
+
+    def test_batch_matches_scalar_without_numpy(self):
+        with patch.object(matter_converter_module, "numpy", None):
+            self._check_batch_matches_scalar()
+            self.assertIsInstance(EpaAqiCalculator.pm25_to_aqi_batch([8.0]), list)
+
+    def test_batch_missing_values_without_numpy(self):
+        with patch.object(matter_converter_module, "numpy", None):
+            self._check_missing_values()
+
+    def test_batch_zero_width_breakpoint_returns_low_index(self):
+        """A zero-width breakpoint returns the low AQI index instead of dividing by zero."""
+        with patch.object(EpaAqiCalculator, "BREAKPOINTS", [(10.0, 10.0, 42, 99)]):
+            self.assertEqual(list(EpaAqiCalculator.pm25_to_aqi_batch([10.0])), [42.0])
+            with patch.object(matter_converter_module, "numpy", None):
+                self.assertEqual(EpaAqiCalculator.pm25_to_aqi_batch([10.0]), [42.0])
+
+
 # =============================================================================
 # Unit Conversion Tests
 # =============================================================================
@@ -612,5 +691,320 @@ class PurpleAirMatterConverterNormaliseInnerNotDictTest(unittest.TestCase):
         self.assertEqual(aq_attrs["measuredValue"], 0)
 
 
+SAMPLE_MULTIPLE_SENSORS_RESPONSE = {
+    "fields": ["sensor_index", "name", "pm2.5", "pm1.0", "temperature", "model"],
+    "data": [
+        [282168, "first", 12.3, 5.7, 83.0, "PA-I"],
+        [282169, "second", 80.0, None, None, "PA-II"],
+        [282170, None, None, 1.0, 50.0, "PA-II"],
+    ],
+}
+
+
+class PurpleAirMatterConverterAirQualitySensorsTest(unittest.TestCase):
+    """Tests for :meth:`PurpleAirMatterConverter.to_air_quality_sensors`."""
+
+    def test_matches_single_sensor_conversion(self):
+        fields = SAMPLE_MULTIPLE_SENSORS_RESPONSE["fields"]
+        expected = [
+            PurpleAirMatterConverter.to_air_quality_sensor(dict(zip(fields, row)))
+            for row in SAMPLE_MULTIPLE_SENSORS_RESPONSE["data"]
+        ]
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE
+        )
+        self.assertEqual(retval, expected)
+
+    def test_matches_single_sensor_conversion_without_numpy(self):
+        with patch.object(matter_converter_module, "numpy", None):
+            self.test_matches_single_sensor_conversion()
+
+    @unittest.skipIf(matter_converter_module.numpy is None, "NumPy is not installed")
+    def test_matches_single_sensor_conversion_with_numpy(self):
+        fields = ["sensor_index", "pm2.5", "pm1.0", "temperature", "humidity"]
+        pm25_values = [0.0, 9.9, 12.0, 12.1, 35.4, 55.5, 150.4, 250.5, 499.0, 700.0]
+        # Readings between tenths, which numpy.round rounds the other way
+        pm25_values += [0.15, 0.65, 1.05, 2.55, 12.05, 35.45]
+        response = {
+            "fields": fields,
+            "data": [
+                [index, pm25, pm25 / 2, 70.0 + index, 40.0]
+                for index, pm25 in enumerate(pm25_values)
+            ]
+            + [[100, None, None, None, None], [101, "bad", 1.0, 60.0, 50.0]],
+        }
+        expected = [
+            PurpleAirMatterConverter.to_air_quality_sensor(dict(zip(fields, row)))
+            for row in response["data"]
+        ]
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(response)
+        self.assertEqual(retval, expected)
+
+        # The NumPy results are converted back to plain Python values
+        for endpoint in retval:
+            summary = endpoint["air_quality_summary"]
+            self.assertIn(type(summary["epa_aqi"]), (int, float))
+            self.assertIs(type(summary["epa_category"]), str)
+            self.assertIs(type(summary["matter_air_quality_rating_value"]), int)
+
+    def test_static_fragments_are_shared(self):
+        first, second, _ = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE
+        )
+        self.assertIs(first["device_type"], second["device_type"])
+        self.assertIs(
+            first["air_quality_summary"]["references"],
+            second["air_quality_summary"]["references"],
+        )
+        self.assertIsNot(
+            first["clusters"]["air_quality_measurement"]["attributes"],
+            second["clusters"]["air_quality_measurement"]["attributes"],
+        )
+
+    def test_lazy_returns_iterator(self):
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE, lazy=True
+        )
+        self.assertNotIsInstance(retval, list)
+        self.assertEqual(next(retval)["sensor_index"], 282168)
+        self.assertEqual(len(list(retval)), 2)
+
+    def test_negative_pm25_is_unknown(self):
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(
+            {"fields": ["sensor_index", "pm2.5"], "data": [[1, -3.0]]}
+        )
+        summary = retval[0]["air_quality_summary"]
+        self.assertTrue(math.isnan(summary["epa_aqi"]))
+        self.assertEqual(summary["epa_category"], "Unknown")
+        self.assertEqual(summary["matter_air_quality_rating_value"], 0)
+
+    def test_empty_or_invalid_response(self):
+        self.assertEqual(PurpleAirMatterConverter.to_air_quality_sensors({}), [])
+        self.assertEqual(PurpleAirMatterConverter.to_air_quality_sensors(None), [])
+
+
+class PurpleAirMatterConverterRecordTest(unittest.TestCase):
+    """Tests for the ``as_record`` output mode and :class:`AirQualityEndpoint`."""
+
+    def test_to_dict_matches_dictionary_output(self):
+        for raw in (SAMPLE_RAW_SENSOR, SAMPLE_SENSOR_MISSING_FIELDS):
+            record = PurpleAirMatterConverter.to_air_quality_sensor(
+                raw, sensor_name="Porch", as_record=True
+            )
+            self.assertIsInstance(record, AirQualityEndpoint)
+            self.assertEqual(
+                record.to_dict(),
+                PurpleAirMatterConverter.to_air_quality_sensor(
+                    raw, sensor_name="Porch"
+                ),
+            )
+
+    def test_batch_records_match_dictionary_output(self):
+        records = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE, as_record=True
+        )
+        self.assertEqual(
+            [record.to_dict() for record in records],
+            PurpleAirMatterConverter.to_air_quality_sensors(
+                SAMPLE_MULTIPLE_SENSORS_RESPONSE
+            ),
+        )
+
+    def test_records_are_frozen_and_slotted(self):
+        record = PurpleAirMatterConverter.to_air_quality_sensor(
+            SAMPLE_RAW_SENSOR, as_record=True
+        )
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertFalse(hasattr(record.temperature, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.sensor_name = "changed"
+        with self.assertRaises(AttributeError):
+            record.temperature.measured_value = 0
+
+    def test_static_metadata_is_shared_by_the_class(self):
+        first, second, _ = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE, as_record=True
+        )
+        self.assertIs(first.temperature.references, TemperatureCluster.references)
+        self.assertIs(first.device_type, second.device_type)
+        self.assertEqual(first.temperature.cluster_id, MATTER_CLUSTER_TEMP_MEASUREMENT)
+        self.assertEqual(first.air_quality.measured_value, 1230)
+
+    def test_to_dict_returns_copies_of_static_metadata(self):
+        record = PurpleAirMatterConverter.to_air_quality_sensor(
+            SAMPLE_RAW_SENSOR, as_record=True
+        )
+        retval = record.to_dict()
+        retval["device_type"]["label"] = "changed"
+        retval["clusters"]["temperature_measurement"]["references"].clear()
+        self.assertEqual(AirQualityEndpoint.device_type["label"], "Air Quality Sensor")
+        self.assertTrue(TemperatureCluster.references)
+
+
+class PurpleAirMatterConverterMatterDevicesTest(unittest.TestCase):
+    """Tests for :meth:`PurpleAirMatterConverter.to_matter_devices`."""
+
+    def test_matches_each_device_type_method(self):
+        retval = PurpleAirMatterConverter.to_matter_devices(
+            SAMPLE_SENSOR_WRAPPED, sensor_name="Porch"
+        )
+        self.assertEqual(list(retval), list(MATTER_DEVICE_TYPE_NAMES))
+        self.assertEqual(
+            retval["air_quality_sensor"],
+            PurpleAirMatterConverter.to_air_quality_sensor(
+                SAMPLE_SENSOR_WRAPPED, sensor_name="Porch"
+            ),
+        )
+        self.assertEqual(
+            retval["temperature_sensor"],
+            PurpleAirMatterConverter.to_temperature_sensor(
+                SAMPLE_SENSOR_WRAPPED, sensor_name="Porch"
+            ),
+        )
+        self.assertEqual(
+            retval["environmental_sensor"],
+            PurpleAirMatterConverter.to_environmental_sensor(
+                SAMPLE_SENSOR_WRAPPED, sensor_name="Porch"
+            ),
+        )
+
+    def test_normalises_once(self):
+        with patch.object(
+            PurpleAirMatterConverter,
+            "_normalise",
+            wraps=PurpleAirMatterConverter._normalise,
+        ) as mock_normalise:
+            PurpleAirMatterConverter.to_matter_devices(SAMPLE_RAW_SENSOR)
+        mock_normalise.assert_called_once_with(SAMPLE_RAW_SENSOR)
+
+    def test_chosen_device_types_in_order(self):
+        retval = PurpleAirMatterConverter.to_matter_devices(
+            SAMPLE_RAW_SENSOR, ["environmental_sensor", "temperature_sensor"]
+        )
+        self.assertEqual(list(retval), ["environmental_sensor", "temperature_sensor"])
+
+    def test_unknown_device_type_raises(self):
+        with self.assertRaises(ValueError):
+            PurpleAirMatterConverter.to_matter_devices(
+                SAMPLE_RAW_SENSOR, ["air_quality_sensor", "thermostat"]
+            )
+
+    def test_invalid_data_yields_empty_devices(self):
+        retval = PurpleAirMatterConverter.to_matter_devices(None)
+        self.assertIsNone(
+            retval["temperature_sensor"]["clusters"]["temperature_measurement"][
+                "attributes"
+            ]["measuredValue"]
+        )
+
+
+class PurpleAirMatterConverterNowCastTest(unittest.TestCase):
+    """Tests for computing the EPA AQI from a PM2.5 NowCast."""
+
+    def test_single_sensor_uses_nowcast(self):
+        retval = PurpleAirMatterConverter.to_air_quality_sensor(
+            SAMPLE_RAW_SENSOR, nowcast_pm25=80.0
+        )
+        self.assertEqual(
+            retval["air_quality_summary"]["epa_aqi"],
+            EpaAqiCalculator.pm25_to_aqi(80.0),
+        )
+        self.assertEqual(
+            retval["clusters"]["air_quality_measurement"]["attributes"]["aqiRating"],
+            MatterAirQualityRating.POOR.value,
+        )
+        # measuredValue stays the instantaneous reading
+        self.assertEqual(
+            retval["clusters"]["air_quality_measurement"]["attributes"][
+                "measuredValue"
+            ],
+            1230,
+        )
+
+    def test_matter_devices_use_nowcast(self):
+        retval = PurpleAirMatterConverter.to_matter_devices(
+            SAMPLE_RAW_SENSOR, ["air_quality_sensor"], nowcast_pm25=80.0
+        )
+        self.assertEqual(
+            retval["air_quality_sensor"],
+            PurpleAirMatterConverter.to_air_quality_sensor(
+                SAMPLE_RAW_SENSOR, nowcast_pm25=80.0
+            ),
+        )
+
+    def test_single_sensor_without_nowcast_is_unknown(self):
+        for retval in [
+            PurpleAirMatterConverter.to_air_quality_sensor(
+                SAMPLE_RAW_SENSOR, nowcast_pm25=None
+            ),
+            PurpleAirMatterConverter.to_matter_devices(
+                SAMPLE_RAW_SENSOR, ["air_quality_sensor"], nowcast_pm25=None
+            )["air_quality_sensor"],
+        ]:
+            self.assertTrue(math.isnan(retval["air_quality_summary"]["epa_aqi"]))
+            self.assertEqual(retval["air_quality_summary"]["epa_category"], "Unknown")
+            self.assertEqual(
+                retval["clusters"]["air_quality_measurement"]["attributes"][
+                    "aqiRating"
+                ],
+                MatterAirQualityRating.UNKNOWN.value,
+            )
+
+        record = PurpleAirMatterConverter.to_air_quality_sensor(
+            SAMPLE_RAW_SENSOR, as_record=True, nowcast_pm25=None
+        )
+        self.assertEqual(record.summary.rating, MatterAirQualityRating.UNKNOWN)
+
+    def test_single_sensor_nowcast_fallback(self):
+        self.assertEqual(
+            PurpleAirMatterConverter.to_air_quality_sensor(
+                SAMPLE_RAW_SENSOR, nowcast_pm25=None, nowcast_fallback=True
+            ),
+            PurpleAirMatterConverter.to_air_quality_sensor(SAMPLE_RAW_SENSOR),
+        )
+
+    def test_batch_uses_nowcast_per_row(self):
+        nowcasts = [80.0, None, 2.0]
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE, nowcast_pm25=nowcasts
+        )
+        fields = SAMPLE_MULTIPLE_SENSORS_RESPONSE["fields"]
+        rows = SAMPLE_MULTIPLE_SENSORS_RESPONSE["data"]
+        for index in (0, 2):
+            self.assertEqual(
+                retval[index],
+                PurpleAirMatterConverter.to_air_quality_sensor(
+                    dict(zip(fields, rows[index])), nowcast_pm25=nowcasts[index]
+                ),
+            )
+
+        # Like AirNow, a row without a NowCast reports no AQI
+        self.assertTrue(math.isnan(retval[1]["air_quality_summary"]["epa_aqi"]))
+        self.assertEqual(retval[1]["air_quality_summary"]["epa_category"], "Unknown")
+        self.assertEqual(
+            retval[1]["air_quality_summary"]["matter_air_quality_rating"], "UNKNOWN"
+        )
+
+    def test_batch_nowcast_fallback(self):
+        retval = PurpleAirMatterConverter.to_air_quality_sensors(
+            SAMPLE_MULTIPLE_SENSORS_RESPONSE,
+            nowcast_pm25=[80.0, None, 2.0],
+            nowcast_fallback=True,
+        )
+        fields = SAMPLE_MULTIPLE_SENSORS_RESPONSE["fields"]
+        self.assertEqual(
+            retval[1],
+            PurpleAirMatterConverter.to_air_quality_sensor(
+                dict(zip(fields, SAMPLE_MULTIPLE_SENSORS_RESPONSE["data"][1]))
+            ),
+        )
+
+    def test_batch_nowcast_length_must_match_rows(self):
+        with self.assertRaises(ValueError):
+            PurpleAirMatterConverter.to_air_quality_sensors(
+                SAMPLE_MULTIPLE_SENSORS_RESPONSE, nowcast_pm25=[1.0]
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+Tests for the Matter attribute delta reporting module.
+"""
+
+import copy
+import sys
+import unittest
+
+# Make purpleair_api importable from the repo root.
+sys.path.append("../")
+
+
+from purpleair_api.PurpleAirMatterConverter import PurpleAirMatterConverter
+from purpleair_api.PurpleAirMatterDelta import PurpleAirMatterDeltaReporter
+
+SAMPLE_RAW_SENSOR = {
+    "sensor_index": 282168,
+    "name": "carlkidcrypto-purpleair3",
+    "pm2.5": 12.3,
+    "pm1.0": 5.7,
+    "pm10.0": 18.4,
+    "humidity": 45.6,
+    "temperature": 83.0,  # Fahrenheit
+    "pressure": 13.247,  # PSI
+}
+
+
+def make_endpoint(**changes):
+    """Convert SAMPLE_RAW_SENSOR with some fields changed."""
+    raw = dict(SAMPLE_RAW_SENSOR)
+    raw.update(changes)
+    return PurpleAirMatterConverter.to_air_quality_sensor(raw)
+
+
+class PurpleAirMatterDeltaReporterTest(unittest.TestCase):
+    """Tests for :class:`PurpleAirMatterDeltaReporter`."""
+
+    def setUp(self):
+        self.reporter = PurpleAirMatterDeltaReporter()
+
+    def test_first_endpoint_is_reported_in_full(self):
+        endpoint = make_endpoint()
+        changes = self.reporter.diff(endpoint)
+        self.assertEqual(
+            changes,
+            {
+                cluster_name: cluster["attributes"]
+                for cluster_name, cluster in endpoint["clusters"].items()
+            },
+        )
+        self.assertEqual(self.reporter.tracked_count, 1)
+
+    def test_unchanged_endpoint_reports_nothing(self):
+        self.reporter.diff(make_endpoint())
+        self.assertEqual(self.reporter.diff(make_endpoint()), {})
+
+    def test_change_below_threshold_is_not_reported(self):
+        self.reporter.diff(make_endpoint())
+        # 83.0 °F → 83.1 °F is about 0.06 °C, under the 0.1 °C default
+        self.assertEqual(self.reporter.diff(make_endpoint(temperature=83.1)), {})
+
+    def test_drift_is_reported_once_it_adds_up(self):
+        self.reporter.diff(make_endpoint())
+        self.reporter.diff(make_endpoint(temperature=83.1))
+        changes = self.reporter.diff(make_endpoint(temperature=83.2))
+        self.assertEqual(list(changes), ["temperature_measurement"])
+        self.assertEqual(
+            changes["temperature_measurement"],
+            {
+                "measuredValue": make_endpoint(temperature=83.2)["clusters"][
+                    "temperature_measurement"
+                ]["attributes"]["measuredValue"]
+            },
+        )
+
+    def test_enum_attributes_report_any_change(self):
+        self.reporter.diff(make_endpoint())
+        changes = self.reporter.diff(make_endpoint(**{"pm2.5": 80.0}))
+        self.assertIn("airQuality", changes["air_quality_measurement"])
+        self.assertIn("aqiRating", changes["air_quality_measurement"])
+        self.assertIn("measuredValue", changes["air_quality_measurement"])
+
+    def test_custom_thresholds(self):
+        reporter = PurpleAirMatterDeltaReporter(
+            {("temperature_measurement", "measuredValue"): 0}
+        )
+        reporter.diff(make_endpoint())
+        changes = reporter.diff(make_endpoint(temperature=83.1))
+        self.assertIn("temperature_measurement", changes)
+
+    def test_change_to_none_is_reported(self):
+        endpoint = make_endpoint()
+        self.reporter.diff(endpoint)
+        endpoint = copy.deepcopy(endpoint)
+        endpoint["clusters"]["humidity_measurement"]["attributes"][
+            "measuredValue"
+        ] = None
+        self.assertEqual(
+            self.reporter.diff(endpoint),
+            {"humidity_measurement": {"measuredValue": None}},
+        )
+
+    def test_sensors_are_tracked_apart(self):
+        self.reporter.diff(make_endpoint())
+        changes = self.reporter.diff(make_endpoint(sensor_index=1))
+        self.assertEqual(len(changes), 4)
+        self.assertEqual(self.reporter.tracked_count, 2)
+
+    def test_diff_many_skips_unchanged_sensors(self):
+        self.reporter.diff(make_endpoint())
+        retval = self.reporter.diff_many(
+            [make_endpoint(), make_endpoint(sensor_index=1)]
+        )
+        self.assertEqual(list(retval), [1])
+
+    def test_forget(self):
+        self.reporter.diff(make_endpoint())
+        self.reporter.diff(make_endpoint(sensor_index=1))
+
+        self.reporter.forget(282168)
+        self.assertEqual(self.reporter.tracked_count, 1)
+        self.assertEqual(len(self.reporter.diff(make_endpoint())), 4)
+
+        self.reporter.forget()
+        self.assertEqual(self.reporter.tracked_count, 0)
+
+    def test_temperature_sensors_are_tracked_apart(self):
+        self.reporter.diff(
+            PurpleAirMatterConverter.to_temperature_sensor(SAMPLE_RAW_SENSOR)
+        )
+        changes = self.reporter.diff(
+            PurpleAirMatterConverter.to_temperature_sensor(
+                dict(SAMPLE_RAW_SENSOR, sensor_index=1, temperature=90.0)
+            )
+        )
+        self.assertEqual(
+            set(changes["temperature_measurement"]),
+            {"measuredValue", "minMeasuredValue", "maxMeasuredValue"},
+        )
+
+    def test_device_types_are_tracked_apart(self):
+        devices = PurpleAirMatterConverter.to_matter_devices(SAMPLE_RAW_SENSOR)
+        for endpoint in devices.values():
+            self.assertIn("temperature_measurement", self.reporter.diff(endpoint))
+        self.assertEqual(self.reporter.tracked_count, 1)
+
+    def test_missing_sensor_index_raises(self):
+        raw = dict(SAMPLE_RAW_SENSOR)
+        del raw["sensor_index"]
+        endpoint = PurpleAirMatterConverter.to_environmental_sensor(raw)
+        with self.assertRaises(ValueError):
+            self.reporter.diff(endpoint)
+        with self.assertRaises(ValueError):
+            self.reporter.diff({"clusters": {}})
+
+        self.assertEqual(len(self.reporter.diff(endpoint, key="porch")), 3)
+        self.assertEqual(self.reporter.diff(endpoint, key="porch"), {})
+
+    def test_records_are_accepted(self):
+        record = PurpleAirMatterConverter.to_air_quality_sensor(
+            SAMPLE_RAW_SENSOR, as_record=True
+        )
+        self.assertEqual(
+            self.reporter.diff(record),
+            {
+                cluster_name: cluster["attributes"]
+                for cluster_name, cluster in record.to_dict()["clusters"].items()
+            },
+        )
+        self.assertEqual(self.reporter.diff_many([record]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
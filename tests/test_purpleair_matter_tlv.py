@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+Tests for the Matter TLV encoder and decoder module.
+"""
+
+import sys
+import unittest
+
+# Make purpleair_api importable from the repo root.
+sys.path.append("../")
+
+
+from purpleair_api.PurpleAirMatterConverter import (
+    PurpleAirMatterConverter,
+    MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT,
+    MATTER_CLUSTER_TEMP_MEASUREMENT,
+    MATTER_CLUSTER_HUMIDITY_MEASUREMENT,
+    MATTER_CLUSTER_PRESSURE_MEASUREMENT,
+)
+from purpleair_api.PurpleAirMatterTLV import (
+    MATTER_ATTRIBUTE_IDS,
+    decode_tlv,
+    encode_air_quality_sensor_tlv,
+    encode_cluster_attributes,
+    encode_tlv,
+)
+
+SAMPLE_RAW_SENSOR = {
+    "sensor_index": 282168,
+    "name": "carlkidcrypto-purpleair3",
+    "pm2.5": 12.3,
+    "pm1.0": 5.7,
+    "pm10.0": 18.4,
+    "voc": 0.123,
+    "humidity": 45.6,
+    "temperature": 83.0,  # Fahrenheit
+    "pressure": 13.247,  # PSI
+}
+
+
+class MatterTLVEncodingTest(unittest.TestCase):
+    """Tests for :func:`encode_tlv` against the Matter TLV encoding examples."""
+
+    def test_spec_examples(self):
+        self.assertEqual(encode_tlv(False), bytes.fromhex("08"))
+        self.assertEqual(encode_tlv(True), bytes.fromhex("09"))
+        self.assertEqual(encode_tlv(42), bytes.fromhex("042a"))
+        self.assertEqual(encode_tlv(-17), bytes.fromhex("00ef"))
+        self.assertEqual(encode_tlv(42, signed=True), bytes.fromhex("002a"))
+        self.assertEqual(encode_tlv(-170000), bytes.fromhex("02f067fdff"))
+        self.assertEqual(encode_tlv(40000000000), bytes.fromhex("0700902f5009000000"))
+        self.assertEqual(encode_tlv("Hello!"), bytes.fromhex("0c0648656c6c6f21"))
+        self.assertEqual(encode_tlv(b""), bytes.fromhex("1000"))
+        self.assertEqual(encode_tlv(None), bytes.fromhex("14"))
+        self.assertEqual(encode_tlv({}), bytes.fromhex("1518"))
+        self.assertEqual(encode_tlv([]), bytes.fromhex("1618"))
+        self.assertEqual(encode_tlv({1: 42}), bytes.fromhex("1524012a18"))
+
+    def test_round_trip(self):
+        value = {
+            0: [1, -2, 3.5, "é", b"\x00\x01", None, False],
+            1: {2: 2**40, 3: -(2**63)},
+            255: 2**64 - 1,
+        }
+        self.assertEqual(decode_tlv(encode_tlv(value)), value)
+
+    def test_encode_errors(self):
+        with self.assertRaises(ValueError):
+            encode_tlv(2**64)
+        with self.assertRaises(ValueError):
+            encode_tlv(-1, signed=False)
+        with self.assertRaises(ValueError):
+            encode_tlv({256: 1})
+        with self.assertRaises(ValueError):
+            encode_tlv(object())
+
+    def test_decode_errors(self):
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("05ff"))  # truncated uint16
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("0c05414243"))  # truncated string
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("042a2a"))  # trailing byte
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("15"))  # unterminated structure
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("1f"))  # unknown element type
+        with self.assertRaises(ValueError):
+            decode_tlv(bytes.fromhex("44000000002a"))  # common profile tag
+
+    def test_decode_float32_and_list(self):
+        self.assertEqual(decode_tlv(bytes.fromhex("0a0000c03f")), 1.5)
+        self.assertEqual(
+            decode_tlv(bytes.fromhex("1724012a041818")), [(1, 42), (None, 24)]
+        )
+
+
+class MatterTLVAttributeTest(unittest.TestCase):
+    """Tests for the cluster attribute encoders."""
+
+    def test_cluster_attributes_use_attribute_ids_and_types(self):
+        encoded = encode_cluster_attributes(
+            MATTER_CLUSTER_TEMP_MEASUREMENT,
+            {"measuredValue": 2833, "minMeasuredValue": None},
+        )
+        # Structure, int16 measuredValue (tag 0), null minMeasuredValue (tag 1)
+        self.assertEqual(encoded, bytes.fromhex("152100110b3401" + "18"))
+
+    def test_value_outside_its_type_raises(self):
+        with self.assertRaisesRegex(ValueError, "uint16 \\(0 to 65535\\); got 70000"):
+            encode_cluster_attributes(
+                MATTER_CLUSTER_HUMIDITY_MEASUREMENT, {"measuredValue": 70000}
+            )
+        with self.assertRaisesRegex(ValueError, "'pm1Density' .* uint32"):
+            encode_cluster_attributes(
+                MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT, {"pm1Density": -100}
+            )
+        with self.assertRaises(ValueError):
+            encode_cluster_attributes(
+                MATTER_CLUSTER_TEMP_MEASUREMENT, {"measuredValue": 28.5}
+            )
+
+    def test_negative_density_reading_raises(self):
+        with self.assertRaisesRegex(ValueError, "'pm1Density' .* got -100"):
+            encode_air_quality_sensor_tlv(dict(SAMPLE_RAW_SENSOR, **{"pm1.0": -1}))
+
+    def test_unknown_cluster_or_attribute_raises(self):
+        with self.assertRaises(ValueError):
+            encode_cluster_attributes(0x9999, {"measuredValue": 1})
+        with self.assertRaises(ValueError):
+            encode_cluster_attributes(
+                MATTER_CLUSTER_TEMP_MEASUREMENT, {"pm1Density": 1}
+            )
+
+    def test_air_quality_sensor_matches_converter(self):
+        endpoint = PurpleAirMatterConverter.to_air_quality_sensor(SAMPLE_RAW_SENSOR)
+        encoded = encode_air_quality_sensor_tlv(SAMPLE_RAW_SENSOR)
+
+        for cluster_name, cluster_id in [
+            ("air_quality_measurement", MATTER_CLUSTER_AIR_QUALITY_MEASUREMENT),
+            ("temperature_measurement", MATTER_CLUSTER_TEMP_MEASUREMENT),
+            ("humidity_measurement", MATTER_CLUSTER_HUMIDITY_MEASUREMENT),
+            ("pressure_measurement", MATTER_CLUSTER_PRESSURE_MEASUREMENT),
+        ]:
+            attribute_ids = MATTER_ATTRIBUTE_IDS[cluster_id]
+            expected = {
+                attribute_ids[attribute_name][0]: value
+                for attribute_name, value in endpoint["clusters"][cluster_name][
+                    "attributes"
+                ].items()
+            }
+            self.assertEqual(decode_tlv(encoded[cluster_id]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+Tests for the incremental EPA NowCast module.
+"""
+
+import math
+import sys
+import unittest
+
+# Make purpleair_api importable from the repo root.
+sys.path.append("../")
+
+
+from purpleair_api.PurpleAirMatterConverter import EpaAqiCalculator
+from purpleair_api.PurpleAirNowCast import (
+    NOWCAST_HOURS,
+    PurpleAirNowCast,
+    _NowCastHistory,
+    nowcast_pm25,
+)
+
+NAN = float("nan")
+
+# The start of an hour, in seconds since the epoch
+HOUR_0 = 1_700_000_000 // 3600 * 3600
+
+
+def at_hour(hour, minute=0):
+    """Return the timestamp of a minute past an hour after HOUR_0."""
+    return HOUR_0 + hour * 3600 + minute * 60
+
+
+class NowCastPm25Test(unittest.TestCase):
+    """Tests for :func:`nowcast_pm25`."""
+
+    def test_steady_concentration(self):
+        self.assertEqual(nowcast_pm25([10.0] * NOWCAST_HOURS), 10.0)
+
+    def test_weight_factor_from_range(self):
+        # w = 8 / 10 = 0.8: (10 + 0.8 * 8 + 0.64 * 9) / (1 + 0.8 + 0.64) = 9.08
+        self.assertEqual(nowcast_pm25([10.0, 8.0, 9.0]), 9.0)
+
+    def test_weight_factor_is_at_least_one_half(self):
+        # w = max(10 / 100, 0.5): (100 + 0.5 * 10) / 1.5 = 70
+        self.assertEqual(nowcast_pm25([100.0, 10.0]), 70.0)
+
+    def test_result_is_truncated(self):
+        # (40 + 0.5 * 20) / 1.5 = 33.33
+        self.assertEqual(nowcast_pm25([40.0, 20.0]), 33.3)
+        self.assertEqual(nowcast_pm25([12.39, 12.39]), 12.3)
+
+    def test_missing_hours_are_left_out(self):
+        self.assertEqual(nowcast_pm25([10.0, None, 10.0, NAN, 10.0]), 10.0)
+        self.assertEqual(nowcast_pm25([0.0, 0.0, 0.0]), 0.0)
+
+    def test_needs_two_of_the_three_most_recent_hours(self):
+        self.assertIsNone(nowcast_pm25([10.0, NAN, NAN, 10.0, 10.0]))
+        self.assertIsNone(nowcast_pm25([None, None, 10.0]))
+        self.assertIsNone(nowcast_pm25([]))
+
+
+class PurpleAirNowCastTest(unittest.TestCase):
+    """Tests for :class:`PurpleAirNowCast`."""
+
+    def setUp(self):
+        self.nowcast = PurpleAirNowCast()
+
+    def test_hourly_averages_of_completed_hours(self):
+        self.nowcast.update(1, 10.0, at_hour(0, 5))
+        self.nowcast.update(1, 20.0, at_hour(0, 45))
+        self.nowcast.update(1, 30.0, at_hour(1))
+        # Hour 1 is still being collected
+        self.assertIsNone(self.nowcast.nowcast(1))
+        averages = self.nowcast.hourly_averages(1)
+        self.assertEqual(averages[0], 15.0)
+        self.assertTrue(math.isnan(averages[1]))
+
+        self.nowcast.update(1, 5.0, at_hour(2))
+        self.assertEqual(self.nowcast.hourly_averages(1)[:2], [30.0, 15.0])
+        # (30 + 0.5 * 15) / 1.5
+        self.assertEqual(self.nowcast.nowcast(1), 25.0)
+
+    def test_timestamp_completes_the_current_hour(self):
+        for hour, pm25 in enumerate([15.0, 30.0, 5.0]):
+            self.nowcast.update(1, pm25, at_hour(hour))
+        # (5 + 0.5 * 30 + 0.25 * 15) / 1.75 = 13.57
+        self.assertEqual(self.nowcast.nowcast(1, at_hour(3)), 13.5)
+        # Two hours later only one of the three most recent hours has readings
+        self.assertIsNone(self.nowcast.nowcast(1, at_hour(5)))
+
+    def test_ring_buffer_keeps_the_last_twelve_hours(self):
+        for hour in range(30):
+            self.nowcast.update(1, float(hour), at_hour(hour))
+        self.assertEqual(
+            self.nowcast.hourly_averages(1), [float(hour) for hour in range(28, 16, -1)]
+        )
+
+    def test_skipped_hours_are_missing(self):
+        for hour in range(12):
+            self.nowcast.update(1, 10.0, at_hour(hour))
+        self.nowcast.update(1, 10.0, at_hour(14))
+        averages = self.nowcast.hourly_averages(1)
+        self.assertTrue(math.isnan(averages[0]) and math.isnan(averages[1]))
+        self.assertEqual(averages[2], 10.0)
+
+        # A gap longer than the ring buffer leaves no history
+        self.nowcast.update(1, 10.0, at_hour(40))
+        self.assertTrue(
+            all(math.isnan(value) for value in self.nowcast.hourly_averages(1))
+        )
+
+    def test_rejected_readings(self):
+        self.assertTrue(self.nowcast.update(1, 10.0, at_hour(5)))
+        self.assertFalse(self.nowcast.update(1, 10.0, at_hour(4)))
+        self.assertFalse(self.nowcast.update(1, None, at_hour(5)))
+        self.assertFalse(self.nowcast.update(1, "bad", at_hour(5)))
+        self.assertFalse(self.nowcast.update(1, -1.0, at_hour(5)))
+        self.assertFalse(self.nowcast.update(2, NAN, at_hour(5)))
+        self.assertEqual(self.nowcast.tracked_count, 1)
+
+    def test_unknown_sensor(self):
+        self.assertIsNone(self.nowcast.nowcast(404))
+        self.assertIsNone(self.nowcast.aqi(404))
+        self.assertEqual(len(self.nowcast.hourly_averages(404)), NOWCAST_HOURS)
+
+    def test_aqi_of_the_nowcast(self):
+        for hour, pm25 in enumerate([40.0, 40.0, 20.0, 0.0]):
+            self.nowcast.update(1, pm25, at_hour(hour))
+        self.assertEqual(
+            self.nowcast.aqi(1),
+            EpaAqiCalculator.pm25_to_aqi(self.nowcast.nowcast(1)),
+        )
+
+    def test_update_many(self):
+        response = {
+            "time_stamp": at_hour(0, 30),
+            "fields": ["sensor_index", "last_seen", "pm2.5"],
+            "data": [[1, at_hour(0), 10.0], [2, None, 20.0], [3, at_hour(0), None]],
+        }
+        self.assertEqual(self.nowcast.update_many(response), 2)
+
+        response["data"] = [[1, at_hour(1), 10.0], [2, at_hour(1), 20.0]]
+        self.nowcast.update_many(response)
+        response["data"] = [[1, at_hour(2), 10.0], [2, at_hour(2), 20.0]]
+        self.nowcast.update_many(response)
+        self.assertEqual(self.nowcast.nowcast_many([1, 2, 3]), [10.0, 20.0, None])
+
+    def test_update_many_without_needed_fields(self):
+        self.assertEqual(self.nowcast.update_many({"fields": ["pm2.5"]}), 0)
+        self.assertEqual(self.nowcast.update_many(None), 0)
+
+    def test_forget(self):
+        self.nowcast.update(1, 10.0, at_hour(0))
+        self.nowcast.update(2, 10.0, at_hour(0))
+        self.nowcast.forget(1)
+        self.assertEqual(self.nowcast.tracked_count, 1)
+        self.nowcast.forget()
+        self.assertEqual(self.nowcast.tracked_count, 0)
+
+    def test_history_is_slotted(self):
+        self.assertFalse(hasattr(_NowCastHistory(0), "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from threading import Thread
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIConstants import ACCEPTED_FIELD_NAMES_DICT
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirRateLimiter import PurpleAirRateLimiter
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+
+
+class FakeClock:
+    """
+    A stand in for time.monotonic and time.sleep. Sleeping moves the clock forward.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now = self.now + seconds
+
+
+class PurpleAirRateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.patchers = [
+            patch("purpleair_api.PurpleAirRateLimiter.monotonic", self.clock.monotonic),
+            patch("purpleair_api.PurpleAirRateLimiter.sleep", self.clock.sleep),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_estimate_points(self):
+        """
+        Test that the cost model counts the call, the fields and the rows.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(10, points_per_call=2, points_per_field=3)
+
+        # Action and Expected Result
+        self.assertEqual(limiter.estimate_points("name, pm2.5", row_count=4), 26)
+        self.assertEqual(limiter.estimate_points(["name"], row_count=0), 5)
+        self.assertEqual(limiter.estimate_points([]), 2)
+        self.assertEqual(
+            limiter.estimate_points(), 2 + 3 * len(ACCEPTED_FIELD_NAMES_DICT)
+        )
+
+    def test_acquire_block_waits_for_refill(self):
+        """
+        Test that block mode waits until the bucket has refilled enough points.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(points_per_second=2, burst_points=4)
+
+        # Action
+        first_wait = limiter.acquire(4)
+        second_wait = limiter.acquire(3)
+
+        # Expected Result
+        self.assertEqual(first_wait, 0.0)
+        self.assertEqual(second_wait, 1.5)
+        self.assertEqual(self.clock.sleeps, [1.5])
+        self.assertEqual(limiter.spent_points, 7)
+
+    def test_acquire_nonblock_raises(self):
+        """
+        Test that nonblock mode raises `PurpleAirAPIError` instead of waiting.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1, burst_points=3, mode="nonblock")
+        limiter.acquire(3)
+
+        # Action and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            limiter.acquire(1)
+
+        self.assertEqual(limiter.spent_points, 3)
+        self.clock.now = 1.0
+        limiter.acquire(1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_acquire_nonblock_over_burst_raises_right_away(self):
+        """
+        Test that a nonblock request costing more than the burst raises without spending points.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1, burst_points=3, mode="nonblock")
+
+        # Action and Expected Result
+        with self.assertRaisesRegex(PurpleAirAPIError, "never"):
+            limiter.acquire(4)
+
+        self.assertEqual(limiter.spent_points, 0)
+        self.assertEqual(limiter.available_points, 3)
+
+        # Blocking requests still go into debt and wait
+        self.assertEqual(limiter.acquire(4, mode="block"), 1.0)
+
+    def test_estimate_points_per_endpoint_and_field(self):
+        """
+        Test that dictionaries of costs are used per endpoint and per field, with defaults.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(
+            10,
+            points_per_call={"sensors": 5},
+            points_per_field={"pm2.5": 2, "name": 0},
+        )
+
+        # Action and Expected Result
+        self.assertEqual(
+            limiter.estimate_points(
+                "name, pm2.5", row_count=3, endpoint_name="sensors"
+            ),
+            5 + (0 + 2) * 3,
+        )
+        self.assertEqual(
+            limiter.estimate_points(["pm2.5", "humidity"], endpoint_name="sensor"),
+            1 + 2 + 1,
+        )
+        self.assertEqual(
+            limiter.estimate_points(),
+            1 + (len(ACCEPTED_FIELD_NAMES_DICT) - 2) + 2 + 0,
+        )
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRateLimiter(10, points_per_call={"sensorz": 5})
+
+    def test_acquire_estimate_only(self):
+        """
+        Test that estimate mode only adds up the points.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1, mode="estimate")
+
+        # Action
+        for _ in range(5):
+            limiter.acquire(100)
+        limiter.charge(50)
+
+        # Expected Result
+        self.assertEqual(limiter.spent_points, 550)
+        self.assertEqual(limiter.available_points, 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_charge_puts_bucket_in_debt(self):
+        """
+        Test that charging extra points delays the next request.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(points_per_second=10, burst_points=10)
+
+        # Action
+        limiter.charge(30)
+        available_points = limiter.available_points
+        wait_seconds = limiter.acquire(10)
+
+        # Expected Result
+        self.assertEqual(available_points, -20)
+        self.assertEqual(wait_seconds, 3.0)
+
+    def test_invalid_parameters(self):
+        """
+        Test that invalid rates and modes raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRateLimiter(0)
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRateLimiter(1, burst_points=-1)
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRateLimiter(1, mode="later")
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRateLimiter(1).acquire(1, mode="later")
+
+    def test_acquire_is_thread_safe(self):
+        """
+        Test that points taken from many threads at once are all accounted for.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1, burst_points=1000000, mode="nonblock")
+
+        def take_points():
+            for _ in range(1000):
+                limiter.acquire(1)
+
+        threads = [Thread(target=take_points) for _ in range(8)]
+
+        # Action
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Expected Result
+        self.assertEqual(limiter.spent_points, 8000)
+        self.assertEqual(limiter.available_points, 1000000 - 8000)
+
+    def test_read_api_charges_per_endpoint(self):
+        """
+        Test that read requests are charged the cost of their endpoint.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(
+            1000, mode="estimate", points_per_call={"organization": 0, "sensor": 3}
+        )
+        para = PurpleAirReadAPI("123456789", rate_limiter=limiter)
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get("https://api.purpleair.com/v1/organization", json={}, status_code=200)
+            m.get(
+                "https://api.purpleair.com/v1/sensors/1234?fields=name",
+                json={"sensor": {"name": "a"}},
+                status_code=200,
+            )
+            para.request_organization_data()
+            para.request_sensor_data(1234, fields="name")
+
+        # Expected Result
+        self.assertEqual(limiter.spent_points, 0 + (3 + 1))
+
+    def test_read_api_charges_the_rate_limiter(self):
+        """
+        Test that read requests take their estimate and are charged for extra rows.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1000, mode="estimate")
+        para = PurpleAirReadAPI("123456789", rate_limiter=limiter)
+        fake_url_request = "https://api.purpleair.com/v1/sensors/?fields=name,pm2.5"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                fake_url_request,
+                json={
+                    "fields": ["sensor_index", "name", "pm2.5"],
+                    "data": [[1, "a", 2.5], [2, "b", 3.5]],
+                },
+                status_code=200,
+            )
+            m.get("https://api.purpleair.com/v1/organization", json={}, status_code=200)
+            para.request_multiple_sensors_data("name,pm2.5")
+            para.request_organization_data()
+
+        # Expected Result
+        self.assertEqual(limiter.spent_points, (1 + 3 * 2) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
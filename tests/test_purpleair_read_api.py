@@ -7,9 +7,13 @@ Copyright 2023 carlkidcrypto, All rights reserved.
 import unittest
 import requests_mock
 import sys
+from requests.exceptions import ReadTimeout
 
 sys.path.append("../")
 
+from purpleair_api.PurpleAirAPIConstants import DEFAULT_MAX_REQUEST_URL_LENGTH
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import create_session
 from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
 
 
@@ -482,6 +486,286 @@ class PurpleAirReadAPITest(unittest.TestCase):
             )
             self.assertEqual(result, {"test": 5})
 
+    def test_request_sensor_data_with_injected_session(self):
+        """
+        Test that requests go through an injected session and that close leaves it open.
+        """
+
+        # Setup
+        session = create_session()
+        adapter = requests_mock.Adapter()
+        session.mount("https://", adapter)
+        adapter.register_uri(
+            "GET", "https://api.purpleair.com/v1/sensors/1234", text='{"test": 5}'
+        )
+        para = PurpleAirReadAPI(123456789, session=session)
+
+        # Action
+        retval = para.request_sensor_data(1234)
+        para.close()
+
+        # Expected Result
+        self.assertEqual(retval, {"test": 5})
+        self.assertEqual(adapter.call_count, 1)
+        self.assertFalse(para._owns_session)
+
+    def test_close_owned_session(self):
+        """
+        Test that close closes the session the class created for itself.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI(123456789)
+        closed = []
+        para._session.close = lambda: closed.append(True)
+
+        # Action
+        para.close()
+
+        # Expected Result
+        self.assertTrue(para._owns_session)
+        self.assertEqual(closed, [True])
+
+    def test_request_sensor_historic_data_range(self):
+        """
+        Test that a long range is fetched in windows and merged into one sorted payload.
+        """
+
+        # Setup
+        day = 24 * 60 * 60
+        base_url = "https://api.purpleair.com/v1/sensors/1234/history?fields=pm2.5"
+        para = PurpleAirReadAPI(123456789)
+
+        def history_response(request, context):
+            start = int(request.qs["start_timestamp"][0])
+            return {
+                "sensor_index": 1234,
+                "fields": ["time_stamp", "pm2.5"],
+                "data": [[start + 60, 2.0], [start, 1.0]],
+            }
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(base_url, json=history_response, status_code=200)
+            retval = para.request_sensor_historic_data_range(
+                1234, "pm2.5", 0, 7 * day, average=10, max_workers=2
+            )
+
+        # Expected Result
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(
+            [row[0] for row in retval["data"]],
+            [0, 60, 3 * day, 3 * day + 60, 6 * day, 6 * day + 60],
+        )
+        self.assertEqual(retval["end_timestamp"], 7 * day)
+
+    def test_request_sensor_historic_data_range_errors(self):
+        """
+        Test that invalid parameters and a failed window raise `PurpleAirAPIError`.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI(123456789)
+        base_url = "https://api.purpleair.com/v1/sensors/1234/history?fields=pm2.5"
+
+        # Action and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            para.request_sensor_historic_data_range(1234, "pm2.5", 0, 10, max_workers=0)
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                base_url,
+                json={"error": "NotFoundError", "description": "Not found"},
+                status_code=404,
+            )
+            with self.assertRaises(PurpleAirAPIError):
+                para.request_sensor_historic_data_range(1234, "pm2.5", 0, 10)
+
+    def test_request_multiple_sensors_data_tiled(self):
+        """
+        Test that a large box is fetched in tiles, merged, and a tile that times out is split.
+        """
+
+        # Setup
+        base_url = "https://api.purpleair.com/v1/sensors/?fields=name"
+        para = PurpleAirReadAPI(123456789)
+        timed_out_tiles = []
+        requested_tiles = []
+
+        def sensors_response(request, context):
+            requested_tiles.append(request.qs)
+            nwlng = float(request.qs["nwlng"][0])
+            nwlat = float(request.qs["nwlat"][0])
+            selng = float(request.qs["selng"][0])
+            if nwlng == -10 and selng == 0 and not timed_out_tiles:
+                timed_out_tiles.append(nwlng)
+                raise ReadTimeout("tile too large")
+
+            # Every tile sees sensor 1 on the shared corner, plus one of its own
+            return {
+                "fields": ["sensor_index", "name"],
+                "data": [[1, "corner"], [int(1000 + nwlng * 10 + nwlat), "own"]],
+            }
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(base_url, json=sensors_response, status_code=200)
+            retval = para.request_multiple_sensors_data_tiled(
+                "name",
+                -10,
+                10,
+                10,
+                -10,
+                max_sensors_per_tile=100,
+                sensors_per_square_degree=1,
+                max_workers=1,
+            )
+
+        # Expected Result
+        self.assertEqual(len(requested_tiles), 4 + 4)
+        self.assertEqual(len(timed_out_tiles), 1)
+        self.assertEqual(len(retval["data"]), 1 + 3 + 4)
+        self.assertEqual(retval["data"][0], [1, "corner"])
+        self.assertEqual(
+            [row[0] for row in retval["data"]],
+            sorted(row[0] for row in retval["data"]),
+        )
+
+    def test_request_multiple_sensors_data_tiled_errors(self):
+        """
+        Test that invalid parameters raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            self.para.request_multiple_sensors_data_tiled("name", 10, 10, -10, -10)
+
+        with self.assertRaises(PurpleAirAPIError):
+            self.para.request_multiple_sensors_data_tiled(
+                "name", -10, 10, 10, -10, max_workers=0
+            )
+
+    def test_request_multiple_sensors_data_splits_long_show_only(self):
+        """
+        Test that a show_only list too long for one URL is fetched in batches and merged.
+        """
+
+        # Setup
+        base_url = "https://api.purpleair.com/v1/sensors/?fields=name"
+        para = PurpleAirReadAPI(123456789)
+        sensor_indexes = list(range(100000, 100600))
+        requested_urls = []
+
+        def sensors_response(request, context):
+            requested_urls.append(request.url)
+            batch_indexes = [
+                int(index) for index in request.qs["show_only"][0].split(",")
+            ]
+            # Answer in reverse field order to check the columns are put back in order
+            return {
+                "fields": ["name", "sensor_index"],
+                "data": [
+                    [f"sensor {index}", index] for index in reversed(batch_indexes)
+                ],
+            }
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(base_url, json=sensors_response, status_code=200)
+            retval = para.request_multiple_sensors_data(
+                "name", show_only=sensor_indexes, columnar=True
+            )
+
+        # Expected Result
+        self.assertGreater(len(requested_urls), 1)
+        self.assertTrue(
+            all(len(url) <= DEFAULT_MAX_REQUEST_URL_LENGTH for url in requested_urls)
+        )
+        self.assertEqual(retval.fields, ["name", "sensor_index"])
+        self.assertEqual(len(retval), 600)
+        self.assertEqual(list(retval.column("sensor_index")), sensor_indexes)
+
+    def test_show_only_batches_max_workers_errors(self):
+        """
+        Test that an invalid `max_workers` raises `PurpleAirAPIError` before any request is sent.
+        """
+
+        # Setup, Action, and Expected Result
+        with requests_mock.Mocker() as m:
+            for max_workers in (0, -1, 1.5, None):
+                with self.assertRaises(PurpleAirAPIError):
+                    self.para.request_multiple_sensors_data(
+                        "name", show_only=list(range(600)), max_workers=max_workers
+                    )
+
+                with self.assertRaises(PurpleAirAPIError):
+                    self.para.request_members_data(
+                        1, "name", show_only="123", max_workers=max_workers
+                    )
+
+        self.assertEqual(m.call_count, 0)
+
+    def test_request_members_data_splits_paired_read_keys(self):
+        """
+        Test that read keys paired with show_only are split with their sensors.
+        """
+
+        # Setup
+        base_url = "https://api.purpleair.com/v1/groups/1/members?fields=name"
+        para = PurpleAirReadAPI(123456789)
+        sensor_indexes = list(range(1000, 1300))
+        read_keys = [f"key{index}" for index in sensor_indexes]
+        requested_pairs = []
+
+        def members_response(request, context):
+            batch_indexes = request.qs["show_only"][0].split(",")
+            batch_read_keys = request.qs["read_keys"][0].split(",")
+            requested_pairs.append((batch_indexes, batch_read_keys))
+            return {
+                "fields": ["sensor_index", "name"],
+                "data": [[int(index), "member"] for index in batch_indexes],
+            }
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(base_url, json=members_response, status_code=200)
+            retval = para.request_members_data(
+                1, "name", read_keys=",".join(read_keys), show_only=sensor_indexes
+            )
+
+        # Expected Result
+        self.assertGreater(len(requested_pairs), 1)
+        for batch_indexes, batch_read_keys in requested_pairs:
+            self.assertEqual(
+                batch_read_keys, [f"key{index}" for index in batch_indexes]
+            )
+
+        self.assertEqual([row[0] for row in retval["data"]], sensor_indexes)
+
+    def test_stream_sensor_historic_data(self):
+        """
+        Test that CSV history is streamed from the CSV endpoint as typed rows.
+        """
+
+        # Setup
+        fake_url_request = "https://api.purpleair.com/v1/sensors/1234/history/csv?fields=pm2.5_atm&average=0"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                fake_url_request,
+                text="time_stamp,sensor_index,pm2.5_atm\n1704067200,1234,3.5\n1704067320,1234,4.0\n",
+                status_code=200,
+            )
+            retval = list(
+                self.para.stream_sensor_historic_data(1234, "pm2.5_atm", average=0)
+            )
+
+        # Expected Result
+        self.assertEqual(len(retval), 2)
+        self.assertEqual(retval[1]["time_stamp"], 1704067320)
+        self.assertEqual(retval[1]["pm2.5_atm"], 4.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+from purpleair_api.PurpleAirResponseCache import PurpleAirResponseCache
+from purpleair_api.PurpleAirWriteAPI import PurpleAirWriteAPI
+
+BASE_URL = "https://api.purpleair.com/v1/"
+
+
+class FakeClock:
+    """
+    A stand in for time.monotonic. Tests move the clock forward by hand.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class PurpleAirResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        monotonic_patcher = patch(
+            "purpleair_api.PurpleAirResponseCache.monotonic", self.clock.monotonic
+        )
+        monotonic_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+
+        self.cache = PurpleAirResponseCache()
+
+    def test_entries_expire_after_their_endpoint_ttl(self):
+        """
+        Test that each endpoint keeps its responses for its own TTL.
+        """
+
+        # Setup
+        cache = PurpleAirResponseCache(ttl_seconds_dict={"sensor": 10, "groups": 100})
+        cache.put("key", BASE_URL + "sensors/1", {"sensor": 1})
+        cache.put("key", BASE_URL + "groups/", {"groups": []})
+
+        # Action and Expected Result
+        self.clock.now = 9.0
+        self.assertEqual(cache.get("key", BASE_URL + "sensors/1"), {"sensor": 1})
+
+        self.clock.now = 10.0
+        self.assertIsNone(cache.get("key", BASE_URL + "sensors/1"))
+        self.assertEqual(cache.get("key", BASE_URL + "groups/"), {"groups": []})
+        self.assertEqual(cache.entry_count, 1)
+
+    def test_entries_are_keyed_on_the_api_key(self):
+        """
+        Test that a response cached for one key is not returned for another.
+        """
+
+        # Setup
+        self.cache.put("key_a", BASE_URL + "organization", {"organization_id": "a"})
+
+        # Action and Expected Result
+        self.assertIsNone(self.cache.get("key_b", BASE_URL + "organization"))
+
+    def test_disabled_endpoint_is_not_cached(self):
+        """
+        Test that a TTL of 0 turns caching off for an endpoint, and unknown names raise.
+        """
+
+        # Setup
+        cache = PurpleAirResponseCache(ttl_seconds_dict={"sensor": 0})
+
+        # Action
+        cache.put("key", BASE_URL + "sensors/1", {"sensor": 1})
+
+        # Expected Result
+        self.assertIsNone(cache.get("key", BASE_URL + "sensors/1"))
+        self.assertEqual(cache.entry_count, 0)
+        self.assertEqual(cache.misses, 0)
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirResponseCache(ttl_seconds_dict={"sensorz": 10})
+
+    def test_lru_eviction_by_entry_count(self):
+        """
+        Test that the least recently used entry is evicted once `max_entries` is passed.
+        """
+
+        # Setup
+        cache = PurpleAirResponseCache(max_entries=2)
+        cache.put("key", BASE_URL + "sensors/1", {"sensor": 1})
+        cache.put("key", BASE_URL + "sensors/2", {"sensor": 2})
+        cache.get("key", BASE_URL + "sensors/1")
+
+        # Action
+        cache.put("key", BASE_URL + "sensors/3", {"sensor": 3})
+
+        # Expected Result
+        self.assertIsNone(cache.get("key", BASE_URL + "sensors/2"))
+        self.assertIsNotNone(cache.get("key", BASE_URL + "sensors/1"))
+        self.assertIsNotNone(cache.get("key", BASE_URL + "sensors/3"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_lru_eviction_by_bytes(self):
+        """
+        Test that entries are evicted to stay within `max_bytes`, and oversized ones are skipped.
+        """
+
+        # Setup
+        small_payload = {"data": list(range(10))}
+        cache = PurpleAirResponseCache(max_bytes=128)
+
+        # Action
+        for sensor_index in range(10):
+            cache.put("key", BASE_URL + f"sensors/{sensor_index}", small_payload)
+        cache.put("key", BASE_URL + "sensors/99", {"data": list(range(10000))})
+
+        # Expected Result
+        self.assertLessEqual(cache.byte_count, 128)
+        self.assertLess(cache.entry_count, 10)
+        self.assertGreater(cache.evictions, 0)
+        self.assertIsNone(cache.get("key", BASE_URL + "sensors/99"))
+        self.assertIsNotNone(cache.get("key", BASE_URL + "sensors/9"))
+
+    def test_byte_count_is_the_body_length(self):
+        """
+        Test that entries are measured by the byte length of the response body.
+        """
+
+        # Setup
+        body = b'{"sensor": {"sensor_index": 1}}'
+
+        # Action
+        self.cache.put(
+            "key", BASE_URL + "sensors/1", {"sensor": {"sensor_index": 1}}, body
+        )
+        self.cache.put("key", BASE_URL + "sensors/2", {"sensor": 2})
+
+        # Expected Result
+        self.assertEqual(self.cache.byte_count, len(body) + len(b'{"sensor":2}'))
+
+    def test_get_returns_a_copy(self):
+        """
+        Test that changing a returned response does not change what later callers get.
+        """
+
+        # Setup
+        payload = {"sensor": {"sensor_index": 1, "name": "a"}}
+        self.cache.put("key", BASE_URL + "sensors/1", payload)
+        payload["sensor"]["name"] = "b"
+
+        # Action
+        first = self.cache.get("key", BASE_URL + "sensors/1")
+        first["sensor"]["name"] = "c"
+        second = self.cache.get("key", BASE_URL + "sensors/1")
+
+        # Expected Result
+        self.assertEqual(second, {"sensor": {"sensor_index": 1, "name": "a"}})
+
+    def test_invalidate_group(self):
+        """
+        Test that invalidating a group drops its entries and the group list only.
+        """
+
+        # Setup
+        for request_url in [
+            "groups/",
+            "groups/1",
+            "groups/1/members?fields=name",
+            "groups/1/members/5",
+            "groups/2",
+            "sensors/1",
+        ]:
+            self.cache.put("key", BASE_URL + request_url, {"test": request_url})
+
+        # Action
+        self.cache.invalidate_group(1)
+
+        # Expected Result
+        self.assertEqual(self.cache.entry_count, 2)
+        self.assertIsNotNone(self.cache.get("key", BASE_URL + "groups/2"))
+        self.assertIsNotNone(self.cache.get("key", BASE_URL + "sensors/1"))
+
+    def test_hit_and_miss_counters(self):
+        """
+        Test that hits and misses are counted in total and for each endpoint.
+        """
+
+        # Setup
+        self.cache.get("key", BASE_URL + "sensors/1")
+        self.cache.put("key", BASE_URL + "sensors/1", {"sensor": 1})
+
+        # Action
+        self.cache.get("key", BASE_URL + "sensors/1")
+        self.cache.get("key", BASE_URL + "sensors/1")
+        self.cache.get("key", BASE_URL + "organization")
+
+        # Expected Result
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.endpoint_stats["sensor"], {"hits": 2, "misses": 1})
+        self.assertEqual(
+            self.cache.endpoint_stats["organization"], {"hits": 0, "misses": 1}
+        )
+
+    def test_read_api_uses_the_cache(self):
+        """
+        Test that a repeated read is answered from the cache until its TTL passes.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", response_cache=self.cache)
+        fake_url_request = BASE_URL + "sensors/1234"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(fake_url_request, text='{"test": 5}', status_code=200)
+            first = para.request_sensor_data(1234)
+            second = para.request_sensor_data(1234)
+            self.clock.now = 121.0
+            third = para.request_sensor_data(1234)
+
+        # Expected Result
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(first, {"test": 5})
+        self.assertEqual(second, {"test": 5})
+        self.assertIsNot(first, second)
+        self.assertEqual(third, {"test": 5})
+
+    def test_write_api_invalidates_group_entries(self):
+        """
+        Test that adding or deleting a member drops the cached group entries.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", response_cache=self.cache)
+        pawa = PurpleAirWriteAPI("987654321", response_cache=self.cache)
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(BASE_URL + "groups/1", text='{"members": []}', status_code=200)
+            m.post(BASE_URL + "groups/1/members", text='{"id": 5}', status_code=201)
+            m.delete(BASE_URL + "groups/1/members/5", text="", status_code=204)
+
+            para.request_group_detail_data(1)
+            para.request_group_detail_data(1)
+            self.assertEqual(m.call_count, 1)
+
+            pawa.post_create_member(1, sensor_index=1234)
+            para.request_group_detail_data(1)
+            self.assertEqual(m.call_count, 3)
+
+            pawa.post_delete_member(1, 5)
+            para.request_group_detail_data(1)
+            self.assertEqual(m.call_count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirAPIHelpers import (
+    send_url_get_request,
+    send_url_post_request,
+)
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+from purpleair_api.PurpleAirRetryPolicy import PurpleAirRetryPolicy
+from requests.exceptions import ConnectionError, ConnectTimeout
+
+FAKE_URL = "https://api.purpleair.com/v1/groups"
+ERROR_TEXT = '{"error": "ServiceUnavailable", "description": "Try again"}'
+
+
+class PurpleAirRetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        sleep_patcher = patch(
+            "purpleair_api.PurpleAirRetryPolicy.sleep", self.sleeps.append
+        )
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+        self.retries = []
+        self.retry_policy = PurpleAirRetryPolicy(
+            max_attempts=3, backoff_base=1.0, jitter=0, metrics_hook=self.retries.append
+        )
+
+    def test_backoff_delay(self):
+        """
+        Test that the delay doubles each attempt, is capped, and is jittered below the backoff.
+        """
+
+        # Setup
+        jittered_policy = PurpleAirRetryPolicy(backoff_base=1.0, jitter=1.0)
+
+        # Action and Expected Result
+        self.assertEqual(self.retry_policy.backoff_delay(1), 1.0)
+        self.assertEqual(self.retry_policy.backoff_delay(3), 4.0)
+        self.assertEqual(self.retry_policy.backoff_delay(20), 30.0)
+        for _ in range(20):
+            self.assertLessEqual(jittered_policy.backoff_delay(2), 2.0)
+
+    def test_retry_after_delay(self):
+        """
+        Test that Retry-After is read as seconds or an HTTP date and capped.
+        """
+
+        # Setup
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        # Action and Expected Result
+        self.assertEqual(self.retry_policy.retry_after_delay("7"), 7.0)
+        self.assertEqual(self.retry_policy.retry_after_delay("100000"), 120.0)
+        self.assertAlmostEqual(
+            self.retry_policy.retry_after_delay(format_datetime(retry_at, usegmt=True)),
+            30.0,
+            delta=2.0,
+        )
+        self.assertIsNone(self.retry_policy.retry_after_delay(None))
+        self.assertIsNone(self.retry_policy.retry_after_delay("soon"))
+
+    def test_invalid_parameters(self):
+        """
+        Test that invalid attempt counts and jitter raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRetryPolicy(max_attempts=0)
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirRetryPolicy(jitter=2)
+
+    def test_get_retries_status_code_and_honors_retry_after(self):
+        """
+        Test that a GET is retried on 503, waits for Retry-After, and reports the retry.
+        """
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                FAKE_URL,
+                [
+                    {
+                        "text": ERROR_TEXT,
+                        "status_code": 503,
+                        "headers": {"Retry-After": "2"},
+                    },
+                    {"text": '{"test": 5}', "status_code": 200},
+                ],
+            )
+            retval = send_url_get_request(
+                FAKE_URL, "111", retry_policy=self.retry_policy
+            )
+
+        # Expected Result
+        self.assertEqual(retval, {"test": 5})
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(self.sleeps, [2.0])
+        self.assertEqual(self.retries[0]["status_code"], 503)
+        self.assertEqual(self.retries[0]["attempt"], 1)
+        self.assertEqual(self.retries[0]["method"], "GET")
+
+    def test_get_retries_connection_errors_then_gives_up(self):
+        """
+        Test that connection errors are retried with backoff and raised once attempts run out.
+        """
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, exc=ConnectionError("connection reset"))
+            with self.assertRaises(ConnectionError):
+                send_url_get_request(FAKE_URL, retry_policy=self.retry_policy)
+
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+        self.assertIsInstance(self.retries[1]["exception"], ConnectionError)
+
+    def test_get_gives_up_on_error_status(self):
+        """
+        Test that the last error response is raised as `PurpleAirAPIError`.
+        """
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.get(FAKE_URL, text=ERROR_TEXT, status_code=503)
+            with self.assertRaises(PurpleAirAPIError):
+                send_url_get_request(FAKE_URL, retry_policy=self.retry_policy)
+
+        self.assertEqual(m.call_count, 3)
+
+    def test_post_is_only_retried_when_safe(self):
+        """
+        Test that a POST is retried on 429 and connect timeouts, but not on 503 or a reset.
+        """
+
+        # Action and Expected Result
+        with requests_mock.Mocker() as m:
+            m.post(FAKE_URL, text=ERROR_TEXT, status_code=503)
+            with self.assertRaises(PurpleAirAPIError):
+                send_url_post_request(FAKE_URL, "111", retry_policy=self.retry_policy)
+            self.assertEqual(m.call_count, 1)
+
+            m.post(FAKE_URL, exc=ConnectionError("connection reset"))
+            with self.assertRaises(ConnectionError):
+                send_url_post_request(FAKE_URL, "111", retry_policy=self.retry_policy)
+            self.assertEqual(m.call_count, 2)
+
+            m.post(
+                FAKE_URL,
+                [
+                    {"exc": ConnectTimeout("connect timeout")},
+                    {"text": ERROR_TEXT, "status_code": 429},
+                    {"text": '{"group_id": 1}', "status_code": 201},
+                ],
+            )
+            retval = send_url_post_request(
+                FAKE_URL, "111", {"name": "x"}, retry_policy=self.retry_policy
+            )
+
+        self.assertEqual(retval, {"group_id": 1})
+        self.assertEqual(m.call_count, 5)
+        self.assertEqual(len(self.retries), 2)
+
+    def test_read_api_uses_retry_policy(self):
+        """
+        Test that a client passes its retry policy to every request.
+        """
+
+        # Setup
+        para = PurpleAirReadAPI("123456789", retry_policy=self.retry_policy)
+        fake_url_request = "https://api.purpleair.com/v1/organization"
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(
+                fake_url_request,
+                [
+                    {"text": ERROR_TEXT, "status_code": 502},
+                    {"text": '{"test": 5}', "status_code": 200},
+                ],
+            )
+            retval = para.request_organization_data()
+
+        # Expected Result
+        self.assertEqual(retval, {"test": 5})
+        self.assertEqual(len(self.retries), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
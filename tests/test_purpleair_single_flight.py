@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirDeadline import PurpleAirDeadline
+from purpleair_api.PurpleAirRateLimiter import PurpleAirRateLimiter
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+from purpleair_api.PurpleAirSingleFlight import PurpleAirSingleFlight
+
+
+class PurpleAirSingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.single_flight = PurpleAirSingleFlight()
+        self.release = Event()
+        self.calls = []
+
+    def blocking_send_request(self, result):
+        """
+        Build a request that records the call and waits until the test releases it.
+        """
+
+        def send_request():
+            self.calls.append(result)
+            self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+
+            return result
+
+        return send_request
+
+    def wait_for_shared_calls(self, shared_count):
+        """
+        Wait until `shared_count` callers are waiting on the in flight request.
+        """
+
+        for _ in range(500):
+            if self.single_flight.shared_count >= shared_count:
+                return
+
+            Event().wait(0.01)
+
+        self.fail(f"{shared_count} shared call(s) never arrived")
+
+    def test_identical_calls_share_one_request(self):
+        """
+        Test that concurrent calls with the same key send one request and get the same result.
+        """
+
+        # Setup
+        result = {"sensor": {"sensor_index": 1}}
+
+        # Action
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(
+                    self.single_flight.do,
+                    ("key", "url"),
+                    self.blocking_send_request(result),
+                )
+                for _ in range(5)
+            ]
+            self.wait_for_shared_calls(4)
+            self.release.set()
+            retvals = [future.result() for future in futures]
+
+        # Expected Result
+        self.assertEqual(len(self.calls), 1)
+        for retval in retvals:
+            self.assertIs(retval, result)
+        self.assertEqual(self.single_flight.in_flight_count, 0)
+
+    def test_different_keys_are_not_shared(self):
+        """
+        Test that calls with different keys each send their own request.
+        """
+
+        # Setup
+        self.release.set()
+
+        # Action
+        first = self.single_flight.do(("key", "a"), self.blocking_send_request(1))
+        second = self.single_flight.do(("key", "b"), self.blocking_send_request(2))
+        third = self.single_flight.do(("key", "a"), self.blocking_send_request(3))
+
+        # Expected Result
+        self.assertEqual((first, second, third), (1, 2, 3))
+        self.assertEqual(self.single_flight.shared_count, 0)
+
+    def test_exception_is_shared(self):
+        """
+        Test that an exception from the shared request is raised to every caller.
+        """
+
+        # Setup
+        error = PurpleAirAPIError("Request failed")
+
+        # Action
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(
+                    self.single_flight.do,
+                    ("key", "url"),
+                    self.blocking_send_request(error),
+                )
+                for _ in range(3)
+            ]
+            self.wait_for_shared_calls(2)
+            self.release.set()
+
+            # Expected Result
+            for future in futures:
+                with self.assertRaises(PurpleAirAPIError):
+                    future.result()
+
+        self.assertEqual(len(self.calls), 1)
+
+    def test_waiting_caller_honors_deadline(self):
+        """
+        Test that a caller waiting on a shared request gives up when its deadline passes.
+        """
+
+        # Setup
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.single_flight.do,
+                ("key", "url"),
+                self.blocking_send_request(1),
+            )
+            while self.single_flight.in_flight_count == 0:
+                Event().wait(0.01)
+
+            # Action and Expected Result
+            with self.assertRaises(PurpleAirAPIError):
+                self.single_flight.do(
+                    ("key", "url"),
+                    self.blocking_send_request(2),
+                    deadline=PurpleAirDeadline(0.05),
+                )
+
+            self.release.set()
+            self.assertEqual(future.result(), 1)
+
+    def test_read_api_coalesces_identical_requests(self):
+        """
+        Test that identical sensor reads share one request and one rate limiter charge.
+        """
+
+        # Setup
+        limiter = PurpleAirRateLimiter(1000, mode="estimate")
+        para = PurpleAirReadAPI(
+            "123456789", rate_limiter=limiter, single_flight=self.single_flight
+        )
+        request_urls = []
+
+        def fake_send_url_get_request(request_url, *args, **kwargs):
+            request_urls.append(request_url)
+            self.release.wait(5)
+            return {"sensor": {"sensor_index": 1}}
+
+        # Action
+        with patch(
+            "purpleair_api.PurpleAirReadAPI.send_url_get_request",
+            fake_send_url_get_request,
+        ):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(para.request_sensor_data, 1, fields="name")
+                    for _ in range(3)
+                ]
+                futures.append(
+                    executor.submit(para.request_sensor_data, 2, fields="name")
+                )
+                self.wait_for_shared_calls(2)
+                self.release.set()
+                retvals = [future.result() for future in futures]
+
+        # Expected Result
+        self.assertEqual(len(request_urls), 2)
+        self.assertIs(retvals[0], retvals[1])
+        self.assertIs(retvals[0], retvals[2])
+        self.assertEqual(limiter.spent_points, 2 * (1 + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
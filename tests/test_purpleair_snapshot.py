@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Copyright 2023 carlkidcrypto, All rights reserved.
+"""
+
+import unittest
+import requests_mock
+import sys
+
+sys.path.append("../")
+
+from purpleair_api.PurpleAirAPIError import PurpleAirAPIError
+from purpleair_api.PurpleAirReadAPI import PurpleAirReadAPI
+from purpleair_api.PurpleAirSnapshot import PurpleAirSnapshot
+
+SENSORS_URL = "https://api.purpleair.com/v1/sensors/?fields=name,pm2.5&location_type=0"
+
+
+class PurpleAirSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.para = PurpleAirReadAPI("123456789")
+        self.snapshot = PurpleAirSnapshot(self.para, "name,pm2.5", location_type=0)
+
+    def test_poll_applies_only_changed_rows(self):
+        """
+        Test that later polls send `modified_since` and only report changed sensors.
+        """
+
+        # Setup
+        first_payload = {
+            "time_stamp": 1000,
+            "fields": ["sensor_index", "name", "pm2.5"],
+            "data": [[1, "a", 2.5], [2, "b", 3.0]],
+        }
+        second_payload = {
+            "time_stamp": 1060,
+            "fields": ["sensor_index", "name", "pm2.5"],
+            "data": [[2, "b", 3.0], [3, "c", 9.0], [1, "a", 4.0]],
+        }
+
+        # Action
+        with requests_mock.Mocker() as m:
+            m.get(SENSORS_URL, json=first_payload, status_code=200)
+            m.get(
+                SENSORS_URL + "&modified_since=1000",
+                json=second_payload,
+                status_code=200,
+            )
+            first_changed = self.snapshot.poll()
+            second_changed = self.snapshot.poll()
+
+        # Expected Result
+        self.assertEqual(first_changed, {1, 2})
+        self.assertEqual(second_changed, {1, 3})
+        self.assertEqual(self.snapshot.last_changed, {1, 3})
+        self.assertEqual(self.snapshot.last_time_stamp, 1060)
+        self.assertEqual(len(self.snapshot), 3)
+        self.assertEqual(self.snapshot[1]["pm2.5"], 4.0)
+        self.assertIn(3, self.snapshot)
+
+    def test_reset(self):
+        """
+        Test that reset forgets the sensors and the last time stamp.
+        """
+
+        # Setup
+        self.snapshot.apply(
+            {"time_stamp": 5, "fields": ["sensor_index"], "data": [[1], [2]]}
+        )
+
+        # Action
+        self.snapshot.reset()
+
+        # Expected Result
+        self.assertEqual(self.snapshot.sensors, {})
+        self.assertIsNone(self.snapshot.last_time_stamp)
+        self.assertEqual(self.snapshot.last_changed, set())
+
+    def test_invalid_payloads_and_parameters(self):
+        """
+        Test that invalid payloads and a user provided `modified_since` raise `PurpleAirAPIError`.
+        """
+
+        # Setup, Action, and Expected Result
+        with self.assertRaises(PurpleAirAPIError):
+            self.snapshot.apply({"time_stamp": 5})
+
+        with self.assertRaises(PurpleAirAPIError):
+            self.snapshot.apply({"fields": ["name"], "data": [["a"]]})
+
+        with self.assertRaises(PurpleAirAPIError):
+            PurpleAirSnapshot(self.para, "name", modified_since=0)
+
+
+if __name__ == "__main__":
+    unittest.main()